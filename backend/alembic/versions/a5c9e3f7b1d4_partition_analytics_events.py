@@ -0,0 +1,116 @@
+"""partition_analytics_events
+
+Revision ID: a5c9e3f7b1d4
+Revises: f3a8d1c5b2e9
+Create Date: 2026-10-19 18:00:00.000000
+
+"""
+from datetime import date, datetime, timezone
+from typing import Iterator, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = 'a5c9e3f7b1d4'
+down_revision: Union[str, Sequence[str], None] = 'f3a8d1c5b2e9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COLUMNS = "id, event_name, source, route, user_type_guess, session_id, payload, ip_address, user_agent, created_at"
+
+
+# Partition helpers as of this revision (app.services.analytics_rollups
+# creates later months with the same naming and bounds).
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def month_range(first: date, last: date) -> Iterator[date]:
+    """Month starts from first's month through last's month."""
+    month = first.replace(day=1)
+    while month <= last:
+        yield month
+        month = add_months(month, 1)
+
+
+def create_partition_sql(month: date) -> str:
+    return (
+        f"CREATE TABLE IF NOT EXISTS analytics_events_p{month:%Y%m} PARTITION OF analytics_events "
+        f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') TO ('{add_months(month, 1).isoformat()} 00:00:00+00')"
+    )
+
+
+def _create_events_table(partitioned: bool) -> None:
+    op.execute(f"""
+        CREATE TABLE analytics_events (
+            id BIGINT NOT NULL DEFAULT nextval('analytics_events_id_seq'),
+            event_name VARCHAR(120) NOT NULL,
+            source VARCHAR(120) NOT NULL DEFAULT 'unknown',
+            route VARCHAR(255) NOT NULL DEFAULT 'unknown',
+            user_type_guess VARCHAR(32) NOT NULL DEFAULT 'unknown',
+            session_id VARCHAR(128),
+            payload JSONB NOT NULL DEFAULT '{{}}'::jsonb,
+            ip_address VARCHAR(64),
+            user_agent VARCHAR,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT now(),
+            PRIMARY KEY ({'id, created_at' if partitioned else 'id'})
+        ){' PARTITION BY RANGE (created_at)' if partitioned else ''}
+    """)
+    op.execute("ALTER SEQUENCE analytics_events_id_seq OWNED BY analytics_events.id")
+    op.create_index('ix_analytics_events_created_at', 'analytics_events', ['created_at'], unique=False)
+    op.create_index('ix_analytics_events_event_name', 'analytics_events', ['event_name'], unique=False)
+
+
+def _rename_to_legacy() -> None:
+    op.drop_index('ix_analytics_events_event_name', table_name='analytics_events')
+    op.drop_index('ix_analytics_events_created_at', table_name='analytics_events')
+    op.execute("ALTER TABLE analytics_events RENAME TO analytics_events_legacy")
+    op.execute("ALTER TABLE analytics_events_legacy RENAME CONSTRAINT analytics_events_pkey TO analytics_events_legacy_pkey")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    conn = op.get_bind()
+    _rename_to_legacy()
+    op.execute("ALTER SEQUENCE analytics_events_id_seq AS BIGINT")
+    _create_events_table(partitioned=True)
+
+    today = datetime.now(timezone.utc).date()
+    first = conn.execute(sa.text("SELECT min(created_at) FROM analytics_events_legacy")).scalar()
+    first_day = first.astimezone(timezone.utc).date() if first is not None else today
+    for month in month_range(min(first_day, today), add_months(today.replace(day=1), 2)):
+        op.execute(create_partition_sql(month))
+
+    op.execute(f"INSERT INTO analytics_events ({COLUMNS}) SELECT {COLUMNS} FROM analytics_events_legacy")
+    op.drop_table('analytics_events_legacy')
+
+    op.create_table(
+        'analytics_daily_rollups',
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('event_name', sa.String(length=120), nullable=False),
+        sa.Column('route', sa.String(length=255), nullable=False),
+        sa.Column('user_type_guess', sa.String(length=32), nullable=False),
+        sa.Column('events', sa.BigInteger(), nullable=False),
+        sa.PrimaryKeyConstraint('day', 'event_name', 'route', 'user_type_guess'),
+    )
+    op.create_table(
+        'analytics_daily_sessions',
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('sessions_sketch', sa.LargeBinary(), nullable=False),
+        sa.Column('refreshed_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.PrimaryKeyConstraint('day'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('analytics_daily_sessions')
+    op.drop_table('analytics_daily_rollups')
+
+    _rename_to_legacy()
+    _create_events_table(partitioned=False)
+    op.execute(f"INSERT INTO analytics_events ({COLUMNS}) SELECT {COLUMNS} FROM analytics_events_legacy")
+    op.drop_table('analytics_events_legacy')
+    op.execute("ALTER SEQUENCE analytics_events_id_seq AS INTEGER")
@@ -0,0 +1,85 @@
+"""add_vacancy_snippet
+
+Revision ID: b8e3d6a2c4f7
+Revises: a5c9e3f7b1d4
+Create Date: 2026-10-19 20:00:00.000000
+
+"""
+import html
+import re
+from typing import Optional, Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'b8e3d6a2c4f7'
+down_revision: Union[str, Sequence[str], None] = 'a5c9e3f7b1d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+SNIPPET_LENGTH = 200
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACE_RE = re.compile(r"\s+")
+
+vacancies = sa.table(
+    'vacancies',
+    sa.column('id', sa.Integer),
+    sa.column('description', sa.Text),
+    sa.column('raw_data', postgresql.JSONB),
+    sa.column('snippet', sa.String),
+)
+
+
+def make_snippet(description: Optional[str], hh_snippet: Optional[dict] = None, limit: int = SNIPPET_LENGTH) -> Optional[str]:
+    """app.utils.helpers.make_snippet as of this revision."""
+    text = description or ""
+    if not text.strip() and hh_snippet:
+        text = " ".join(filter(None, (hh_snippet.get("responsibility"), hh_snippet.get("requirement"))))
+    text = _SPACE_RE.sub(" ", html.unescape(_TAG_RE.sub(" ", text))).strip()
+    if not text:
+        return None
+    if len(text) <= limit:
+        return text
+    cut = text[:limit]
+    if text[limit] != " " and " " in cut:
+        cut = cut.rsplit(" ", 1)[0]
+    return cut.rstrip(" ,.;:-") + "…"
+
+
+def _backfill_snippets(conn) -> None:
+    """Same text the scraper stores: stripped description, else HH's search snippet."""
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            sa.select(vacancies.c.id, vacancies.c.description, vacancies.c.raw_data['snippet'].label('hh_snippet'))
+            .where(vacancies.c.id > last_id)
+            .order_by(vacancies.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            return
+        last_id = rows[-1].id
+        updates = []
+        for row in rows:
+            hh_snippet = row.hh_snippet if isinstance(row.hh_snippet, dict) else None
+            snippet = make_snippet(row.description, hh_snippet)
+            if snippet:
+                updates.append((row.id, snippet))
+        if updates:
+            data = sa.values(sa.column('id', sa.Integer), sa.column('snippet', sa.String), name='data').data(updates)
+            conn.execute(vacancies.update().where(vacancies.c.id == data.c.id).values(snippet=data.c.snippet))
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('vacancies', sa.Column('snippet', sa.String(), nullable=True))
+    _backfill_snippets(op.get_bind())
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('vacancies', 'snippet')
@@ -0,0 +1,94 @@
+"""move_vacancy_raw_data
+
+Revision ID: c2f7a9e4b6d1
+Revises: b8e3d6a2c4f7
+Create Date: 2026-10-19 22:00:00.000000
+
+Operator step after upgrade: DROP COLUMN raw_data only marks the column
+dropped; the old payloads stay in the vacancies heap and its TOAST table
+until rows are rewritten. To reclaim the space, run in a maintenance
+window (ACCESS EXCLUSIVE lock for the whole rewrite):
+
+    VACUUM (FULL, ANALYZE) vacancies;
+
+or rewrite it online with pg_repack:
+
+    pg_repack --table=vacancies <dbname>
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2f7a9e4b6d1'
+down_revision: Union[str, Sequence[str], None] = 'b8e3d6a2c4f7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'vacancy_raw',
+        sa.Column('vacancy_id', sa.Integer(), nullable=False),
+        sa.Column('raw_data', postgresql.JSONB(astext_type=sa.Text()), nullable=False),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+        sa.ForeignKeyConstraint(['vacancy_id'], ['vacancies.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('vacancy_id'),
+    )
+    # lz4 TOAST compression (Postgres 14+ built with lz4); keep the default where it is unavailable.
+    op.execute(
+        """
+        DO $$
+        BEGIN
+            ALTER TABLE vacancy_raw ALTER COLUMN raw_data SET COMPRESSION lz4;
+        EXCEPTION WHEN feature_not_supported THEN
+            NULL;
+        END $$
+        """
+    )
+    op.execute(
+        """
+        INSERT INTO vacancy_raw (vacancy_id, raw_data, updated_at)
+        SELECT id, raw_data, updated_at FROM vacancies WHERE raw_data IS NOT NULL
+        """
+    )
+
+    op.add_column('vacancies', sa.Column('professional_role_ids', postgresql.ARRAY(sa.Integer()), nullable=True))
+    op.execute(
+        r"""
+        UPDATE vacancies SET professional_role_ids = ARRAY(
+            SELECT DISTINCT (role->>'id')::integer
+            FROM jsonb_array_elements(raw_data->'professional_roles') AS role
+            WHERE role->>'id' ~ '^\d+$'
+            ORDER BY 1
+        )
+        WHERE jsonb_typeof(raw_data->'professional_roles') = 'array'
+        """
+    )
+    op.create_index(
+        'ix_vacancies_professional_role_ids', 'vacancies', ['professional_role_ids'],
+        unique=False, postgresql_using='gin',
+    )
+    op.drop_column('vacancies', 'raw_data')
+    # Reclaiming the dropped payloads is an operator step; see the module docstring.
+    op.execute("ANALYZE vacancy_raw")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column('vacancies', sa.Column('raw_data', postgresql.JSONB(astext_type=sa.Text()), nullable=True))
+    op.execute(
+        """
+        UPDATE vacancies SET raw_data = vacancy_raw.raw_data
+        FROM vacancy_raw WHERE vacancy_raw.vacancy_id = vacancies.id
+        """
+    )
+    op.execute("UPDATE vacancies SET raw_data = '{}'::jsonb WHERE raw_data IS NULL")
+    op.alter_column('vacancies', 'raw_data', nullable=False)
+
+    op.drop_index('ix_vacancies_professional_role_ids', table_name='vacancies', postgresql_using='gin')
+    op.drop_column('vacancies', 'professional_role_ids')
+    op.drop_table('vacancy_raw')
@@ -0,0 +1,53 @@
+"""add_vacancy_skill_keys
+
+Revision ID: c4e1b7a9d2f3
+Revises: 8d2ef2754f1b
+Create Date: 2026-10-19 10:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'c4e1b7a9d2f3'
+down_revision: Union[str, Sequence[str], None] = '8d2ef2754f1b'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Lowercased, trimmed, de-duplicated skill array derived from key_skills (JSONB).
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION vacancy_skill_keys(skills jsonb) RETURNS text[]
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+            SELECT coalesce(array_agg(DISTINCT lower(btrim(s)) ORDER BY lower(btrim(s))), '{}'::text[])
+            FROM jsonb_array_elements_text(
+                CASE WHEN jsonb_typeof(skills) = 'array' THEN skills ELSE '[]'::jsonb END
+            ) AS s
+            WHERE btrim(s) <> ''
+        $$
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION skill_overlap(a text[], b text[]) RETURNS integer
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+            SELECT count(*)::integer FROM unnest(a) AS s WHERE s = ANY(b)
+        $$
+        """
+    )
+    op.add_column('vacancies', sa.Column('skill_keys', postgresql.ARRAY(sa.Text()), sa.Computed("vacancy_skill_keys(key_skills)", persisted=True), nullable=True))
+    op.create_index('ix_vacancies_skill_keys', 'vacancies', ['skill_keys'], unique=False, postgresql_using='gin')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_vacancies_skill_keys', table_name='vacancies', postgresql_using='gin')
+    op.drop_column('vacancies', 'skill_keys')
+    op.execute("DROP FUNCTION IF EXISTS skill_overlap(text[], text[])")
+    op.execute("DROP FUNCTION IF EXISTS vacancy_skill_keys(jsonb)")
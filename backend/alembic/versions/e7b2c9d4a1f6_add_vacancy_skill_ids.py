@@ -0,0 +1,333 @@
+"""add_vacancy_skill_ids
+
+Revision ID: e7b2c9d4a1f6
+Revises: c4e1b7a9d2f3
+Create Date: 2026-10-19 14:00:00.000000
+
+Rewrites vacancies.key_skills and users.skills to canonical names; the
+downgrade drops skill_ids but cannot restore the original spellings.
+"""
+import json
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision: str = 'e7b2c9d4a1f6'
+down_revision: Union[str, Sequence[str], None] = 'c4e1b7a9d2f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BATCH_SIZE = 1000
+
+# Snapshot of app.core.skills at this revision: lowercase name or synonym ->
+# (skill id, canonical name). Later registry changes must not alter what
+# this migration writes.
+SKILLS: Dict[str, Tuple[int, str]] = {
+    'python': (1, 'Python'),
+    'javascript': (2, 'JavaScript'),
+    'typescript': (3, 'TypeScript'),
+    'java': (4, 'Java'),
+    'go': (5, 'Go'),
+    'golang': (5, 'Go'),
+    'c#': (6, 'C#'),
+    'c++': (7, 'C++'),
+    'php': (8, 'PHP'),
+    'ruby': (9, 'Ruby'),
+    'swift': (10, 'Swift'),
+    'kotlin': (11, 'Kotlin'),
+    'rust': (12, 'Rust'),
+    'scala': (13, 'Scala'),
+    'perl': (14, 'Perl'),
+    'r': (15, 'R'),
+    'dart': (16, 'Dart'),
+    'elixir': (17, 'Elixir'),
+    'react': (18, 'React'),
+    'reactjs': (18, 'React'),
+    'vue.js': (19, 'Vue.js'),
+    'vue': (19, 'Vue.js'),
+    'angular': (20, 'Angular'),
+    'angularjs': (21, 'AngularJS'),
+    'svelte': (22, 'Svelte'),
+    'next.js': (23, 'Next.js'),
+    'nuxt': (24, 'Nuxt'),
+    'gatsby': (25, 'Gatsby'),
+    'jquery': (26, 'jQuery'),
+    'ember': (27, 'Ember'),
+    'backbone': (28, 'Backbone'),
+    'html': (29, 'HTML'),
+    'html5': (29, 'HTML'),
+    'css': (30, 'CSS'),
+    'css3': (30, 'CSS'),
+    'sass': (31, 'SASS'),
+    'scss': (32, 'SCSS'),
+    'less': (33, 'LESS'),
+    'tailwind': (34, 'Tailwind'),
+    'bootstrap': (35, 'Bootstrap'),
+    'material-ui': (36, 'Material-UI'),
+    'ant design': (37, 'Ant Design'),
+    'chakra ui': (38, 'Chakra UI'),
+    'node.js': (39, 'Node.js'),
+    'node': (39, 'Node.js'),
+    'express': (40, 'Express'),
+    'django': (41, 'Django'),
+    'flask': (42, 'Flask'),
+    'fastapi': (43, 'FastAPI'),
+    'spring': (44, 'Spring'),
+    'spring boot': (45, 'Spring Boot'),
+    'laravel': (46, 'Laravel'),
+    'symfony': (47, 'Symfony'),
+    'ruby on rails': (48, 'Ruby on Rails'),
+    'rails': (48, 'Ruby on Rails'),
+    'asp.net': (49, 'ASP.NET'),
+    '.net': (50, '.NET'),
+    'gin': (51, 'Gin'),
+    'echo': (52, 'Echo'),
+    'nestjs': (53, 'NestJS'),
+    'koa': (54, 'Koa'),
+    'fastify': (55, 'Fastify'),
+    'postgresql': (56, 'PostgreSQL'),
+    'postgres': (56, 'PostgreSQL'),
+    'mysql': (57, 'MySQL'),
+    'mongodb': (58, 'MongoDB'),
+    'redis': (59, 'Redis'),
+    'sqlite': (60, 'SQLite'),
+    'oracle': (61, 'Oracle'),
+    'sql server': (62, 'SQL Server'),
+    'ms sql': (62, 'SQL Server'),
+    'mariadb': (63, 'MariaDB'),
+    'cassandra': (64, 'Cassandra'),
+    'dynamodb': (65, 'DynamoDB'),
+    'elasticsearch': (66, 'Elasticsearch'),
+    'clickhouse': (67, 'ClickHouse'),
+    'couchdb': (68, 'CouchDB'),
+    'neo4j': (69, 'Neo4j'),
+    'docker': (70, 'Docker'),
+    'kubernetes': (71, 'Kubernetes'),
+    'k8s': (71, 'Kubernetes'),
+    'git': (72, 'Git'),
+    'github': (73, 'GitHub'),
+    'gitlab': (74, 'GitLab'),
+    'bitbucket': (75, 'Bitbucket'),
+    'devops': (76, 'DevOps'),
+    'jenkins': (77, 'Jenkins'),
+    'circleci': (78, 'CircleCI'),
+    'travis ci': (79, 'Travis CI'),
+    'github actions': (80, 'GitHub Actions'),
+    'gitlab ci': (81, 'GitLab CI'),
+    'terraform': (82, 'Terraform'),
+    'ansible': (83, 'Ansible'),
+    'chef': (84, 'Chef'),
+    'puppet': (85, 'Puppet'),
+    'vagrant': (86, 'Vagrant'),
+    'linux': (87, 'Linux'),
+    'ubuntu': (88, 'Ubuntu'),
+    'centos': (89, 'CentOS'),
+    'debian': (90, 'Debian'),
+    'rhel': (91, 'RHEL'),
+    'nginx': (92, 'Nginx'),
+    'apache': (93, 'Apache'),
+    'tomcat': (94, 'Tomcat'),
+    'aws': (95, 'AWS'),
+    'azure': (96, 'Azure'),
+    'gcp': (97, 'GCP'),
+    'google cloud': (97, 'GCP'),
+    'heroku': (98, 'Heroku'),
+    'digitalocean': (99, 'DigitalOcean'),
+    'prometheus': (100, 'Prometheus'),
+    'grafana': (101, 'Grafana'),
+    'elk': (102, 'ELK'),
+    'kibana': (103, 'Kibana'),
+    'logstash': (104, 'Logstash'),
+    'android': (105, 'Android'),
+    'ios': (106, 'iOS'),
+    'react native': (107, 'React Native'),
+    'flutter': (108, 'Flutter'),
+    'xamarin': (109, 'Xamarin'),
+    'ionic': (110, 'Ionic'),
+    'pandas': (111, 'Pandas'),
+    'numpy': (112, 'NumPy'),
+    'tensorflow': (113, 'TensorFlow'),
+    'pytorch': (114, 'PyTorch'),
+    'scikit-learn': (115, 'Scikit-learn'),
+    'keras': (116, 'Keras'),
+    'spark': (117, 'Spark'),
+    'hadoop': (118, 'Hadoop'),
+    'airflow': (119, 'Airflow'),
+    'kafka': (120, 'Kafka'),
+    'rabbitmq': (121, 'RabbitMQ'),
+    'jest': (122, 'Jest'),
+    'mocha': (123, 'Mocha'),
+    'cypress': (124, 'Cypress'),
+    'selenium': (125, 'Selenium'),
+    'pytest': (126, 'Pytest'),
+    'junit': (127, 'JUnit'),
+    'testng': (128, 'TestNG'),
+    'graphql': (129, 'GraphQL'),
+    'rest': (130, 'REST'),
+    'grpc': (131, 'gRPC'),
+    'websocket': (132, 'WebSocket'),
+    'oauth': (133, 'OAuth'),
+    'jwt': (134, 'JWT'),
+    'microservices': (135, 'Microservices'),
+    'agile': (136, 'Agile'),
+    'scrum': (137, 'Scrum'),
+    'ci/cd': (138, 'CI/CD'),
+}
+
+vacancies = sa.table(
+    'vacancies',
+    sa.column('id', sa.Integer),
+    sa.column('key_skills', postgresql.JSONB),
+    sa.column('skill_ids', postgresql.ARRAY(sa.Integer)),
+)
+users = sa.table(
+    'users',
+    sa.column('id', sa.Integer),
+    sa.column('skills', postgresql.JSONB),
+)
+
+
+def _lookup(name) -> Optional[Tuple[int, str]]:
+    return SKILLS.get(name.strip().lower()) if isinstance(name, str) else None
+
+
+def _canonical_skills(names: List) -> Tuple[List[str], List[int]]:
+    """Canonical names in first-seen order and sorted ids of the known skills."""
+    canonical: Dict[int, str] = {}
+    for skill in map(_lookup, names):
+        if skill is not None and skill[0] not in canonical:
+            canonical[skill[0]] = skill[1]
+    return list(canonical.values()), sorted(canonical)
+
+
+def _normalize_profile_skills(names: List) -> List[str]:
+    """Lowercased profile skills with synonyms mapped to the canonical name."""
+    result: List[str] = []
+    for name in names:
+        if not isinstance(name, str) or not name.strip():
+            continue
+        skill = _lookup(name)
+        key = skill[1].lower() if skill is not None else name.strip().lower()
+        if key not in result:
+            result.append(key)
+    return result
+
+
+def _update_from_values(conn, table, columns: List[str], rows: List[tuple]) -> None:
+    """One UPDATE ... FROM (VALUES ...) for a batch; values are text cast to each column's type."""
+    if not rows:
+        return
+    data = sa.values(
+        sa.column('id', sa.Integer), *(sa.column(name, sa.Text) for name in columns), name='data'
+    ).data(rows)
+    conn.execute(
+        table.update()
+        .where(table.c.id == data.c.id)
+        .values({name: sa.cast(data.c[name], table.c[name].type) for name in columns})
+    )
+
+
+def _int_array(values: List[int]) -> str:
+    return '{' + ','.join(map(str, values)) + '}'
+
+
+def _backfill_vacancies(conn) -> None:
+    """Canonicalize key_skills (synonyms -> canonical name) and fill skill_ids."""
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            sa.select(vacancies.c.id, vacancies.c.key_skills)
+            .where(vacancies.c.id > last_id, vacancies.c.key_skills.isnot(None))
+            .order_by(vacancies.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            return
+        last_id = rows[-1].id
+        updates = []
+        for row in rows:
+            names, ids = _canonical_skills(row.key_skills if isinstance(row.key_skills, list) else [])
+            updates.append((row.id, json.dumps(names, ensure_ascii=False), _int_array(ids)))
+        _update_from_values(conn, vacancies, ['key_skills', 'skill_ids'], updates)
+
+
+def _backfill_users(conn) -> None:
+    """Map profile skill synonyms to canonical keys ("golang" -> "go")."""
+    last_id = 0
+    while True:
+        rows = conn.execute(
+            sa.select(users.c.id, users.c.skills)
+            .where(users.c.id > last_id, users.c.skills.isnot(None))
+            .order_by(users.c.id)
+            .limit(BATCH_SIZE)
+        ).all()
+        if not rows:
+            return
+        last_id = rows[-1].id
+        updates = []
+        for row in rows:
+            if not isinstance(row.skills, list):
+                continue
+            normalized = _normalize_profile_skills(row.skills)
+            if normalized != row.skills:
+                updates.append((row.id, json.dumps(normalized, ensure_ascii=False)))
+        _update_from_values(conn, users, ['skills'], updates)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('vacancies', sa.Column('skill_ids', postgresql.ARRAY(sa.Integer()), nullable=True))
+
+    conn = op.get_bind()
+    _backfill_vacancies(conn)
+    _backfill_users(conn)
+
+    op.create_index('ix_vacancies_skill_ids', 'vacancies', ['skill_ids'], unique=False, postgresql_using='gin')
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION skill_id_overlap(a integer[], b integer[]) RETURNS integer
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+            SELECT count(*)::integer FROM unnest(a) AS s WHERE s = ANY(b)
+        $$
+        """
+    )
+
+    # The text-key column is superseded by skill_ids.
+    op.drop_index('ix_vacancies_skill_keys', table_name='vacancies', postgresql_using='gin')
+    op.drop_column('vacancies', 'skill_keys')
+    op.execute("DROP FUNCTION IF EXISTS skill_overlap(text[], text[])")
+    op.execute("DROP FUNCTION IF EXISTS vacancy_skill_keys(jsonb)")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # The key_skills / users.skills rewrite is one-way: canonical names stay.
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION vacancy_skill_keys(skills jsonb) RETURNS text[]
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+            SELECT coalesce(array_agg(DISTINCT lower(btrim(s)) ORDER BY lower(btrim(s))), '{}'::text[])
+            FROM jsonb_array_elements_text(
+                CASE WHEN jsonb_typeof(skills) = 'array' THEN skills ELSE '[]'::jsonb END
+            ) AS s
+            WHERE btrim(s) <> ''
+        $$
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION skill_overlap(a text[], b text[]) RETURNS integer
+        LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+            SELECT count(*)::integer FROM unnest(a) AS s WHERE s = ANY(b)
+        $$
+        """
+    )
+    op.add_column('vacancies', sa.Column('skill_keys', postgresql.ARRAY(sa.Text()), sa.Computed("vacancy_skill_keys(key_skills)", persisted=True), nullable=True))
+    op.create_index('ix_vacancies_skill_keys', 'vacancies', ['skill_keys'], unique=False, postgresql_using='gin')
+
+    op.drop_index('ix_vacancies_skill_ids', table_name='vacancies', postgresql_using='gin')
+    op.execute("DROP FUNCTION IF EXISTS skill_id_overlap(integer[], integer[])")
+    op.drop_column('vacancies', 'skill_ids')
@@ -2,20 +2,21 @@
 Authentication utilities for JWT-based auth.
 """
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Optional, Tuple
 import secrets
 import hashlib
 
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, update
 
 from app.database import get_db
 from app.models import User, RefreshToken, EmailVerificationToken, PasswordResetToken
 from app.config import settings
+from app.infra.password_hasher import PasswordHasherBusy, build_crypt_context, get_password_hasher
+from app.infra.principal_cache import Principal, get_principal_cache, invalidate_principal
 
 # Configuration from settings (reads from .env)
 # No fallback - fail fast if JWT_SECRET_KEY is not set
@@ -26,8 +27,8 @@ REFRESH_TOKEN_EXPIRE_DAYS = settings.REFRESH_TOKEN_EXPIRE_DAYS
 EMAIL_VERIFICATION_EXPIRE_HOURS = settings.EMAIL_VERIFICATION_EXPIRE_HOURS
 PASSWORD_RESET_EXPIRE_HOURS = settings.PASSWORD_RESET_EXPIRE_HOURS
 
-# Password hashing context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing context (synchronous helpers; request handlers use the async pool below)
+pwd_context = build_crypt_context(settings.BCRYPT_ROUNDS)
 
 # OAuth2 scheme
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/token")
@@ -43,6 +44,35 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+def _hashing_unavailable() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Authentication is temporarily overloaded, please retry",
+        headers={"Retry-After": "1"},
+    )
+
+
+async def hash_password_async(password: str) -> str:
+    """Hash a password in the dedicated bcrypt pool; 503 when the pool is saturated."""
+    try:
+        return await get_password_hasher().hash(password)
+    except PasswordHasherBusy:
+        raise _hashing_unavailable()
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Verify a password in the dedicated bcrypt pool; 503 when the pool is saturated.
+
+    Returns (valid, new_hash). new_hash is set when the stored hash uses a
+    lower cost than BCRYPT_ROUNDS; callers should store it.
+    """
+    try:
+        return await get_password_hasher().verify_and_update(plain_password, hashed_password)
+    except PasswordHasherBusy:
+        raise _hashing_unavailable()
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token."""
     to_encode = data.copy()
@@ -55,44 +85,104 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 
-async def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: AsyncSession = Depends(get_db)
-) -> User:
-    """
-    Dependency to get the current authenticated user.
-    Validates the JWT token and returns the user from database.
-    """
-    credentials_exception = HTTPException(
+def access_token_claims(user: User) -> dict:
+    """Claims for a user's access token: subject, user id and token version."""
+    return {"sub": user.email, "uid": user.id, "ver": user.token_version or 0}
+
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+
+def _decode_access_token(token: str) -> Tuple[str, Optional[int], Optional[int]]:
+    """
+    Return (email, user_id, token_version) from an access token.
+
+    Tokens issued before the "uid"/"ver" claims existed yield None for both;
+    they are resolved by email and are not served from the principal cache.
+    """
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        email: str = payload.get("sub")
-        if email is None:
-            raise credentials_exception
     except JWTError:
-        raise credentials_exception
-
-    # Fetch user from database
-    result = await db.execute(select(User).filter(User.email == email))
+        raise _credentials_exception()
+    email = payload.get("sub")
+    if email is None:
+        raise _credentials_exception()
+    user_id = payload.get("uid")
+    version = payload.get("ver")
+    if not isinstance(user_id, int) or not isinstance(version, int):
+        return email, None, None
+    return email, user_id, version
+
+
+async def _load_user(db: AsyncSession, email: str, user_id: Optional[int], version: Optional[int]) -> User:
+    if user_id is not None:
+        result = await db.execute(select(User).filter(User.id == user_id))
+    else:
+        result = await db.execute(select(User).filter(User.email == email))
     user = result.scalar_one_or_none()
 
-    if user is None:
-        raise credentials_exception
+    if user is None or user.email != email:
+        raise _credentials_exception()
+    # Token issued before logout-all / password change
+    if version is not None and version != (user.token_version or 0):
+        raise _credentials_exception()
+    return user
 
+
+def _ensure_active(user) -> None:
     if not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Inactive user"
         )
 
+
+async def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_db)
+) -> User:
+    """
+    Dependency to get the current authenticated user.
+    Validates the JWT token and returns the user from database.
+
+    Use this when the handler modifies the user or needs columns that are
+    not part of Principal (e.g. hashed_password); read-only handlers should
+    depend on get_current_principal instead.
+    """
+    email, user_id, version = _decode_access_token(token)
+    user = await _load_user(db, email, user_id, version)
+    _ensure_active(user)
     return user
 
 
+async def get_current_principal(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_db)
+) -> Principal:
+    """
+    Dependency to get the current authenticated user as a read-only Principal.
+    Served from the principal cache when the token's user id and version match.
+    """
+    email, user_id, version = _decode_access_token(token)
+    cache = get_principal_cache()
+    if user_id is not None:
+        principal = await cache.get(user_id, version)
+        if principal is not None and principal.email == email:
+            _ensure_active(principal)
+            return principal
+
+    user = await _load_user(db, email, user_id, version)
+    principal = Principal.from_user(user)
+    await cache.set(principal)
+    _ensure_active(principal)
+    return principal
+
+
 # --- Refresh Token Functions ---
 
 def create_refresh_token() -> str:
@@ -186,7 +276,10 @@ async def revoke_refresh_token(db: AsyncSession, token: str) -> bool:
 
 
 async def revoke_all_user_tokens(db: AsyncSession, user_id: int):
-    """Revoke all refresh tokens for a user."""
+    """
+    Revoke all refresh tokens for a user.
+    Also bumps the user's token_version, so access tokens issued so far are rejected.
+    """
     result = await db.execute(
         select(RefreshToken).filter(
             RefreshToken.user_id == user_id,
@@ -199,12 +292,18 @@ async def revoke_all_user_tokens(db: AsyncSession, user_id: int):
         token.revoked = True
         token.revoked_at = datetime.now(timezone.utc)
 
+    await db.execute(
+        update(User)
+        .where(User.id == user_id)
+        .values(token_version=User.token_version + 1)
+    )
     await db.commit()
+    await invalidate_principal(user_id)
 
 
 # --- Role Checking ---
 
-async def require_admin(current_user: User = Depends(get_current_user)) -> User:
+async def require_admin(current_user: Principal = Depends(get_current_principal)) -> Principal:
     """Dependency to require admin role."""
     if current_user.role != "admin":
         raise HTTPException(
@@ -267,6 +366,7 @@ async def verify_email_token(db: AsyncSession, token: str, user_id: int) -> Opti
         user.email_verified_at = datetime.now(timezone.utc)
         await db.commit()
         await db.refresh(user)
+        await invalidate_principal(user.id)
 
     return user
 
@@ -20,11 +20,31 @@ class Settings(BaseSettings):
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
     EMAIL_VERIFICATION_EXPIRE_HOURS: int = 24
     PASSWORD_RESET_EXPIRE_HOURS: int = 1
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60  # Redis copy of the authenticated user
+    PRINCIPAL_CACHE_LOCAL_TTL_SECONDS: float = 5.0  # per-process LRU; bounds cross-worker staleness
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 10000
+    BCRYPT_ROUNDS: int = 12  # stored hashes with a lower cost are re-hashed on login
+    PASSWORD_HASH_WORKERS: int = 0  # bcrypt process pool size; 0 = CPU count
+    PASSWORD_HASH_MAX_PENDING: int = 0  # in-flight hash jobs before 503; 0 = 4 x workers
 
     # Security
     INTERNAL_SECRET: str
     ALLOWED_ORIGINS: str = "http://localhost:5173"  # Comma-separated list for production
     ENV: str = "dev"
+    # Peers whose X-Forwarded-For is trusted (nginx in docker / localhost), comma-separated CIDRs
+    TRUSTED_PROXIES: str = "127.0.0.1/32,::1/128,10.0.0.0/8,172.16.0.0/12,192.168.0.0/16"
+
+    # Rate limiting (shared Redis counters when REDIS_URL is set)
+    RATE_LIMIT_STORAGE_ENABLED: bool = True  # False = per-process in-memory counters
+    RATE_LIMIT_PREFETCH_MAX: int = 10  # max hits reserved per Redis round trip (generous limits only)
+    RATE_LIMIT_PREFETCH_MAX_AGE_SECONDS: float = 1.0
+    RATE_LIMIT_REDIS_TIMEOUT_SECONDS: float = 0.1
+
+    # Analytics ingestion (per-process buffer, flushed with multi-row INSERTs)
+    ANALYTICS_BUFFER_MAX_EVENTS: int = 10000  # events beyond this are dropped
+    ANALYTICS_FLUSH_BATCH_SIZE: int = 500
+    ANALYTICS_FLUSH_INTERVAL_MS: int = 1000
+    ANALYTICS_RETENTION_MONTHS: int = 6  # monthly analytics_events partitions older than this are dropped
 
     # Email settings
     EMAIL_ENABLED: bool = False  # False for dev mode
@@ -43,9 +63,18 @@ class Settings(BaseSettings):
     REDIS_URL: Optional[str] = None
     CACHE_ENABLED: bool = True
     CACHE_TTL_SECONDS: int = 120
-    INTERVIEW_SESSION_BACKEND: str = "memory"  # redis | memory
+    HTTP_CACHE_MAX_AGE_SECONDS: int = 60  # dataset-derived GETs (vacancies, filters, metrics, companies); then ETag revalidation
+    INTERVIEW_SESSION_BACKEND: str = "memory"  # redis | memory | token (stateless signed tokens)
+    INTERVIEW_SESSION_TOKEN_SECRET: Optional[str] = None  # defaults to JWT_SECRET_KEY
     INTERVIEW_SESSION_MAX_ACTIVE: int = 2000
+    INTERVIEW_CATALOG_RELOAD_INTERVAL_SECONDS: float = 5.0  # 0 disables hot reload of interview data files
+    INTERVIEW_STATIC_CACHE_MAX_AGE_SECONDS: int = 86400  # questions/stages/roles; revalidated by ETag
     DB_STATEMENT_TIMEOUT_SECONDS: int = 30
+    RECOMMENDATIONS_TOP_K: int = 20
+    RECOMMENDATIONS_FEED_TTL_SECONDS: int = 2 * 24 * 3600  # feeds are keyed by dataset generation
+    SITEMAP_SHARD_SIZE: int = 50000  # URLs per vacancy sitemap (protocol maximum)
+    SITEMAP_MAX_AGE_SECONDS: int = 3600  # rebuild in the background after this even without a new generation
+    SITEMAP_CACHE_MAX_AGE_SECONDS: int = 3600
 
     # Scraper settings
     HH_AREA: int = 40  # Kazakhstan
@@ -53,6 +82,14 @@ class Settings(BaseSettings):
     # AI/LLM settings
     OPENAI_API_KEY: Optional[str] = None
     AI_MODEL: str = "gpt-4o"
+    INTERVIEW_LLM_CACHE_ENABLED: bool = True
+    INTERVIEW_LLM_CACHE_TTL_SECONDS: int = 7 * 24 * 3600
+    INTERVIEW_LLM_CACHE_LOCAL_SIZE: int = 512
+    INTERVIEW_LLM_CACHE_SCORE_STEP: float = 0.05  # role score quantization bucket
+    INTERVIEW_LLM_WORKERS: int = 4
+    INTERVIEW_LLM_QUEUE_MAX: int = 200
+    INTERVIEW_LLM_JOB_TIMEOUT_SECONDS: int = 90
+    INTERVIEW_LLM_JOB_TTL_SECONDS: int = 3600
 
     # Salary normalization rates
     EXCHANGE_RATE_USD: float = 509.0
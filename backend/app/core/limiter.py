@@ -1,4 +1,66 @@
+import ipaddress
+from functools import lru_cache
+from typing import List, Optional, Union
+
 from slowapi import Limiter
 from slowapi.util import get_remote_address
+from starlette.requests import Request
+
+from app.config import settings
+# Registers the "prefetch+redis://" storage scheme with limits
+from app.infra import rate_limit_storage  # noqa: F401
+
+IPNetwork = Union[ipaddress.IPv4Network, ipaddress.IPv6Network]
+
+
+@lru_cache(maxsize=1)
+def _trusted_proxies() -> List[IPNetwork]:
+    networks = []
+    for item in settings.TRUSTED_PROXIES.split(","):
+        item = item.strip()
+        if item:
+            networks.append(ipaddress.ip_network(item, strict=False))
+    return networks
+
+
+def _is_trusted_proxy(host: Optional[str]) -> bool:
+    try:
+        address = ipaddress.ip_address(host)
+    except (TypeError, ValueError):
+        return False
+    return any(address in network for network in _trusted_proxies())
+
+
+def get_client_ip(request: Request) -> str:
+    """
+    Client IP for rate limiting and lockouts.
+
+    X-Forwarded-For is only honoured when the direct peer is a trusted proxy;
+    the header is then walked from the right (nginx appends the address it
+    saw) and the first hop that is not a trusted proxy is the client. This
+    ignores anything a client prepends to the header itself.
+    """
+    peer = get_remote_address(request)
+    if not _is_trusted_proxy(peer):
+        return peer
+    forwarded = request.headers.get("x-forwarded-for")
+    if not forwarded:
+        return peer
+    hops = [hop.strip() for hop in forwarded.split(",") if hop.strip()]
+    for hop in reversed(hops):
+        if not _is_trusted_proxy(hop):
+            return hop
+    return hops[0] if hops else peer
+
+
+def _storage_uri() -> str:
+    if settings.RATE_LIMIT_STORAGE_ENABLED and settings.REDIS_URL:
+        return f"prefetch+{settings.REDIS_URL}"
+    return "memory://"
+
 
-limiter = Limiter(key_func=get_remote_address)
+limiter = Limiter(
+    key_func=get_client_ip,
+    storage_uri=_storage_uri(),
+    strategy="fixed-window",  # the Redis storage itself computes a sliding-window count
+)
@@ -0,0 +1,245 @@
+"""
+Canonical skill registry.
+
+Every known technology has a stable integer id, a canonical display name and
+optional synonyms ("Golang" -> Go, "Postgres" -> PostgreSQL). The registry is
+applied at ingest (tech extractor), at profile update and when filtering, so
+the hot paths compare integer ids (vacancies.skill_ids int[]) instead of
+lowercasing strings.
+
+Ids are persisted: append new skills with new ids, never renumber or reuse.
+"""
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+@dataclass(frozen=True)
+class Skill:
+    id: int
+    name: str
+    synonyms: Tuple[str, ...] = ()
+
+
+SKILLS: Tuple[Skill, ...] = (
+    # Languages
+    Skill(1, 'Python'),
+    Skill(2, 'JavaScript'),
+    Skill(3, 'TypeScript'),
+    Skill(4, 'Java'),
+    Skill(5, 'Go', ('Golang',)),
+    Skill(6, 'C#'),
+    Skill(7, 'C++'),
+    Skill(8, 'PHP'),
+    Skill(9, 'Ruby'),
+    Skill(10, 'Swift'),
+    Skill(11, 'Kotlin'),
+    Skill(12, 'Rust'),
+    Skill(13, 'Scala'),
+    Skill(14, 'Perl'),
+    Skill(15, 'R'),
+    Skill(16, 'Dart'),
+    Skill(17, 'Elixir'),
+
+    # Frontend
+    Skill(18, 'React', ('ReactJS',)),
+    Skill(19, 'Vue.js', ('Vue',)),
+    Skill(20, 'Angular'),
+    Skill(21, 'AngularJS'),
+    Skill(22, 'Svelte'),
+    Skill(23, 'Next.js'),
+    Skill(24, 'Nuxt'),
+    Skill(25, 'Gatsby'),
+    Skill(26, 'jQuery'),
+    Skill(27, 'Ember'),
+    Skill(28, 'Backbone'),
+    Skill(29, 'HTML', ('HTML5',)),
+    Skill(30, 'CSS', ('CSS3',)),
+    Skill(31, 'SASS'),
+    Skill(32, 'SCSS'),
+    Skill(33, 'LESS'),
+    Skill(34, 'Tailwind'),
+    Skill(35, 'Bootstrap'),
+    Skill(36, 'Material-UI'),
+    Skill(37, 'Ant Design'),
+    Skill(38, 'Chakra UI'),
+
+    # Backend/Frameworks
+    Skill(39, 'Node.js', ('Node',)),
+    Skill(40, 'Express'),
+    Skill(41, 'Django'),
+    Skill(42, 'Flask'),
+    Skill(43, 'FastAPI'),
+    Skill(44, 'Spring'),
+    Skill(45, 'Spring Boot'),
+    Skill(46, 'Laravel'),
+    Skill(47, 'Symfony'),
+    Skill(48, 'Ruby on Rails', ('Rails',)),
+    Skill(49, 'ASP.NET'),
+    Skill(50, '.NET'),
+    Skill(51, 'Gin'),
+    Skill(52, 'Echo'),
+    Skill(53, 'NestJS'),
+    Skill(54, 'Koa'),
+    Skill(55, 'Fastify'),
+
+    # Databases
+    Skill(56, 'PostgreSQL', ('Postgres',)),
+    Skill(57, 'MySQL'),
+    Skill(58, 'MongoDB'),
+    Skill(59, 'Redis'),
+    Skill(60, 'SQLite'),
+    Skill(61, 'Oracle'),
+    Skill(62, 'SQL Server', ('MS SQL',)),
+    Skill(63, 'MariaDB'),
+    Skill(64, 'Cassandra'),
+    Skill(65, 'DynamoDB'),
+    Skill(66, 'Elasticsearch'),
+    Skill(67, 'ClickHouse'),
+    Skill(68, 'CouchDB'),
+    Skill(69, 'Neo4j'),
+
+    # DevOps/Tools
+    Skill(70, 'Docker'),
+    Skill(71, 'Kubernetes', ('K8s',)),
+    Skill(72, 'Git'),
+    Skill(73, 'GitHub'),
+    Skill(74, 'GitLab'),
+    Skill(75, 'Bitbucket'),
+    Skill(76, 'DevOps'),
+    Skill(77, 'Jenkins'),
+    Skill(78, 'CircleCI'),
+    Skill(79, 'Travis CI'),
+    Skill(80, 'GitHub Actions'),
+    Skill(81, 'GitLab CI'),
+    Skill(82, 'Terraform'),
+    Skill(83, 'Ansible'),
+    Skill(84, 'Chef'),
+    Skill(85, 'Puppet'),
+    Skill(86, 'Vagrant'),
+    Skill(87, 'Linux'),
+    Skill(88, 'Ubuntu'),
+    Skill(89, 'CentOS'),
+    Skill(90, 'Debian'),
+    Skill(91, 'RHEL'),
+    Skill(92, 'Nginx'),
+    Skill(93, 'Apache'),
+    Skill(94, 'Tomcat'),
+    Skill(95, 'AWS'),
+    Skill(96, 'Azure'),
+    Skill(97, 'GCP', ('Google Cloud',)),
+    Skill(98, 'Heroku'),
+    Skill(99, 'DigitalOcean'),
+    Skill(100, 'Prometheus'),
+    Skill(101, 'Grafana'),
+    Skill(102, 'ELK'),
+    Skill(103, 'Kibana'),
+    Skill(104, 'Logstash'),
+
+    # Mobile
+    Skill(105, 'Android'),
+    Skill(106, 'iOS'),
+    Skill(107, 'React Native'),
+    Skill(108, 'Flutter'),
+    Skill(109, 'Xamarin'),
+    Skill(110, 'Ionic'),
+
+    # Data/ML
+    Skill(111, 'Pandas'),
+    Skill(112, 'NumPy'),
+    Skill(113, 'TensorFlow'),
+    Skill(114, 'PyTorch'),
+    Skill(115, 'Scikit-learn'),
+    Skill(116, 'Keras'),
+    Skill(117, 'Spark'),
+    Skill(118, 'Hadoop'),
+    Skill(119, 'Airflow'),
+    Skill(120, 'Kafka'),
+    Skill(121, 'RabbitMQ'),
+
+    # Testing
+    Skill(122, 'Jest'),
+    Skill(123, 'Mocha'),
+    Skill(124, 'Cypress'),
+    Skill(125, 'Selenium'),
+    Skill(126, 'Pytest'),
+    Skill(127, 'JUnit'),
+    Skill(128, 'TestNG'),
+
+    # Other
+    Skill(129, 'GraphQL'),
+    Skill(130, 'REST'),
+    Skill(131, 'gRPC'),
+    Skill(132, 'WebSocket'),
+    Skill(133, 'OAuth'),
+    Skill(134, 'JWT'),
+    Skill(135, 'Microservices'),
+    Skill(136, 'Agile'),
+    Skill(137, 'Scrum'),
+    Skill(138, 'CI/CD'),
+)
+
+
+class SkillRegistry:
+    """Lookup tables over SKILLS (case-insensitive names and synonyms)."""
+
+    def __init__(self, skills: Iterable[Skill]):
+        self._by_id: Dict[int, Skill] = {}
+        self._by_key: Dict[str, Skill] = {}
+        for skill in skills:
+            if skill.id in self._by_id:
+                raise ValueError(f"Duplicate skill id {skill.id}")
+            self._by_id[skill.id] = skill
+            for surface in (skill.name, *skill.synonyms):
+                key = surface.strip().lower()
+                if key in self._by_key:
+                    raise ValueError(f"Skill name '{surface}' is registered twice")
+                self._by_key[key] = skill
+
+    @property
+    def surface_forms(self) -> Dict[str, Skill]:
+        """Every lowercase name and synonym -> skill (used by the tech extractor)."""
+        return dict(self._by_key)
+
+    def lookup(self, name: Optional[str]) -> Optional[Skill]:
+        if not isinstance(name, str):
+            return None
+        return self._by_key.get(name.strip().lower())
+
+    def get(self, skill_id: int) -> Optional[Skill]:
+        return self._by_id.get(skill_id)
+
+    def ids(self, names: Optional[Iterable[str]]) -> List[int]:
+        """Sorted, de-duplicated ids of the known skills among names."""
+        found = {skill.id for skill in map(self.lookup, names or ()) if skill is not None}
+        return sorted(found)
+
+    def canonical_names(self, names: Optional[Iterable[str]]) -> List[str]:
+        """Canonical display names, de-duplicated in first-seen order; unknown names are dropped."""
+        result: List[str] = []
+        seen = set()
+        for name in names or ():
+            skill = self.lookup(name)
+            if skill is not None and skill.id not in seen:
+                seen.add(skill.id)
+                result.append(skill.name)
+        return result
+
+    def normalize_profile_skills(self, names: Optional[Iterable[str]]) -> List[str]:
+        """
+        Lowercase profile skills, mapping synonyms to the canonical name
+        ("Golang" -> "go"); unknown skills are kept as typed (lowercased).
+        """
+        result: List[str] = []
+        seen = set()
+        for name in names or ():
+            if not isinstance(name, str) or not name.strip():
+                continue
+            skill = self.lookup(name)
+            key = skill.name.lower() if skill is not None else name.strip().lower()
+            if key not in seen:
+                seen.add(key)
+                result.append(key)
+        return result
+
+
+SKILL_REGISTRY = SkillRegistry(SKILLS)
@@ -0,0 +1,177 @@
+"""
+In-process ingestion buffer for first-party analytics events.
+
+POST /api/analytics/events used to open a transaction per beacon. Events are
+now appended to a bounded per-process buffer and a background flusher writes
+them with one multi-row INSERT every ANALYTICS_FLUSH_BATCH_SIZE events or
+ANALYTICS_FLUSH_INTERVAL_MS, whichever comes first.
+
+Analytics is best effort: when the buffer is full new events are dropped
+(and counted) instead of slowing the request down, and a failed batch is
+logged and dropped rather than retried. Remaining events are flushed on
+shutdown.
+"""
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Deque, Dict, List, Optional
+
+from sqlalchemy import insert
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.models import AnalyticsEvent
+
+logger = logging.getLogger(__name__)
+
+Writer = Callable[[List[Dict[str, Any]]], Awaitable[None]]
+
+
+async def _insert_events(rows: List[Dict[str, Any]]) -> None:
+    async with AsyncSessionLocal() as session:
+        await session.execute(insert(AnalyticsEvent), rows)
+        await session.commit()
+
+
+@dataclass
+class AnalyticsBufferStats:
+    """Counters exposed for monitoring ingestion."""
+
+    accepted: int = 0
+    dropped: int = 0
+    written: int = 0
+    failed: int = 0
+    batches: int = 0
+    max_buffered: int = 0
+    flush_latency_total_ms: float = 0.0
+    flush_latency_max_ms: float = 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        avg = self.flush_latency_total_ms / self.batches if self.batches else 0.0
+        return {
+            "accepted": self.accepted,
+            "dropped": self.dropped,
+            "written": self.written,
+            "failed": self.failed,
+            "batches": self.batches,
+            "max_buffered": self.max_buffered,
+            "avg_flush_latency_ms": round(avg, 1),
+            "max_flush_latency_ms": round(self.flush_latency_max_ms, 1),
+        }
+
+
+class AnalyticsBuffer:
+    """Bounded event buffer drained by a single background flusher task."""
+
+    def __init__(
+        self,
+        max_events: int = 10000,
+        batch_size: int = 500,
+        flush_interval_ms: int = 1000,
+        writer: Optional[Writer] = None,
+    ):
+        self._max_events = max(1, max_events)
+        self._batch_size = max(1, batch_size)
+        self._flush_interval = max(1, flush_interval_ms) / 1000
+        self._writer = writer or _insert_events
+        self._events: Deque[Dict[str, Any]] = deque()
+        self._wake: Optional[asyncio.Event] = None
+        self._flusher: Optional[asyncio.Task] = None
+        self._stopping = False
+        self.stats = AnalyticsBufferStats()
+
+    def _ensure_flusher(self) -> None:
+        """Start the flusher lazily on the running loop (restarting it if the loop changed)."""
+        loop = asyncio.get_running_loop()
+        if self._flusher is not None and not self._flusher.done() and self._flusher.get_loop() is loop:
+            return
+        self._stopping = False
+        self._wake = asyncio.Event()
+        self._flusher = loop.create_task(self._run(), name="analytics-flusher")
+
+    def submit(self, rows: List[Dict[str, Any]]) -> int:
+        """Buffer rows for insertion and return how many were accepted (the rest are dropped)."""
+        self._ensure_flusher()
+        free = self._max_events - len(self._events)
+        accepted = rows[:max(0, free)]
+        if len(accepted) < len(rows):
+            dropped = len(rows) - len(accepted)
+            self.stats.dropped += dropped
+            logger.warning("analytics_buffer_full dropped=%d buffered=%d", dropped, len(self._events))
+
+        self._events.extend(accepted)
+        self.stats.accepted += len(accepted)
+        self.stats.max_buffered = max(self.stats.max_buffered, len(self._events))
+        if len(self._events) >= self._batch_size:
+            self._wake.set()
+        return len(accepted)
+
+    async def _run(self) -> None:
+        while not self._stopping:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self._flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await self.flush()
+
+    async def flush(self) -> None:
+        """Write everything currently buffered, one batch at a time."""
+        while self._events:
+            batch = [self._events.popleft() for _ in range(min(self._batch_size, len(self._events)))]
+            started = time.perf_counter()
+            try:
+                await self._writer(batch)
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                self.stats.failed += len(batch)
+                logger.warning("analytics_flush_error events=%d error=%s", len(batch), exc)
+            else:
+                self.stats.written += len(batch)
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self.stats.batches += 1
+            self.stats.flush_latency_total_ms += elapsed_ms
+            self.stats.flush_latency_max_ms = max(self.stats.flush_latency_max_ms, elapsed_ms)
+
+    def get_stats(self) -> Dict[str, float]:
+        data = self.stats.to_dict()
+        data["buffered"] = len(self._events)
+        data["max_events"] = self._max_events
+        data["batch_size"] = self._batch_size
+        data["flush_interval_ms"] = int(self._flush_interval * 1000)
+        return data
+
+    async def shutdown(self) -> None:
+        """Stop the flusher and write whatever is still buffered."""
+        flusher, self._flusher = self._flusher, None
+        self._stopping = True
+        if flusher is not None and not flusher.done():
+            if flusher.get_loop() is asyncio.get_running_loop():
+                self._wake.set()
+                await asyncio.gather(flusher, return_exceptions=True)
+            else:
+                flusher.cancel()
+        await self.flush()
+
+
+_buffer: Optional[AnalyticsBuffer] = None
+
+
+def get_analytics_buffer() -> AnalyticsBuffer:
+    """Get or create the analytics buffer singleton."""
+    global _buffer
+    if _buffer is None:
+        _buffer = AnalyticsBuffer(
+            max_events=settings.ANALYTICS_BUFFER_MAX_EVENTS,
+            batch_size=settings.ANALYTICS_FLUSH_BATCH_SIZE,
+            flush_interval_ms=settings.ANALYTICS_FLUSH_INTERVAL_MS,
+        )
+    return _buffer
+
+
+async def shutdown_analytics_buffer() -> None:
+    if _buffer is not None:
+        await _buffer.shutdown()
@@ -3,15 +3,18 @@ Cache helper functions for endpoint-level caching.
 
 Features:
 - Normalized cache keys from path + query params
-- JSON serialization/deserialization
+- JSON serialization/deserialization (orjson)
+- Pre-encoded bodies: hits return the stored JSON bytes as-is
 - Fail-open behavior (API works even if Redis is down)
 - Cache hit/miss logging with request tracking
 """
-import json
 import logging
 import hashlib
 from typing import Optional, Any
 from urllib.parse import urlencode, parse_qs
+
+import orjson
+
 from app.config import settings
 from app.infra.redis_client import get_redis
 
@@ -41,14 +44,9 @@ def build_cache_key(path: str, query_params: dict) -> str:
     return key
 
 
-def _serialize_response(data: Any) -> str:
-    """Serialize response data to JSON string."""
-    return json.dumps(data, ensure_ascii=False, separators=(',', ':'))
-
-
-def _deserialize_response(data: str) -> Any:
-    """Deserialize JSON string to Python object."""
-    return json.loads(data)
+def encode_json(data: Any) -> bytes:
+    """Encode JSON-compatible data (e.g. model_dump(mode="json")) to compact UTF-8 bytes."""
+    return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS)
 
 
 async def get_cached_response(cache_key: str, request_id: Optional[str] = None) -> Optional[Any]:
@@ -62,6 +60,25 @@ async def get_cached_response(cache_key: str, request_id: Optional[str] = None)
     Returns:
         Cached response data if found, None otherwise
     """
+    body = await get_cached_body(cache_key, request_id)
+    if body is None:
+        return None
+    try:
+        return orjson.loads(body)
+    except orjson.JSONDecodeError as e:
+        logger.warning(
+            f"cache_error operation=decode cache_key={cache_key} error={e} request_id={request_id or 'N/A'}"
+        )
+        return None
+
+
+async def get_cached_body(cache_key: str, request_id: Optional[str] = None) -> Optional[bytes]:
+    """
+    Get a cached, already encoded JSON body from Redis.
+
+    Returns:
+        The stored JSON bytes if found, None otherwise
+    """
     if not settings.CACHE_ENABLED:
         return None
 
@@ -75,7 +92,7 @@ async def get_cached_response(cache_key: str, request_id: Optional[str] = None)
             logger.info(
                 f"cache_hit cache_key={cache_key} request_id={request_id or 'N/A'}"
             )
-            return _deserialize_response(cached_value)
+            return cached_value.encode("utf-8") if isinstance(cached_value, str) else cached_value
         else:
             logger.info(
                 f"cache_miss cache_key={cache_key} request_id={request_id or 'N/A'}"
@@ -107,6 +124,25 @@ async def set_cached_response(
     Returns:
         True if cached successfully, False otherwise
     """
+    if not settings.CACHE_ENABLED or get_redis() is None:
+        return False
+    try:
+        body = encode_json(data)
+    except TypeError as e:
+        logger.warning(
+            f"cache_error operation=encode cache_key={cache_key} error={e} request_id={request_id or 'N/A'}"
+        )
+        return False
+    return await set_cached_body(cache_key, body, ttl_seconds, request_id)
+
+
+async def set_cached_body(
+    cache_key: str,
+    body: bytes,
+    ttl_seconds: Optional[int] = None,
+    request_id: Optional[str] = None
+) -> bool:
+    """Store an encoded JSON body in Redis with TTL (see set_cached_response)."""
     if not settings.CACHE_ENABLED:
         return False
 
@@ -118,8 +154,7 @@ async def set_cached_response(
         ttl_seconds = settings.CACHE_TTL_SECONDS
 
     try:
-        serialized = _serialize_response(data)
-        await redis.setex(cache_key, ttl_seconds, serialized)
+        await redis.setex(cache_key, ttl_seconds, body)
         logger.info(
             f"cache_set cache_key={cache_key} ttl={ttl_seconds}s request_id={request_id or 'N/A'}"
         )
@@ -130,3 +165,50 @@ async def set_cached_response(
             f"cache_error operation=set cache_key={cache_key} error={e} request_id={request_id or 'N/A'}"
         )
         return False
+
+
+DATASET_GENERATION_KEY = "cache:v1:dataset_generation"
+
+
+async def read_dataset_generation() -> Optional[int]:
+    """
+    Current dataset generation, or None when Redis is unavailable.
+
+    Use this where a stale generation would be wrong rather than merely
+    wasteful (e.g. HTTP validators): without Redis the generation never moves.
+    """
+    redis = get_redis()
+    if redis is None:
+        return None
+
+    try:
+        value = await redis.get(DATASET_GENERATION_KEY)
+        return int(value) if value is not None else 0
+    except Exception as e:
+        logger.warning(f"cache_error operation=get_generation error={e}")
+        return None
+
+
+async def get_dataset_generation() -> int:
+    """
+    Current dataset generation (bumped after each scrape/cleanup cycle).
+
+    Cache keys that embed the generation are invalidated wholesale by a bump.
+    Returns 0 when Redis is unavailable.
+    """
+    return await read_dataset_generation() or 0
+
+
+async def bump_dataset_generation() -> Optional[int]:
+    """Advance the dataset generation; returns the new value or None on failure."""
+    redis = get_redis()
+    if redis is None:
+        return None
+
+    try:
+        generation = await redis.incr(DATASET_GENERATION_KEY)
+        logger.info(f"cache_generation_bump generation={generation}")
+        return int(generation)
+    except Exception as e:
+        logger.warning(f"cache_error operation=bump_generation error={e}")
+        return None
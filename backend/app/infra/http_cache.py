@@ -0,0 +1,127 @@
+"""
+HTTP conditional-request helpers (ETag / If-None-Match).
+
+Features:
+- Pre-encoded JSON bodies paired with a strong ETag
+- If-None-Match handling (lists, weak validators and "*") returning 304
+- Cache-Control / ETag headers on both 200 and 304 responses
+- Weak validators for dataset-derived GET endpoints (dataset generation +
+  request path/query), checked before any database or cache work
+"""
+import functools
+import hashlib
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from fastapi import Request
+from fastapi.responses import Response
+
+from app.config import settings
+from app.infra.cache import read_dataset_generation
+
+
+@dataclass(frozen=True)
+class EncodedPayload:
+    """A JSON body encoded once, with its strong ETag."""
+    body: bytes
+    etag: str
+
+    @classmethod
+    def from_bytes(cls, body: bytes) -> "EncodedPayload":
+        return cls(body=body, etag=make_etag(body))
+
+
+def make_etag(*parts: bytes) -> str:
+    """Strong ETag over the given byte strings."""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part)
+    return f'"{digest.hexdigest()[:32]}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    """True if If-None-Match matches etag (weak comparison, per RFC 9110)."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    if header.strip() == "*":
+        return True
+    target = etag[2:] if etag.startswith("W/") else etag
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == target:
+            return True
+    return False
+
+
+def conditional_response(
+    request: Request,
+    body: bytes,
+    etag: str,
+    cache_control: Optional[str] = None,
+    media_type: str = "application/json",
+) -> Response:
+    """Return 304 if the client already has this ETag, otherwise the body."""
+    headers = {"ETag": etag}
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type=media_type, headers=headers)
+
+
+def dataset_cache_control() -> str:
+    return f"public, max-age={settings.HTTP_CACHE_MAX_AGE_SECONDS}"
+
+
+def validator_headers(etag: str, cache_control: Optional[str] = None) -> Dict[str, str]:
+    return {"ETag": etag, "Cache-Control": cache_control or dataset_cache_control()}
+
+
+def not_modified(request: Request, etag: str, cache_control: Optional[str] = None) -> Optional[Response]:
+    """A 304 response if the client already has etag, else None."""
+    if etag_matches(request, etag):
+        return Response(status_code=304, headers=validator_headers(etag, cache_control))
+    return None
+
+
+def dataset_etag(generation: int, request: Request, *parts: str) -> str:
+    """Weak ETag for a response determined by the dataset generation, path, query and extra parts."""
+    key = "\n".join([request.url.path, *sorted(f"{k}={v}" for k, v in request.query_params.multi_items()), *parts])
+    return f'W/"g{generation}-{hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]}"'
+
+
+def dataset_validated(func):
+    """
+    Conditional GET for handlers whose output only changes with the dataset generation.
+
+    The handler must receive a Request and a Response (fastapi-cache's @cache
+    injects both; apply this decorator outside it so these validators replace
+    its per-process ones). A matching If-None-Match returns 304 before the
+    handler runs. Without Redis no validators are sent, since the generation
+    never moves. The generation is left on request.state.dataset_generation.
+    """
+    @functools.wraps(func)
+    async def wrapper(*args, **kwargs):
+        request = next((value for value in kwargs.values() if isinstance(value, Request)), None)
+        generation = await read_dataset_generation() if request is not None else None
+        if generation is None:
+            return await func(*args, **kwargs)
+
+        request.state.dataset_generation = generation
+        etag = dataset_etag(generation, request)
+        cached = not_modified(request, etag)
+        if cached is not None:
+            return cached
+
+        result = await func(*args, **kwargs)
+        response = result if isinstance(result, Response) else next(
+            (value for value in kwargs.values() if isinstance(value, Response)), None
+        )
+        if response is not None:
+            response.headers.update(validator_headers(etag))
+        return result
+
+    return wrapper
@@ -0,0 +1,192 @@
+"""
+Dedicated, bounded executor for bcrypt.
+
+bcrypt is deliberately slow (~0.3 s at cost 12) and holds a core while it
+runs. Running it through asyncio.to_thread shares the default threadpool
+with the interview endpoints, so a burst of logins could starve them.
+PasswordHasher runs hashing in its own process pool (sized to the cores by
+default) and caps in-flight work: past the cap it raises
+PasswordHasherBusy immediately, which the auth layer turns into a 503,
+instead of queueing logins for seconds.
+
+verify_and_update() also reports a replacement hash when the stored one
+uses a lower bcrypt cost than configured, so costs are upgraded on login.
+"""
+import asyncio
+import logging
+import os
+import threading
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Tuple
+
+from passlib.context import CryptContext
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Worker side: one CryptContext per process and cost.
+_contexts: Dict[int, CryptContext] = {}
+
+
+def build_crypt_context(rounds: int) -> CryptContext:
+    """bcrypt context hashing at `rounds` and flagging cheaper hashes for upgrade."""
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__default_rounds=rounds,
+        bcrypt__min_rounds=rounds,
+    )
+
+
+def _context(rounds: int) -> CryptContext:
+    context = _contexts.get(rounds)
+    if context is None:
+        context = _contexts[rounds] = build_crypt_context(rounds)
+    return context
+
+
+def _hash(password: str, rounds: int) -> str:
+    return _context(rounds).hash(password)
+
+
+def _verify_and_update(password: str, hashed: str, rounds: int) -> Tuple[bool, Optional[str]]:
+    return _context(rounds).verify_and_update(password, hashed)
+
+
+class PasswordHasherBusy(Exception):
+    """Raised when the hashing pool already has its maximum of pending jobs."""
+    pass
+
+
+@dataclass
+class PasswordHasherStats:
+    """Counters exposed for monitoring the hashing pool."""
+
+    hashes: int = 0
+    verifications: int = 0
+    rehashes: int = 0
+    rejected: int = 0
+    failures: int = 0
+    max_in_flight: int = 0
+    latency_total_ms: float = 0.0
+    latency_max_ms: float = 0.0
+
+    @property
+    def completed(self) -> int:
+        return self.hashes + self.verifications
+
+    @property
+    def avg_latency_ms(self) -> float:
+        return self.latency_total_ms / self.completed if self.completed else 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "hashes": self.hashes,
+            "verifications": self.verifications,
+            "rehashes": self.rehashes,
+            "rejected": self.rejected,
+            "failures": self.failures,
+            "max_in_flight": self.max_in_flight,
+            "avg_latency_ms": round(self.avg_latency_ms, 1),
+            "max_latency_ms": round(self.latency_max_ms, 1),
+        }
+
+
+class PasswordHasher:
+    """Runs bcrypt in a dedicated bounded executor (a process pool by default)."""
+
+    def __init__(
+        self,
+        rounds: int = 12,
+        workers: Optional[int] = None,
+        max_pending: Optional[int] = None,
+        executor_factory: Optional[Callable[[int], Executor]] = None,
+    ):
+        self._rounds = rounds
+        self._workers = max(1, workers or os.cpu_count() or 1)
+        # Jobs allowed in flight (running + queued) before new ones are rejected.
+        self._max_pending = max(self._workers, max_pending or self._workers * 4)
+        self._executor_factory = executor_factory or (lambda n: ProcessPoolExecutor(max_workers=n))
+        self._executor: Optional[Executor] = None
+        self._executor_lock = threading.Lock()
+        self._in_flight = 0
+        self.stats = PasswordHasherStats()
+
+    def _get_executor(self) -> Executor:
+        executor = self._executor
+        if executor is None:
+            with self._executor_lock:
+                executor = self._executor
+                if executor is None:
+                    executor = self._executor = self._executor_factory(self._workers)
+        return executor
+
+    async def _run(self, fn, *args):
+        if self._in_flight >= self._max_pending:
+            self.stats.rejected += 1
+            logger.warning("password_hasher_busy in_flight=%d max_pending=%d", self._in_flight, self._max_pending)
+            raise PasswordHasherBusy()
+
+        self._in_flight += 1
+        self.stats.max_in_flight = max(self.stats.max_in_flight, self._in_flight)
+        started = time.perf_counter()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._get_executor(), fn, *args)
+        except Exception:
+            self.stats.failures += 1
+            raise
+        finally:
+            self._in_flight -= 1
+            elapsed_ms = (time.perf_counter() - started) * 1000
+            self.stats.latency_total_ms += elapsed_ms
+            self.stats.latency_max_ms = max(self.stats.latency_max_ms, elapsed_ms)
+
+    async def hash(self, password: str) -> str:
+        hashed = await self._run(_hash, password, self._rounds)
+        self.stats.hashes += 1
+        return hashed
+
+    async def verify_and_update(self, password: str, hashed: str) -> Tuple[bool, Optional[str]]:
+        """Return (valid, new_hash); new_hash is set when the stored hash should be upgraded."""
+        valid, new_hash = await self._run(_verify_and_update, password, hashed, self._rounds)
+        self.stats.verifications += 1
+        if new_hash is not None:
+            self.stats.rehashes += 1
+        return valid, new_hash
+
+    def get_stats(self) -> Dict[str, float]:
+        data = self.stats.to_dict()
+        data["in_flight"] = self._in_flight
+        data["workers"] = self._workers
+        data["max_pending"] = self._max_pending
+        data["rounds"] = self._rounds
+        return data
+
+    def shutdown(self) -> None:
+        with self._executor_lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+_hasher: Optional[PasswordHasher] = None
+
+
+def get_password_hasher() -> PasswordHasher:
+    """Get or create the password hasher singleton."""
+    global _hasher
+    if _hasher is None:
+        _hasher = PasswordHasher(
+            rounds=settings.BCRYPT_ROUNDS,
+            workers=settings.PASSWORD_HASH_WORKERS or None,
+            max_pending=settings.PASSWORD_HASH_MAX_PENDING or None,
+        )
+    return _hasher
+
+
+def shutdown_password_hasher() -> None:
+    if _hasher is not None:
+        _hasher.shutdown()
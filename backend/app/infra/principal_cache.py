@@ -0,0 +1,189 @@
+"""
+Short-TTL cache of authenticated principals.
+
+get_current_principal() (app.auth) resolves a bearer token to a Principal
+without a database round trip in the common case:
+
+1. per-process TTL LRU (a few seconds, bounds staleness across workers)
+2. Redis (principal:v1:{user_id}, TTL PRINCIPAL_CACHE_TTL_SECONDS)
+3. SELECT users ... (the result is written back to both levels)
+
+Entries are keyed by user id and carry the user's token_version; a token
+whose "ver" claim does not match is never served from cache. Callers
+invalidate on profile update, role change, email verification, logout-all
+and account deletion.
+
+Fail-open: any Redis problem degrades to the local LRU and the database.
+"""
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from typing import Optional, Tuple
+
+from app.config import settings
+from app.infra.redis_client import get_redis
+
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = "principal:v1:"
+
+
+@dataclass(frozen=True)
+class Principal:
+    """The authenticated user's fields needed by request handlers (read-only)."""
+    id: int
+    email: str
+    username: str
+    role: str
+    is_active: bool
+    token_version: int
+    email_verified: bool
+    email_verified_at: Optional[datetime] = None
+    full_name: Optional[str] = None
+    location: Optional[str] = None
+    grade: Optional[str] = None
+    skills: Tuple[str, ...] = ()
+    bio: Optional[str] = None
+
+    @classmethod
+    def from_user(cls, user) -> "Principal":
+        return cls(
+            id=user.id,
+            email=user.email,
+            username=user.username,
+            role=user.role,
+            is_active=user.is_active,
+            token_version=user.token_version or 0,
+            email_verified=bool(user.email_verified),
+            email_verified_at=user.email_verified_at,
+            full_name=user.full_name,
+            location=user.location,
+            grade=user.grade,
+            skills=tuple(user.skills or ()),
+            bio=user.bio,
+        )
+
+    def to_json(self) -> str:
+        data = asdict(self)
+        data["skills"] = list(self.skills)
+        if self.email_verified_at is not None:
+            data["email_verified_at"] = self.email_verified_at.isoformat()
+        return json.dumps(data, ensure_ascii=False, separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, payload: str) -> "Principal":
+        data = json.loads(payload)
+        data["skills"] = tuple(data.get("skills") or ())
+        if data.get("email_verified_at"):
+            data["email_verified_at"] = datetime.fromisoformat(data["email_verified_at"])
+        return cls(**data)
+
+
+def _redis_key(user_id: int) -> str:
+    return f"{_KEY_PREFIX}{user_id}"
+
+
+class PrincipalCache:
+    """Two-level (local TTL LRU + Redis) principal cache keyed by user id."""
+
+    def __init__(
+        self,
+        ttl_seconds: int = 60,
+        local_ttl_seconds: float = 5.0,
+        max_entries: int = 10000,
+    ):
+        self._ttl_seconds = ttl_seconds
+        self._local_ttl_seconds = local_ttl_seconds
+        self._max_entries = max(1, max_entries)
+        self._local: "OrderedDict[int, Tuple[float, Principal]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _local_get(self, user_id: int) -> Optional[Principal]:
+        now = time.monotonic()
+        with self._lock:
+            entry = self._local.get(user_id)
+            if entry is None:
+                return None
+            expires_at, principal = entry
+            if expires_at <= now:
+                del self._local[user_id]
+                return None
+            self._local.move_to_end(user_id)
+            return principal
+
+    def _local_set(self, principal: Principal) -> None:
+        if self._local_ttl_seconds <= 0:
+            return
+        with self._lock:
+            self._local[principal.id] = (time.monotonic() + self._local_ttl_seconds, principal)
+            self._local.move_to_end(principal.id)
+            while len(self._local) > self._max_entries:
+                self._local.popitem(last=False)
+
+    async def get(self, user_id: int, token_version: int) -> Optional[Principal]:
+        """Cached principal for user_id, only if it was issued the same token version."""
+        principal = self._local_get(user_id)
+        if principal is None:
+            redis = get_redis()
+            if redis is not None:
+                try:
+                    payload = await redis.get(_redis_key(user_id))
+                except Exception as exc:
+                    logger.warning("principal_cache_error operation=get user_id=%s error=%s", user_id, exc)
+                    payload = None
+                if payload is not None:
+                    try:
+                        principal = Principal.from_json(payload)
+                    except (ValueError, TypeError) as exc:
+                        logger.warning("principal_cache_error operation=decode user_id=%s error=%s", user_id, exc)
+                        principal = None
+                    if principal is not None:
+                        self._local_set(principal)
+        if principal is None or principal.token_version != token_version:
+            return None
+        return principal
+
+    async def set(self, principal: Principal) -> None:
+        self._local_set(principal)
+        redis = get_redis()
+        if redis is None:
+            return
+        try:
+            await redis.set(_redis_key(principal.id), principal.to_json(), ex=self._ttl_seconds)
+        except Exception as exc:
+            logger.warning("principal_cache_error operation=set user_id=%s error=%s", principal.id, exc)
+
+    async def invalidate(self, user_id: int) -> None:
+        with self._lock:
+            self._local.pop(user_id, None)
+        redis = get_redis()
+        if redis is None:
+            return
+        try:
+            await redis.delete(_redis_key(user_id))
+        except Exception as exc:
+            logger.warning("principal_cache_error operation=invalidate user_id=%s error=%s", user_id, exc)
+
+
+_principal_cache: Optional[PrincipalCache] = None
+
+
+def get_principal_cache() -> PrincipalCache:
+    """Get or create the principal cache singleton."""
+    global _principal_cache
+    if _principal_cache is None:
+        _principal_cache = PrincipalCache(
+            ttl_seconds=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+            local_ttl_seconds=settings.PRINCIPAL_CACHE_LOCAL_TTL_SECONDS,
+            max_entries=settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+        )
+    return _principal_cache
+
+
+async def invalidate_principal(user_id: int) -> None:
+    """Drop a user's cached principal (call after committing a change to the user)."""
+    await get_principal_cache().invalidate(user_id)
@@ -0,0 +1,318 @@
+"""
+Redis-backed storage for slowapi/limits, shared by all workers.
+
+slowapi's default in-memory storage counts per process, so every uvicorn
+worker enforced its own "100/minute". PrefetchRedisStorage (registered for
+the "prefetch+redis://" / "prefetch+rediss://" schemes) keeps the counters
+in Redis:
+
+- Sliding-window counter, computed atomically by one Lua script: the
+  current fixed window plus the previous one weighted by how much of it
+  still overlaps the sliding window. Used with the "fixed-window" strategy,
+  which only compares the returned count with the limit.
+- Local prefetch: for generous limits (e.g. 100/minute) a client that is
+  bursting (its previous reservation ran out within
+  RATE_LIMIT_PREFETCH_MAX_AGE_SECONDS) gets a small batch of hits reserved
+  in one round trip, served locally for up to that age. Other requests
+  reserve exactly their own hit, so sparse clients are counted exactly.
+  Strict limits (login: 5/minute) always go to Redis. Hits left unused
+  when a burst ends (at most one batch per burst) make the shared limit
+  slightly stricter, never looser.
+- Fail open: on Redis errors the storage counts in process memory (the old
+  behaviour) and retries Redis after a short back-off.
+
+Per-route counters (checks, rejections, Redis round trips, latency) are
+kept in RateLimitStats.
+"""
+import logging
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import redis
+from limits.limits import GRANULARITIES
+from limits.storage import MemoryStorage, Storage
+from redis.exceptions import RedisError
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+_KEY_PREFIX = "ratelimit:v1:"
+_RETRY_AFTER_ERROR_SECONDS = 5.0
+_MAX_RESERVATIONS = 10000
+
+# KEYS[1] = current window counter, KEYS[2] = previous window counter
+# ARGV = amount, window_ms, elapsed_ms (time since the current window started)
+# Returns the sliding-window count including this increment.
+_SLIDING_WINDOW_SCRIPT = """
+local amount = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local elapsed = tonumber(ARGV[3])
+local current = redis.call('INCRBY', KEYS[1], amount)
+if current == amount then
+    redis.call('PEXPIRE', KEYS[1], window * 2)
+end
+local previous = tonumber(redis.call('GET', KEYS[2]) or '0')
+return math.floor(previous * (window - elapsed) / window) + current
+"""
+
+
+@dataclass
+class RouteRateLimitStats:
+    checks: int = 0
+    rejected: int = 0
+    local_hits: int = 0
+    redis_calls: int = 0
+    redis_latency_total_ms: float = 0.0
+    redis_latency_max_ms: float = 0.0
+
+    def to_dict(self) -> Dict[str, float]:
+        avg = self.redis_latency_total_ms / self.redis_calls if self.redis_calls else 0.0
+        return {
+            "checks": self.checks,
+            "rejected": self.rejected,
+            "local_hits": self.local_hits,
+            "redis_calls": self.redis_calls,
+            "avg_redis_latency_ms": round(avg, 3),
+            "max_redis_latency_ms": round(self.redis_latency_max_ms, 3),
+        }
+
+
+class RateLimitStats:
+    """Per-route rate limit counters (route = the limit scope, i.e. the request path)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._routes: Dict[str, RouteRateLimitStats] = defaultdict(RouteRateLimitStats)
+        self.redis_errors = 0
+        self.fallback_checks = 0
+
+    def record(
+        self,
+        route: str,
+        rejected: bool,
+        local_hit: bool = False,
+        redis_latency_ms: Optional[float] = None,
+    ) -> None:
+        with self._lock:
+            stats = self._routes[route]
+            stats.checks += 1
+            if rejected:
+                stats.rejected += 1
+            if local_hit:
+                stats.local_hits += 1
+            if redis_latency_ms is not None:
+                stats.redis_calls += 1
+                stats.redis_latency_total_ms += redis_latency_ms
+                stats.redis_latency_max_ms = max(stats.redis_latency_max_ms, redis_latency_ms)
+
+    def to_dict(self) -> Dict[str, object]:
+        with self._lock:
+            return {
+                "redis_errors": self.redis_errors,
+                "fallback_checks": self.fallback_checks,
+                "routes": {route: stats.to_dict() for route, stats in sorted(self._routes.items())},
+            }
+
+
+rate_limit_stats = RateLimitStats()
+
+
+def parse_limit_key(key: str) -> Tuple[str, int]:
+    """
+    (route, limit amount) from a limits key.
+
+    Keys look like "LIMITER/<client>/<scope>/<amount>/<multiples>/<granularity>",
+    where the scope is the request path (and may contain slashes).
+    """
+    head, amount, _, _ = key.rsplit("/", 3)
+    parts = head.split("/", 2)
+    route = parts[2] if len(parts) == 3 else head
+    try:
+        return route, int(amount)
+    except ValueError:
+        return route, 0
+
+
+@dataclass
+class _Reservation:
+    window_index: int
+    fetched_at: float
+    count: int  # sliding-window count of the last hit served
+    remaining: int  # reserved hits not yet served
+
+
+class PrefetchRedisStorage(Storage):
+    """limits storage: atomic Redis sliding-window counter with local prefetch (fail-open)."""
+
+    STORAGE_SCHEME = ["prefetch+redis", "prefetch+rediss"]
+
+    def __init__(
+        self,
+        uri: str,
+        wrap_exceptions: bool = False,
+        prefetch_max: Optional[int] = None,
+        prefetch_max_age_seconds: Optional[float] = None,
+        socket_timeout: Optional[float] = None,
+        client: Optional[redis.Redis] = None,
+        **options,
+    ):
+        super().__init__(uri, wrap_exceptions=wrap_exceptions, **options)
+        timeout = socket_timeout if socket_timeout is not None else settings.RATE_LIMIT_REDIS_TIMEOUT_SECONDS
+        self._redis = client or redis.Redis.from_url(
+            uri.replace("prefetch+", "", 1),
+            socket_timeout=timeout,
+            socket_connect_timeout=timeout,
+        )
+        self._script = self._redis.register_script(_SLIDING_WINDOW_SCRIPT)
+        self._prefetch_max = prefetch_max if prefetch_max is not None else settings.RATE_LIMIT_PREFETCH_MAX
+        self._prefetch_max_age = (
+            prefetch_max_age_seconds
+            if prefetch_max_age_seconds is not None
+            else settings.RATE_LIMIT_PREFETCH_MAX_AGE_SECONDS
+        )
+        self._reservations: Dict[str, _Reservation] = {}
+        self._lock = threading.Lock()
+        self._fallback = MemoryStorage()
+        self._redis_retry_at = 0.0
+
+    @property
+    def base_exceptions(self):
+        return RedisError
+
+    def _batch_size(self, limit_amount: int, amount: int) -> int:
+        # Reserve at most 5% of the limit per round trip; strict limits get no prefetch.
+        return max(amount, min(self._prefetch_max, limit_amount // 20))
+
+    def _take_local(self, key: str, window_index: int, amount: int) -> Tuple[Optional[int], bool]:
+        """
+        (count, False) when served from the reservation, else (None, prefetch).
+
+        prefetch is True when the reservation is still fresh but used up, i.e.
+        the client is bursting and the next round trip should reserve a batch.
+        """
+        with self._lock:
+            reservation = self._reservations.get(key)
+            if reservation is None:
+                return None, False
+            fresh = (
+                reservation.window_index == window_index
+                and time.monotonic() - reservation.fetched_at <= self._prefetch_max_age
+            )
+            if not fresh or reservation.remaining < amount:
+                del self._reservations[key]
+                return None, fresh
+            reservation.remaining -= amount
+            reservation.count += amount
+            return reservation.count, False
+
+    def _prune_reservations(self) -> None:
+        """Drop expired reservations (caller holds the lock); clear all if none expired."""
+        cutoff = time.monotonic() - self._prefetch_max_age
+        stale = [key for key, reservation in self._reservations.items() if reservation.fetched_at < cutoff]
+        for key in stale:
+            del self._reservations[key]
+        if not stale:
+            self._reservations.clear()
+
+    def incr(self, key: str, expiry: float, amount: int = 1) -> int:
+        route, limit_amount = parse_limit_key(key)
+        window_ms = max(1, int(expiry * 1000))
+        now_ms = int(time.time() * 1000)
+        window_index, elapsed_ms = divmod(now_ms, window_ms)
+
+        count, prefetch = self._take_local(key, window_index, amount)
+        if count is not None:
+            rate_limit_stats.record(route, rejected=count > limit_amount, local_hit=True)
+            return count
+
+        if time.monotonic() < self._redis_retry_at:
+            return self._fallback_incr(route, key, expiry, amount, limit_amount)
+
+        max_batch = self._batch_size(limit_amount, amount)
+        batch = max_batch if prefetch else amount
+        base = f"{_KEY_PREFIX}{key}"
+        started = time.perf_counter()
+        try:
+            total = int(self._script(
+                keys=[f"{base}:{window_index}", f"{base}:{window_index - 1}"],
+                args=[batch, window_ms, elapsed_ms],
+            ))
+        except RedisError as exc:
+            rate_limit_stats.redis_errors += 1
+            self._redis_retry_at = time.monotonic() + _RETRY_AFTER_ERROR_SECONDS
+            logger.warning("rate_limit_storage_error operation=incr error=%s", exc)
+            return self._fallback_incr(route, key, expiry, amount, limit_amount)
+        latency_ms = (time.perf_counter() - started) * 1000
+
+        count = total - batch + amount
+        if max_batch > amount:
+            # Kept even when empty: using it up within the max age marks a burst.
+            with self._lock:
+                if len(self._reservations) >= _MAX_RESERVATIONS:
+                    self._prune_reservations()
+                self._reservations[key] = _Reservation(
+                    window_index=window_index,
+                    fetched_at=time.monotonic(),
+                    count=count,
+                    remaining=batch - amount,
+                )
+        rate_limit_stats.record(route, rejected=count > limit_amount, redis_latency_ms=latency_ms)
+        return count
+
+    def _fallback_incr(self, route: str, key: str, expiry: float, amount: int, limit_amount: int) -> int:
+        rate_limit_stats.fallback_checks += 1
+        count = self._fallback.incr(key, expiry, amount=amount)
+        rate_limit_stats.record(route, rejected=count > limit_amount)
+        return count
+
+    def get(self, key: str) -> int:
+        window_ms = max(1, int(self._expiry_for(key) * 1000))
+        window_index, elapsed_ms = divmod(int(time.time() * 1000), window_ms)
+        base = f"{_KEY_PREFIX}{key}"
+        try:
+            current, previous = self._redis.mget(f"{base}:{window_index}", f"{base}:{window_index - 1}")
+        except RedisError:
+            return self._fallback.get(key)
+        return int(int(previous or 0) * (window_ms - elapsed_ms) / window_ms) + int(current or 0)
+
+    def get_expiry(self, key: str) -> float:
+        window = self._expiry_for(key)
+        now = time.time()
+        return now + (window - now % window)
+
+    @staticmethod
+    def _expiry_for(key: str) -> float:
+        _, multiples, granularity = key.rsplit("/", 3)[1:]
+        return int(multiples) * GRANULARITIES[granularity].seconds
+
+    def check(self) -> bool:
+        try:
+            return bool(self._redis.ping())
+        except RedisError:
+            return False
+
+    def reset(self) -> Optional[int]:
+        with self._lock:
+            self._reservations.clear()
+        self._fallback.reset()
+        deleted = 0
+        try:
+            for key in self._redis.scan_iter(match=f"{_KEY_PREFIX}*", count=1000):
+                deleted += self._redis.delete(key)
+        except RedisError as exc:
+            logger.warning("rate_limit_storage_error operation=reset error=%s", exc)
+        return deleted
+
+    def clear(self, key: str) -> None:
+        with self._lock:
+            self._reservations.pop(key, None)
+        self._fallback.clear(key)
+        try:
+            for redis_key in self._redis.scan_iter(match=f"{_KEY_PREFIX}{key}:*", count=100):
+                self._redis.delete(redis_key)
+        except RedisError as exc:
+            logger.warning("rate_limit_storage_error operation=clear error=%s", exc)
@@ -8,6 +8,8 @@ from .aggregation_engine import (
     IncompleteSessionError,
     RoleScoreResult
 )
+from .scoring_model import CompiledScoringModel, ScoringModelError
+from .batch_scoring import BatchScorer, BatchScoreResult
 from .stage_aggregation_engine import (
     StageAggregationEngine,
     StageAggregationEngineError,
@@ -19,6 +21,10 @@ __all__ = [
     'AggregationEngineError',
     'IncompleteSessionError',
     'RoleScoreResult',
+    'CompiledScoringModel',
+    'ScoringModelError',
+    'BatchScorer',
+    'BatchScoreResult',
     'StageAggregationEngine',
     'StageAggregationEngineError',
     'StageScoreComputeResult',
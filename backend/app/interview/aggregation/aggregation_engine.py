@@ -5,9 +5,14 @@ Computes role scores and stage affinity deterministically through
 weight summation and max-possible normalization.
 """
 
-from typing import Dict, List, Tuple
+import logging
+from typing import Dict, List, Optional, Tuple
 from dataclasses import dataclass, field
+from ..models.user_response import SessionModel, UserResponse
 from ..storage.session_store import SessionStore
+from .scoring_model import CompiledScoringModel, ScoringModelError
+
+logger = logging.getLogger(__name__)
 
 
 class AggregationEngineError(Exception):
@@ -49,10 +54,49 @@ class AggregationEngine:
 
     v2.2: Uses max-possible normalization (% of theoretical max per role).
     Also computes stage_affinity from stage_weights for role-first algorithm.
+
+    Scoring runs on a CompiledScoringModel built once per question bank
+    version; the dict-based path is kept for responses the model cannot map.
     """
 
-    def __init__(self, user_response_store: SessionStore):
+    def __init__(
+        self,
+        user_response_store: SessionStore,
+        scoring_model: Optional[CompiledScoringModel] = None,
+    ):
         self._user_response_store = user_response_store
+        # A precompiled model (e.g. from the interview catalog) skips the first compile.
+        self._scoring_model: Optional[CompiledScoringModel] = scoring_model
+        # Question bank version whose compile failed; not retried until the version changes.
+        self._failed_model_version: Optional[str] = None
+
+    def get_scoring_model(self) -> Optional[CompiledScoringModel]:
+        """
+        Return the compiled model for the current question bank version.
+
+        A failed compile is logged once and remembered for that version, so
+        scoring falls back to the dict-based path without recompiling per call.
+        """
+        question_bank_manager = getattr(self._user_response_store, "_question_bank_manager", None)
+        if question_bank_manager is None:
+            return None
+
+        version = question_bank_manager.get_version()
+        model = self._scoring_model
+        if model is None or model.version != version:
+            if self._failed_model_version == version:
+                return None
+            try:
+                model = CompiledScoringModel.compile(question_bank_manager)
+            except Exception:
+                logger.exception(
+                    "Scoring model compile failed for question bank %s; using the dict-based path", version
+                )
+                self._failed_model_version = version
+                return None
+            self._scoring_model = model
+            self._failed_model_version = None
+        return model
 
     def _get_all_role_ids(self) -> List[str]:
         """
@@ -102,10 +146,20 @@ class AggregationEngine:
 
         return max_possible
 
-    def compute_scores(self, session_id: str) -> RoleScoreResult:
+    async def compute_scores(self, session_id: str) -> RoleScoreResult:
         """
         Compute role scores and stage affinity for a completed test session.
 
+        Loads one session snapshot from the store and scores it; see
+        score_session for the algorithm.
+        """
+        session = await self._user_response_store.get_session(session_id)
+        return self.score_session(session)
+
+    def score_session(self, session: SessionModel) -> RoleScoreResult:
+        """
+        Score an already loaded session snapshot.
+
         Algorithm:
         1. Sum role_weights from all responses -> raw_scores
         2. Sum stage_weights from all responses -> stage_affinity
@@ -113,16 +167,38 @@ class AggregationEngine:
         4. Rank roles by normalized score (descending)
         5. Aggregate signal profile (count occurrences)
         """
-        if not self._user_response_store.validate_response_completeness(session_id):
-            responses = self._user_response_store.get_session_responses(session_id)
-            expected = self._user_response_store._question_bank_manager.get_question_count()
+        expected = self._user_response_store._question_bank_manager.get_question_count()
+        if len(session.responses) != expected:
             raise IncompleteSessionError(
                 f"Cannot compute scores for incomplete session. "
-                f"Expected {expected} responses, got {len(responses)}"
+                f"Expected {expected} responses, got {len(session.responses)}"
             )
 
-        responses = self._user_response_store.get_session_responses(session_id)
-
+        return self.score_responses(session.responses)
+
+    def score_responses(self, responses: List[UserResponse]) -> RoleScoreResult:
+        """Score a list of responses (gather-and-sum on the compiled model)."""
+        model = self.get_scoring_model()
+        if model is not None:
+            try:
+                rows = model.resolve_rows(
+                    [(response.question_id, response.answer_option_id) for response in responses]
+                )
+            except ScoringModelError:
+                rows = None
+            if rows is not None:
+                ranked_roles, raw_scores, signal_profile, stage_affinity = model.score(rows)
+                return RoleScoreResult(
+                    ranked_roles=ranked_roles,
+                    raw_scores=raw_scores,
+                    signal_profile=signal_profile,
+                    stage_affinity=stage_affinity
+                )
+
+        return self._score_resolved_responses(responses)
+
+    def _score_resolved_responses(self, responses: List[UserResponse]) -> RoleScoreResult:
+        """Dict-based scoring over the weights resolved into each response."""
         # Step 1: Sum role_weights for each role
         raw_scores: Dict[str, float] = {}
         for response in responses:
@@ -169,8 +245,8 @@ class AggregationEngine:
             stage_affinity=stage_affinity
         )
 
-    def validate_determinism(self, session_id: str) -> bool:
+    async def validate_determinism(self, session_id: str) -> bool:
         """Validate that score computation is deterministic."""
-        result1 = self.compute_scores(session_id)
-        result2 = self.compute_scores(session_id)
+        result1 = await self.compute_scores(session_id)
+        result2 = await self.compute_scores(session_id)
         return result1 == result2
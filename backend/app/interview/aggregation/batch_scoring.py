@@ -0,0 +1,184 @@
+"""
+Bulk scoring for IT Career Test Engine.
+
+Offline batch API on top of CompiledScoringModel: scores thousands to
+millions of answer vectors in vectorized chunks and applies the same
+role-first stage selection as StageAggregationEngine. Used for weight
+calibration (see scripts/calibrate_career_test.py), not on the request path.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+import numpy as np
+
+from ..storage.question_bank_manager import QuestionBankManager
+from ..storage.role_catalog_manager import RoleCatalogManager
+from .scoring_model import CompiledScoringModel, ScoringModelError
+
+
+@dataclass
+class BatchScoreResult:
+    """Vectorized scores for N sessions."""
+
+    role_ids: Tuple[str, ...]
+    stage_ids: Tuple[str, ...]  # model stages plus catalog-only primary stages
+    signal_ids: Tuple[str, ...]
+    normalized: np.ndarray  # (N, roles) normalized role scores
+    stage_affinity: np.ndarray  # (N, model stages) raw stage affinity
+    signal_counts: np.ndarray  # (N, signals)
+    winning_role: np.ndarray  # (N,) index into role_ids
+    winning_stage: np.ndarray  # (N,) index into stage_ids, -1 if the role has no primary stages
+    top_gap: np.ndarray  # (N,) normalized score gap between the top two roles
+
+    @property
+    def size(self) -> int:
+        return len(self.winning_role)
+
+    @property
+    def tied(self) -> np.ndarray:
+        return self.top_gap == 0
+
+    def role_distribution(self) -> Dict[str, float]:
+        counts = np.bincount(self.winning_role, minlength=len(self.role_ids))
+        return {role_id: float(counts[idx]) / max(1, self.size) for idx, role_id in enumerate(self.role_ids)}
+
+    def stage_distribution(self) -> Dict[str, float]:
+        valid = self.winning_stage[self.winning_stage >= 0]
+        counts = np.bincount(valid, minlength=len(self.stage_ids))
+        return {stage_id: float(counts[idx]) / max(1, self.size) for idx, stage_id in enumerate(self.stage_ids)}
+
+
+class BatchScorer:
+    """Scores answer matrices with the compiled model and role-first stage selection."""
+
+    def __init__(
+        self,
+        question_bank_manager: Optional[QuestionBankManager] = None,
+        role_catalog_manager: Optional[RoleCatalogManager] = None,
+        chunk_size: int = 65536,
+    ):
+        self._question_bank_manager = question_bank_manager or QuestionBankManager()
+        self._role_catalog_manager = role_catalog_manager or RoleCatalogManager()
+        self._chunk_size = max(1, chunk_size)
+        self.model = CompiledScoringModel.compile(self._question_bank_manager)
+
+        stage_ids = list(self.model.stage_ids)
+        # Per role: primary stage columns in catalog order (None when the role has none).
+        self._primary_stage_cols: List[Optional[np.ndarray]] = []
+        for role_id in self.model.role_ids:
+            primary_stages = self._role_catalog_manager.get_primary_stages(role_id)
+            if not primary_stages:
+                self._primary_stage_cols.append(None)
+                continue
+            cols = []
+            for stage_id in primary_stages:
+                if stage_id not in stage_ids:
+                    stage_ids.append(stage_id)
+                cols.append(stage_ids.index(stage_id))
+            self._primary_stage_cols.append(np.asarray(cols, dtype=np.int64))
+        self._stage_ids = tuple(stage_ids)
+
+    @property
+    def question_ids(self) -> Tuple[str, ...]:
+        return self.model.question_ids
+
+    def rows_from_answer_maps(self, answer_maps: Iterable[Mapping[str, str]]) -> np.ndarray:
+        """Convert recorded {question_id: option_id} answers into an option-row matrix."""
+        question_ids = self.model.question_ids
+        rows = [
+            [self.model.option_rows[(question_id, answers[question_id])] for question_id in question_ids]
+            for answers in answer_maps
+        ]
+        return np.asarray(rows, dtype=np.int64).reshape(-1, len(question_ids))
+
+    def score_answers(self, answers: np.ndarray) -> BatchScoreResult:
+        """Score an (N, questions) matrix of per-question option indices."""
+        return self.score_rows(self.model.local_to_rows(answers))
+
+    def score_rows(self, rows: np.ndarray) -> BatchScoreResult:
+        """Score an (N, questions) matrix of option rows, answers in question order."""
+        rows = np.asarray(rows, dtype=np.int64)
+        if rows.ndim != 2:
+            raise ScoringModelError("Expected a 2-D matrix of option rows")
+
+        parts = [
+            self._score_chunk(rows[start:start + self._chunk_size])
+            for start in range(0, rows.shape[0], self._chunk_size)
+        ] or [self._score_chunk(rows)]
+
+        return BatchScoreResult(
+            role_ids=self.model.role_ids,
+            stage_ids=self._stage_ids,
+            signal_ids=self.model.signal_ids,
+            normalized=np.concatenate([p[0] for p in parts]),
+            stage_affinity=np.concatenate([p[1] for p in parts]),
+            signal_counts=np.concatenate([p[2] for p in parts]),
+            winning_role=np.concatenate([p[3] for p in parts]),
+            winning_stage=np.concatenate([p[4] for p in parts]),
+            top_gap=np.concatenate([p[5] for p in parts]),
+        )
+
+    def _score_chunk(self, rows: np.ndarray):
+        _, normalized, stage_affinity, signal_counts = self.model.score_batch(rows)
+        n_sessions, n_roles = normalized.shape
+
+        top = normalized.max(axis=1) if n_roles else np.zeros(n_sessions)
+        if n_roles >= 2:
+            second = np.partition(normalized, -2, axis=1)[:, -2]
+            top_gap = top - second
+        else:
+            top_gap = np.full(n_sessions, np.inf)
+
+        # np.argmax picks the lowest role index on ties; the engine instead keeps
+        # first-appearance order, so ties are resolved exactly on the tied subset.
+        winning_role = normalized.argmax(axis=1) if n_roles else np.zeros(n_sessions, dtype=np.int64)
+        tied = np.flatnonzero(top_gap == 0)
+        if tied.size:
+            first_seen = self.model.first_seen_batch(self.model.role_rank, rows[tied])
+            is_top = normalized[tied] == top[tied, None]
+            key = np.where(is_top, first_seen.astype(np.float64), np.inf)
+            winning_role[tied] = key.argmin(axis=1)
+
+        # Role-first stage selection: best affinity among the winner's primary
+        # stages, first stage wins ties (matches StageAggregationEngine).
+        padded = np.zeros((n_sessions, len(self._stage_ids)), dtype=np.float64)
+        padded[:, :stage_affinity.shape[1]] = stage_affinity
+        winning_stage = np.full(n_sessions, -1, dtype=np.int64)
+        for role_idx, cols in enumerate(self._primary_stage_cols):
+            if cols is None:
+                continue
+            members = np.flatnonzero(winning_role == role_idx)
+            if members.size:
+                winning_stage[members] = cols[padded[members][:, cols].argmax(axis=1)]
+
+        return normalized, stage_affinity, signal_counts, winning_role, winning_stage, top_gap
+
+    def random_answers(self, n_sessions: int, rng: np.random.Generator) -> np.ndarray:
+        """Uniformly random option per question."""
+        options = self.model.options_per_question
+        return (rng.random((n_sessions, len(options))) * options[None, :]).astype(np.int64)
+
+    def persona_answers(
+        self,
+        role_id: str,
+        n_sessions: int,
+        rng: np.random.Generator,
+        fidelity: float = 0.7,
+    ) -> np.ndarray:
+        """
+        Answers of a persona leaning towards ``role_id``: with probability
+        ``fidelity`` it picks the option with the highest weight for the role,
+        otherwise a uniformly random option.
+        """
+        role_col = self.model.role_ids.index(role_id)
+        offsets = self.model.question_offsets
+        options = self.model.options_per_question
+        preferred = np.asarray([
+            int(np.argmax(self.model.role_weights[offset:offset + count, role_col]))
+            for offset, count in zip(offsets, options)
+        ], dtype=np.int64)
+
+        answers = self.random_answers(n_sessions, rng)
+        follow = rng.random(answers.shape) < fidelity
+        return np.where(follow, preferred[None, :], answers)
@@ -0,0 +1,283 @@
+"""
+Compiled scoring model for IT Career Test Engine.
+
+Compiles the question bank once per version into dense NumPy matrices
+(options x roles, options x stages, options x signals) plus the
+max-possible role vector, so scoring a session is a gather-and-sum over
+the selected option rows.
+
+Output parity with the dict-based algorithm is exact: weights are small
+integers (sums are exact in float64) and dict insertion order — which
+decides tie order in ranked_roles and in the LLM prompt — is reproduced
+from the first-appearance position of every key.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from ..storage.question_bank_manager import QuestionBankManager
+
+# Sentinel rank for "key never appeared in the selected options".
+_NOT_SEEN = np.iinfo(np.int64).max
+
+
+class ScoringModelError(Exception):
+    """Raised when a response cannot be mapped onto the compiled model."""
+
+
+def _dense(
+    rows: List[Dict[str, float]],
+    columns: Sequence[str],
+    dtype,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Build a (values, rank) pair for a list of per-option mappings.
+
+    rank[o, c] is the position of key c inside option o's mapping (used to
+    reproduce dict insertion order); -1 marks absent keys.
+    """
+    column_index = {column: idx for idx, column in enumerate(columns)}
+    values = np.zeros((len(rows), len(columns)), dtype=dtype)
+    rank = np.full((len(rows), len(columns)), -1, dtype=np.int64)
+    for row_idx, mapping in enumerate(rows):
+        for position, (key, value) in enumerate(mapping.items()):
+            col = column_index[key]
+            values[row_idx, col] += value
+            if rank[row_idx, col] < 0:
+                rank[row_idx, col] = position
+    return values, rank
+
+
+@dataclass(frozen=True)
+class CompiledScoringModel:
+    """Immutable, vectorized view of one question bank version."""
+
+    version: str
+    question_ids: Tuple[str, ...]
+    option_rows: Dict[Tuple[str, str], int]  # (question_id, option_id) -> option row
+    option_question: np.ndarray  # option row -> question index
+    role_ids: Tuple[str, ...]
+    stage_ids: Tuple[str, ...]
+    signal_ids: Tuple[str, ...]
+    role_weights: np.ndarray  # (options, roles) float64
+    stage_weights: np.ndarray  # (options, stages) float64
+    signal_counts: np.ndarray  # (options, signals) int64
+    role_rank: np.ndarray
+    stage_rank: np.ndarray
+    signal_rank: np.ndarray
+    max_possible: np.ndarray  # (roles,) float64
+    rank_stride: int  # > max keys per option mapping
+
+    @classmethod
+    def compile(cls, question_bank_manager: QuestionBankManager) -> "CompiledScoringModel":
+        questions = question_bank_manager.get_all_questions()
+
+        option_rows: Dict[Tuple[str, str], int] = {}
+        option_question: List[int] = []
+        role_maps: List[Dict[str, float]] = []
+        stage_maps: List[Dict[str, float]] = []
+        signal_maps: List[Dict[str, int]] = []
+        role_ids, stage_ids, signal_ids = set(), set(), set()
+
+        for question_idx, question in enumerate(questions):
+            for option in question.answer_options:
+                option_rows[(question.id, option.id)] = len(option_question)
+                option_question.append(question_idx)
+                role_maps.append(option.role_weights)
+                stage_maps.append(option.stage_weights)
+                counts: Dict[str, int] = {}
+                for signal_id in option.signal_associations:
+                    counts[signal_id] = counts.get(signal_id, 0) + 1
+                signal_maps.append(counts)
+                role_ids.update(option.role_weights)
+                stage_ids.update(option.stage_weights)
+                signal_ids.update(counts)
+
+        role_columns = tuple(sorted(role_ids))
+        stage_columns = tuple(sorted(stage_ids))
+        signal_columns = tuple(sorted(signal_ids))
+
+        role_weights, role_rank = _dense(role_maps, role_columns, np.float64)
+        stage_weights, stage_rank = _dense(stage_maps, stage_columns, np.float64)
+        signal_counts, signal_rank = _dense(signal_maps, signal_columns, np.int64)
+
+        # Max possible per role: sum over questions of the best weight among
+        # options that carry the role at all (absent keys do not compete).
+        option_question_arr = np.asarray(option_question, dtype=np.int64)
+        max_possible = np.zeros(len(role_columns), dtype=np.float64)
+        for question_idx in range(len(questions)):
+            rows = option_question_arr == question_idx
+            present = role_rank[rows] >= 0
+            if not present.any():
+                continue
+            best = np.where(present, role_weights[rows], -np.inf).max(axis=0)
+            max_possible += np.where(np.isfinite(best), best, 0.0)
+
+        rank_stride = 1 + max(
+            [len(m) for m in role_maps + stage_maps + signal_maps] or [0]
+        )
+
+        return cls(
+            version=question_bank_manager.get_version(),
+            question_ids=tuple(question.id for question in questions),
+            option_rows=option_rows,
+            option_question=option_question_arr,
+            role_ids=role_columns,
+            stage_ids=stage_columns,
+            signal_ids=signal_columns,
+            role_weights=role_weights,
+            stage_weights=stage_weights,
+            signal_counts=signal_counts,
+            role_rank=role_rank,
+            stage_rank=stage_rank,
+            signal_rank=signal_rank,
+            max_possible=max_possible,
+            rank_stride=rank_stride,
+        )
+
+    @property
+    def option_count(self) -> int:
+        return len(self.option_question)
+
+    @property
+    def options_per_question(self) -> np.ndarray:
+        return np.bincount(self.option_question, minlength=len(self.question_ids))
+
+    @property
+    def question_offsets(self) -> np.ndarray:
+        """First option row of every question."""
+        counts = self.options_per_question
+        return np.concatenate(([0], np.cumsum(counts)[:-1])).astype(np.int64)
+
+    def local_to_rows(self, answers: np.ndarray) -> np.ndarray:
+        """
+        Convert an (N, questions) matrix of per-question option indices
+        (0-based, questions in bank order) into global option rows.
+        """
+        answers = np.asarray(answers, dtype=np.int64)
+        if answers.ndim != 2 or answers.shape[1] != len(self.question_ids):
+            raise ScoringModelError(
+                f"Expected answers of shape (N, {len(self.question_ids)}), got {answers.shape}"
+            )
+        if answers.size and (
+            answers.min() < 0 or (answers >= self.options_per_question[None, :]).any()
+        ):
+            raise ScoringModelError("Answer option index out of range")
+        return answers + self.question_offsets[None, :]
+
+    def score_batch(self, rows: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Score many sessions at once.
+
+        Args:
+            rows: (N, answers) matrix of option rows, answers in question order.
+
+        Returns:
+            (raw, normalized, stage_affinity, signal_counts) with shapes
+            (N, roles), (N, roles), (N, stages), (N, signals).
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        n_sessions = rows.shape[0]
+        # One-hot selection matrix times weight matrices: exact for integer weights.
+        selection = np.zeros((n_sessions, self.option_count), dtype=np.float64)
+        np.put_along_axis(selection, rows, 1.0, axis=1)
+
+        raw = selection @ self.role_weights
+        stage_affinity = selection @ self.stage_weights
+        signal_counts = (selection @ self.signal_counts.astype(np.float64)).astype(np.int64)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            normalized = np.where(
+                self.max_possible[None, :] > 0,
+                np.clip(raw / self.max_possible[None, :], 0.0, 1.0),
+                0.0,
+            )
+        return raw, normalized, stage_affinity, signal_counts
+
+    def first_seen_batch(self, rank: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        """Vectorized _first_seen for an (N, answers) matrix of option rows."""
+        rows = np.asarray(rows, dtype=np.int64)
+        gathered = rank[rows]  # (N, answers, columns)
+        positions = (
+            np.arange(rows.shape[1], dtype=np.int64)[None, :, None] * self.rank_stride + gathered
+        )
+        positions = np.where(gathered >= 0, positions, _NOT_SEEN)
+        return positions.min(axis=1)
+
+    def resolve_rows(self, answers: Sequence[Tuple[str, str]]) -> np.ndarray:
+        """Map (question_id, option_id) pairs to option rows, preserving order."""
+        try:
+            return np.fromiter(
+                (self.option_rows[answer] for answer in answers),
+                dtype=np.int64,
+                count=len(answers),
+            )
+        except KeyError as exc:
+            raise ScoringModelError(f"Unknown answer for compiled model: {exc.args[0]}") from None
+
+    def _first_seen(self, rank: np.ndarray, rows: np.ndarray) -> np.ndarray:
+        """First-appearance position of every column over the selected rows."""
+        if len(rows) == 0:
+            return np.full(rank.shape[1], _NOT_SEEN, dtype=np.int64)
+        gathered = rank[rows]
+        positions = (
+            np.arange(len(rows), dtype=np.int64)[:, None] * self.rank_stride + gathered
+        )
+        positions = np.where(gathered >= 0, positions, _NOT_SEEN)
+        return positions.min(axis=0)
+
+    @staticmethod
+    def _insertion_order(first_seen: np.ndarray) -> np.ndarray:
+        # Columns are sorted by id, so a stable sort keeps id order for ties
+        # (i.e. for every never-seen column).
+        return np.argsort(first_seen, kind="stable")
+
+    def score(
+        self,
+        rows: np.ndarray,
+    ) -> Tuple[List[Tuple[str, float]], Dict[str, float], Dict[str, int], Dict[str, float]]:
+        """
+        Score one session given its selected option rows (in answer order).
+
+        Returns (ranked_roles, raw_scores, signal_profile, stage_affinity)
+        with the exact values and ordering of the dict-based algorithm.
+        """
+        raw = self.role_weights[rows].sum(axis=0)
+        stage_sum = self.stage_weights[rows].sum(axis=0)
+        signal_sum = self.signal_counts[rows].sum(axis=0)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            normalized = np.where(
+                self.max_possible > 0,
+                np.clip(raw / self.max_possible, 0.0, 1.0),
+                0.0,
+            )
+
+        # Roles: seen roles in first-appearance order, then the rest sorted by id.
+        role_order = self._insertion_order(self._first_seen(self.role_rank, rows))
+        ranked_idx = role_order[np.argsort(-normalized[role_order], kind="stable")]
+
+        raw_list = raw.tolist()
+        normalized_list = normalized.tolist()
+        raw_scores = {self.role_ids[i]: raw_list[i] for i in role_order.tolist()}
+        ranked_roles = [(self.role_ids[i], normalized_list[i]) for i in ranked_idx.tolist()]
+
+        stage_seen = self._first_seen(self.stage_rank, rows)
+        stage_list = stage_sum.tolist()
+        stage_affinity = {
+            self.stage_ids[i]: stage_list[i]
+            for i in self._insertion_order(stage_seen).tolist()
+            if stage_seen[i] != _NOT_SEEN
+        }
+
+        signal_seen = self._first_seen(self.signal_rank, rows)
+        signal_list = signal_sum.tolist()
+        signal_profile = {
+            self.signal_ids[i]: signal_list[i]
+            for i in self._insertion_order(signal_seen).tolist()
+            if signal_seen[i] != _NOT_SEEN
+        }
+
+        return ranked_roles, raw_scores, signal_profile, stage_affinity
@@ -0,0 +1,328 @@
+"""
+Interview catalog snapshot.
+
+All static career-test data (question bank, role profiles, signals, role
+catalog, stages and the career pipeline) is compiled once into a frozen,
+versioned InterviewCatalog: the loaded managers plus id->index maps, lookup
+tables used on the request path and pre-serialized API payloads.
+
+The current snapshot is published through a module-level pointer. Reloads
+compile a complete new snapshot off to the side and swap the pointer in one
+assignment, so readers never see a half-loaded catalog; a failed compile
+keeps the previous snapshot. A polling watcher (started from the app
+lifespan) stats the source files and triggers the reload, instead of the
+managers stat()-ing their files on every call.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+from dataclasses import dataclass, replace
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
+
+from pydantic import TypeAdapter
+
+from app.config import settings
+from app.infra.http_cache import EncodedPayload
+from app.schemas import (
+    AnswerOptionResponse,
+    PrimaryVacancyFiltersResponse,
+    QuestionResponse,
+    StageDetailResponse,
+    StageResponse,
+    StageRoleMapResponse,
+    StageWithRolesResponse,
+)
+
+from .aggregation.scoring_model import CompiledScoringModel
+from .aggregation.stage_aggregation_engine import StageAggregationEngine
+from .models.stage import StageRoleMap
+from .storage.career_pipeline_manager import CareerPipelineManager
+from .storage.question_bank_manager import QuestionBankManager
+from .storage.role_catalog_manager import RoleCatalogManager
+from .storage.role_profile_manager import RoleProfileManager
+from .storage.session_codec import SessionCodec
+from .storage.signal_dictionary_manager import SignalDictionaryManager
+from .storage.stage_manager import StageManager
+
+logger = logging.getLogger(__name__)
+
+_PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+_DATA_DIR = os.path.join(_PACKAGE_DIR, "data")
+_DATA_FILES = (
+    "career_pipeline.json",
+    "role_catalog.json",
+    "stage_role_map.json",
+    "stage_test_mapping.json",
+    "stages_data.json",
+)
+
+_QUESTIONS_ADAPTER = TypeAdapter(List[QuestionResponse])
+_STAGES_ADAPTER = TypeAdapter(List[StageResponse])
+
+Fingerprint = Tuple[Tuple[str, int, int], ...]
+
+
+class CatalogError(Exception):
+    """Raised when the interview catalog cannot be compiled."""
+    pass
+
+
+@dataclass(frozen=True)
+class InterviewCatalog:
+    """Immutable snapshot of all interview reference data for one version."""
+    version: str  # content hash of the source files
+    fingerprint: Fingerprint
+    question_bank: QuestionBankManager
+    role_profiles: RoleProfileManager
+    signals: SignalDictionaryManager
+    role_catalog: RoleCatalogManager
+    stage_manager: StageManager
+    career_pipeline: CareerPipelineManager
+    stage_engine: StageAggregationEngine
+    scoring_model: CompiledScoringModel
+    session_codec: SessionCodec
+    question_index: Mapping[str, int]
+    role_index: Mapping[str, int]
+    stage_index: Mapping[str, int]
+    stage_roles: Mapping[str, Tuple[StageRoleMap, ...]]
+    # Role/signal descriptions in the shape the LLM interpreter expects.
+    llm_role_profiles: Mapping[str, Dict[str, Any]]
+    llm_signals: Mapping[str, Dict[str, Any]]
+    # Pre-serialized JSON bodies (with ETags) for the static interview endpoints.
+    questions_payload: EncodedPayload
+    stages_payload: EncodedPayload
+    stage_payloads: Mapping[str, EncodedPayload]
+    role_payloads: Mapping[str, EncodedPayload]
+
+
+def _source_paths(questions_file: Optional[str] = None) -> List[str]:
+    if questions_file is None:
+        questions_file = os.path.join(_PACKAGE_DIR, "storage", QuestionBankManager.DEFAULT_QUESTIONS_FILE)
+    return [os.path.abspath(questions_file)] + [os.path.join(_DATA_DIR, name) for name in _DATA_FILES]
+
+
+def _fingerprint(paths: List[str]) -> Fingerprint:
+    entries = []
+    for path in paths:
+        try:
+            stat = os.stat(path)
+        except OSError:
+            entries.append((path, -1, -1))
+        else:
+            entries.append((path, stat.st_mtime_ns, stat.st_size))
+    return tuple(entries)
+
+
+def _content_hash(paths: List[str]) -> str:
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def _freeze(mapping: Dict) -> Mapping:
+    return MappingProxyType(mapping)
+
+
+def _stage_detail(stage, role_maps) -> StageWithRolesResponse:
+    return StageWithRolesResponse(
+        stage=StageDetailResponse(
+            id=stage.id,
+            name=stage.name,
+            summary=stage.summary,
+            typical_outputs=stage.typical_outputs,
+            common_mistakes=stage.common_mistakes,
+            primary_vacancy_filters=PrimaryVacancyFiltersResponse(
+                roles=stage.primary_vacancy_filters.roles,
+                keywords=stage.primary_vacancy_filters.keywords,
+            ),
+        ),
+        roles=[
+            StageRoleMapResponse(
+                stage_id=rm.stage_id,
+                role_id=rm.role_id,
+                why_here=rm.why_here,
+                how_it_connects_to_vacancies=rm.how_it_connects_to_vacancies,
+                importance=rm.importance,
+            )
+            for rm in role_maps
+        ],
+    )
+
+
+def compile_catalog(questions_file: Optional[str] = None) -> InterviewCatalog:
+    """Load every source and build a new snapshot; raises CatalogError on bad data."""
+    paths = _source_paths(questions_file)
+    # Fingerprint before reading so a write during compile triggers another reload.
+    fingerprint = _fingerprint(paths)
+    try:
+        question_bank = QuestionBankManager(questions_file)
+        role_profiles = RoleProfileManager()
+        signals = SignalDictionaryManager()
+        role_catalog = RoleCatalogManager()
+        stage_manager = StageManager()
+        career_pipeline = CareerPipelineManager()
+        if not career_pipeline.get_full_graph():
+            raise CatalogError("career pipeline graph is empty")
+        scoring_model = CompiledScoringModel.compile(question_bank)
+        version = _content_hash(paths)
+    except Exception as exc:
+        raise CatalogError(f"Failed to compile interview catalog: {exc}") from exc
+
+    questions = question_bank.get_all_questions()
+    stages = stage_manager.get_all_stages()
+    stage_roles = {stage.id: tuple(stage_manager.get_roles_for_stage(stage.id)) for stage in stages}
+
+    questions_payload = EncodedPayload.from_bytes(_QUESTIONS_ADAPTER.dump_json([
+        QuestionResponse(
+            id=q.id,
+            text=q.text,
+            thematic_block=q.thematic_block,
+            type=q.type,
+            answer_options=[AnswerOptionResponse(id=opt.id, text=opt.text) for opt in q.answer_options],
+        )
+        for q in questions
+    ]))
+    stages_payload = EncodedPayload.from_bytes(_STAGES_ADAPTER.dump_json([
+        StageResponse(id=stage.id, name=stage.name, summary=stage.summary) for stage in stages
+    ]))
+
+    return InterviewCatalog(
+        version=version,
+        fingerprint=fingerprint,
+        question_bank=question_bank,
+        role_profiles=role_profiles,
+        signals=signals,
+        role_catalog=role_catalog,
+        stage_manager=stage_manager,
+        career_pipeline=career_pipeline,
+        stage_engine=StageAggregationEngine(stage_manager, role_catalog),
+        scoring_model=scoring_model,
+        session_codec=SessionCodec(question_bank),
+        question_index=_freeze({q.id: idx for idx, q in enumerate(questions)}),
+        role_index=_freeze({role_id: idx for idx, role_id in enumerate(scoring_model.role_ids)}),
+        stage_index=_freeze({stage.id: idx for idx, stage in enumerate(stages)}),
+        stage_roles=_freeze(stage_roles),
+        llm_role_profiles=_freeze({
+            role.id: {
+                'name': role.name,
+                'description': role.description,
+                'key_signals': role.key_signals,
+            }
+            for role in role_profiles.get_all_roles()
+        }),
+        llm_signals=_freeze({
+            signal.id: {
+                'name': signal.name,
+                'description': signal.description,
+            }
+            for signal in signals.get_all_signals()
+        }),
+        questions_payload=questions_payload,
+        stages_payload=stages_payload,
+        stage_payloads=_freeze({
+            stage.id: EncodedPayload.from_bytes(
+                _stage_detail(stage, stage_roles[stage.id]).model_dump_json().encode("utf-8")
+            )
+            for stage in stages
+        }),
+        role_payloads=_freeze({
+            role.id: EncodedPayload.from_bytes(role.model_dump_json().encode("utf-8"))
+            for role in role_profiles.get_all_roles()
+        }),
+    )
+
+
+_catalog: Optional[InterviewCatalog] = None
+_compile_lock = threading.Lock()
+_watch_task: Optional[asyncio.Task] = None
+
+
+def get_interview_catalog() -> InterviewCatalog:
+    """Return the current catalog snapshot, compiling it on first use."""
+    catalog = _catalog
+    if catalog is None:
+        with _compile_lock:
+            catalog = _catalog
+            if catalog is None:
+                catalog = _publish(compile_catalog())
+    return catalog
+
+
+def _publish(catalog: InterviewCatalog) -> InterviewCatalog:
+    global _catalog
+    previous = _catalog
+    _catalog = catalog
+    if previous is not None and previous.question_bank.get_version() != catalog.question_bank.get_version():
+        logger.warning(
+            "Interview question bank changed (%s -> %s); running orchestrators keep the bank "
+            "their sessions were started on until restart",
+            previous.question_bank.get_version(),
+            catalog.question_bank.get_version(),
+        )
+    logger.info("Interview catalog published version=%s", catalog.version)
+    return catalog
+
+
+def reload_interview_catalog(force: bool = False) -> bool:
+    """
+    Recompile and swap the snapshot if any source file changed.
+
+    Returns True when a new snapshot was published. Compile errors are
+    logged and the previous snapshot stays current.
+    """
+    global _catalog
+    with _compile_lock:
+        current = _catalog
+        if current is None:
+            _publish(compile_catalog())
+            return True
+        if not force and _fingerprint([path for path, _, _ in current.fingerprint]) == current.fingerprint:
+            return False
+        try:
+            candidate = compile_catalog()
+        except CatalogError:
+            logger.exception("Interview catalog reload failed; keeping version=%s", current.version)
+            return False
+        if candidate.version == current.version and not force:
+            # Touched but unchanged: keep the snapshot, remember the new mtimes.
+            _catalog = replace(current, fingerprint=candidate.fingerprint)
+            return False
+        _publish(candidate)
+        return True
+
+
+async def _watch_catalog(interval_seconds: float) -> None:
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            await asyncio.to_thread(reload_interview_catalog)
+        except Exception:
+            logger.exception("Interview catalog watcher iteration failed")
+
+
+def start_catalog_watcher() -> None:
+    """Compile the catalog and start polling its sources (no-op if disabled)."""
+    global _watch_task
+    get_interview_catalog()
+    interval = settings.INTERVIEW_CATALOG_RELOAD_INTERVAL_SECONDS
+    if interval <= 0 or _watch_task is not None:
+        return
+    _watch_task = asyncio.create_task(_watch_catalog(interval))
+
+
+async def stop_catalog_watcher() -> None:
+    global _watch_task
+    task, _watch_task = _watch_task, None
+    if task is None:
+        return
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        pass
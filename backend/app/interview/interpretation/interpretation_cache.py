@@ -0,0 +1,228 @@
+"""
+Interpretation cache for IT Career Test Engine.
+
+The LLM prompt is fully determined by the top roles, the top signals and
+catalog data, so users with near-identical profiles can share one
+interpretation. Results are keyed by a quantized profile fingerprint, the
+prompt/model version and the catalog version the prompt was built from
+(role and signal texts hot-swap on catalog reload), and stored in a local
+LRU and (optionally) Redis.
+
+Fail-open: any Redis problem degrades to the local LRU only.
+"""
+
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+import hashlib
+import json
+import logging
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+import redis
+from redis.exceptions import RedisError
+
+from .llm_interpreter import InterpretationResult
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class InterpretationCacheStats:
+    """Counters exposed for monitoring the interpretation cache."""
+
+    local_hits: int = 0
+    redis_hits: int = 0
+    misses: int = 0
+    stores: int = 0
+    redis_errors: int = 0
+    llm_calls: int = 0
+    llm_latency_total_ms: float = 0.0
+    hit_latency_total_ms: float = 0.0
+
+    @property
+    def hits(self) -> int:
+        return self.local_hits + self.redis_hits
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    @property
+    def avg_llm_latency_ms(self) -> float:
+        return self.llm_latency_total_ms / self.llm_calls if self.llm_calls else 0.0
+
+    @property
+    def avg_hit_latency_ms(self) -> float:
+        return self.hit_latency_total_ms / self.hits if self.hits else 0.0
+
+    @property
+    def estimated_saved_ms(self) -> float:
+        """Latency saved by hits, estimated from the average observed LLM call."""
+        return max(0.0, self.hits * (self.avg_llm_latency_ms - self.avg_hit_latency_ms))
+
+    def to_dict(self) -> Dict[str, float]:
+        return {
+            "hits": self.hits,
+            "local_hits": self.local_hits,
+            "redis_hits": self.redis_hits,
+            "misses": self.misses,
+            "stores": self.stores,
+            "redis_errors": self.redis_errors,
+            "hit_ratio": round(self.hit_ratio, 4),
+            "llm_calls": self.llm_calls,
+            "avg_llm_latency_ms": round(self.avg_llm_latency_ms, 1),
+            "avg_hit_latency_ms": round(self.avg_hit_latency_ms, 3),
+            "estimated_saved_ms": round(self.estimated_saved_ms, 1),
+        }
+
+
+def build_profile_fingerprint(
+    ranked_roles: List[Tuple[str, float]],
+    signal_profile: Dict[str, int],
+    score_step: float,
+    close_threshold: float,
+    top_roles: int = 4,
+    top_signals: int = 5,
+) -> str:
+    """
+    Build a canonical fingerprint of the parts of a result that feed the prompt.
+
+    Role scores are quantized to ``score_step`` buckets; signal counts are
+    already small integers and are kept exact. Whether the top two roles are
+    "close" changes the prompt, so it is part of the fingerprint as well.
+    """
+    step = score_step if score_step > 0 else 0.001
+    roles = [
+        [role_id, int(round(score / step))]
+        for role_id, score in ranked_roles[:top_roles]
+    ]
+    is_close = (
+        len(ranked_roles) >= 2
+        and (ranked_roles[0][1] - ranked_roles[1][1]) < close_threshold
+    )
+    signals = sorted(
+        ((signal_id, count) for signal_id, count in signal_profile.items() if count),
+        key=lambda item: (-item[1], item[0]),
+    )[:top_signals]
+
+    canonical = json.dumps(
+        {"r": roles, "c": is_close, "s": [list(item) for item in signals]},
+        separators=(",", ":"),
+        sort_keys=True,
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class InterpretationCache:
+    """Two-level (local LRU + Redis) cache of LLM interpretations."""
+
+    _KEY_PREFIX = "interview:interpretation:"
+
+    def __init__(
+        self,
+        version: str,
+        redis_url: Optional[str] = None,
+        ttl_seconds: int = 7 * 24 * 3600,
+        local_max_entries: int = 512,
+        score_step: float = 0.05,
+        close_threshold: float = 0.1,
+    ):
+        self._version = version
+        self._ttl_seconds = ttl_seconds
+        self._local_max_entries = max(1, local_max_entries)
+        self._score_step = score_step
+        self._close_threshold = close_threshold
+        self._local: "OrderedDict[str, str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = InterpretationCacheStats()
+
+        self._redis: Optional[redis.Redis] = None
+        if redis_url:
+            self._redis = redis.Redis.from_url(
+                redis_url,
+                decode_responses=True,
+                socket_connect_timeout=2,
+                socket_timeout=2,
+            )
+
+    def build_key(
+        self,
+        ranked_roles: List[Tuple[str, float]],
+        signal_profile: Dict[str, int],
+        catalog_version: str,
+    ) -> str:
+        fingerprint = build_profile_fingerprint(
+            ranked_roles,
+            signal_profile,
+            score_step=self._score_step,
+            close_threshold=self._close_threshold,
+        )
+        return f"{self._KEY_PREFIX}{self._version}:{catalog_version}:{fingerprint}"
+
+    def _local_get(self, key: str) -> Optional[str]:
+        with self._lock:
+            payload = self._local.get(key)
+            if payload is not None:
+                self._local.move_to_end(key)
+            return payload
+
+    def _local_set(self, key: str, payload: str) -> None:
+        with self._lock:
+            self._local[key] = payload
+            self._local.move_to_end(key)
+            while len(self._local) > self._local_max_entries:
+                self._local.popitem(last=False)
+
+    def get(self, key: str) -> Optional[InterpretationResult]:
+        """Look up an interpretation in the local LRU, then in Redis."""
+        started = time.perf_counter()
+        payload = self._local_get(key)
+        if payload is not None:
+            self.stats.local_hits += 1
+            self.stats.hit_latency_total_ms += (time.perf_counter() - started) * 1000
+            return InterpretationResult(**json.loads(payload))
+
+        if self._redis is not None:
+            try:
+                payload = self._redis.get(key)
+            except RedisError as exc:
+                self.stats.redis_errors += 1
+                logger.warning("interpretation_cache_error operation=get key=%s error=%s", key, exc)
+                payload = None
+            if payload is not None:
+                self._local_set(key, payload)
+                self.stats.redis_hits += 1
+                self.stats.hit_latency_total_ms += (time.perf_counter() - started) * 1000
+                return InterpretationResult(**json.loads(payload))
+
+        self.stats.misses += 1
+        return None
+
+    def set(self, key: str, result: InterpretationResult) -> None:
+        """Store an interpretation; parse-fallback results are never cached."""
+        if result.is_fallback:
+            return
+
+        payload = json.dumps(asdict(result), ensure_ascii=False, separators=(",", ":"))
+        self._local_set(key, payload)
+        self.stats.stores += 1
+
+        if self._redis is not None:
+            try:
+                self._redis.set(key, payload, ex=self._ttl_seconds)
+            except RedisError as exc:
+                self.stats.redis_errors += 1
+                logger.warning("interpretation_cache_error operation=set key=%s error=%s", key, exc)
+
+    def record_llm_call(self, elapsed_ms: float) -> None:
+        self.stats.llm_calls += 1
+        self.stats.llm_latency_total_ms += elapsed_ms
+
+    def get_stats(self) -> Dict[str, float]:
+        data = self.stats.to_dict()
+        data["local_entries"] = len(self._local)
+        data["version"] = self._version
+        return data
@@ -0,0 +1,192 @@
+"""
+Background LLM interpretation jobs for IT Career Test Engine.
+
+Completion returns deterministic scores immediately; the LLM interpretation
+is produced by a bounded pool of asyncio workers and persisted in Redis
+(or in process memory when Redis is not configured) for polling. The
+blocking LLM calls run on the queue's own thread pool (one thread per
+worker), never on the event loop's default executor.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+import json
+import logging
+import time
+from typing import Any, Callable, Dict, List, Optional
+from uuid import uuid4
+
+from app.infra.redis_client import get_redis
+
+from .llm_interpreter import InterpretationResult
+
+logger = logging.getLogger(__name__)
+
+
+class InterpretationJobStatus:
+    PENDING = "pending"
+    READY = "ready"
+    FAILED = "failed"
+
+
+class InterpretationQueueFullError(Exception):
+    """Raised when the interpretation queue cannot accept more jobs."""
+
+
+class InterpretationJobQueue:
+    """Bounded async worker pool with Redis-persisted job results."""
+
+    _JOB_KEY_PREFIX = "interview:interpretation_job:"
+
+    def __init__(
+        self,
+        max_workers: int = 4,
+        max_queue_size: int = 200,
+        job_timeout_seconds: float = 90.0,
+        result_ttl_seconds: int = 3600,
+    ):
+        self._max_workers = max(1, max_workers)
+        self._max_queue_size = max(1, max_queue_size)
+        self._job_timeout_seconds = job_timeout_seconds
+        self._result_ttl_seconds = result_ttl_seconds
+        self._queue: Optional[asyncio.Queue] = None
+        self._workers: List[asyncio.Task] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._local_jobs: Dict[str, tuple] = {}  # job_id -> (expires_at, payload)
+
+    def _job_key(self, job_id: str) -> str:
+        return f"{self._JOB_KEY_PREFIX}{job_id}"
+
+    def _ensure_workers(self) -> None:
+        """Start workers lazily on the running loop (restarting them if the loop changed)."""
+        loop = asyncio.get_running_loop()
+        if self._queue is not None and self._workers and self._workers[0].get_loop() is loop:
+            return
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers,
+                thread_name_prefix="interpretation",
+            )
+        self._queue = asyncio.Queue(maxsize=self._max_queue_size)
+        self._workers = [
+            loop.create_task(self._worker(), name=f"interpretation-worker-{idx}")
+            for idx in range(self._max_workers)
+        ]
+
+    async def _save(self, job_id: str, payload: Dict[str, Any]) -> None:
+        serialized = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+        redis = get_redis()
+        if redis is not None:
+            try:
+                await redis.setex(self._job_key(job_id), self._result_ttl_seconds, serialized)
+                return
+            except Exception as exc:
+                logger.warning("interpretation_job_store_error job_id=%s error=%s", job_id, exc)
+
+        now = time.monotonic()
+        for stale_id in [jid for jid, (expires_at, _) in self._local_jobs.items() if expires_at <= now]:
+            del self._local_jobs[stale_id]
+        self._local_jobs[job_id] = (now + self._result_ttl_seconds, serialized)
+
+    async def get(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Return the stored job payload, or None if unknown/expired."""
+        redis = get_redis()
+        if redis is not None:
+            try:
+                payload = await redis.get(self._job_key(job_id))
+                if payload is not None:
+                    return json.loads(payload)
+            except Exception as exc:
+                logger.warning("interpretation_job_store_error job_id=%s error=%s", job_id, exc)
+
+        entry = self._local_jobs.get(job_id)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return json.loads(entry[1])
+
+    async def submit(
+        self,
+        session_id: str,
+        interpret: Callable[[], InterpretationResult],
+    ) -> str:
+        """
+        Enqueue a blocking interpretation callable and return its job id.
+
+        Raises:
+            InterpretationQueueFullError: when the bounded queue is full.
+        """
+        self._ensure_workers()
+        if self._queue.full():
+            raise InterpretationQueueFullError("Interpretation queue is full")
+
+        job_id = f"job_{uuid4()}"
+        await self._save(job_id, {
+            "job_id": job_id,
+            "session_id": session_id,
+            "status": InterpretationJobStatus.PENDING,
+            "interpretation": None,
+            "warnings": [],
+        })
+        self._queue.put_nowait((job_id, session_id, interpret))
+        return job_id
+
+    async def _worker(self) -> None:
+        while True:
+            job_id, session_id, interpret = await self._queue.get()
+            started = time.monotonic()
+            payload: Dict[str, Any] = {
+                "job_id": job_id,
+                "session_id": session_id,
+                "interpretation": None,
+                "warnings": [],
+            }
+            try:
+                result = await asyncio.wait_for(
+                    asyncio.get_running_loop().run_in_executor(self._executor, interpret),
+                    timeout=self._job_timeout_seconds,
+                )
+                payload["status"] = InterpretationJobStatus.READY
+                payload["interpretation"] = asdict(result)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.warning("Interpretation job failed job_id=%s", job_id, exc_info=True)
+                payload["status"] = InterpretationJobStatus.FAILED
+                payload["warnings"] = ["llm_unavailable"]
+            finally:
+                self._queue.task_done()
+
+            try:
+                await self._save(job_id, payload)
+            except Exception:
+                logger.exception("Failed to persist interpretation job job_id=%s", job_id)
+            logger.info(
+                "interpretation_job_finished job_id=%s status=%s duration_ms=%d",
+                job_id,
+                payload["status"],
+                int((time.monotonic() - started) * 1000),
+            )
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            "workers": len(self._workers),
+            "queued": self._queue.qsize() if self._queue is not None else 0,
+            "max_queue_size": self._max_queue_size,
+        }
+
+    async def shutdown(self) -> None:
+        """Cancel workers; queued jobs are abandoned and expire with their TTL.
+
+        A running LLM call is not interrupted, but it is bounded by the
+        interpreter's request timeout.
+        """
+        for task in self._workers:
+            task.cancel()
+        if self._workers:
+            await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        self._queue = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
@@ -50,11 +50,16 @@ class InterpretationResult:
     alternative_roles: List[str]
     differentiation_criteria: str
     why_this_role_reasons: List[str]
+    is_fallback: bool = False
 
 
 class LLMInterpreter:
     """LLM-based interpreter for natural language explanation of test results."""
 
+    # Bump whenever the system prompt or _format_prompt output changes:
+    # cached interpretations are keyed by this version.
+    PROMPT_VERSION = "2026.1"
+
     EXPLANATION_BLOCK_TITLES = [
         "Почему тебе подходит роль",
         "Твои сильные качества",
@@ -68,6 +73,7 @@ class LLMInterpreter:
         model: str = "gpt-4o",
         score_threshold: float = 0.1,
         retry_config: Optional[RetryConfig] = None,
+        request_timeout_seconds: float = 90.0,
     ):
         self._api_key = api_key or os.getenv("OPENAI_API_KEY")
         if not self._api_key:
@@ -80,6 +86,8 @@ class LLMInterpreter:
         self._model = model
         self._score_threshold = score_threshold
         self._retry_config = retry_config or RetryConfig()
+        # Budget for one interpretation, retries included; curl is killed when it runs out.
+        self._request_timeout_seconds = max(1.0, float(request_timeout_seconds))
 
     def _calculate_delay(self, attempt: int) -> float:
         delay = self._retry_config.base_delay * (self._retry_config.exponential_base**attempt)
@@ -145,11 +153,15 @@ primary_recommendation, explanation, signal_analysis, why_this_role_reasons, alt
             "max_tokens": 900,
         })
 
+        deadline = time.monotonic() + self._request_timeout_seconds
         for attempt in range(self._retry_config.max_retries + 1):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise LLMAPIError("OpenAI call timed out")
             try:
                 result = subprocess.run(
                     [
-                        "curl", "-s", "--max-time", "45",
+                        "curl", "-s", "--max-time", f"{min(45.0, remaining):.1f}",
                         "-X", "POST", f"{self._base_url}/chat/completions",
                         "-H", "Content-Type: application/json",
                         "-H", f"Authorization: Bearer {self._api_key}",
@@ -158,7 +170,7 @@ primary_recommendation, explanation, signal_analysis, why_this_role_reasons, alt
                     ],
                     capture_output=True,
                     text=True,
-                    timeout=50,
+                    timeout=min(50.0, remaining + 1.0),
                 )
 
                 if result.returncode != 0:
@@ -171,9 +183,11 @@ primary_recommendation, explanation, signal_analysis, why_this_role_reasons, alt
 
                 return data["choices"][0]["message"]["content"]
 
+            except subprocess.TimeoutExpired as e:
+                raise LLMAPIError(f"OpenAI call timed out: {e}") from e
             except LLMAPIError as e:
-                if attempt < self._retry_config.max_retries:
-                    delay = self._calculate_delay(attempt)
+                delay = self._calculate_delay(attempt)
+                if attempt < self._retry_config.max_retries and time.monotonic() + delay < deadline:
                     logger.warning(f"Retry {attempt + 1}: {e}. Waiting {delay:.2f}s...")
                     time.sleep(delay)
                 else:
@@ -517,8 +531,19 @@ primary_recommendation, explanation, signal_analysis, why_this_role_reasons, alt
                 alternative_roles=[] if not multiple_recommendations else [r[0] for r in ranked_roles[1:3]],
                 differentiation_criteria="",
                 why_this_role_reasons=[],
+                is_fallback=True,
             )
 
+    @property
+    def model(self) -> str:
+        """Model name used for completions."""
+        return self._model
+
+    @property
+    def score_threshold(self) -> float:
+        """Score gap below which the top roles are treated as close."""
+        return self._score_threshold
+
     @property
     def retry_config(self) -> RetryConfig:
         """Get current retry configuration."""
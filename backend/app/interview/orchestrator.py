@@ -11,24 +11,29 @@ Orchestrates the role-first scoring pipeline:
 7. Return results
 """
 
-from typing import List, Dict, Tuple, Optional
+from typing import Any, List, Dict, Tuple, Optional
 from dataclasses import dataclass, field
+import asyncio
 import os
 import logging
+import time
 
 from app.config import settings
+from app.infra.http_cache import EncodedPayload
 
+from .catalog import InterviewCatalog, get_interview_catalog
 from .storage.role_profile_manager import RoleProfileManager
 from .storage.signal_dictionary_manager import SignalDictionaryManager
-from .storage.question_bank_manager import QuestionBankManager
 from .storage.user_response_store import UserResponseStore
 from .storage.redis_session_store import RedisSessionStore
 from .storage.session_store import SessionBackendUnavailableError
+from .storage.session_token import SessionNonceRegistry, SessionTokenSigner
 from .storage.role_catalog_manager import RoleCatalogManager
 from .storage.stage_manager import StageManager
-from .aggregation.aggregation_engine import AggregationEngine
+from .aggregation.aggregation_engine import AggregationEngine, RoleScoreResult
 from .aggregation.stage_aggregation_engine import StageAggregationEngine, StageScoreComputeResult
 from .interpretation.llm_interpreter import LLMInterpreter, InterpretationResult
+from .interpretation.interpretation_cache import InterpretationCache
 from .models.question import Question
 
 logger = logging.getLogger(__name__)
@@ -46,7 +51,15 @@ class CareerTestResult:
 
 
 class ITCareerTestOrchestrator:
-    """Orchestrator for the IT Career Test Engine v2.1."""
+    """
+    Orchestrator for the IT Career Test Engine v2.1.
+
+    Reference data comes from the shared interview catalog snapshot. The
+    question bank (and with it the session stores, codec and scoring model)
+    is pinned to the snapshot current at construction, since in-flight
+    sessions are bound to it; role, signal and stage data follow catalog
+    reloads unless an explicit catalog is passed in.
+    """
 
     def __init__(
         self,
@@ -54,14 +67,18 @@ class ITCareerTestOrchestrator:
         model: str = "gpt-4",
         enable_llm: bool = True,
         session_backend: str = None,
+        catalog: Optional[InterviewCatalog] = None,
     ):
-        self.role_manager = RoleProfileManager()
-        self.signal_manager = SignalDictionaryManager()
-        self.question_manager = QuestionBankManager()
+        self._pinned_catalog = catalog
+        initial_catalog = catalog or get_interview_catalog()
+        self._question_catalog = initial_catalog
+        self.question_manager = initial_catalog.question_bank
         backend = (session_backend or settings.INTERVIEW_SESSION_BACKEND or "memory").lower()
-        if backend not in {"memory", "redis"}:
+        if backend not in {"memory", "redis", "token"}:
             raise ValueError(f"Unsupported interview session backend: {backend}")
         self._session_backend = backend
+        self.session_tokens: Optional[SessionTokenSigner] = None
+        self.session_nonces: Optional[SessionNonceRegistry] = None
         if backend == "redis":
             try:
                 self.response_store = RedisSessionStore(
@@ -87,32 +104,127 @@ class ITCareerTestOrchestrator:
                 self.question_manager,
                 max_active_sessions=settings.INTERVIEW_SESSION_MAX_ACTIVE,
             )
-        self.aggregation_engine = AggregationEngine(self.response_store)
-        self.role_catalog_manager = RoleCatalogManager()
-        self.stage_manager = StageManager()
-        self.stage_engine = StageAggregationEngine(
-            stage_manager=self.stage_manager,
-            role_catalog_manager=self.role_catalog_manager,
+        if backend == "token":
+            # Stateless sessions: state lives in signed tokens held by the client.
+            self.session_tokens = SessionTokenSigner(
+                initial_catalog.session_codec,
+                secret=settings.INTERVIEW_SESSION_TOKEN_SECRET or settings.JWT_SECRET_KEY,
+                ttl_seconds=max(60, settings.CAREER_SESSION_TTL_MINUTES * 60),
+            )
+            self.session_nonces = SessionNonceRegistry()
+        self.aggregation_engine = AggregationEngine(
+            self.response_store,
+            scoring_model=initial_catalog.scoring_model,
         )
 
         self.llm_interpreter = None
+        self.interpretation_cache = None
         if enable_llm:
-            self.llm_interpreter = LLMInterpreter(api_key=openai_api_key, model=model)
+            self.llm_interpreter = LLMInterpreter(
+                api_key=openai_api_key,
+                model=model,
+                request_timeout_seconds=settings.INTERVIEW_LLM_JOB_TIMEOUT_SECONDS,
+            )
+            if settings.INTERVIEW_LLM_CACHE_ENABLED:
+                # The catalog version is added per lookup: role and signal
+                # texts in the prompt follow catalog reloads.
+                self.interpretation_cache = InterpretationCache(
+                    version=f"{LLMInterpreter.PROMPT_VERSION}:{self.llm_interpreter.model}",
+                    redis_url=settings.REDIS_URL,
+                    ttl_seconds=settings.INTERVIEW_LLM_CACHE_TTL_SECONDS,
+                    local_max_entries=settings.INTERVIEW_LLM_CACHE_LOCAL_SIZE,
+                    score_step=settings.INTERVIEW_LLM_CACHE_SCORE_STEP,
+                    close_threshold=self.llm_interpreter.score_threshold,
+                )
+
+    @property
+    def catalog(self) -> InterviewCatalog:
+        return self._pinned_catalog or get_interview_catalog()
+
+    @property
+    def role_manager(self) -> RoleProfileManager:
+        return self.catalog.role_profiles
+
+    @property
+    def signal_manager(self) -> SignalDictionaryManager:
+        return self.catalog.signals
+
+    @property
+    def role_catalog_manager(self) -> RoleCatalogManager:
+        return self.catalog.role_catalog
+
+    @property
+    def stage_manager(self) -> StageManager:
+        return self.catalog.stage_manager
+
+    @property
+    def stage_engine(self) -> StageAggregationEngine:
+        return self.catalog.stage_engine
 
     def get_all_questions(self) -> List[Question]:
         return self.question_manager.get_all_questions()
 
-    def start_test(self) -> str:
-        session = self.response_store.create_session()
+    @property
+    def questions_payload(self) -> EncodedPayload:
+        """Pre-encoded question list for the pinned question bank."""
+        return self._question_catalog.questions_payload
+
+    async def start_test(self) -> str:
+        session = await self.response_store.create_session()
         return session.session_id
 
-    def submit_answer(self, session_id: str, question_id: str, answer_option_id: str) -> None:
-        self.response_store.store_response(session_id, question_id, answer_option_id)
+    async def submit_answer(self, session_id: str, question_id: str, answer_option_id: str) -> None:
+        await self.response_store.store_response(session_id, question_id, answer_option_id)
 
-    def complete_test(self, session_id: str, skip_llm: bool = False) -> CareerTestResult:
+    @property
+    def uses_session_tokens(self) -> bool:
+        return self.session_tokens is not None
+
+    async def start_token_test(self) -> Tuple[str, str]:
+        """Start a stateless session; returns (session_id, session_token)."""
+        state = self.session_tokens.issue()
+        return state.session_id, self.session_tokens.encode(state)
+
+    async def submit_token_answer(
+        self,
+        session_id: str,
+        session_token: str,
+        question_id: str,
+        answer_option_id: str,
+    ) -> str:
+        """Record an answer in a stateless session and return the new token."""
+        state = self.session_tokens.decode(session_token, session_id)
+        return self.session_tokens.encode(
+            self.session_tokens.with_answer(state, question_id, answer_option_id)
+        )
+
+    async def complete_token_test(
+        self,
+        session_id: str,
+        session_token: str,
+        skip_llm: bool = False,
+    ) -> CareerTestResult:
+        """Score a stateless session; each token can be completed once."""
+        state = self.session_tokens.decode(session_token, session_id)
+        session = self.session_tokens.to_session(state)
+        score_result = self.aggregation_engine.score_session(session)
+        await self.session_nonces.claim(state)
+        return await self._finish_test(session_id, score_result, skip_llm)
+
+    async def complete_test(self, session_id: str, skip_llm: bool = False) -> CareerTestResult:
         """Complete the test: role scores -> role-first stage selection -> LLM interpretation."""
-        score_result = self.aggregation_engine.compute_scores(session_id)
-        self.response_store.complete_session(session_id)
+        # One atomic store call checks every question is answered, completes
+        # the session and returns the snapshot that is scored.
+        session = await self.response_store.complete_session(session_id, require_all_answered=True)
+        score_result = self.aggregation_engine.score_session(session)
+        return await self._finish_test(session_id, score_result, skip_llm)
+
+    async def _finish_test(
+        self,
+        session_id: str,
+        score_result: RoleScoreResult,
+        skip_llm: bool,
+    ) -> CareerTestResult:
         warnings: List[str] = []
 
         # Role-first stage selection
@@ -130,26 +242,10 @@ class ITCareerTestOrchestrator:
         interpretation = None
         if not skip_llm and self.llm_interpreter is not None:
             try:
-                role_profiles = {
-                    role.id: {
-                        'name': role.name,
-                        'description': role.description,
-                        'key_signals': role.key_signals
-                    }
-                    for role in self.role_manager.get_all_roles()
-                }
-                signals = {
-                    signal.id: {
-                        'name': signal.name,
-                        'description': signal.description
-                    }
-                    for signal in self.signal_manager.get_all_signals()
-                }
-                interpretation = self.llm_interpreter.interpret_results(
+                interpretation = await asyncio.to_thread(
+                    self.interpret_scores,
                     ranked_roles=score_result.ranked_roles,
                     signal_profile=score_result.signal_profile,
-                    role_profiles=role_profiles,
-                    signals=signals
                 )
             except Exception:
                 # LLM is non-critical for the test flow: return deterministic result without interpretation.
@@ -166,11 +262,66 @@ class ITCareerTestOrchestrator:
             warnings=warnings,
         )
 
-    def run_full_test(self, answers: List[Tuple[str, str]]) -> CareerTestResult:
-        session_id = self.start_test()
+    @property
+    def llm_enabled(self) -> bool:
+        return self.llm_interpreter is not None
+
+    def get_cached_interpretation(
+        self,
+        ranked_roles: List[Tuple[str, float]],
+        signal_profile: Dict[str, int],
+    ) -> Optional[InterpretationResult]:
+        """Return a cached interpretation for this profile without calling the LLM."""
+        if self.interpretation_cache is None:
+            return None
+        cache_key = self.interpretation_cache.build_key(ranked_roles, signal_profile, self.catalog.version)
+        return self.interpretation_cache.get(cache_key)
+
+    def interpret_scores(
+        self,
+        ranked_roles: List[Tuple[str, float]],
+        signal_profile: Dict[str, int],
+        check_cache: bool = True,
+    ) -> InterpretationResult:
+        """
+        Interpret results, reusing a cached interpretation for the same profile.
+
+        Pass check_cache=False when the caller already looked the profile up
+        via get_cached_interpretation, so a miss is not counted twice.
+        """
+        # One snapshot for both the key and the prompt, so a concurrent
+        # reload cannot file this result under the other catalog version.
+        catalog = self.catalog
+        cache_key = None
+        if self.interpretation_cache is not None:
+            cache_key = self.interpretation_cache.build_key(ranked_roles, signal_profile, catalog.version)
+            if check_cache:
+                cached = self.interpretation_cache.get(cache_key)
+                if cached is not None:
+                    return cached
+
+        started = time.perf_counter()
+        interpretation = self.llm_interpreter.interpret_results(
+            ranked_roles=ranked_roles,
+            signal_profile=signal_profile,
+            role_profiles=catalog.llm_role_profiles,
+            signals=catalog.llm_signals
+        )
+        if self.interpretation_cache is not None:
+            self.interpretation_cache.record_llm_call((time.perf_counter() - started) * 1000)
+            self.interpretation_cache.set(cache_key, interpretation)
+        return interpretation
+
+    def get_interpretation_cache_stats(self) -> Optional[Dict[str, Any]]:
+        if self.interpretation_cache is None:
+            return None
+        return self.interpretation_cache.get_stats()
+
+    async def run_full_test(self, answers: List[Tuple[str, str]]) -> CareerTestResult:
+        session_id = await self.start_test()
         for question_id, answer_option_id in answers:
-            self.submit_answer(session_id, question_id, answer_option_id)
-        return self.complete_test(session_id)
+            await self.submit_answer(session_id, question_id, answer_option_id)
+        return await self.complete_test(session_id)
 
 
 def load_env_file():
@@ -187,17 +338,11 @@ def load_env_file():
         logger.warning("Could not load .env file: %s", e)
 
 
-def main():
-    load_env_file()
-    logger.info("=" * 60)
-    logger.info("IT Career Test Engine v2.1")
-    logger.info("=" * 60)
-
-    orchestrator = ITCareerTestOrchestrator()
+async def _run_interactive(orchestrator: ITCareerTestOrchestrator) -> CareerTestResult:
     questions = orchestrator.get_all_questions()
     logger.info("Загружено %d вопросов.", len(questions))
 
-    session_id = orchestrator.start_test()
+    session_id = await orchestrator.start_test()
     for i, question in enumerate(questions, 1):
         num_options = len(question.answer_options)
         logger.info("Вопрос %d/%d: [%s]", i, len(questions), question.thematic_block)
@@ -208,12 +353,22 @@ def main():
             try:
                 idx = int(input(f"\nВаш выбор (1-{num_options}): ").strip()) - 1
                 if 0 <= idx < num_options:
-                    orchestrator.submit_answer(session_id, question.id, question.answer_options[idx].id)
+                    await orchestrator.submit_answer(session_id, question.id, question.answer_options[idx].id)
                     break
             except ValueError:
                 pass
 
-    result = orchestrator.complete_test(session_id)
+    return await orchestrator.complete_test(session_id)
+
+
+def main():
+    load_env_file()
+    logger.info("=" * 60)
+    logger.info("IT Career Test Engine v2.1")
+    logger.info("=" * 60)
+
+    orchestrator = ITCareerTestOrchestrator()
+    result = asyncio.run(_run_interactive(orchestrator))
     logger.info("Топ-5 ролей:")
     for i, (role_id, score) in enumerate(result.ranked_roles[:5], 1):
         role = orchestrator.role_manager.get_role(role_id)
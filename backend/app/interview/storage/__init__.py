@@ -18,7 +18,10 @@ from .user_response_store import (
     QuestionAlreadyAnsweredError,
     InvalidReferenceError,
     SessionCompleteError,
+    UnansweredQuestionsError,
 )
+from .session_codec import SessionCodec, SessionCodecError
+from .session_token import SessionTokenSigner, SessionTokenError, SessionNonceRegistry
 from .redis_session_store import RedisSessionStore
 from .stage_manager import StageManager
 
@@ -32,10 +35,16 @@ __all__ = [
     'SessionBackendUnavailableError',
     'UserResponseStore',
     'RedisSessionStore',
+    'SessionCodec',
+    'SessionCodecError',
+    'SessionTokenSigner',
+    'SessionTokenError',
+    'SessionNonceRegistry',
     'UserResponseStoreError',
     'SessionNotFoundError',
     'QuestionAlreadyAnsweredError',
     'InvalidReferenceError',
     'SessionCompleteError',
+    'UnansweredQuestionsError',
     'StageManager',
 ]
@@ -1,7 +1,7 @@
 
 import json
 import logging
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -30,12 +30,14 @@ class CareerPipelineManager:
         self._graph_data: List[Dict] = []
         self._clusters_data: List[Dict] = []
         self._version: str = ""
-        self._last_loaded_mtime: Optional[float] = None
+        self._next_roles: Dict[str, List[Dict]] = {}
+        self._transitions: Dict[Tuple[str, str], Dict] = {}
+        self._cluster_by_role: Dict[str, Dict] = {}
         
         self._load_data()
         
     def _load_data(self) -> None:
-        """Load data from the JSON file."""
+        """Load data from the JSON file and build the lookup tables."""
         if not self.data_file.exists():
             # Fallback or empty init if file missing (should not happen in prod)
             logger.warning("Career pipeline data file not found at %s", self.data_file)
@@ -44,34 +46,40 @@ class CareerPipelineManager:
         try:
             with open(self.data_file, 'r', encoding='utf-8') as f:
                 data = json.load(f)
-                self._version = data.get("version", "unknown")
-                self._graph_data = data.get("career_pipeline_graph", [])
-                self._clusters_data = data.get("role_clusters", [])
-                self._last_loaded_mtime = self.data_file.stat().st_mtime
         except Exception as e:
             logger.error("Error loading career pipeline data: %s", e)
+            return
 
-    def _reload_if_source_changed(self) -> None:
-        """
-        Reload data when JSON source changes on disk.
+        graph = data.get("career_pipeline_graph", [])
+        clusters = data.get("role_clusters", [])
+        next_roles: Dict[str, List[Dict]] = {}
+        transitions: Dict[Tuple[str, str], Dict] = {}
+        for edge in graph:
+            next_roles.setdefault(edge.get("from"), []).append(edge)
+            transitions.setdefault((edge.get("from"), edge.get("to")), edge)
+        cluster_by_role: Dict[str, Dict] = {}
+        for cluster in clusters:
+            for role_id in cluster.get("roles", []):
+                cluster_by_role.setdefault(role_id, cluster)
 
-        This keeps singleton consumers fresh in long-running API processes.
+        self._version = data.get("version", "unknown")
+        self._graph_data = graph
+        self._clusters_data = clusters
+        self._next_roles = next_roles
+        self._transitions = transitions
+        self._cluster_by_role = cluster_by_role
+
+    def reload(self) -> None:
         """
-        if not self.data_file.exists():
-            return
+        Re-read the JSON source.
 
-        current_mtime = self.data_file.stat().st_mtime
-        should_reload = (
-            self._last_loaded_mtime is None
-            or current_mtime > self._last_loaded_mtime
-            or not self._graph_data
-        )
-        if should_reload:
-            self._load_data()
+        Long-running processes get fresh data through the interview catalog
+        watcher (app.interview.catalog), which builds a new manager on change.
+        """
+        self._load_data()
             
     def get_version(self) -> str:
         """Return the data version."""
-        self._reload_if_source_changed()
         return self._version
         
     def get_next_roles(self, role_id: str) -> List[Dict[str, Any]]:
@@ -84,12 +92,7 @@ class CareerPipelineManager:
         Returns:
             List of transition objects containing 'to', 'reason', etc.
         """
-        self._reload_if_source_changed()
-        transitions = []
-        for edge in self._graph_data:
-            if edge.get("from") == role_id:
-                transitions.append(edge)
-        return transitions
+        return list(self._next_roles.get(role_id, []))
         
     def get_transition_details(self, from_role: str, to_role: str) -> Optional[Dict[str, Any]]:
         """
@@ -102,15 +105,10 @@ class CareerPipelineManager:
         Returns:
             Transition details dict or None if no direct transition exists.
         """
-        self._reload_if_source_changed()
-        for edge in self._graph_data:
-            if edge.get("from") == from_role and edge.get("to") == to_role:
-                return edge
-        return None
+        return self._transitions.get((from_role, to_role))
         
     def get_role_clusters(self) -> List[Dict[str, Any]]:
         """Get all role clusters."""
-        self._reload_if_source_changed()
         return self._clusters_data
         
     def get_cluster_for_role(self, role_id: str) -> Optional[Dict[str, Any]]:
@@ -123,13 +121,8 @@ class CareerPipelineManager:
         Returns:
             The cluster object or None.
         """
-        self._reload_if_source_changed()
-        for cluster in self._clusters_data:
-            if role_id in cluster.get("roles", []):
-                return cluster
-        return None
+        return self._cluster_by_role.get(role_id)
     
     def get_full_graph(self) -> List[Dict[str, Any]]:
         """Return the complete graph data."""
-        self._reload_if_source_changed()
         return self._graph_data
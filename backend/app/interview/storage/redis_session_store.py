@@ -1,34 +1,122 @@
 """
 Redis-backed interview session store.
+
+Each session is a single Redis hash of metadata (_status, _version,
+_created_at, _expires_at) plus _answers: the compact (question_index,
+option_index) byte pairs from session_codec, in answer order (scoring
+relies on that order for tie-breaking). Weights are resolved from the
+question bank when a snapshot is loaded. Answers and completion are applied
+by Lua scripts, so per-answer writes are atomic without distributed locks.
+Admission control runs in one script against an expiry-scored active
+index, so session starts are constant time and need no global lock.
 """
 
-from contextlib import contextmanager
 from datetime import datetime, timedelta, timezone
 import logging
-import time
-from typing import List, Optional
+from typing import Dict, List, Optional
 from uuid import uuid4
 
 import redis
-from redis.exceptions import RedisError
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError, ResponseError
 
 from app.config import settings
 
 from ..models.user_response import SessionModel, SessionStatus, UserResponse
 from .question_bank_manager import QuestionBankManager
+from .session_codec import SessionCodec, SessionCodecError
 from .session_store import SessionStore, SessionBackendUnavailableError, SessionLimitExceededError
-from .user_response_store import InvalidReferenceError, SessionCompleteError, SessionNotFoundError
+from .user_response_store import (
+    InvalidReferenceError,
+    SessionCompleteError,
+    SessionNotFoundError,
+    UnansweredQuestionsError,
+)
 
 logger = logging.getLogger(__name__)
 
+_STATUS_FIELD = "_status"
+_VERSION_FIELD = "_version"
+_CREATED_FIELD = "_created_at"
+_EXPIRES_FIELD = "_expires_at"
+_ANSWERS_FIELD = "_answers"
+# Marker of the earlier one-field-per-question hash layout.
+_LEGACY_SEQ_FIELD = "_seq"
+
+# Script result codes
+_OK = 1
+_LIMIT_EXCEEDED = 0
+_NOT_FOUND = -1
+_COMPLETED = -3
+_LEGACY_LAYOUT = -4
+_VERSION_MISMATCH = -5
+_INCOMPLETE = -6
+
+# The active index is a sorted set of in-progress session ids scored by
+# expiry (unix seconds): expired members are dropped with one
+# ZREMRANGEBYSCORE and ZCARD is the live count.
+
+# KEYS[1] = active index, KEYS[2] = session hash;
+# ARGV = now, expires_at_score, max_active, session_id, ttl_seconds,
+#        status, version, created_at, expires_at
+_CREATE_SESSION_SCRIPT = """
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', ARGV[1])
+if redis.call('ZCARD', KEYS[1]) >= tonumber(ARGV[3]) then return 0 end
+redis.call('HSET', KEYS[2], '_status', ARGV[6], '_version', ARGV[7],
+  '_created_at', ARGV[8], '_expires_at', ARGV[9], '_answers', '')
+redis.call('EXPIRE', KEYS[2], ARGV[5])
+redis.call('ZADD', KEYS[1], ARGV[2], ARGV[4])
+return 1
+"""
+
+# KEYS[1] = session hash, KEYS[2] = active index;
+# ARGV = answer pair (2 bytes), bank version, ttl_seconds, session_id,
+#        expires_at_score, expires_at
+_STORE_RESPONSE_SCRIPT = """
+local status = redis.call('HGET', KEYS[1], '_status')
+if not status then return -1 end
+if status == 'completed' then return -3 end
+if redis.call('HEXISTS', KEYS[1], '_seq') == 1 then return -4 end
+if redis.call('HGET', KEYS[1], '_version') ~= ARGV[2] then return -5 end
+local answers = redis.call('HGET', KEYS[1], '_answers') or ''
+local question = string.sub(ARGV[1], 1, 1)
+local updated = nil
+for i = 1, #answers, 2 do
+  if string.sub(answers, i, i) == question then
+    updated = string.sub(answers, 1, i - 1) .. ARGV[1] .. string.sub(answers, i + 2)
+    break
+  end
+end
+if not updated then updated = answers .. ARGV[1] end
+redis.call('HSET', KEYS[1], '_answers', updated, '_expires_at', ARGV[6])
+redis.call('EXPIRE', KEYS[1], ARGV[3])
+redis.call('ZADD', KEYS[2], 'XX', ARGV[5], ARGV[4])
+return 1
+"""
+
+# KEYS[1] = session hash, KEYS[2] = active index;
+# ARGV = session_id, ttl_seconds, bank version, required answer count (0 = any).
+# Returns the completed session hash so no second read is needed.
+_COMPLETE_SESSION_SCRIPT = """
+local status = redis.call('HGET', KEYS[1], '_status')
+if not status then return -1 end
+if status == 'completed' then return -3 end
+if redis.call('HEXISTS', KEYS[1], '_seq') == 1 then return -4 end
+if redis.call('HGET', KEYS[1], '_version') ~= ARGV[3] then return -5 end
+local answers = redis.call('HGET', KEYS[1], '_answers') or ''
+if #answers / 2 < tonumber(ARGV[4]) then return -6 end
+redis.call('HSET', KEYS[1], '_status', 'completed')
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+redis.call('ZREM', KEYS[2], ARGV[1])
+return redis.call('HGETALL', KEYS[1])
+"""
+
 
 class RedisSessionStore(SessionStore):
-    """Session store backed by Redis with TTL and distributed locks."""
+    """Session store backed by Redis hashes, TTLs and atomic Lua scripts."""
 
     _SESSION_KEY_PREFIX = "interview:session:"
-    _SESSION_LOCK_PREFIX = "interview:session:lock:"
     _ACTIVE_SESSIONS_KEY = "interview:sessions:active"
-    _CREATE_LOCK_KEY = "interview:sessions:create_lock"
 
     def __init__(
         self,
@@ -49,165 +137,284 @@ class RedisSessionStore(SessionStore):
             else settings.INTERVIEW_SESSION_MAX_ACTIVE
         )
         self._ttl_seconds = max(60, settings.CAREER_SESSION_TTL_MINUTES * 60)
-        self._redis = redis.Redis.from_url(
-            self._redis_url,
-            decode_responses=True,
-            socket_connect_timeout=5,
-            socket_timeout=10
-        )
+        self._codec = SessionCodec(question_bank_manager)
 
+        # One-off synchronous reachability check so the orchestrator can
+        # fall back to the in-memory store at construction time.
+        probe = redis.Redis.from_url(self._redis_url, socket_connect_timeout=5, socket_timeout=5)
         try:
-            self._redis.ping()
+            probe.ping()
         except RedisError as exc:
             raise SessionBackendUnavailableError(
                 "Interview Redis session backend is unavailable"
             ) from exc
+        finally:
+            probe.close()
+
+        self._redis = aioredis.Redis.from_url(
+            self._redis_url,
+            decode_responses=True,
+            socket_connect_timeout=5,
+            socket_timeout=10
+        )
+        self._create_session_script = self._redis.register_script(_CREATE_SESSION_SCRIPT)
+        self._store_response_script = self._redis.register_script(_STORE_RESPONSE_SCRIPT)
+        self._complete_session_script = self._redis.register_script(_COMPLETE_SESSION_SCRIPT)
 
     def _session_key(self, session_id: str) -> str:
         return f"{self._SESSION_KEY_PREFIX}{session_id}"
 
-    def _session_lock_key(self, session_id: str) -> str:
-        return f"{self._SESSION_LOCK_PREFIX}{session_id}"
-
-    @contextmanager
-    def _redis_lock(self, lock_key: str):
-        lock = self._redis.lock(lock_key, timeout=10, blocking_timeout=3)
-        started = time.monotonic()
-        acquired = lock.acquire(blocking=True)
-        wait_ms = int((time.monotonic() - started) * 1000)
-        logger.info("redis_lock_wait_ms=%s lock_key=%s", wait_ms, lock_key)
-
-        if not acquired:
-            raise SessionBackendUnavailableError("Could not acquire Redis session lock")
-
+    def _get_codec(self) -> SessionCodec:
+        if self._codec.version != self._question_bank_manager.get_version():
+            self._codec = SessionCodec(self._question_bank_manager)
+        return self._codec
+
+    def _build_session(self, session_id: str, fields: Dict[str, str]) -> SessionModel:
+        """Build a SessionModel snapshot from a session hash, resolving answers from the bank."""
+        version = fields.get(_VERSION_FIELD) or None
+        codec = self._get_codec()
+        if version != codec.version:
+            raise SessionNotFoundError(
+                f"Session '{session_id}' was started on question bank {version}, current is {codec.version}"
+            )
         try:
-            yield
-        finally:
-            try:
-                lock.release()
-            except Exception:
-                logger.warning("Failed to release Redis lock: %s", lock_key)
-
-    def _save_session(self, session: SessionModel) -> None:
-        self._redis.set(
-            self._session_key(session.session_id),
-            session.model_dump_json(),
-            ex=self._ttl_seconds,
+            responses = codec.to_responses(session_id, fields.get(_ANSWERS_FIELD, "").encode("ascii"))
+        except SessionCodecError as exc:
+            raise SessionNotFoundError(f"Session '{session_id}' is unreadable: {exc}") from exc
+
+        expires_at = fields.get(_EXPIRES_FIELD)
+        return SessionModel(
+            session_id=session_id,
+            responses=responses,
+            status=SessionStatus(fields.get(_STATUS_FIELD, SessionStatus.IN_PROGRESS.value)),
+            locked_question_bank_version=version,
+            created_at=datetime.fromisoformat(fields[_CREATED_FIELD]),
+            expires_at=datetime.fromisoformat(expires_at) if expires_at else None,
         )
 
-    def _load_session(self, session_id: str) -> SessionModel:
-        payload = self._redis.get(self._session_key(session_id))
-        if not payload:
-            raise SessionNotFoundError(f"Session '{session_id}' does not exist")
-        return SessionModel.model_validate_json(payload)
-
-    def _prune_active_index(self) -> None:
-        session_ids = self._redis.zrange(self._ACTIVE_SESSIONS_KEY, 0, -1)
-        if not session_ids:
+    def _legacy_answers(self, fields: Dict[str, str]) -> bytes:
+        """Encode answers of the one-field-per-question layout ("<seq>:<option_id>")."""
+        answers = []
+        for question_id, value in fields.items():
+            if question_id.startswith("_"):
+                continue
+            seq, _, option_id = value.partition(":")
+            answers.append((int(seq), question_id, option_id))
+        answers.sort()
+        return self._get_codec().encode((question_id, option_id) for _, question_id, option_id in answers)
+
+    async def _read_legacy_session(self, key: str, key_type: str):
+        """Return (compact mapping, status) for a legacy session, or (None, None)."""
+        if key_type == "string":
+            payload = await self._redis.get(key)
+            if not payload:
+                return None, None
+            legacy = SessionModel.model_validate_json(payload)
+            status = legacy.status.value
+            mapping = {
+                _STATUS_FIELD: status,
+                _VERSION_FIELD: legacy.locked_question_bank_version or "",
+                _CREATED_FIELD: legacy.created_at.isoformat(),
+                _EXPIRES_FIELD: legacy.expires_at.isoformat() if legacy.expires_at else "",
+            }
+            encoded = self._get_codec().encode(
+                (response.question_id, response.answer_option_id) for response in legacy.responses
+            )
+        elif key_type == "hash":
+            fields = await self._redis.hgetall(key)
+            if _LEGACY_SEQ_FIELD not in fields:
+                return None, None
+            status = fields.get(_STATUS_FIELD, SessionStatus.IN_PROGRESS.value)
+            mapping = {
+                name: fields[name]
+                for name in (_STATUS_FIELD, _VERSION_FIELD, _CREATED_FIELD, _EXPIRES_FIELD)
+                if name in fields
+            }
+            encoded = self._legacy_answers(fields)
+        else:
+            return None, None
+        mapping[_ANSWERS_FIELD] = encoded.decode("ascii")
+        return mapping, status
+
+    async def _migrate_legacy_session(self, session_id: str) -> None:
+        """
+        Rewrite a session from an older layout into the compact hash.
+
+        Reads both the original JSON string sessions (one SessionModel dump
+        per key) and the one-field-per-question hash layout.
+        """
+        key = self._session_key(session_id)
+        key_type = await self._redis.type(key)
+        try:
+            mapping, status = await self._read_legacy_session(key, key_type)
+        except SessionCodecError as exc:
+            raise SessionNotFoundError(f"Session '{session_id}' is unreadable: {exc}") from exc
+        if mapping is None:
             return
 
-        pipeline = self._redis.pipeline()
-        for session_id in session_ids:
-            pipeline.exists(self._session_key(session_id))
-        exists_flags = pipeline.execute()
+        ttl = await self._redis.ttl(key)
+        ttl = ttl if ttl and ttl > 0 else self._ttl_seconds
+        async with self._redis.pipeline(transaction=True) as pipe:
+            pipe.delete(key)
+            pipe.hset(key, mapping=mapping)
+            pipe.expire(key, ttl)
+            if status == SessionStatus.IN_PROGRESS.value:
+                # Legacy index entries were scored by creation time, so the
+                # create script may already have evicted this one as expired;
+                # (re-)add it with its real expiry.
+                pipe.zadd(
+                    self._ACTIVE_SESSIONS_KEY,
+                    {session_id: datetime.now(timezone.utc).timestamp() + ttl},
+                )
+            await pipe.execute()
+        logger.info("interview_session_migrated session_id=%s from=%s", session_id, key_type)
 
-        stale_ids = [
-            session_id
-            for session_id, exists in zip(session_ids, exists_flags)
-            if not exists
-        ]
-        if stale_ids:
-            self._redis.zrem(self._ACTIVE_SESSIONS_KEY, *stale_ids)
+    async def _run_script(self, script, session_id: str, keys: List[str], args: List):
+        try:
+            result = await script(keys=keys, args=args)
+        except ResponseError as exc:
+            if "WRONGTYPE" not in str(exc):
+                raise
+            result = _LEGACY_LAYOUT
+        if result != _LEGACY_LAYOUT:
+            return result
+        await self._migrate_legacy_session(session_id)
+        try:
+            result = await script(keys=keys, args=args)
+        except ResponseError as exc:
+            if "WRONGTYPE" not in str(exc):
+                raise
+            result = _LEGACY_LAYOUT
+        if result == _LEGACY_LAYOUT:
+            # A concurrent writer put the old layout back; do not loop on it.
+            raise SessionBackendUnavailableError(
+                f"Session '{session_id}' is still in a legacy layout after migration"
+            )
+        return result
 
-    def create_session(self) -> SessionModel:
+    async def _load_session(self, session_id: str) -> SessionModel:
+        key = self._session_key(session_id)
         try:
-            with self._redis_lock(self._CREATE_LOCK_KEY):
-                self._prune_active_index()
-                active_count = int(self._redis.zcard(self._ACTIVE_SESSIONS_KEY) or 0)
-                if active_count >= self._max_active_sessions:
-                    raise SessionLimitExceededError("Too many active interview sessions")
-
-                session_id = f"session_{uuid4()}"
-                now = datetime.now(timezone.utc)
-                session = SessionModel(
-                    session_id=session_id,
-                    responses=[],
-                    status=SessionStatus.IN_PROGRESS,
-                    locked_question_bank_version=self._question_bank_manager.get_version(),
-                    created_at=now,
-                    expires_at=now + timedelta(seconds=self._ttl_seconds),
-                )
+            fields = await self._redis.hgetall(key)
+        except ResponseError as exc:
+            if "WRONGTYPE" not in str(exc):
+                raise
+            await self._migrate_legacy_session(session_id)
+            fields = await self._redis.hgetall(key)
+        if not fields:
+            raise SessionNotFoundError(f"Session '{session_id}' does not exist")
+        if _LEGACY_SEQ_FIELD in fields:
+            await self._migrate_legacy_session(session_id)
+            fields = await self._redis.hgetall(key)
+        return self._build_session(session_id, fields)
+
+    async def create_session(self) -> SessionModel:
+        session_id = f"session_{uuid4()}"
+        now = datetime.now(timezone.utc)
+        session = SessionModel(
+            session_id=session_id,
+            responses=[],
+            status=SessionStatus.IN_PROGRESS,
+            locked_question_bank_version=self._question_bank_manager.get_version(),
+            created_at=now,
+            expires_at=now + timedelta(seconds=self._ttl_seconds),
+        )
 
-                self._question_bank_manager.lock_question_bank(session_id)
-                try:
-                    self._save_session(session)
-                    self._redis.zadd(self._ACTIVE_SESSIONS_KEY, {session_id: now.timestamp()})
-                except RedisError:
-                    self._question_bank_manager.unlock_question_bank(session_id)
-                    raise
-
-                return session
-        except SessionLimitExceededError:
-            raise
+        try:
+            result = await self._create_session_script(
+                keys=[self._ACTIVE_SESSIONS_KEY, self._session_key(session_id)],
+                args=[
+                    now.timestamp(),
+                    session.expires_at.timestamp(),
+                    self._max_active_sessions,
+                    session_id,
+                    self._ttl_seconds,
+                    session.status.value,
+                    session.locked_question_bank_version or "",
+                    session.created_at.isoformat(),
+                    session.expires_at.isoformat(),
+                ],
+            )
         except RedisError as exc:
             raise SessionBackendUnavailableError(
                 "Redis backend failed while creating interview session"
             ) from exc
 
-    def store_response(self, session_id: str, question_id: str, answer_option_id: str) -> UserResponse:
-        try:
-            with self._redis_lock(self._session_lock_key(session_id)):
-                session = self._load_session(session_id)
-                if session.status == SessionStatus.COMPLETED:
-                    raise SessionCompleteError(
-                        f"Cannot add responses to completed session '{session_id}'"
-                    )
-
-                question = self._question_bank_manager.get_question(question_id)
-                if question is None:
-                    raise InvalidReferenceError(f"Invalid question ID: '{question_id}'")
-
-                answer_option = next(
-                    (option for option in question.answer_options if option.id == answer_option_id),
-                    None,
-                )
-                if answer_option is None:
-                    raise InvalidReferenceError(
-                        f"Invalid answer option ID: '{answer_option_id}' for question '{question_id}'"
-                    )
-
-                user_response = UserResponse(
-                    session_id=session_id,
-                    question_id=question_id,
-                    answer_option_id=answer_option_id,
-                    resolved_signals=answer_option.signal_associations.copy(),
-                    resolved_weights=answer_option.role_weights.copy(),
-                    resolved_stage_weights=answer_option.stage_weights.copy(),
-                    timestamp=datetime.now(timezone.utc),
-                )
+        if result == _LIMIT_EXCEEDED:
+            raise SessionLimitExceededError("Too many active interview sessions")
 
-                existing_idx = next(
-                    (idx for idx, response in enumerate(session.responses) if response.question_id == question_id),
-                    None,
-                )
-                if existing_idx is None:
-                    session.responses.append(user_response)
-                else:
-                    session.responses[existing_idx] = user_response
-
-                self._save_session(session)
-                return user_response
-        except (SessionNotFoundError, SessionCompleteError, InvalidReferenceError):
-            raise
+        self._question_bank_manager.lock_question_bank(session_id)
+        return session
+
+    async def store_response(self, session_id: str, question_id: str, answer_option_id: str) -> UserResponse:
+        question = self._question_bank_manager.get_question(question_id)
+        if question is None:
+            raise InvalidReferenceError(f"Invalid question ID: '{question_id}'")
+
+        answer_option = next(
+            (option for option in question.answer_options if option.id == answer_option_id),
+            None,
+        )
+        if answer_option is None:
+            raise InvalidReferenceError(
+                f"Invalid answer option ID: '{answer_option_id}' for question '{question_id}'"
+            )
+
+        codec = self._get_codec()
+        pair = codec.encode_answer(question_id, answer_option_id)
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=self._ttl_seconds)
+        try:
+            result = await self._run_script(
+                self._store_response_script,
+                session_id,
+                keys=[self._session_key(session_id), self._ACTIVE_SESSIONS_KEY],
+                args=[
+                    pair,
+                    codec.version,
+                    self._ttl_seconds,
+                    session_id,
+                    expires_at.timestamp(),
+                    expires_at.isoformat(),
+                ],
+            )
         except RedisError as exc:
             raise SessionBackendUnavailableError(
                 f"Redis backend failed while storing response for session '{session_id}'"
             ) from exc
 
-    def get_session_responses(self, session_id: str) -> List[UserResponse]:
+        if result == _NOT_FOUND:
+            raise SessionNotFoundError(f"Session '{session_id}' does not exist")
+        if result == _COMPLETED:
+            raise SessionCompleteError(
+                f"Cannot add responses to completed session '{session_id}'"
+            )
+        if result == _VERSION_MISMATCH:
+            raise SessionNotFoundError(
+                f"Session '{session_id}' was started on another question bank version"
+            )
+
+        return UserResponse(
+            session_id=session_id,
+            question_id=question_id,
+            answer_option_id=answer_option_id,
+            resolved_signals=answer_option.signal_associations.copy(),
+            resolved_weights=answer_option.role_weights.copy(),
+            resolved_stage_weights=answer_option.stage_weights.copy(),
+            timestamp=datetime.now(timezone.utc),
+        )
+
+    async def get_session_responses(self, session_id: str) -> List[UserResponse]:
+        session = await self.get_session(session_id)
+        return session.responses.copy()
+
+    async def validate_response_completeness(self, session_id: str) -> bool:
+        session = await self.get_session(session_id)
+        expected_count = self._question_bank_manager.get_question_count()
+        return len(session.responses) == expected_count
+
+    async def get_session(self, session_id: str) -> SessionModel:
         try:
-            session = self._load_session(session_id)
-            return session.responses.copy()
+            return await self._load_session(session_id)
         except SessionNotFoundError:
             raise
         except RedisError as exc:
@@ -215,54 +422,62 @@ class RedisSessionStore(SessionStore):
                 f"Redis backend failed while reading session '{session_id}'"
             ) from exc
 
-    def validate_response_completeness(self, session_id: str) -> bool:
-        session = self._load_session(session_id)
-        expected_count = self._question_bank_manager.get_question_count()
-        return len(session.responses) == expected_count
-
-    def get_session(self, session_id: str) -> SessionModel:
-        return self._load_session(session_id)
-
-    def complete_session(self, session_id: str) -> SessionModel:
+    async def complete_session(self, session_id: str, require_all_answered: bool = False) -> SessionModel:
+        codec = self._get_codec()
+        required = self._question_bank_manager.get_question_count() if require_all_answered else 0
         try:
-            with self._redis_lock(self._session_lock_key(session_id)):
-                session = self._load_session(session_id)
-                if session.status == SessionStatus.COMPLETED:
-                    raise SessionCompleteError(f"Session '{session_id}' is already completed")
-
-                session.status = SessionStatus.COMPLETED
-                self._save_session(session)
-                self._redis.zrem(self._ACTIVE_SESSIONS_KEY, session_id)
-                self._question_bank_manager.unlock_question_bank(session_id)
-                return session
-        except (SessionNotFoundError, SessionCompleteError):
-            raise
+            result = await self._run_script(
+                self._complete_session_script,
+                session_id,
+                keys=[self._session_key(session_id), self._ACTIVE_SESSIONS_KEY],
+                args=[session_id, self._ttl_seconds, codec.version, required],
+            )
         except RedisError as exc:
             raise SessionBackendUnavailableError(
                 f"Redis backend failed while completing session '{session_id}'"
             ) from exc
 
-    def get_all_sessions(self) -> List[SessionModel]:
+        if result == _NOT_FOUND:
+            raise SessionNotFoundError(f"Session '{session_id}' does not exist")
+        if result == _COMPLETED:
+            raise SessionCompleteError(f"Session '{session_id}' is already completed")
+        if result == _VERSION_MISMATCH:
+            raise SessionNotFoundError(
+                f"Session '{session_id}' was started on another question bank version"
+            )
+        if result == _INCOMPLETE:
+            raise UnansweredQuestionsError(
+                f"Session '{session_id}' has unanswered questions, expected {required} responses"
+            )
+
+        self._question_bank_manager.unlock_question_bank(session_id)
+        # The script returns the updated hash as a flat [field, value, ...] list.
+        return self._build_session(session_id, dict(zip(result[::2], result[1::2])))
+
+    async def get_all_sessions(self) -> List[SessionModel]:
         try:
             sessions: List[SessionModel] = []
-            for key in self._redis.scan_iter(match=f"{self._SESSION_KEY_PREFIX}*"):
-                payload = self._redis.get(key)
-                if payload:
-                    sessions.append(SessionModel.model_validate_json(payload))
+            async for key in self._redis.scan_iter(match=f"{self._SESSION_KEY_PREFIX}session_*"):
+                session_id = key[len(self._SESSION_KEY_PREFIX):]
+                try:
+                    sessions.append(await self._load_session(session_id))
+                except SessionNotFoundError:
+                    continue
             return sessions
         except RedisError as exc:
             raise SessionBackendUnavailableError(
                 "Redis backend failed while listing sessions"
             ) from exc
 
-    def delete_session(self, session_id: str) -> None:
+    async def delete_session(self, session_id: str) -> None:
         try:
-            with self._redis_lock(self._session_lock_key(session_id)):
-                session = self._load_session(session_id)
-                if session.status == SessionStatus.IN_PROGRESS:
-                    self._question_bank_manager.unlock_question_bank(session_id)
-                self._redis.delete(self._session_key(session_id))
-                self._redis.zrem(self._ACTIVE_SESSIONS_KEY, session_id)
+            session = await self._load_session(session_id)
+            if session.status == SessionStatus.IN_PROGRESS:
+                self._question_bank_manager.unlock_question_bank(session_id)
+            async with self._redis.pipeline(transaction=True) as pipe:
+                pipe.delete(self._session_key(session_id))
+                pipe.zrem(self._ACTIVE_SESSIONS_KEY, session_id)
+                await pipe.execute()
         except SessionNotFoundError:
             raise
         except RedisError as exc:
@@ -0,0 +1,100 @@
+"""
+Compact answer encoding for interview sessions.
+
+A session's answers are stored as a byte string of (question_index,
+option_index) pairs in answer order, where indices refer to one question
+bank version. Weights and signals are resolved from the bank only when a
+session snapshot is loaded for scoring.
+"""
+
+from typing import Iterable, List, Optional, Tuple
+
+from ..models.user_response import UserResponse
+from .question_bank_manager import QuestionBankManager
+
+# Indices are kept below 0x80 so the encoded answers are plain ASCII and
+# survive decode_responses Redis clients and Lua string handling unchanged.
+MAX_INDEX = 0x7F
+
+
+class SessionCodecError(Exception):
+    """Raised when answers cannot be encoded or decoded for a bank version."""
+
+
+class SessionCodec:
+    """Maps answers to index bytes for one question bank version."""
+
+    def __init__(self, question_bank_manager: QuestionBankManager):
+        self._question_bank_manager = question_bank_manager
+        self.version = question_bank_manager.get_version()
+        self._questions = question_bank_manager.get_all_questions()
+        if len(self._questions) > MAX_INDEX + 1:
+            raise SessionCodecError("Question bank is too large for compact session encoding")
+
+        self._indices = {}
+        for question_idx, question in enumerate(self._questions):
+            if len(question.answer_options) > MAX_INDEX + 1:
+                raise SessionCodecError(f"Question '{question.id}' has too many options")
+            for option_idx, option in enumerate(question.answer_options):
+                self._indices[(question.id, option.id)] = (question_idx, option_idx)
+
+    def encode_answer(self, question_id: str, answer_option_id: str) -> Optional[bytes]:
+        """Two-byte encoding of one answer, or None for unknown ids."""
+        indices = self._indices.get((question_id, answer_option_id))
+        if indices is None:
+            return None
+        return bytes(indices)
+
+    def encode(self, answers: Iterable[Tuple[str, str]]) -> bytes:
+        encoded = bytearray()
+        for question_id, answer_option_id in answers:
+            pair = self.encode_answer(question_id, answer_option_id)
+            if pair is None:
+                raise SessionCodecError(
+                    f"Unknown answer '{answer_option_id}' for question '{question_id}'"
+                )
+            encoded += pair
+        return bytes(encoded)
+
+    def _decode_options(self, data: bytes):
+        if len(data) % 2:
+            raise SessionCodecError("Encoded answers have odd length")
+        decoded = []
+        for offset in range(0, len(data), 2):
+            question_idx, option_idx = data[offset], data[offset + 1]
+            try:
+                question = self._questions[question_idx]
+                decoded.append((question, question.answer_options[option_idx]))
+            except IndexError:
+                raise SessionCodecError(
+                    f"Answer index ({question_idx}, {option_idx}) is out of range for "
+                    f"question bank {self.version}"
+                ) from None
+        return decoded
+
+    def decode(self, data: bytes) -> List[Tuple[str, str]]:
+        """Decode index pairs back into (question_id, option_id) in answer order."""
+        return [(question.id, option.id) for question, option in self._decode_options(data)]
+
+    def to_responses(self, session_id: str, data: bytes) -> List[UserResponse]:
+        """Materialize responses with weights resolved from the question bank."""
+        return [
+            UserResponse(
+                session_id=session_id,
+                question_id=question.id,
+                answer_option_id=option.id,
+                resolved_signals=option.signal_associations.copy(),
+                resolved_weights=option.role_weights.copy(),
+                resolved_stage_weights=option.stage_weights.copy(),
+            )
+            for question, option in self._decode_options(data)
+        ]
+
+
+def upsert_answer(data: bytes, pair: bytes) -> bytes:
+    """Replace the answer for pair's question in place, or append it."""
+    question_byte = pair[0]
+    for offset in range(0, len(data), 2):
+        if data[offset] == question_byte:
+            return data[:offset] + pair + data[offset + 2:]
+    return data + pair
@@ -21,36 +21,44 @@ class SessionBackendUnavailableError(SessionStoreError):
 
 
 class SessionStore(ABC):
-    """Storage contract for interview sessions."""
+    """
+    Async storage contract for interview sessions.
+
+    get_session returns a full snapshot (responses in answer order); callers
+    that need several views of a session should load it once and reuse it.
+    complete_session returns the completed snapshot; with
+    require_all_answered it refuses (UnansweredQuestionsError) unless every
+    question is answered, checked atomically with the status change.
+    """
 
     @abstractmethod
-    def create_session(self) -> SessionModel:
+    async def create_session(self) -> SessionModel:
         raise NotImplementedError
 
     @abstractmethod
-    def store_response(self, session_id: str, question_id: str, answer_option_id: str) -> UserResponse:
+    async def store_response(self, session_id: str, question_id: str, answer_option_id: str) -> UserResponse:
         raise NotImplementedError
 
     @abstractmethod
-    def get_session_responses(self, session_id: str) -> List[UserResponse]:
+    async def get_session_responses(self, session_id: str) -> List[UserResponse]:
         raise NotImplementedError
 
     @abstractmethod
-    def validate_response_completeness(self, session_id: str) -> bool:
+    async def validate_response_completeness(self, session_id: str) -> bool:
         raise NotImplementedError
 
     @abstractmethod
-    def get_session(self, session_id: str) -> SessionModel:
+    async def get_session(self, session_id: str) -> SessionModel:
         raise NotImplementedError
 
     @abstractmethod
-    def complete_session(self, session_id: str) -> SessionModel:
+    async def complete_session(self, session_id: str, require_all_answered: bool = False) -> SessionModel:
         raise NotImplementedError
 
     @abstractmethod
-    def get_all_sessions(self) -> List[SessionModel]:
+    async def get_all_sessions(self) -> List[SessionModel]:
         raise NotImplementedError
 
     @abstractmethod
-    def delete_session(self, session_id: str) -> None:
+    async def delete_session(self, session_id: str) -> None:
         raise NotImplementedError
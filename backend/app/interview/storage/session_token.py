@@ -0,0 +1,182 @@
+"""
+Stateless signed session tokens for the career test.
+
+In the "token" session backend the whole session travels with the client:
+a versioned, HMAC-SHA256 signed token carrying a random session nonce, the
+expiry, a tag of the question bank version and the compact answer bytes
+from session_codec. Any worker can validate and score it without shared
+storage; replay protection is applied only when a token is completed
+(see SessionNonceRegistry).
+
+Token layout (before base64url): version(1) | nonce(12) | expires_at(4,
+unix seconds) | bank_tag(4) | answers(2 per answer) | signature(16).
+"""
+
+import base64
+import hashlib
+import hmac
+import logging
+import secrets
+import struct
+import time
+from dataclasses import dataclass
+from typing import Dict, Optional
+
+from app.infra.redis_client import get_redis
+
+from ..models.user_response import SessionModel, SessionStatus
+from .session_codec import SessionCodec, SessionCodecError, upsert_answer
+from .user_response_store import InvalidReferenceError, SessionCompleteError, SessionNotFoundError
+
+logger = logging.getLogger(__name__)
+
+TOKEN_VERSION = 1
+_HEADER = struct.Struct(">B12sI4s")
+_SIGNATURE_BYTES = 16
+SESSION_ID_PREFIX = "tok_"
+
+
+class SessionTokenError(SessionNotFoundError):
+    """Raised when a session token is malformed, forged, expired or stale."""
+
+
+@dataclass(frozen=True)
+class SessionTokenState:
+    """Decoded, verified contents of a session token."""
+    nonce: bytes
+    expires_at: int
+    answers: bytes
+
+    @property
+    def session_id(self) -> str:
+        return f"{SESSION_ID_PREFIX}{self.nonce.hex()}"
+
+
+def _b64encode(data: bytes) -> str:
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode("ascii")
+
+
+def _b64decode(data: str) -> bytes:
+    return base64.urlsafe_b64decode(data + "=" * (-len(data) % 4))
+
+
+class SessionTokenSigner:
+    """Issues and verifies session tokens for the current question bank version."""
+
+    def __init__(self, codec: SessionCodec, secret: str, ttl_seconds: int):
+        if not secret:
+            raise ValueError("A secret is required to sign interview session tokens")
+        # Domain-separated key so the token secret can be shared with other settings.
+        self._key = hmac.new(secret.encode("utf-8"), b"interview-session-token", hashlib.sha256).digest()
+        self._codec = codec
+        self._ttl_seconds = ttl_seconds
+        self._bank_tag = hashlib.sha256(codec.version.encode("utf-8")).digest()[:4]
+
+    @property
+    def codec(self) -> SessionCodec:
+        return self._codec
+
+    def _sign(self, body: bytes) -> bytes:
+        return hmac.new(self._key, body, hashlib.sha256).digest()[:_SIGNATURE_BYTES]
+
+    def issue(self) -> SessionTokenState:
+        """Start a new session state (fresh nonce, full TTL)."""
+        return SessionTokenState(
+            nonce=secrets.token_bytes(12),
+            expires_at=int(time.time()) + self._ttl_seconds,
+            answers=b"",
+        )
+
+    def encode(self, state: SessionTokenState) -> str:
+        body = _HEADER.pack(TOKEN_VERSION, state.nonce, state.expires_at, self._bank_tag) + state.answers
+        return _b64encode(body + self._sign(body))
+
+    def decode(self, token: str, session_id: Optional[str] = None) -> SessionTokenState:
+        """Verify signature, version, expiry and bank version of a token."""
+        try:
+            raw = _b64decode(token)
+        except (ValueError, TypeError):
+            raise SessionTokenError("Malformed session token") from None
+        if len(raw) < _HEADER.size + _SIGNATURE_BYTES:
+            raise SessionTokenError("Malformed session token")
+
+        body, signature = raw[:-_SIGNATURE_BYTES], raw[-_SIGNATURE_BYTES:]
+        if not hmac.compare_digest(signature, self._sign(body)):
+            raise SessionTokenError("Invalid session token signature")
+
+        version, nonce, expires_at, bank_tag = _HEADER.unpack_from(body)
+        if version != TOKEN_VERSION:
+            raise SessionTokenError(f"Unsupported session token version {version}")
+        if bank_tag != self._bank_tag:
+            raise SessionTokenError("Session token was issued for another question bank version")
+        if expires_at <= time.time():
+            raise SessionTokenError("Session token expired")
+
+        state = SessionTokenState(nonce=nonce, expires_at=expires_at, answers=body[_HEADER.size:])
+        if session_id is not None and session_id != state.session_id:
+            raise SessionTokenError("Session token does not match session id")
+        return state
+
+    def with_answer(self, state: SessionTokenState, question_id: str, answer_option_id: str) -> SessionTokenState:
+        pair = self._codec.encode_answer(question_id, answer_option_id)
+        if pair is None:
+            raise InvalidReferenceError(
+                f"Invalid answer option ID: '{answer_option_id}' for question '{question_id}'"
+            )
+        return SessionTokenState(
+            nonce=state.nonce,
+            expires_at=state.expires_at,
+            answers=upsert_answer(state.answers, pair),
+        )
+
+    def to_session(self, state: SessionTokenState) -> SessionModel:
+        try:
+            responses = self._codec.to_responses(state.session_id, state.answers)
+        except SessionCodecError as exc:
+            raise SessionTokenError(str(exc)) from exc
+        return SessionModel(
+            session_id=state.session_id,
+            responses=responses,
+            status=SessionStatus.IN_PROGRESS,
+            locked_question_bank_version=self._codec.version,
+        )
+
+
+class SessionNonceRegistry:
+    """
+    Remembers completed session nonces until their tokens expire.
+
+    Uses one Redis key per nonce (SET NX EX); without Redis it falls back to
+    process memory, which only protects a single worker.
+    """
+
+    _KEY_PREFIX = "interview:session_token:completed:"
+
+    def __init__(self):
+        self._local: Dict[bytes, float] = {}
+
+    async def claim(self, state: SessionTokenState) -> None:
+        """
+        Mark the session as completed.
+
+        Raises:
+            SessionCompleteError: if the token was already completed.
+        """
+        ttl = max(1, int(state.expires_at - time.time()))
+        redis = get_redis()
+        if redis is not None:
+            try:
+                claimed = await redis.set(f"{self._KEY_PREFIX}{state.nonce.hex()}", "1", nx=True, ex=ttl)
+            except Exception as exc:
+                logger.warning("session_token_nonce_error operation=claim error=%s", exc)
+            else:
+                if not claimed:
+                    raise SessionCompleteError(f"Session '{state.session_id}' is already completed")
+                return
+
+        now = time.time()
+        for nonce in [n for n, expires_at in self._local.items() if expires_at <= now]:
+            del self._local[nonce]
+        if state.nonce in self._local:
+            raise SessionCompleteError(f"Session '{state.session_id}' is already completed")
+        self._local[state.nonce] = now + ttl
@@ -1,15 +1,19 @@
 """
 User Response Store for IT Career Test Engine v2.1.
 
-Manages test sessions and user responses with semantic context storage
-(resolved signals, role weights, and stage weights from answer options).
+Manages test sessions in a compact form: answers are kept as
+(question_index, option_index) bytes and resolved into responses with
+signals, role weights and stage weights when a session is read.
 """
 
-from typing import Dict, List, Optional
+from dataclasses import dataclass
+import heapq
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 from uuid import uuid4
 from ..models.user_response import UserResponse, SessionModel, SessionStatus
 from .question_bank_manager import QuestionBankManager
+from .session_codec import SessionCodec, SessionCodecError, upsert_answer
 from .session_store import SessionStore, SessionLimitExceededError
 from app.config import settings
 
@@ -39,12 +43,29 @@ class SessionCompleteError(UserResponseStoreError):
     pass
 
 
+class UnansweredQuestionsError(UserResponseStoreError):
+    """Raised when completing a session that still has unanswered questions."""
+    pass
+
+
+@dataclass(slots=True)
+class _StoredSession:
+    """Compact in-memory session record."""
+    session_id: str
+    status: SessionStatus
+    version: str
+    created_at: datetime
+    expires_at: Optional[datetime]
+    answers: bytes = b""
+
+
 class UserResponseStore(SessionStore):
     """
     Manages user responses with semantic context storage.
 
-    Stores responses with resolved signals, role weights, and stage weights
-    from answer options (denormalization for efficient aggregation).
+    Only answer indices are stored per session; signals, role weights and
+    stage weights are resolved from the question bank version the session
+    was started on whenever a snapshot is read.
     """
 
     def __init__(
@@ -52,35 +73,70 @@ class UserResponseStore(SessionStore):
         question_bank_manager: QuestionBankManager,
         max_active_sessions: Optional[int] = None
     ):
-        self._sessions: Dict[str, SessionModel] = {}
+        self._sessions: Dict[str, _StoredSession] = {}
+        # (expires_at, session_id) min-heap; entries for deleted sessions are
+        # skipped lazily when they reach the top.
+        self._expiry_heap: List[Tuple[datetime, str]] = []
+        self._active_count = 0
         self._question_bank_manager = question_bank_manager
+        self._codec = SessionCodec(question_bank_manager)
         self._max_active_sessions = (
             max_active_sessions
             if max_active_sessions is not None
             else settings.INTERVIEW_SESSION_MAX_ACTIVE
         )
 
+    def _get_codec(self, version: Optional[str] = None) -> SessionCodec:
+        current = self._question_bank_manager.get_version()
+        if self._codec.version != current:
+            self._codec = SessionCodec(self._question_bank_manager)
+        if version is not None and version != current:
+            raise SessionCodecError(
+                f"Session was started on question bank {version}, current is {current}"
+            )
+        return self._codec
+
+    def _to_model(self, stored: _StoredSession) -> SessionModel:
+        """Materialize a session snapshot with responses resolved from the bank."""
+        try:
+            responses = self._get_codec(stored.version).to_responses(stored.session_id, stored.answers)
+        except SessionCodecError as exc:
+            raise SessionNotFoundError(str(exc)) from exc
+        return SessionModel(
+            session_id=stored.session_id,
+            responses=responses,
+            status=stored.status,
+            locked_question_bank_version=stored.version,
+            created_at=stored.created_at,
+            expires_at=stored.expires_at,
+        )
+
     def _evict_expired_sessions(self, current_session_id: Optional[str] = None) -> None:
-        """Remove expired sessions from memory."""
+        """Remove expired sessions from memory (amortized O(log N) per session)."""
         now = datetime.now()
-        for session_id, session in list(self._sessions.items()):
-            if session.expires_at and now >= session.expires_at:
-                if session.status == SessionStatus.IN_PROGRESS:
-                    self._question_bank_manager.unlock_question_bank(session_id)
-                del self._sessions[session_id]
-                if current_session_id and session_id == current_session_id:
-                    raise SessionNotFoundError("Session expired")
-
-    def create_session(self) -> SessionModel:
+        current_expired = False
+        while self._expiry_heap and self._expiry_heap[0][0] <= now:
+            expires_at, session_id = heapq.heappop(self._expiry_heap)
+            session = self._sessions.get(session_id)
+            if session is None or session.expires_at != expires_at:
+                continue
+            self._drop_session(session)
+            if session_id == current_session_id:
+                current_expired = True
+        if current_expired:
+            raise SessionNotFoundError("Session expired")
+
+    def _drop_session(self, session: _StoredSession) -> None:
+        if session.status == SessionStatus.IN_PROGRESS:
+            self._question_bank_manager.unlock_question_bank(session.session_id)
+            self._active_count -= 1
+        del self._sessions[session.session_id]
+
+    async def create_session(self) -> SessionModel:
         """Create a new test session."""
         self._evict_expired_sessions()
 
-        active_sessions = sum(
-            1
-            for session in self._sessions.values()
-            if session.status == SessionStatus.IN_PROGRESS
-        )
-        if active_sessions >= self._max_active_sessions:
+        if self._active_count >= self._max_active_sessions:
             raise SessionLimitExceededError("Too many active interview sessions")
 
         session_id = f"session_{uuid4()}"
@@ -90,30 +146,32 @@ class UserResponseStore(SessionStore):
         question_bank_version = self._question_bank_manager.get_version()
         self._question_bank_manager.lock_question_bank(session_id)
 
-        session = SessionModel(
+        stored = _StoredSession(
             session_id=session_id,
-            responses=[],
             status=SessionStatus.IN_PROGRESS,
-            locked_question_bank_version=question_bank_version,
+            version=question_bank_version,
             created_at=created_at,
-            expires_at=expires_at
+            expires_at=expires_at,
         )
 
-        self._sessions[session_id] = session
-        return session
+        self._sessions[session_id] = stored
+        heapq.heappush(self._expiry_heap, (expires_at, session_id))
+        self._active_count += 1
+        return self._to_model(stored)
 
-    def store_response(
+    async def store_response(
         self,
         session_id: str,
         question_id: str,
         answer_option_id: str
     ) -> UserResponse:
         """
-        Store or update a user response with resolved semantic context.
+        Store or update a user response.
 
-        Resolves and stores signals, role weights, and stage weights
-        from the selected answer option. If the question was already answered
-        in the same in-progress session, the previous response is overwritten.
+        Validates the answer option and stores its indices; the returned
+        response carries the resolved signals and weights. If the question was
+        already answered in the same in-progress session, the previous
+        response is overwritten in place.
         """
         self._evict_expired_sessions(session_id)
 
@@ -127,12 +185,6 @@ class UserResponseStore(SessionStore):
                 f"Cannot add responses to completed session '{session_id}'"
             )
 
-        existing_response_index = None
-        for idx, response in enumerate(session.responses):
-            if response.question_id == question_id:
-                existing_response_index = idx
-                break
-
         question = self._question_bank_manager.get_question(question_id)
         if question is None:
             raise InvalidReferenceError(f"Invalid question ID: '{question_id}'")
@@ -148,35 +200,31 @@ class UserResponseStore(SessionStore):
                 f"Invalid answer option ID: '{answer_option_id}' for question '{question_id}'"
             )
 
-        # Resolve signals, role weights, and stage weights from the answer option
-        resolved_signals = answer_option.signal_associations.copy()
-        resolved_weights = answer_option.role_weights.copy()
-        resolved_stage_weights = answer_option.stage_weights.copy()
+        try:
+            pair = self._get_codec(session.version).encode_answer(question_id, answer_option_id)
+        except SessionCodecError as exc:
+            raise SessionNotFoundError(str(exc)) from exc
+        # Overwrites keep the original answer position (it matters for tie order).
+        session.answers = upsert_answer(session.answers, pair)
 
-        user_response = UserResponse(
+        return UserResponse(
             session_id=session_id,
             question_id=question_id,
             answer_option_id=answer_option_id,
-            resolved_signals=resolved_signals,
-            resolved_weights=resolved_weights,
-            resolved_stage_weights=resolved_stage_weights,
+            resolved_signals=answer_option.signal_associations.copy(),
+            resolved_weights=answer_option.role_weights.copy(),
+            resolved_stage_weights=answer_option.stage_weights.copy(),
             timestamp=datetime.now()
         )
 
-        if existing_response_index is not None:
-            session.responses[existing_response_index] = user_response
-        else:
-            session.responses.append(user_response)
-        return user_response
-
-    def get_session_responses(self, session_id: str) -> List[UserResponse]:
+    async def get_session_responses(self, session_id: str) -> List[UserResponse]:
         """Retrieve all responses for a test session."""
         self._evict_expired_sessions(session_id)
         if session_id not in self._sessions:
             raise SessionNotFoundError(f"Session '{session_id}' does not exist")
-        return self._sessions[session_id].responses.copy()
+        return self._to_model(self._sessions[session_id]).responses
 
-    def validate_response_completeness(self, session_id: str) -> bool:
+    async def validate_response_completeness(self, session_id: str) -> bool:
         """Validate that all questions have been answered (dynamic count)."""
         self._evict_expired_sessions(session_id)
         if session_id not in self._sessions:
@@ -184,17 +232,17 @@ class UserResponseStore(SessionStore):
 
         session = self._sessions[session_id]
         expected_count = self._question_bank_manager.get_question_count()
-        return len(session.responses) == expected_count
+        return len(session.answers) // 2 == expected_count
 
-    def get_session(self, session_id: str) -> SessionModel:
+    async def get_session(self, session_id: str) -> SessionModel:
         """Retrieve a test session."""
         self._evict_expired_sessions(session_id)
         if session_id not in self._sessions:
             raise SessionNotFoundError(f"Session '{session_id}' does not exist")
-        return self._sessions[session_id]
+        return self._to_model(self._sessions[session_id])
 
-    def complete_session(self, session_id: str) -> SessionModel:
-        """Mark a session as completed."""
+    async def complete_session(self, session_id: str, require_all_answered: bool = False) -> SessionModel:
+        """Mark a session as completed, optionally only once every question is answered."""
         self._evict_expired_sessions(session_id)
         if session_id not in self._sessions:
             raise SessionNotFoundError(f"Session '{session_id}' does not exist")
@@ -204,23 +252,26 @@ class UserResponseStore(SessionStore):
             raise SessionCompleteError(
                 f"Session '{session_id}' is already completed"
             )
+        if require_all_answered:
+            expected_count = self._question_bank_manager.get_question_count()
+            if len(session.answers) // 2 != expected_count:
+                raise UnansweredQuestionsError(
+                    f"Session '{session_id}' has unanswered questions, expected {expected_count} responses"
+                )
         session.status = SessionStatus.COMPLETED
+        self._active_count -= 1
         self._question_bank_manager.unlock_question_bank(session_id)
-        return session
+        return self._to_model(session)
 
-    def get_all_sessions(self) -> List[SessionModel]:
+    async def get_all_sessions(self) -> List[SessionModel]:
         """Retrieve all test sessions."""
         self._evict_expired_sessions()
-        return list(self._sessions.values())
+        return [self._to_model(session) for session in self._sessions.values()]
 
-    def delete_session(self, session_id: str) -> None:
+    async def delete_session(self, session_id: str) -> None:
         """Delete a test session."""
         self._evict_expired_sessions(session_id)
         if session_id not in self._sessions:
             raise SessionNotFoundError(f"Session '{session_id}' does not exist")
 
-        session = self._sessions[session_id]
-        if session.status == SessionStatus.IN_PROGRESS:
-            self._question_bank_manager.unlock_question_bank(session_id)
-
-        del self._sessions[session_id]
+        self._drop_session(self._sessions[session_id])
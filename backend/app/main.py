@@ -19,7 +19,13 @@ from app.core.limiter import limiter
 from app.core.logging_middleware import LoggingMiddleware
 from app.database import engine, sync_engine
 from app.logging_config import configure_logging
+from app.infra.analytics_buffer import shutdown_analytics_buffer
+from app.infra.password_hasher import shutdown_password_hasher
 from app.infra.redis_client import init_redis, close_redis
+from app.interview.catalog import start_catalog_watcher, stop_catalog_watcher
+from app.services.recommendation_engine import shutdown_recommendation_engine
+from app.services.sitemap_builder import shutdown_sitemap_store
+from app.utils.account_security import flush_login_audit
 from app.routers import (
     admin,
     analytics,
@@ -95,9 +101,19 @@ async def lifespan(app: FastAPI):
         logger.warning("REDIS_URL is not configured. FastAPI cache uses in-memory backend.")
         FastAPICache.init(InMemoryBackend(), prefix="fastapi-cache")
 
+    # Startup: Compile the interview catalog and watch its data files
+    start_catalog_watcher()
+
     yield
 
-    # Shutdown: Close connections gracefully
+    # Shutdown: Stop background interpretation workers, then close connections
+    await stop_catalog_watcher()
+    await interview.shutdown_interpretation_jobs()
+    await shutdown_recommendation_engine()
+    await shutdown_sitemap_store()
+    shutdown_password_hasher()
+    await flush_login_audit()
+    await shutdown_analytics_buffer()
     await close_redis()
     await engine.dispose()
     sync_engine.dispose()
@@ -1,7 +1,10 @@
-from datetime import datetime
+from datetime import date, datetime
 from typing import Optional
 
 from sqlalchemy import (
+    BigInteger,
+    Date,
+    LargeBinary,
     String,
     Text,
     Boolean,
@@ -14,7 +17,7 @@ from sqlalchemy import (
     ForeignKey,
     text,
 )
-from sqlalchemy.dialects.postgresql import JSONB, TSVECTOR
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -34,6 +37,9 @@ class Vacancy(Base):
     
     title: Mapped[str] = mapped_column(String, index=True)
     description: Mapped[Optional[str]] = mapped_column(Text)
+
+    # Короткий текстовый анонс без HTML для карточек в списках (make_snippet)
+    snippet: Mapped[Optional[str]] = mapped_column(String)
     
     salary_from: Mapped[Optional[int]] = mapped_column(Integer)
     salary_to: Mapped[Optional[int]] = mapped_column(Integer)
@@ -92,10 +98,14 @@ class Vacancy(Base):
     
     # Ключевые навыки (список технологий/требований)
     key_skills: Mapped[Optional[list]] = mapped_column(JSONB)
-    
-    # Хранение полных данных от API в формате JSONB
-    raw_data: Mapped[dict] = mapped_column(JSONB)
 
+    # Канонические id навыков (app.core.skills) для overlap-поиска (&&) по GIN-индексу
+    skill_ids: Mapped[Optional[list]] = mapped_column(ARRAY(Integer))
+
+    # id профессиональных ролей HH (professional_roles) для очистки по роли (@>) по GIN-индексу
+    professional_role_ids: Mapped[Optional[list]] = mapped_column(ARRAY(Integer))
+
+    # Полный ответ API хранится отдельно, в vacancy_raw (VacancyRaw)
 
     # Full Text Search Vector (Computed)
     search_vector: Mapped[Optional[str]] = mapped_column(
@@ -107,12 +117,35 @@ class Vacancy(Base):
     __table_args__ = (
         UniqueConstraint("external_id", "source", name="unique_external_vacancy"),
         Index("ix_vacancies_search_vector", "search_vector", postgresql_using="gin"),
+        Index("ix_vacancies_skill_ids", "skill_ids", postgresql_using="gin"),
+        Index("ix_vacancies_professional_role_ids", "professional_role_ids", postgresql_using="gin"),
     )
 
     def __repr__(self) -> str:
         return f"<Vacancy(title={self.title}, source={self.source})>"
 
 
+class VacancyRaw(Base):
+    """
+    Full source API payload of a vacancy, kept out of the vacancies heap so
+    listings, filters, facets and vacuum never touch it. Read only by the
+    vacancy detail endpoint.
+    """
+    __tablename__ = "vacancy_raw"
+
+    vacancy_id: Mapped[int] = mapped_column(
+        Integer,
+        ForeignKey('vacancies.id', ondelete='CASCADE'),
+        primary_key=True
+    )
+    raw_data: Mapped[dict] = mapped_column(JSONB, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now()
+    )
+
+
 class Company(Base):
     __tablename__ = "companies"
 
@@ -170,6 +203,8 @@ class User(Base):
 
     # Auth enhancements
     role: Mapped[str] = mapped_column(String, default="user", server_default="user")  # "user" | "admin"
+    # Bumped on logout-all / password change; access tokens carry it as the "ver" claim
+    token_version: Mapped[int] = mapped_column(Integer, default=0, server_default="0")
     email_verified: Mapped[bool] = mapped_column(Boolean, default=False, server_default="false")
     email_verified_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
     last_login_at: Mapped[Optional[datetime]] = mapped_column(DateTime(timezone=True), nullable=True)
@@ -255,10 +290,17 @@ class LoginAttempt(Base):
 
 
 class AnalyticsEvent(Base):
-    """Product analytics event stored in first-party Postgres."""
+    """
+    Product analytics event stored in first-party Postgres.
+
+    Range-partitioned by month on created_at (partitions analytics_events_pYYYYMM
+    are created ahead and dropped after retention by scripts/maintain_analytics.py),
+    so the primary key includes created_at.
+    """
     __tablename__ = "analytics_events"
+    __table_args__ = {"postgresql_partition_by": "RANGE (created_at)"}
 
-    id: Mapped[int] = mapped_column(primary_key=True)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     event_name: Mapped[str] = mapped_column(String(120), nullable=False, index=True)
     source: Mapped[str] = mapped_column(String(120), nullable=False, server_default="unknown")
     route: Mapped[str] = mapped_column(String(255), nullable=False, server_default="unknown")
@@ -267,7 +309,35 @@ class AnalyticsEvent(Base):
     payload: Mapped[dict] = mapped_column(JSONB, nullable=False, default=dict, server_default=text("'{}'::jsonb"))
     ip_address: Mapped[Optional[str]] = mapped_column(String(64), nullable=True)
     user_agent: Mapped[Optional[str]] = mapped_column(String, nullable=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), index=True)
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), primary_key=True, index=True
+    )
 
     def __repr__(self) -> str:
         return f"<AnalyticsEvent(event_name={self.event_name}, source={self.source})>"
+
+
+class AnalyticsDailyRollup(Base):
+    """Event counts per UTC day, event, route and user type (read by the admin dashboard)."""
+    __tablename__ = "analytics_daily_rollups"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    event_name: Mapped[str] = mapped_column(String(120), primary_key=True)
+    route: Mapped[str] = mapped_column(String(255), primary_key=True)
+    user_type_guess: Mapped[str] = mapped_column(String(32), primary_key=True)
+    events: Mapped[int] = mapped_column(BigInteger, nullable=False)
+
+    def __repr__(self) -> str:
+        return f"<AnalyticsDailyRollup(day={self.day}, event_name={self.event_name}, events={self.events})>"
+
+
+class AnalyticsDailySessions(Base):
+    """HyperLogLog sketch of one UTC day's session ids (sketches merge across days)."""
+    __tablename__ = "analytics_daily_sessions"
+
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+    sessions_sketch: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+    refreshed_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+
+    def __repr__(self) -> str:
+        return f"<AnalyticsDailySessions(day={self.day})>"
@@ -1,4 +1,3 @@
-from datetime import datetime, timedelta
 from typing import List
 from fastapi import APIRouter, Depends, HTTPException, Header, Body, Query
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -6,9 +5,18 @@ from sqlalchemy import desc, func, select
 from fastapi_cache import FastAPICache
 
 from app.database import get_db
-from app.models import User, Vacancy, LoginAttempt, AnalyticsEvent
+from app.models import User, Vacancy, LoginAttempt
 from app.config import settings
 from app.auth import require_admin
+from app.infra.cache import bump_dataset_generation
+from app.infra.analytics_buffer import get_analytics_buffer
+from app.infra.password_hasher import get_password_hasher
+from app.infra.rate_limit_storage import rate_limit_stats
+from app.infra.principal_cache import Principal, invalidate_principal
+from app.services.analytics_rollups import get_analytics_dashboard
+from app.services.recommendation_engine import get_recommendation_engine
+from app.services.sitemap_builder import get_sitemap_store
+from app.routers.interview import get_orchestrator
 
 router = APIRouter(prefix="/api", tags=["Admin"])
 
@@ -26,16 +34,21 @@ async def verify_admin_secret(x_admin_secret: str = Header(..., description="Adm
 @router.post("/internal/clear-cache")
 async def clear_cache(authorized: None = Depends(verify_admin_secret)):
     """
-    Force clear the entire In-Memory cache.
-    Protected by X-Admin-Secret header.
+    Force clear the entire In-Memory cache, advance the dataset generation
+    (invalidates generation-keyed caches such as recommendations) and start
+    rebuilding the precomputed recommendation feeds and the sitemap.
+    Protected by X-Admin-Secret header; called by the scheduler after each pipeline run.
     """
     await FastAPICache.clear()
-    return {"status": "ok", "message": "Cache successfully cleared"}
+    generation = await bump_dataset_generation()
+    get_recommendation_engine().schedule_rebuild()
+    get_sitemap_store().schedule_rebuild()
+    return {"status": "ok", "message": "Cache successfully cleared", "generation": generation}
 
 
 @router.get("/admin/users", summary="Get all users (Admin)")
 async def get_all_users(
-    admin: User = Depends(require_admin),
+    admin: Principal = Depends(require_admin),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -71,7 +84,7 @@ async def get_all_users(
 
 @router.get("/admin/stats", summary="Get platform stats (Admin)")
 async def get_admin_stats(
-    admin: User = Depends(require_admin),
+    admin: Principal = Depends(require_admin),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -123,7 +136,7 @@ async def get_admin_stats(
 async def update_user_role(
     user_id: int,
     new_role: str = Body(..., embed=True),
-    admin: User = Depends(require_admin),
+    admin: Principal = Depends(require_admin),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -152,6 +165,7 @@ async def update_user_role(
 
     user.role = new_role
     await db.commit()
+    await invalidate_principal(user.id)
 
     return {
         "message": f"User {user.email} role updated to {new_role}",
@@ -163,73 +177,21 @@ async def update_user_role(
 @router.get("/admin/analytics", summary="Get analytics dashboard data (Admin)")
 async def get_analytics(
     days: int = Query(7, ge=1, le=90),
-    admin: User = Depends(require_admin),
+    admin: Principal = Depends(require_admin),
     db: AsyncSession = Depends(get_db)
 ):
-    since = datetime.utcnow() - timedelta(days=days)
-
-    result = await db.execute(
-        select(func.count(AnalyticsEvent.id)).filter(AnalyticsEvent.created_at >= since)
-    )
-    total_events = result.scalar()
-
-    result = await db.execute(
-        select(func.count(func.distinct(AnalyticsEvent.session_id)))
-        .filter(AnalyticsEvent.created_at >= since, AnalyticsEvent.session_id.isnot(None))
-    )
-    unique_sessions = result.scalar()
-
-    result = await db.execute(
-        select(AnalyticsEvent.user_type_guess, func.count(AnalyticsEvent.id))
-        .filter(AnalyticsEvent.created_at >= since)
-        .group_by(AnalyticsEvent.user_type_guess)
-    )
-    user_types = {row[0]: row[1] for row in result.all()}
-
-    result = await db.execute(
-        select(AnalyticsEvent.event_name, func.count(AnalyticsEvent.id).label("cnt"))
-        .filter(AnalyticsEvent.created_at >= since)
-        .group_by(AnalyticsEvent.event_name)
-        .order_by(desc("cnt"))
-        .limit(10)
-    )
-    top_events = [{"event_name": row[0], "count": row[1]} for row in result.all()]
-
-    result = await db.execute(
-        select(AnalyticsEvent.route, func.count(AnalyticsEvent.id).label("cnt"))
-        .filter(AnalyticsEvent.created_at >= since)
-        .group_by(AnalyticsEvent.route)
-        .order_by(desc("cnt"))
-        .limit(10)
-    )
-    top_routes = [{"route": row[0], "count": row[1]} for row in result.all()]
-
-    result = await db.execute(
-        select(
-            func.date_trunc("day", AnalyticsEvent.created_at).label("day"),
-            func.count(AnalyticsEvent.id).label("cnt")
-        )
-        .filter(AnalyticsEvent.created_at >= since)
-        .group_by("day")
-        .order_by("day")
-    )
-    events_per_day = [{"date": row[0].strftime("%Y-%m-%d"), "count": row[1]} for row in result.all()]
-
-    return {
-        "period_days": days,
-        "total_events": total_events,
-        "unique_sessions": unique_sessions,
-        "user_types": user_types,
-        "top_events": top_events,
-        "top_routes": top_routes,
-        "events_per_day": events_per_day,
-    }
+    """
+    Event counts, sessions and top events/routes for the last `days` UTC days.
+    Finished days come from the daily rollups; only the open tail is read from raw events.
+    Protected by role-based auth (requires admin role).
+    """
+    return await get_analytics_dashboard(db, days)
 
 
 @router.get("/admin/login-attempts", summary="Get login attempts (Admin)")
 async def get_login_attempts(
     limit: int = 100,
-    admin: User = Depends(require_admin),
+    admin: Principal = Depends(require_admin),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -259,3 +221,44 @@ async def get_login_attempts(
             for a in attempts
         ]
     }
+
+
+@router.get("/admin/interview/interpretation-cache", summary="Get LLM interpretation cache stats (Admin)")
+async def get_interpretation_cache_stats(admin: Principal = Depends(require_admin)):
+    """
+    Hit ratio and estimated latency savings of the career test interpretation cache.
+    Protected by role-based auth (requires admin role).
+    """
+    orchestrator = await get_orchestrator()
+    stats = orchestrator.get_interpretation_cache_stats()
+    return {
+        "enabled": stats is not None,
+        "stats": stats or {},
+    }
+
+
+@router.get("/admin/auth/password-hashing", summary="Get password hashing pool stats (Admin)")
+async def get_password_hashing_stats(admin: Principal = Depends(require_admin)):
+    """
+    Throughput, latency and rejections (503s) of the dedicated bcrypt pool.
+    Protected by role-based auth (requires admin role).
+    """
+    return get_password_hasher().get_stats()
+
+
+@router.get("/admin/analytics/ingestion", summary="Get analytics ingestion buffer stats (Admin)")
+async def get_analytics_ingestion_stats(admin: Principal = Depends(require_admin)):
+    """
+    Buffered, written, dropped and failed analytics events of this worker.
+    Protected by role-based auth (requires admin role).
+    """
+    return get_analytics_buffer().get_stats()
+
+
+@router.get("/admin/rate-limits", summary="Get rate limiter stats (Admin)")
+async def get_rate_limit_stats(admin: Principal = Depends(require_admin)):
+    """
+    Per-route checks, rejections and Redis latency of the shared rate limiter (this worker).
+    Protected by role-based auth (requires admin role).
+    """
+    return rate_limit_stats.to_dict()
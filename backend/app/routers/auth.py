@@ -1,4 +1,3 @@
-import asyncio
 import logging
 from datetime import datetime, timezone
 from typing import List
@@ -16,16 +15,18 @@ from app.schemas import (
     ResetPasswordRequest, SessionOut, DeleteAccountRequest
 )
 from app.auth import (
-    verify_password, get_password_hash, create_access_token, get_current_user,
+    hash_password_async, verify_password_async, create_access_token, access_token_claims,
+    get_current_user, get_current_principal,
     create_refresh_token, save_refresh_token, verify_refresh_token,
     revoke_refresh_token, revoke_all_user_tokens,
     create_verification_token, verify_email_token,
     create_password_reset_token, verify_password_reset_token,
     hash_token, oauth2_scheme
 )
-from app.core.limiter import limiter
+from app.core.limiter import get_client_ip, limiter
+from app.infra.principal_cache import Principal, invalidate_principal
 from app.services.email_service import email_service
-from app.utils.account_security import check_account_lockout, get_lockout_remaining_time
+from app.utils.account_security import get_lockout_status, record_login_attempt
 
 router = APIRouter(prefix="/api/auth", tags=["Auth"])
 logger = logging.getLogger(__name__)
@@ -76,7 +77,7 @@ async def register(
     
     
     # Create new user with hashed password
-    hashed_password = get_password_hash(user_data.password)
+    hashed_password = await hash_password_async(user_data.password)
     new_user = User(
         username=user_data.username,
         email=user_data.email,
@@ -113,7 +114,7 @@ async def login_for_access_token(
     Returns both access_token (15 min) and refresh_token (7 days).
     """
     # Get client info
-    raw_ip = request.client.host if request.client else None
+    raw_ip = get_client_ip(request) if request.client else None
     client_ip = raw_ip or "unknown"
     ip_for_lockout = raw_ip if raw_ip and raw_ip != "unknown" else None
     user_agent = request.headers.get("user-agent", "unknown")
@@ -126,32 +127,30 @@ async def login_for_access_token(
     )
     user = result.scalar_one_or_none()
 
+    async def _record_attempt(success: bool, failure_reason=None):
+        await record_login_attempt(
+            db,
+            email=form_data.username,
+            ip_address=client_ip,
+            user_agent=user_agent,
+            success=success,
+            failure_reason=failure_reason,
+            user_id=user.id if user else None,
+            lockout_ip=ip_for_lockout,
+        )
+
     # Check for account lockout (by user_id if known, else by identifier + IP)
-    is_locked, _ = await check_account_lockout(
+    lockout = await get_lockout_status(
         db,
         user_id=user.id if user else None,
         email=form_data.username,
         ip=ip_for_lockout
     )
     
-    if is_locked:
-        remaining_time = await get_lockout_remaining_time(
-            db,
-            user_id=user.id if user else None,
-            email=form_data.username,
-            ip=ip_for_lockout
-        )
-        minutes = max(1, remaining_time // 60)
+    if lockout.locked:
+        minutes = max(1, lockout.remaining_seconds // 60)
 
-        login_attempt = LoginAttempt(
-            user_id=user.id if user else None,
-            email=form_data.username,
-            ip_address=client_ip,
-            user_agent=user_agent,
-            success=False,
-            failure_reason="rate_limit"
-        )
-        db.add(login_attempt)
+        await _record_attempt(False, "rate_limit")
         await db.commit()
 
         raise HTTPException(
@@ -161,15 +160,7 @@ async def login_for_access_token(
 
     # Log failed attempt if user not found
     if not user:
-        login_attempt = LoginAttempt(
-            user_id=None,
-            email=form_data.username,
-            ip_address=client_ip,
-            user_agent=user_agent,
-            success=False,
-            failure_reason="user_not_found"
-        )
-        db.add(login_attempt)
+        await _record_attempt(False, "user_not_found")
         await db.commit()
 
         raise HTTPException(
@@ -178,22 +169,13 @@ async def login_for_access_token(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    # Verify password
-    is_password_valid = await asyncio.to_thread(
-        verify_password,
+    # Verify password (dedicated bcrypt pool; returns an upgraded hash for low-cost hashes)
+    is_password_valid, upgraded_hash = await verify_password_async(
         form_data.password,
         user.hashed_password
     )
     if not is_password_valid:
-        login_attempt = LoginAttempt(
-            user_id=user.id,
-            email=form_data.username,
-            ip_address=client_ip,
-            user_agent=user_agent,
-            success=False,
-            failure_reason="invalid_password"
-        )
-        db.add(login_attempt)
+        await _record_attempt(False, "invalid_password")
         await db.commit()
 
         raise HTTPException(
@@ -209,7 +191,7 @@ async def login_for_access_token(
         )
 
     # Create tokens
-    access_token = create_access_token(data={"sub": user.email})
+    access_token = create_access_token(data=access_token_claims(user))
     refresh_token = create_refresh_token()
 
     # Save refresh token to database
@@ -221,20 +203,16 @@ async def login_for_access_token(
         ip=client_ip
     )
 
+    # Transparent bcrypt cost upgrade
+    if upgraded_hash:
+        user.hashed_password = upgraded_hash
+
     # Update user last login info
     user.last_login_at = datetime.now(timezone.utc)
     user.last_login_ip = client_ip
 
     # Log successful login
-    login_attempt = LoginAttempt(
-        user_id=user.id,
-        email=form_data.username,
-        ip_address=client_ip,
-        user_agent=user_agent,
-        success=True,
-        failure_reason=None
-    )
-    db.add(login_attempt)
+    await _record_attempt(True)
 
     await db.commit()
 
@@ -247,7 +225,7 @@ async def login_for_access_token(
 
 @router.get("/me", response_model=UserProfileOut, summary="Get current user")
 async def get_current_user_info(
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """
     Get the current authenticated user's information.
@@ -288,13 +266,13 @@ async def refresh_access_token(
         )
 
     # Create new access token
-    access_token = create_access_token(data={"sub": user.email})
+    access_token = create_access_token(data=access_token_claims(user))
     
     # Token Rotation: Create new refresh token
     new_refresh_token = create_refresh_token()
     
     # Get client info
-    client_ip = request.client.host if request.client else "unknown"
+    client_ip = get_client_ip(request) if request.client else "unknown"
     user_agent = request.headers.get("user-agent", "unknown")
     
     # Save new refresh token
@@ -321,7 +299,7 @@ async def refresh_access_token(
 @router.post("/logout", summary="Logout (revoke refresh token)")
 async def logout(
     refresh_data: RefreshTokenRequest,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -333,7 +311,7 @@ async def logout(
 
 @router.post("/logout-all", summary="Logout from all devices")
 async def logout_all_devices(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -356,8 +334,7 @@ async def change_password(
     Logs out from all devices after successful password change.
     """
     # Verify old password
-    is_old_password_valid = await asyncio.to_thread(
-        verify_password,
+    is_old_password_valid, _ = await verify_password_async(
         password_data.old_password,
         current_user.hashed_password
     )
@@ -368,7 +345,7 @@ async def change_password(
         )
 
     # Update password
-    current_user.hashed_password = get_password_hash(password_data.new_password)
+    current_user.hashed_password = await hash_password_async(password_data.new_password)
 
     # Revoke all refresh tokens (logout everywhere for security)
     await revoke_all_user_tokens(db, current_user.id)
@@ -479,7 +456,7 @@ async def reset_password(
         )
 
     # Update password
-    user.hashed_password = get_password_hash(reset_data.new_password)
+    user.hashed_password = await hash_password_async(reset_data.new_password)
 
     # Revoke all refresh tokens (logout everywhere for security)
     await revoke_all_user_tokens(db, user.id)
@@ -491,7 +468,7 @@ async def reset_password(
 
 @router.get("/sessions", response_model=List[SessionOut], summary="Get active sessions")
 async def get_active_sessions(
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     token: str = Depends(oauth2_scheme),
     db: AsyncSession = Depends(get_db)
 ):
@@ -532,7 +509,7 @@ async def get_active_sessions(
 @router.delete("/sessions/{token_id}", summary="Revoke a specific session")
 async def revoke_session(
     token_id: int,
-    current_user: User = Depends(get_current_user),
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ):
     """
@@ -577,8 +554,7 @@ async def delete_account(
     Delete user account. Requires password confirmation.
     """
     # Verify password
-    is_delete_password_valid = await asyncio.to_thread(
-        verify_password,
+    is_delete_password_valid, _ = await verify_password_async(
         delete_data.password,
         current_user.hashed_password
     )
@@ -603,4 +579,6 @@ async def delete_account(
         await db.execute(delete(LoginAttempt).where(LoginAttempt.user_id == user_id))
         await db.execute(delete(User).where(User.id == user_id))
 
+    await invalidate_principal(user_id)
+
     return {"message": "Account and all associated data deleted successfully"}
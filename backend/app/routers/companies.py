@@ -8,13 +8,15 @@ from fastapi_cache.decorator import cache
 
 from app.database import get_db
 from app.models import Vacancy, Company
+from app.infra.http_cache import dataset_validated
 from app.schemas import CompaniesListResponse, CompanyDetailResponse, CompanyResponse
-from app.services.vacancy_service import _escape_ilike_value
+from app.services.vacancy_service import VACANCY_LIST_COLUMNS, _escape_ilike_value
 
 router = APIRouter(prefix="/api/companies", tags=["Companies"])
 
 
 @router.get("", response_model=CompaniesListResponse)
+@dataset_validated
 @cache(expire=3600)
 async def get_companies(
     page: int = Query(1, ge=1, description="Page number"),
@@ -142,7 +144,7 @@ async def get_company_detail_by_id(
 
     # Fetch paginated vacancies
     result = await db.execute(
-        select(Vacancy)
+        select(*VACANCY_LIST_COLUMNS)
         .filter(
             Vacancy.is_active == True,
             Vacancy.company_id == company_id
@@ -151,7 +153,7 @@ async def get_company_detail_by_id(
         .offset(offset)
         .limit(per_page)
     )
-    vacancies = result.scalars().all()
+    vacancies = result.all()
 
     # Build company info
     company_info = CompanyResponse(
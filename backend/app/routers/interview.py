@@ -2,16 +2,24 @@
 Interview API Router - FastAPI endpoints for IT Career Test Engine v2.1.
 """
 import asyncio
+import functools
 import logging
 from typing import List, Optional
-from fastapi import APIRouter, HTTPException, Request, status
+from fastapi import APIRouter, HTTPException, Request, Response, status
 
 from app.interview import ITCareerTestOrchestrator
+from app.interview.catalog import get_interview_catalog
 from app.interview.aggregation import IncompleteSessionError
+from app.interview.interpretation.interpretation_jobs import (
+    InterpretationJobQueue,
+    InterpretationQueueFullError,
+)
+from app.interview.interpretation.llm_interpreter import InterpretationResult
 from app.interview.storage import (
     InvalidReferenceError,
     SessionCompleteError,
     SessionNotFoundError,
+    UnansweredQuestionsError,
 )
 from app.interview.storage.session_store import (
     SessionBackendUnavailableError,
@@ -19,21 +27,20 @@ from app.interview.storage.session_store import (
 )
 from app.config import settings
 from app.core.limiter import limiter
+from app.infra.http_cache import EncodedPayload, conditional_response
 from app.schemas import (
     QuestionResponse,
-    AnswerOptionResponse,
     StartTestResponse,
     SubmitAnswerRequest,
+    CompleteTestRequest,
     TestResultResponse,
     RoleScoreResponse,
     InterpretationResponse,
+    InterpretationJobResponse,
     TestStageScoreResponse,
     TestStageRecommendationResponse,
     StageResponse,
     StageWithRolesResponse,
-    StageDetailResponse,
-    PrimaryVacancyFiltersResponse,
-    StageRoleMapResponse
 )
 
 logger = logging.getLogger(__name__)
@@ -45,6 +52,7 @@ router = APIRouter(
 
 _orchestrator: Optional[ITCareerTestOrchestrator] = None
 _orchestrator_lock: Optional[asyncio.Lock] = None
+_interpretation_jobs: Optional[InterpretationJobQueue] = None
 
 
 async def get_orchestrator() -> ITCareerTestOrchestrator:
@@ -66,7 +74,36 @@ async def get_orchestrator() -> ITCareerTestOrchestrator:
     return _orchestrator
 
 
+def get_interpretation_jobs() -> InterpretationJobQueue:
+    """Get or create the background interpretation worker pool."""
+    global _interpretation_jobs
+    if _interpretation_jobs is None:
+        _interpretation_jobs = InterpretationJobQueue(
+            max_workers=settings.INTERVIEW_LLM_WORKERS,
+            max_queue_size=settings.INTERVIEW_LLM_QUEUE_MAX,
+            job_timeout_seconds=settings.INTERVIEW_LLM_JOB_TIMEOUT_SECONDS,
+            result_ttl_seconds=settings.INTERVIEW_LLM_JOB_TTL_SECONDS,
+        )
+    return _interpretation_jobs
+
+
+async def shutdown_interpretation_jobs() -> None:
+    if _interpretation_jobs is not None:
+        await _interpretation_jobs.shutdown()
+
+
+def _require_session_token(session_token: Optional[str]) -> str:
+    if not session_token:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="session_token is required"
+        )
+    return session_token
+
+
 def _map_interview_exception(exc: Exception) -> HTTPException:
+    if isinstance(exc, HTTPException):
+        return exc
     if isinstance(exc, SessionNotFoundError):
         return HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -77,7 +114,7 @@ def _map_interview_exception(exc: Exception) -> HTTPException:
             status_code=status.HTTP_409_CONFLICT,
             detail="Interview session is already completed"
         )
-    if isinstance(exc, (InvalidReferenceError, IncompleteSessionError)):
+    if isinstance(exc, (InvalidReferenceError, IncompleteSessionError, UnansweredQuestionsError)):
         return HTTPException(
             status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
             detail="Interview session data is invalid or incomplete"
@@ -100,25 +137,19 @@ def _map_interview_exception(exc: Exception) -> HTTPException:
 
 # --- API Endpoints ---
 
+def _static_cache_control() -> str:
+    return f"public, max-age={settings.INTERVIEW_STATIC_CACHE_MAX_AGE_SECONDS}"
+
+
+def _static_response(request: Request, payload: EncodedPayload) -> Response:
+    return conditional_response(request, payload.body, payload.etag, _static_cache_control())
+
+
 @router.get("/questions", response_model=List[QuestionResponse], summary="Get all test questions")
-async def get_questions():
-    """Get all questions for the IT Career Test."""
+async def get_questions(request: Request):
+    """Get all questions for the IT Career Test (pre-encoded, ETag-validated)."""
     orchestrator = await get_orchestrator()
-    questions = orchestrator.get_all_questions()
-
-    return [
-        QuestionResponse(
-            id=q.id,
-            text=q.text,
-            thematic_block=q.thematic_block,
-            type=q.type,
-            answer_options=[
-                AnswerOptionResponse(id=opt.id, text=opt.text)
-                for opt in q.answer_options
-            ]
-        )
-        for q in questions
-    ]
+    return _static_response(request, orchestrator.questions_payload)
 
 
 @router.post("/start", response_model=StartTestResponse, summary="Start a new test session")
@@ -127,9 +158,13 @@ async def start_test(request: Request):
     """Start a new IT Career Test session."""
     try:
         orchestrator = await get_orchestrator()
-        session_id = await asyncio.to_thread(orchestrator.start_test)
+        session_token = None
+        if getattr(orchestrator, "uses_session_tokens", False):
+            session_id, session_token = await orchestrator.start_token_test()
+        else:
+            session_id = await orchestrator.start_test()
         logger.info("interview_session_created session_id=%s", session_id)
-        return StartTestResponse(session_id=session_id)
+        return StartTestResponse(session_id=session_id, session_token=session_token)
     except Exception as exc:
         logger.error("Interview start failed", exc_info=True)
         raise _map_interview_exception(exc)
@@ -141,8 +176,15 @@ async def submit_answer(request: Request, session_id: str, payload: SubmitAnswer
     """Submit an answer for a question in the test."""
     try:
         orchestrator = await get_orchestrator()
-        await asyncio.to_thread(
-            orchestrator.submit_answer,
+        if getattr(orchestrator, "uses_session_tokens", False):
+            session_token = await orchestrator.submit_token_answer(
+                session_id,
+                _require_session_token(payload.session_token),
+                payload.question_id,
+                payload.answer_option_id,
+            )
+            return {"status": "ok", "session_token": session_token}
+        await orchestrator.submit_answer(
             session_id,
             payload.question_id,
             payload.answer_option_id,
@@ -153,34 +195,85 @@ async def submit_answer(request: Request, session_id: str, payload: SubmitAnswer
         raise _map_interview_exception(exc)
 
 
+def _to_interpretation_response(interpretation, warnings: List[str]) -> Optional[InterpretationResponse]:
+    if not interpretation:
+        return None
+    try:
+        return InterpretationResponse(
+            primary_recommendation=interpretation.primary_recommendation,
+            explanation=interpretation.explanation,
+            signal_analysis=interpretation.signal_analysis,
+            alternative_roles=interpretation.alternative_roles,
+            differentiation_criteria=interpretation.differentiation_criteria,
+            why_this_role_reasons=interpretation.why_this_role_reasons
+        )
+    except Exception as ie:
+        logger.warning(f"Interpretation payload invalid, returning result without interpretation: {ie}")
+        warnings.append("interpretation_payload_invalid")
+        return None
+
+
 @router.post("/complete/{session_id}", response_model=TestResultResponse, summary="Complete test and get results")
 @limiter.limit("5/minute")
-async def complete_test(request: Request, session_id: str, skip_llm: bool = False):
-    """Complete the test and get results with role-first stage recommendation."""
+async def complete_test(
+    request: Request,
+    session_id: str,
+    skip_llm: bool = False,
+    payload: Optional[CompleteTestRequest] = None,
+):
+    """
+    Complete the test and get results with role-first stage recommendation.
+
+    Scores and the stage recommendation are returned immediately. Unless the
+    interpretation is already cached, the LLM runs as a background job:
+    the response carries interpretation_status="pending" and a job id to
+    poll via GET /api/interview/interpretation/{job_id}.
+
+    With the stateless token backend the final session_token goes in the
+    body; each token can be completed once.
+    """
     try:
         orchestrator = await get_orchestrator()
-        result = await asyncio.wait_for(
-            asyncio.to_thread(orchestrator.complete_test, session_id, skip_llm),
-            timeout=30.0
-        )
+        if getattr(orchestrator, "uses_session_tokens", False):
+            completion = orchestrator.complete_token_test(
+                session_id,
+                _require_session_token(payload.session_token if payload else None),
+                True,
+            )
+        else:
+            completion = orchestrator.complete_test(session_id, True)
+        result = await asyncio.wait_for(completion, timeout=30.0)
 
-        # Convert interpretation
-        interpretation = None
         warnings = list(result.warnings or [])
-        if result.interpretation:
-            try:
-                interpretation = InterpretationResponse(
-                    primary_recommendation=result.interpretation.primary_recommendation,
-                    explanation=result.interpretation.explanation,
-                    signal_analysis=result.interpretation.signal_analysis,
-                    alternative_roles=result.interpretation.alternative_roles,
-                    differentiation_criteria=result.interpretation.differentiation_criteria,
-                    why_this_role_reasons=result.interpretation.why_this_role_reasons
-                )
-            except Exception as ie:
-                logger.warning(f"Interpretation payload invalid, returning result without interpretation: {ie}")
-                warnings.append("interpretation_payload_invalid")
-                interpretation = None
+        interpretation = _to_interpretation_response(result.interpretation, warnings)
+        interpretation_status = "ready" if interpretation else "skipped"
+        interpretation_job_id = None
+
+        if not skip_llm and getattr(orchestrator, "llm_enabled", False):
+            cached = await asyncio.to_thread(
+                orchestrator.get_cached_interpretation,
+                result.ranked_roles,
+                result.signal_profile,
+            )
+            if cached is not None:
+                interpretation = _to_interpretation_response(cached, warnings)
+                interpretation_status = "ready"
+            else:
+                try:
+                    interpretation_job_id = await get_interpretation_jobs().submit(
+                        session_id=result.session_id,
+                        interpret=functools.partial(
+                            orchestrator.interpret_scores,
+                            result.ranked_roles,
+                            result.signal_profile,
+                            check_cache=False,
+                        ),
+                    )
+                    interpretation_status = "pending"
+                except InterpretationQueueFullError:
+                    logger.warning("Interpretation queue is full, returning result without interpretation")
+                    warnings.append("llm_unavailable")
+                    interpretation_status = "failed"
 
         # Convert stage result (now computed by orchestrator via role-first algorithm)
         ranked_stages = None
@@ -202,7 +295,11 @@ async def complete_test(request: Request, session_id: str, skip_llm: bool = Fals
                 related_roles=rec.related_roles
             )
 
-        logger.info("interview_session_completed session_id=%s", result.session_id)
+        logger.info(
+            "interview_session_completed session_id=%s interpretation_status=%s",
+            result.session_id,
+            interpretation_status,
+        )
 
         return TestResultResponse(
             session_id=result.session_id,
@@ -215,6 +312,8 @@ async def complete_test(request: Request, session_id: str, skip_llm: bool = Fals
             ranked_stages=ranked_stages,
             stage_recommendation=stage_recommendation,
             warnings=warnings or None,
+            interpretation_status=interpretation_status,
+            interpretation_job_id=interpretation_job_id,
         )
     except asyncio.TimeoutError:
         logger.error("Interview completion timed out after 30s for session_id=%s", session_id)
@@ -227,97 +326,69 @@ async def complete_test(request: Request, session_id: str, skip_llm: bool = Fals
         raise _map_interview_exception(exc)
 
 
+@router.get(
+    "/interpretation/{job_id}",
+    response_model=InterpretationJobResponse,
+    summary="Poll a background LLM interpretation job",
+)
+@limiter.limit("120/minute")
+async def get_interpretation_job(request: Request, job_id: str):
+    """Get status and, once ready, the LLM interpretation of a completed test."""
+    job = await get_interpretation_jobs().get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Interpretation job not found")
+
+    warnings = list(job.get("warnings") or [])
+    interpretation = None
+    if job.get("interpretation"):
+        interpretation = _to_interpretation_response(
+            InterpretationResult(**job["interpretation"]),
+            warnings,
+        )
+    return InterpretationJobResponse(
+        job_id=job["job_id"],
+        session_id=job["session_id"],
+        status=job["status"],
+        interpretation=interpretation,
+        warnings=warnings or None,
+    )
+
+
 # --- Career Pipeline Endpoints ---
 
 @router.get("/roles/{role_id}", summary="Get role details")
-async def get_role_details(role_id: str):
-    orchestrator = await get_orchestrator()
-    role = orchestrator.role_manager.get_role(role_id)
-    if not role:
+async def get_role_details(request: Request, role_id: str):
+    payload = get_interview_catalog().role_payloads.get(role_id)
+    if payload is None:
         raise HTTPException(status_code=404, detail="Role not found")
-    return role
+    return _static_response(request, payload)
 
 
 # --- Product Stages Endpoints ---
 
 from app.interview.storage.stage_manager import StageManager
-from app.interview.storage.role_catalog_manager import RoleCatalogManager
 from app.interview.aggregation.stage_aggregation_engine import StageAggregationEngine
 
-_stage_manager: Optional[StageManager] = None
-_stage_engine: Optional[StageAggregationEngine] = None
-_stage_manager_lock: Optional[asyncio.Lock] = None
-_stage_engine_lock: Optional[asyncio.Lock] = None
-
 
 async def get_stage_manager() -> StageManager:
-    global _stage_manager, _stage_manager_lock
-    if _stage_manager is None:
-        current_loop = asyncio.get_running_loop()
-        lock_loop = getattr(_stage_manager_lock, "_loop", None) if _stage_manager_lock else None
-        if _stage_manager_lock is None or (lock_loop is not None and lock_loop is not current_loop):
-            _stage_manager_lock = asyncio.Lock()
-        async with _stage_manager_lock:
-            if _stage_manager is None:
-                _stage_manager = StageManager()
-    return _stage_manager
+    """Stage manager of the current interview catalog snapshot."""
+    return get_interview_catalog().stage_manager
 
 
 async def get_stage_engine() -> StageAggregationEngine:
-    global _stage_engine, _stage_engine_lock
-    if _stage_engine is None:
-        current_loop = asyncio.get_running_loop()
-        lock_loop = getattr(_stage_engine_lock, "_loop", None) if _stage_engine_lock else None
-        if _stage_engine_lock is None or (lock_loop is not None and lock_loop is not current_loop):
-            _stage_engine_lock = asyncio.Lock()
-        async with _stage_engine_lock:
-            if _stage_engine is None:
-                _stage_engine = StageAggregationEngine(
-                    await get_stage_manager(),
-                    RoleCatalogManager()
-                )
-    return _stage_engine
+    """Stage engine of the current interview catalog snapshot."""
+    return get_interview_catalog().stage_engine
 
 
 @router.get("/stages", response_model=List[StageResponse], summary="Get all product stages")
-async def get_all_stages():
+async def get_all_stages(request: Request):
     """Get all stages of IT product creation process."""
-    manager = await get_stage_manager()
-    stages = manager.get_all_stages()
-    return [
-        StageResponse(id=stage.id, name=stage.name, summary=stage.summary)
-        for stage in stages
-    ]
+    return _static_response(request, get_interview_catalog().stages_payload)
 
 
 @router.get("/stages/{stage_id}", response_model=StageWithRolesResponse, summary="Get stage details")
-async def get_stage_details(stage_id: str):
-    manager = await get_stage_manager()
-    stage = manager.get_stage(stage_id)
-    if not stage:
+async def get_stage_details(request: Request, stage_id: str):
+    payload = get_interview_catalog().stage_payloads.get(stage_id)
+    if payload is None:
         raise HTTPException(status_code=404, detail=f"Stage '{stage_id}' not found")
-
-    role_maps = manager.get_roles_for_stage(stage_id)
-    return StageWithRolesResponse(
-        stage=StageDetailResponse(
-            id=stage.id,
-            name=stage.name,
-            summary=stage.summary,
-            typical_outputs=stage.typical_outputs,
-            common_mistakes=stage.common_mistakes,
-            primary_vacancy_filters=PrimaryVacancyFiltersResponse(
-                roles=stage.primary_vacancy_filters.roles,
-                keywords=stage.primary_vacancy_filters.keywords
-            )
-        ),
-        roles=[
-            StageRoleMapResponse(
-                stage_id=rm.stage_id,
-                role_id=rm.role_id,
-                why_here=rm.why_here,
-                how_it_connects_to_vacancies=rm.how_it_connects_to_vacancies,
-                importance=rm.importance
-            )
-            for rm in role_maps
-        ]
-    )
+    return _static_response(request, payload)
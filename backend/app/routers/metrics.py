@@ -7,12 +7,14 @@ from app.database import get_db
 from app.models import Vacancy
 from app.schemas import MetricsResponse
 from app.core.limiter import limiter
+from app.infra.http_cache import dataset_validated
 
 router = APIRouter(prefix="/api/metrics", tags=["Metrics"])
 
 
 @router.get("", response_model=MetricsResponse, summary="Get platform metrics", description="Returns aggregated statistics about vacancies including counts, grade distribution, average salaries, and top locations.")
 @limiter.limit("100/minute")
+@dataset_validated
 @cache(expire=300)
 async def get_metrics(request: Request, db: AsyncSession = Depends(get_db)):
     # 1. Total Count
@@ -1,97 +1,154 @@
-from typing import List
-from datetime import datetime
-from fastapi import APIRouter, Depends
+import hashlib
+from typing import List, Optional
+from fastapi import APIRouter, Depends, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, desc
+from sqlalchemy import Integer, Select, bindparam, desc, func, not_, select
+from sqlalchemy.dialects.postgresql import ARRAY
 
 from app.database import get_db
-from app.models import User, Vacancy
-from app.schemas import VacancyResponse
-from app.auth import get_current_user
+from app.models import Vacancy
+from app.schemas import VacancyListItem
+from app.auth import get_current_principal
+from app.config import settings
+from app.infra.cache import (
+    build_cache_key,
+    get_cached_response,
+    get_dataset_generation,
+    set_cached_response,
+)
+from app.infra.principal_cache import Principal
+from app.core.skills import SKILL_REGISTRY
+from app.services.recommendation_engine import GRADE_NEIGHBOURS, get_recommendation_engine
+from app.services.vacancy_service import VACANCY_LIST_COLUMNS
 
 router = APIRouter(
     prefix="/api/recommendations",
     tags=["recommendations"]
 )
 
-RECOMMENDATIONS_PREFILTER_CAP = 500
-RECOMMENDATIONS_LIMIT = 20
+RECOMMENDATIONS_LIMIT = settings.RECOMMENDATIONS_TOP_K
+# Results are keyed by dataset generation, so the TTL only bounds staleness
+# when the generation cannot be bumped (e.g. Redis was down during a pipeline run).
+RECOMMENDATIONS_CACHE_TTL_SECONDS = 900
+
+def _recommendations_cache_key(
+    skill_ids: List[int],
+    has_skills: bool,
+    grade: Optional[str],
+    generation: int,
+) -> str:
+    skills_hash = hashlib.sha256(",".join(map(str, skill_ids)).encode("utf-8")).hexdigest()[:16]
+    return build_cache_key(
+        "/api/recommendations",
+        {"gen": generation, "grade": grade or "", "has_skills": int(has_skills), "skills": skills_hash},
+    )
+
+
+def _base_query(grade: Optional[str]) -> Select:
+    query = select(*VACANCY_LIST_COLUMNS).filter(Vacancy.is_active == True)
+    if grade and grade in GRADE_NEIGHBOURS:
+        query = query.filter(Vacancy.grade.in_(GRADE_NEIGHBOURS[grade]))
+    return query
+
+
+def _skill_ids_param(skill_ids: List[int]):
+    return bindparam("user_skill_ids", skill_ids, type_=ARRAY(Integer))
+
+
+def build_matched_query(skill_ids: List[int], grade: Optional[str], limit: int) -> Select:
+    """
+    Vacancies sharing at least one canonical skill, ranked in Postgres.
+
+    `skill_ids && :skills` uses the GIN index on vacancies.skill_ids;
+    ranking is by overlap size, then recency.
+    """
+    user_skills = _skill_ids_param(skill_ids)
+    return (
+        _base_query(grade)
+        .filter(Vacancy.skill_ids.overlap(user_skills))
+        .order_by(
+            desc(func.skill_id_overlap(Vacancy.skill_ids, user_skills)),
+            Vacancy.published_at.desc().nullslast(),
+            desc(Vacancy.id),
+        )
+        .limit(limit)
+    )
+
 
+def build_fallback_query(
+    skill_ids: List[int],
+    grade: Optional[str],
+    limit: int,
+    has_skills: bool = True,
+) -> Select:
+    """
+    Latest vacancies without any skill overlap, used to fill up short result lists.
 
-@router.get("", response_model=List[VacancyResponse], summary="Get personalized recommendations")
+    Only vacancies with at least one canonical skill qualify, as in the
+    precomputed feeds (SkillIndex.top_k). has_skills is False for profiles
+    without skills: then any vacancy qualifies.
+    """
+    query = _base_query(grade)
+    if has_skills:
+        query = query.filter(func.cardinality(Vacancy.skill_ids) > 0)
+    if skill_ids:
+        query = query.filter(not_(Vacancy.skill_ids.overlap(_skill_ids_param(skill_ids))))
+    return query.order_by(Vacancy.published_at.desc().nullslast(), desc(Vacancy.id)).limit(limit)
+
+
+@router.get("", response_model=List[VacancyListItem], summary="Get personalized recommendations")
 async def get_recommendations(
-    current_user: User = Depends(get_current_user),
+    request: Request,
+    current_user: Principal = Depends(get_current_principal),
     db: AsyncSession = Depends(get_db)
 ):
     """
     Get personalized vacancy recommendations based on user's grade and skills.
-    
+
     Logic:
     - If user has no grade or skills, returns latest 20 vacancies
     - Filters by grade (±1 level)
-    - Scores by skill match
-    - Sorts by score DESC, then published_at DESC
+    - Ranks by canonical skill-id overlap in Postgres (GIN-indexed &&), then published_at DESC
+    - Fills up with the latest non-matching vacancies when fewer than 20 match
+    - Served from the user's precomputed feed (RecommendationEngine) when present;
+      otherwise computed in SQL, cached per (skills hash, grade, dataset generation),
+      and the feed is refreshed in the background
     """
-    # Fallback: if no profile data, return latest vacancies
-    if not current_user.grade and not current_user.skills:
+    engine = get_recommendation_engine()
+    feed = await engine.read_feed(current_user.id)
+    if feed is not None:
+        return Response(content=feed, media_type="application/json")
+    engine.schedule_user_refresh(current_user.id)
+
+    has_skills = bool(current_user.skills)
+    skill_ids = SKILL_REGISTRY.ids(current_user.skills)
+    grade = current_user.grade if current_user.grade in GRADE_NEIGHBOURS else None
+    request_id = getattr(request.state, "request_id", None) or request.headers.get("X-Request-ID")
+
+    generation = await get_dataset_generation()
+    cache_key = _recommendations_cache_key(skill_ids, has_skills, grade, generation)
+    cached_response = await get_cached_response(cache_key, request_id)
+    if cached_response is not None:
+        return cached_response
+
+    vacancies = []
+    if skill_ids:
+        result = await db.execute(build_matched_query(skill_ids, grade, RECOMMENDATIONS_LIMIT))
+        vacancies = list(result.all())
+
+    if len(vacancies) < RECOMMENDATIONS_LIMIT:
         result = await db.execute(
-            select(Vacancy)
-            .filter(Vacancy.is_active == True)
-            .order_by(desc(Vacancy.published_at))
-            .limit(RECOMMENDATIONS_LIMIT)
-        )
-        return result.scalars().all()
-    
-    # Grade filtering logic
-    grade_map = {
-        'Junior': ['Junior', 'Middle'],
-        'Middle': ['Junior', 'Middle', 'Senior'],
-        'Senior': ['Middle', 'Senior', 'Lead'],
-        'Lead': ['Senior', 'Lead']
-    }
-    
-    query = select(Vacancy).filter(Vacancy.is_active == True)
-    
-    # Apply grade filter if user has grade
-    if current_user.grade and current_user.grade in grade_map:
-        allowed_grades = grade_map[current_user.grade]
-        query = query.filter(Vacancy.grade.in_(allowed_grades))
-    
-    # SQL prefilter before in-memory scoring to cap memory usage.
-    if current_user.skills:
-        query = query.filter(Vacancy.key_skills.isnot(None))
-
-    query = query.order_by(desc(Vacancy.published_at)).limit(RECOMMENDATIONS_PREFILTER_CAP)
-
-    result = await db.execute(query)
-    vacancies = result.scalars().all()
-    
-    # If user has skills, calculate match scores
-    if current_user.skills:
-        user_skills = set(s.lower() for s in current_user.skills)
-        
-        # Calculate scores
-        scored_vacancies = []
-        for vacancy in vacancies:
-            vacancy_skills = set(
-                s.lower() for s in (vacancy.key_skills or [])
-            )
-            score = len(user_skills & vacancy_skills)
-            scored_vacancies.append((vacancy, score))
-        
-        # Sort by score DESC, then published_at DESC
-        scored_vacancies.sort(
-            key=lambda x: (x[1], x[0].published_at or datetime.min),
-            reverse=True
+            build_fallback_query(skill_ids, grade, RECOMMENDATIONS_LIMIT - len(vacancies), has_skills)
         )
-        
-        # Return top recommendations limit.
-        return [v[0] for v in scored_vacancies[:RECOMMENDATIONS_LIMIT]]
-    
-    # No skills, just sort by date
-    vacancies_list = sorted(
-        vacancies,
-        key=lambda v: v.published_at or datetime.min,
-        reverse=True
+        vacancies.extend(result.all())
+
+    response_data = [
+        VacancyListItem.model_validate(vacancy).model_dump(mode="json") for vacancy in vacancies
+    ]
+    await set_cached_response(
+        cache_key,
+        response_data,
+        ttl_seconds=RECOMMENDATIONS_CACHE_TTL_SECONDS,
+        request_id=request_id,
     )
-    return vacancies_list[:RECOMMENDATIONS_LIMIT]
+    return response_data
@@ -1,71 +1,60 @@
-from datetime import datetime, timezone
+import gzip
+import re
+from email.utils import format_datetime, parsedate_to_datetime
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import Response
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.config import settings
-from app.database import get_db
-from app.models import Vacancy
+from app.infra.http_cache import etag_matches
+from app.services.sitemap_builder import INDEX_NAME, PAGES_NAME, SitemapFile, get_sitemap_store
 
 router = APIRouter(tags=["SEO"])
 
-STATIC_PAGES = [
-    {"loc": "/", "changefreq": "daily", "priority": "1.0"},
-    {"loc": "/jobs", "changefreq": "hourly", "priority": "0.9"},
-    {"loc": "/companies", "changefreq": "daily", "priority": "0.8"},
-    {"loc": "/guide", "changefreq": "weekly", "priority": "0.7"},
-    {"loc": "/career", "changefreq": "weekly", "priority": "0.7"},
-    {"loc": "/start", "changefreq": "weekly", "priority": "0.6"},
-]
+_SHARD_NAME = re.compile(r"^vacancies-\d+\.xml$")
+
+
+def _not_modified_since(request: Request, sitemap_file: SitemapFile) -> bool:
+    header = request.headers.get("if-modified-since")
+    if not header or request.headers.get("if-none-match"):
+        return False
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    return since.tzinfo is not None and sitemap_file.last_modified.replace(microsecond=0) <= since
+
+
+def sitemap_response(request: Request, sitemap_file: SitemapFile) -> Response:
+    """Serve a pre-generated sitemap (gzip when accepted) with ETag / Last-Modified validators."""
+    use_gzip = "gzip" in request.headers.get("accept-encoding", "")
+    # Strong ETags must differ between the gzip and identity representations.
+    etag = f'{sitemap_file.etag[:-1]}-gzip"' if use_gzip else sitemap_file.etag
+    headers = {
+        "ETag": etag,
+        "Last-Modified": format_datetime(sitemap_file.last_modified, usegmt=True),
+        "Cache-Control": f"public, max-age={settings.SITEMAP_CACHE_MAX_AGE_SECONDS}",
+        "Vary": "Accept-Encoding",
+    }
+    if etag_matches(request, etag) or _not_modified_since(request, sitemap_file):
+        return Response(status_code=304, headers=headers)
+    if use_gzip:
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=sitemap_file.gzip_body, media_type="application/xml", headers=headers)
+    return Response(content=gzip.decompress(sitemap_file.gzip_body), media_type="application/xml", headers=headers)
 
 
 @router.get("/sitemap.xml", include_in_schema=False)
-async def sitemap(db: AsyncSession = Depends(get_db)):
-    base_url = settings.FRONTEND_URL.rstrip("/")
-
-    result = await db.execute(
-        select(Vacancy.id, Vacancy.updated_at)
-        .where(Vacancy.is_active == True)
-        .order_by(Vacancy.id)
-    )
-    vacancies = result.all()
-
-    today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
-
-    urls: list[str] = []
-
-    for page in STATIC_PAGES:
-        urls.append(
-            f"  <url>\n"
-            f"    <loc>{base_url}{page['loc']}</loc>\n"
-            f"    <changefreq>{page['changefreq']}</changefreq>\n"
-            f"    <priority>{page['priority']}</priority>\n"
-            f"    <lastmod>{today}</lastmod>\n"
-            f"  </url>"
-        )
-
-    for vacancy_id, updated_at in vacancies:
-        lastmod = (
-            updated_at.strftime("%Y-%m-%d")
-            if updated_at
-            else today
-        )
-        urls.append(
-            f"  <url>\n"
-            f"    <loc>{base_url}/jobs/{vacancy_id}</loc>\n"
-            f"    <lastmod>{lastmod}</lastmod>\n"
-            f"    <changefreq>weekly</changefreq>\n"
-            f"    <priority>0.8</priority>\n"
-            f"  </url>"
-        )
-
-    xml = (
-        '<?xml version="1.0" encoding="UTF-8"?>\n'
-        '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
-        + "\n".join(urls)
-        + "\n</urlset>"
-    )
-
-    return Response(content=xml, media_type="application/xml")
+async def sitemap_index(request: Request):
+    sitemap_file = await get_sitemap_store().get(INDEX_NAME)
+    return sitemap_response(request, sitemap_file)
+
+
+@router.get("/sitemaps/{name}", include_in_schema=False)
+async def sitemap_shard(name: str, request: Request):
+    if name != PAGES_NAME and not _SHARD_NAME.match(name):
+        raise HTTPException(status_code=404, detail="Sitemap not found")
+    sitemap_file = await get_sitemap_store().get(name)
+    if sitemap_file is None:
+        raise HTTPException(status_code=404, detail="Sitemap not found")
+    return sitemap_response(request, sitemap_file)
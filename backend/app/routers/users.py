@@ -6,7 +6,9 @@ from sqlalchemy import select
 from app.database import get_db
 from app.models import User
 from app.schemas import UserProfileUpdate, UserProfileOut
-from app.auth import get_current_user
+from app.auth import get_current_principal, get_current_user
+from app.infra.principal_cache import Principal, invalidate_principal
+from app.services.recommendation_engine import get_recommendation_engine
 
 router = APIRouter(
     prefix="/api/users",
@@ -38,13 +40,19 @@ async def update_user_profile(
     
     await db.commit()
     await db.refresh(current_user)
-    
+    await invalidate_principal(current_user.id)
+
+    # Drop the stale recommendation feed and precompute a new one in the background.
+    engine = get_recommendation_engine()
+    await engine.invalidate_user(current_user.id)
+    engine.schedule_user_refresh(current_user.id)
+
     return current_user
 
 
 @router.get("/me/profile", response_model=UserProfileOut, summary="Get user profile")
 async def get_user_profile(
-    current_user: User = Depends(get_current_user)
+    current_user: Principal = Depends(get_current_principal)
 ):
     """
     Get the current user's full profile information.
@@ -1,5 +1,6 @@
 from typing import Optional
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 from fastapi_cache.decorator import cache
 
@@ -9,12 +10,14 @@ from app.core.enums import GradeEnum, SortEnum
 from app.schemas import VacancyResponse, PaginatedVacancies, FiltersResponse, RoleMarketStatsResponse
 from app.services.vacancy_service import VacancyService, ROLE_SEARCH_MAPPING
 from app.core.limiter import limiter
-from app.infra.cache import build_cache_key, get_cached_response, set_cached_response
+from app.infra.cache import build_cache_key, encode_json, get_cached_body, read_dataset_generation, set_cached_body
+from app.infra.http_cache import dataset_etag, dataset_validated, not_modified, validator_headers
 
 router = APIRouter(prefix="/api", tags=["Vacancies"])
 
 @router.get("/filters", response_model=FiltersResponse, summary="Get filter options", description="Returns available filter options for UI: locations, grades, and popular technologies.")
 @limiter.limit("100/minute")
+@dataset_validated
 @cache(expire=3600)
 async def get_filters(request: Request, db: AsyncSession = Depends(get_db)):
     """
@@ -27,8 +30,10 @@ async def get_filters(request: Request, db: AsyncSession = Depends(get_db)):
 
 @router.get("/vacancies", response_model=PaginatedVacancies, summary="Get vacancies", description="Returns paginated list of IT vacancies with filtering and sorting options.")
 @limiter.limit("100/minute")
+@dataset_validated
 async def get_vacancies(
     request: Request,
+    response: Response,
     page: int = Query(1, ge=1, description="Page number"),
     per_page: int = Query(21, ge=1, le=100, description="Number of records per page"),
     search: Optional[str] = Query(None, description="Search in title, description, and company name"),
@@ -42,7 +47,10 @@ async def get_vacancies(
 ):
     """
     Get paginated list of vacancies with optional filters.
-    Uses endpoint-level Redis caching (Approach A).
+    Uses endpoint-level Redis caching (Approach A), keyed by dataset generation
+    so a cached page never outlives the ETag it was served under. The page is
+    encoded once with orjson; cache hits return the stored bytes unchanged.
+    Items are VacancyListItem cards (no description/raw_data; see the detail endpoint).
     """
     # Build cache key from path + normalized query params
     query_params = {
@@ -58,14 +66,17 @@ async def get_vacancies(
     }
     # Remove None values
     query_params = {k: v for k, v in query_params.items() if v is not None}
+    generation = getattr(request.state, "dataset_generation", None)
+    if generation is not None:
+        query_params["generation"] = generation
 
     cache_key = build_cache_key("/api/vacancies", query_params)
     request_id = getattr(request.state, "request_id", None) or request.headers.get("X-Request-ID")
 
     # Try to get from cache
-    cached_response = await get_cached_response(cache_key, request_id)
-    if cached_response is not None:
-        return PaginatedVacancies(**cached_response)
+    cached_body = await get_cached_body(cache_key, request_id)
+    if cached_body is not None:
+        return Response(content=cached_body, media_type="application/json")
 
     # Cache miss - query database
     vacancies, total = await VacancyService.get_vacancies(
@@ -81,26 +92,43 @@ async def get_vacancies(
         sort=sort
     )
 
-    response_data = {
-        "items": [v.model_dump() if hasattr(v, 'model_dump') else v for v in vacancies],
-        "total": total,
-        "page": page,
-        "per_page": per_page
-    }
+    page_data = PaginatedVacancies.model_validate(
+        {"items": vacancies, "total": total, "page": page, "per_page": per_page},
+        from_attributes=True,
+    )
+    body = encode_json(page_data.model_dump(mode="json"))
 
     # Store in cache
-    await set_cached_response(cache_key, response_data, request_id=request_id)
+    await set_cached_body(cache_key, body, request_id=request_id)
 
-    return PaginatedVacancies(**response_data)
+    return Response(content=body, media_type="application/json")
 
 
 @router.get("/vacancies/{vacancy_id}", response_model=VacancyResponse)
-async def get_vacancy(vacancy_id: int, db: AsyncSession = Depends(get_db)):
-    vacancy = await VacancyService.get_vacancy_by_id(db, vacancy_id)
+async def get_vacancy(vacancy_id: int, request: Request, response: Response, db: AsyncSession = Depends(get_db)):
+    """
+    Single active vacancy. The ETag comes from the row's updated_at (plus the
+    dataset generation when Redis is available), probed with a primary-key
+    lookup before the full row is loaded.
+    """
+    result = await db.execute(
+        select(Vacancy.id, Vacancy.updated_at).filter(Vacancy.id == vacancy_id, Vacancy.is_active == True)
+    )
+    row = result.first()
+    if row is None:
+        raise HTTPException(status_code=404, detail="Vacancy not found")
 
+    version = row.updated_at.isoformat() if row.updated_at else ""
+    etag = dataset_etag(await read_dataset_generation() or 0, request, version)
+    cached = not_modified(request, etag)
+    if cached is not None:
+        return cached
+
+    vacancy = await VacancyService.get_vacancy_by_id(db, vacancy_id)
     if not vacancy:
         raise HTTPException(status_code=404, detail="Vacancy not found")
 
+    response.headers.update(validator_headers(etag))
     return vacancy
 
 
@@ -4,6 +4,7 @@ from typing import Optional, Any, List, Dict
 from pydantic import BaseModel, field_validator, Field, EmailStr
 
 from app.core.enums import GradeEnum, SortEnum
+from app.core.skills import SKILL_REGISTRY
 from app.utils.password_validator import validate_password_strength
 
 class VacancyResponse(BaseModel):
@@ -33,8 +34,29 @@ class MetricsResponse(BaseModel):
     avg_salary_by_grade: dict[str, int]
     top_locations: dict[str, int]
 
+class VacancyListItem(BaseModel):
+    """Vacancy card in listings; description and raw_data come from GET /api/vacancies/{id}."""
+    id: int
+    title: str
+    company_id: Optional[int] = None
+    company_name: Optional[str] = None
+    company_logo: Optional[str] = None
+    salary_from: Optional[int] = None
+    salary_to: Optional[int] = None
+    salary_in_kzt: Optional[int] = None
+    currency: Optional[str] = "KZT"
+    location: Optional[str] = None
+    grade: Optional[str] = None
+    published_at: Optional[datetime] = None
+    key_skills: Optional[List[str]] = None
+    url: str
+    snippet: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
 class PaginatedVacancies(BaseModel):
-    items: List[VacancyResponse]
+    items: List[VacancyListItem]
     total: int
     page: int
     per_page: int
@@ -79,7 +101,7 @@ class CompaniesListResponse(BaseModel):
 
 class CompanyDetailResponse(BaseModel):
     company: CompanyResponse
-    vacancies: List[VacancyResponse]
+    vacancies: List[VacancyListItem]
     total: int
     page: int
     per_page: int
@@ -206,7 +228,7 @@ class UserProfileUpdate(BaseModel):
     @classmethod
     def normalize_skills(cls, v):
         if v is not None:
-            return [skill.lower().strip() for skill in v if skill.strip()]
+            return SKILL_REGISTRY.normalize_profile_skills(v)
         return v
 
 
@@ -241,12 +263,20 @@ class QuestionResponse(BaseModel):
 class StartTestResponse(BaseModel):
     """Response when starting a new test."""
     session_id: str
+    # Set only with the stateless "token" session backend
+    session_token: Optional[str] = None
 
 
 class SubmitAnswerRequest(BaseModel):
     """Request body for submitting an answer."""
     question_id: str = Field(..., description="Question ID")
     answer_option_id: str = Field(..., description="Selected answer option ID")
+    session_token: Optional[str] = Field(None, description="Current session token (token backend only)")
+
+
+class CompleteTestRequest(BaseModel):
+    """Optional request body for completing a test."""
+    session_token: Optional[str] = Field(None, description="Final session token (token backend only)")
 
 
 class InterpretationResponse(BaseModel):
@@ -290,6 +320,18 @@ class TestResultResponse(BaseModel):
     ranked_stages: Optional[List[TestStageScoreResponse]] = None
     stage_recommendation: Optional[TestStageRecommendationResponse] = None
     warnings: Optional[List[str]] = None
+    # Async interpretation: "ready" | "pending" | "skipped" | "failed"
+    interpretation_status: Optional[str] = None
+    interpretation_job_id: Optional[str] = None
+
+
+class InterpretationJobResponse(BaseModel):
+    """Status of a background LLM interpretation job."""
+    job_id: str
+    session_id: str
+    status: str
+    interpretation: Optional[InterpretationResponse] = None
+    warnings: Optional[List[str]] = None
 
 
 # --- Stage Schemas ---
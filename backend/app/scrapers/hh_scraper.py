@@ -4,13 +4,14 @@ import logging
 from datetime import datetime, timedelta, timezone
 from typing import List, Optional, Set
 
-from sqlalchemy import func, text
+from sqlalchemy import Integer, bindparam, func, text
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.dialects.postgresql import insert
 from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
 
 from app.database import SessionLocal
-from app.models import Vacancy, Company
-from app.utils.helpers import determine_grade
+from app.models import Vacancy, VacancyRaw, Company
+from app.utils.helpers import determine_grade, make_snippet
 from app.config_roles import EXCHANGE_RATES, ROLES
 from app.config import settings
 
@@ -375,6 +376,16 @@ class HHScraper:
             return None
         return logo_urls.get("240")
 
+    def _extract_professional_role_ids(self, item: dict) -> List[int]:
+        """HH professional role ids ("96" -> 96), used by the per-role cleanup."""
+        role_ids = []
+        for role in item.get("professional_roles") or []:
+            try:
+                role_ids.append(int(role["id"]))
+            except (KeyError, TypeError, ValueError):
+                continue
+        return sorted(set(role_ids))
+
     def save_to_db(self, items: List[dict], role_id: int, start_time: datetime, do_cleanup: bool) -> dict:
         stats = {"added": 0, "updated": 0, "deleted": 0}
 
@@ -394,6 +405,7 @@ class HHScraper:
 
                         # Extract tech stack from title and description
                         from app.utils.tech_extractor import extract_tech_from_vacancy
+                        from app.core.skills import SKILL_REGISTRY
                         title = item.get("name", "")
                         description = item.get("description", "")
                         tech_stack = extract_tech_from_vacancy(title, description)
@@ -414,9 +426,10 @@ class HHScraper:
                             "company_logo": self._extract_company_logo(item),
                             "salary_in_kzt": self._calculate_salary_in_kzt(salary),
                             "key_skills": tech_stack,  # Use extracted tech stack instead of HH.ru's key_skills
+                            "skill_ids": SKILL_REGISTRY.ids(tech_stack),
                             "url": item.get("alternate_url"),
                             "published_at": self._parse_date(item.get("published_at")),
-                            "raw_data": item,
+                            "professional_role_ids": self._extract_professional_role_ids(item),
                             "is_active": True,
                             "updated_at": datetime.now()
                         }
@@ -424,6 +437,7 @@ class HHScraper:
                         # Conditional Description Logic
                         if not item.get('skip_detail'):
                             vacancy_data["description"] = item.get("description")
+                            vacancy_data["snippet"] = make_snippet(item.get("description"), item.get("snippet"))
 
                         # Link to company
                         employer = item.get('employer')
@@ -438,17 +452,17 @@ class HHScraper:
 
                         # Smart AI Recheck: Check if title changed BEFORE update
                         # If title changed, mark for AI re-verification
-                        existing_vacancy = db.query(Vacancy).filter(
+                        existing_title = db.query(Vacancy.title).filter(
                             Vacancy.external_id == str(item.get("id")),
                             Vacancy.source == "hh"
-                        ).first()
+                        ).scalar()
 
-                        title_changed = existing_vacancy and existing_vacancy.title != title
+                        title_changed = existing_title is not None and existing_title != title
                         if title_changed:
                             logger.debug(
                                 "Title changed for %s: '%s' -> '%s'. Will mark for AI recheck.",
                                 item.get('id'),
-                                existing_vacancy.title,
+                                existing_title,
                                 title,
                             )
 
@@ -471,23 +485,33 @@ class HHScraper:
                             set_=update_dict
                         )
 
-                        stmt = stmt.returning(text("(xmax = 0) as is_new"))
+                        stmt = stmt.returning(Vacancy.id, text("(xmax = 0) as is_new"))
                         result = db.execute(stmt)
                         row = result.fetchone()
 
-                        if row and row[0]:
+                        if row and row[1]:
                             stats["added"] += 1
                         else:
                             stats["updated"] += 1
 
+                        # Full payload goes to vacancy_raw; unchanged payloads are not rewritten.
+                        if row:
+                            raw_stmt = insert(VacancyRaw).values(vacancy_id=row[0], raw_data=item)
+                            db.execute(raw_stmt.on_conflict_do_update(
+                                index_elements=["vacancy_id"],
+                                set_={"raw_data": raw_stmt.excluded.raw_data, "updated_at": func.now()},
+                                where=VacancyRaw.raw_data.is_distinct_from(raw_stmt.excluded.raw_data),
+                            ))
+
                     if do_cleanup:
                         threshold = start_time - timedelta(minutes=10)
-                        role_filter = [{"id": str(role_id)}]
                         affected = db.query(Vacancy).filter(
                             Vacancy.source == "hh",
                             Vacancy.is_active == True,
                             Vacancy.updated_at < threshold,
-                            Vacancy.raw_data['professional_roles'].contains(role_filter)
+                            Vacancy.professional_role_ids.contains(
+                                bindparam("cleanup_role_ids", [int(role_id)], type_=ARRAY(Integer))
+                            )
                         ).update({"is_active": False}, synchronize_session=False)
                         if affected:
                             stats["deleted"] = affected
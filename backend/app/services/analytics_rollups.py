@@ -0,0 +1,214 @@
+"""
+Analytics storage maintenance and the admin dashboard query.
+
+analytics_events is range-partitioned by month (analytics_events_pYYYYMM).
+maintain_analytics (scripts/maintain_analytics.py) runs hourly and:
+
+1. creates the partitions for the current and next months,
+2. drops partitions older than the retention period,
+3. re-rolls the days since the last rollup into analytics_daily_rollups
+   (counts per day/event/route/user type) and analytics_daily_sessions
+   (one HyperLogLog sketch of session ids per day).
+
+The dashboard reads the rollups for finished days and aggregates only the
+still-open tail (from the last rolled day on) from raw events. Days are UTC.
+"""
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from sqlalchemy import Date, cast, delete, desc, distinct, func, insert, literal, select, text, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models import AnalyticsDailyRollup, AnalyticsDailySessions, AnalyticsEvent
+from app.utils.hyperloglog import HyperLogLog
+
+PARTITION_PREFIX = "analytics_events_p"
+
+
+def _month_start(day: date) -> date:
+    return day.replace(day=1)
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _utc_start(day: date) -> datetime:
+    return datetime.combine(day, time.min, tzinfo=timezone.utc)
+
+
+def partition_name(month: date) -> str:
+    return f"{PARTITION_PREFIX}{month:%Y%m}"
+
+
+def partition_month(name: str) -> Optional[date]:
+    """Month of a partition created by partition_name(), or None for other tables."""
+    suffix = name[len(PARTITION_PREFIX):] if name.startswith(PARTITION_PREFIX) else ""
+    if len(suffix) != 6 or not suffix.isdigit():
+        return None
+    return date(int(suffix[:4]), int(suffix[4:]), 1)
+
+
+def month_range(first: date, last: date) -> Iterator[date]:
+    """Month starts from first's month through last's month."""
+    month = _month_start(first)
+    while month <= last:
+        yield month
+        month = add_months(month, 1)
+
+
+def create_partition_sql(month: date) -> str:
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(month)} PARTITION OF analytics_events "
+        f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') TO ('{add_months(month, 1).isoformat()} 00:00:00+00')"
+    )
+
+
+def expired_partitions(names: List[str], today: date, retention_months: int) -> List[str]:
+    """Partitions whose whole month is older than the current month minus retention_months."""
+    cutoff = add_months(_month_start(today), -retention_months)
+    return sorted(
+        name for name in names
+        if (month := partition_month(name)) is not None and add_months(month, 1) <= cutoff
+    )
+
+
+def ensure_partitions(db: Session, today: date, months_ahead: int = 2) -> List[str]:
+    months = list(month_range(today, add_months(_month_start(today), months_ahead)))
+    for month in months:
+        db.execute(text(create_partition_sql(month)))
+    return [partition_name(month) for month in months]
+
+
+def list_partitions(db: Session) -> List[str]:
+    return list(db.execute(text(
+        "SELECT child.relname FROM pg_inherits "
+        "JOIN pg_class parent ON parent.oid = pg_inherits.inhparent "
+        "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+        "WHERE parent.relname = 'analytics_events'"
+    )).scalars())
+
+
+def drop_expired_partitions(db: Session, today: date, retention_months: int) -> List[str]:
+    dropped = expired_partitions(list_partitions(db), today, retention_months)
+    for name in dropped:
+        db.execute(text(f"DROP TABLE IF EXISTS {name}"))
+    return dropped
+
+
+def _event_day():
+    return cast(func.timezone("UTC", AnalyticsEvent.created_at), Date)
+
+
+def refresh_rollups(db: Session, today: date) -> List[date]:
+    """Re-roll every day from the last rolled day (it may have been partial) through today."""
+    start = db.scalar(select(func.max(AnalyticsDailySessions.day)))
+    if start is None:
+        first_event = db.scalar(select(func.min(AnalyticsEvent.created_at)))
+        start = first_event.astimezone(timezone.utc).date() if first_event else today
+
+    days = []
+    day = start
+    while day <= today:
+        window = (
+            AnalyticsEvent.created_at >= _utc_start(day),
+            AnalyticsEvent.created_at < _utc_start(day + timedelta(days=1)),
+        )
+        db.execute(delete(AnalyticsDailyRollup).where(AnalyticsDailyRollup.day == day))
+        db.execute(
+            insert(AnalyticsDailyRollup).from_select(
+                ["day", "event_name", "route", "user_type_guess", "events"],
+                select(
+                    literal(day, Date),
+                    AnalyticsEvent.event_name,
+                    AnalyticsEvent.route,
+                    AnalyticsEvent.user_type_guess,
+                    func.count(),
+                )
+                .where(*window)
+                .group_by(AnalyticsEvent.event_name, AnalyticsEvent.route, AnalyticsEvent.user_type_guess),
+            )
+        )
+
+        sketch = HyperLogLog()
+        sessions = db.execute(
+            select(distinct(AnalyticsEvent.session_id))
+            .where(*window, AnalyticsEvent.session_id.isnot(None))
+            .execution_options(yield_per=5000)
+        ).scalars()
+        sketch.update(sessions)
+        db.execute(delete(AnalyticsDailySessions).where(AnalyticsDailySessions.day == day))
+        db.add(AnalyticsDailySessions(day=day, sessions_sketch=sketch.to_bytes()))
+        db.flush()
+
+        days.append(day)
+        day += timedelta(days=1)
+    return days
+
+
+async def get_analytics_dashboard(db: AsyncSession, days: int, today: Optional[date] = None) -> Dict:
+    """Dashboard aggregates for the last `days` UTC days (including today)."""
+    today = today or datetime.now(timezone.utc).date()
+    since_day = today - timedelta(days=days - 1)
+    last_rolled = await db.scalar(select(func.max(AnalyticsDailySessions.day)))
+    live_from = max(since_day, last_rolled) if last_rolled else since_day
+
+    rolled = select(
+        AnalyticsDailyRollup.day.label("day"),
+        AnalyticsDailyRollup.event_name.label("event_name"),
+        AnalyticsDailyRollup.route.label("route"),
+        AnalyticsDailyRollup.user_type_guess.label("user_type_guess"),
+        AnalyticsDailyRollup.events.label("events"),
+    ).where(AnalyticsDailyRollup.day >= since_day, AnalyticsDailyRollup.day < live_from)
+    event_day = _event_day()
+    live = (
+        select(
+            event_day.label("day"),
+            AnalyticsEvent.event_name,
+            AnalyticsEvent.route,
+            AnalyticsEvent.user_type_guess,
+            func.count().label("events"),
+        )
+        .where(AnalyticsEvent.created_at >= _utc_start(live_from))
+        .group_by(event_day, AnalyticsEvent.event_name, AnalyticsEvent.route, AnalyticsEvent.user_type_guess)
+    )
+    source = union_all(rolled, live).subquery("events_by_day")
+    total = func.coalesce(func.sum(source.c.events), 0).label("cnt")
+
+    async def grouped(column, limit: Optional[int] = None) -> List[Tuple]:
+        stmt = select(column, total).group_by(column).order_by(desc("cnt"))
+        if limit:
+            stmt = stmt.limit(limit)
+        return (await db.execute(stmt)).all()
+
+    total_events = int(await db.scalar(select(total)) or 0)
+    user_types = {name: int(cnt) for name, cnt in await grouped(source.c.user_type_guess)}
+    top_events = [{"event_name": name, "count": int(cnt)} for name, cnt in await grouped(source.c.event_name, 10)]
+    top_routes = [{"route": name, "count": int(cnt)} for name, cnt in await grouped(source.c.route, 10)]
+    per_day = (await db.execute(select(source.c.day, total).group_by(source.c.day).order_by(source.c.day))).all()
+    events_per_day = [{"date": day.strftime("%Y-%m-%d"), "count": int(cnt)} for day, cnt in per_day]
+
+    sketch = HyperLogLog()
+    result = await db.execute(
+        select(AnalyticsDailySessions.sessions_sketch)
+        .where(AnalyticsDailySessions.day >= since_day, AnalyticsDailySessions.day < live_from)
+    )
+    for registers in result.scalars():
+        sketch.merge(HyperLogLog.from_bytes(registers))
+    result = await db.execute(
+        select(distinct(AnalyticsEvent.session_id))
+        .where(AnalyticsEvent.created_at >= _utc_start(live_from), AnalyticsEvent.session_id.isnot(None))
+    )
+    sketch.update(result.scalars())
+
+    return {
+        "period_days": days,
+        "total_events": total_events,
+        "unique_sessions": sketch.count(),
+        "user_types": user_types,
+        "top_events": top_events,
+        "top_routes": top_routes,
+        "events_per_day": events_per_day,
+    }
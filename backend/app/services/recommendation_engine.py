@@ -0,0 +1,431 @@
+"""
+Precomputed recommendation feeds.
+
+The engine keeps an in-memory inverted index over active vacancies
+(canonical skill id -> posting list of vacancy positions, plus one boolean
+bitmap per grade) and uses it to precompute every active user's top-K
+vacancies into Redis:
+
+- recs:v2:g{generation}:user:{user_id}  -> "id,id,..." (ranked)
+- recs:v2:g{generation}:vacancies       -> hash id -> VacancyListItem JSON
+
+Keys embed the dataset generation (app.infra.cache), so a pipeline run
+invalidates every feed at once. A full rebuild is scheduled when the
+pipeline reports completion (/api/internal/clear-cache); a single user's
+feed is refreshed after PUT /api/users/me/profile or on a feed miss.
+Reading a feed is one Redis round trip (one Lua script).
+
+Ranking matches the SQL path in app.routers.recommendations: skill overlap
+DESC, then recency (published_at DESC NULLS LAST, id DESC), topped up with
+the latest non-overlapping vacancies.
+"""
+
+import asyncio
+import logging
+import time
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+from sqlalchemy import select
+
+from app.config import settings
+from app.core.skills import SKILL_REGISTRY
+from app.database import AsyncSessionLocal
+from app.infra.cache import get_dataset_generation, DATASET_GENERATION_KEY
+from app.infra.redis_client import get_redis
+from app.models import User, Vacancy
+from app.schemas import VacancyListItem
+from app.services.vacancy_service import VACANCY_LIST_COLUMNS
+
+logger = logging.getLogger(__name__)
+
+GRADE_NEIGHBOURS = {
+    'Junior': ['Junior', 'Middle'],
+    'Middle': ['Junior', 'Middle', 'Senior'],
+    'Senior': ['Middle', 'Senior', 'Lead'],
+    'Lead': ['Senior', 'Lead']
+}
+
+_KEY_PREFIX = "recs:v2:g"
+_USER_BATCH_SIZE = 500
+_PAYLOAD_BATCH_SIZE = 500
+
+# Returns {generation} on a miss, or {generation, row, ..., ''} on a hit
+# (the trailing '' marks a hit, so an empty feed is distinguishable from a miss).
+_READ_FEED_SCRIPT = """
+local generation = redis.call('GET', KEYS[1]) or '0'
+local prefix = ARGV[1] .. generation
+local feed = redis.call('GET', prefix .. ':user:' .. ARGV[2])
+if not feed then
+    return {generation}
+end
+local ids = {}
+for id in string.gmatch(feed, '[^,]+') do
+    ids[#ids + 1] = id
+end
+local result = {generation}
+if #ids == 0 then
+    result[2] = ''
+    return result
+end
+local rows = redis.call('HMGET', prefix .. ':vacancies', unpack(ids))
+for i = 1, #rows do
+    if not rows[i] then
+        return {generation}
+    end
+    result[#result + 1] = rows[i]
+end
+result[#result + 1] = ''
+return result
+"""
+
+
+def _feed_key(generation: int, user_id: int) -> str:
+    return f"{_KEY_PREFIX}{generation}:user:{user_id}"
+
+
+def _payloads_key(generation: int) -> str:
+    return f"{_KEY_PREFIX}{generation}:vacancies"
+
+
+@dataclass(frozen=True)
+class SkillIndex:
+    """Inverted skill index over active vacancies, positions ordered by recency."""
+    generation: int
+    vacancy_ids: np.ndarray  # int64, position -> vacancy id
+    postings: Dict[int, np.ndarray]  # skill id -> sorted positions
+    has_skills: np.ndarray  # bool per position
+    grade_bitmaps: Dict[str, np.ndarray]  # grade -> bool per position
+
+    @classmethod
+    def build(cls, rows: Iterable[Tuple[int, Optional[List[int]], Optional[str]]], generation: int) -> "SkillIndex":
+        """Build from (id, skill_ids, grade) rows already sorted by recency."""
+        ids: List[int] = []
+        postings: Dict[int, List[int]] = {}
+        grades: Dict[str, List[int]] = {}
+        has_skills: List[bool] = []
+        for position, (vacancy_id, skill_ids, grade) in enumerate(rows):
+            ids.append(vacancy_id)
+            has_skills.append(bool(skill_ids))
+            for skill_id in skill_ids or ():
+                postings.setdefault(skill_id, []).append(position)
+            if grade:
+                grades.setdefault(grade, []).append(position)
+
+        size = len(ids)
+        grade_bitmaps = {}
+        for grade, positions in grades.items():
+            bitmap = np.zeros(size, dtype=bool)
+            bitmap[positions] = True
+            grade_bitmaps[grade] = bitmap
+        return cls(
+            generation=generation,
+            vacancy_ids=np.asarray(ids, dtype=np.int64),
+            postings={skill_id: np.asarray(positions, dtype=np.int64) for skill_id, positions in postings.items()},
+            has_skills=np.asarray(has_skills, dtype=bool),
+            grade_bitmaps=grade_bitmaps,
+        )
+
+    def _grade_mask(self, grade: Optional[str]) -> np.ndarray:
+        if not grade or grade not in GRADE_NEIGHBOURS:
+            return np.ones(len(self.vacancy_ids), dtype=bool)
+        mask = np.zeros(len(self.vacancy_ids), dtype=bool)
+        for neighbour in GRADE_NEIGHBOURS[grade]:
+            bitmap = self.grade_bitmaps.get(neighbour)
+            if bitmap is not None:
+                mask |= bitmap
+        return mask
+
+    def top_k(
+        self,
+        skill_ids: Sequence[int],
+        grade: Optional[str],
+        k: int,
+        has_skills: Optional[bool] = None,
+    ) -> List[int]:
+        """
+        Ranked vacancy ids for one profile.
+
+        has_skills defaults to bool(skill_ids); pass True for profiles whose
+        skills are all unregistered (no overlap possible, but the filler still
+        prefers vacancies with skills, like the SQL path).
+        """
+        mask = self._grade_mask(grade)
+        if has_skills is None:
+            has_skills = bool(skill_ids)
+        if not has_skills:
+            return self.vacancy_ids[np.flatnonzero(mask)[:k]].tolist()
+
+        lists = [self.postings[skill_id] for skill_id in skill_ids if skill_id in self.postings]
+        if lists:
+            counts = np.bincount(np.concatenate(lists), minlength=len(self.vacancy_ids))
+        else:
+            counts = np.zeros(len(self.vacancy_ids), dtype=np.int64)
+
+        matched = np.flatnonzero((counts > 0) & mask)
+        # Overlap DESC, then position (recency) ASC.
+        ranked = matched[np.lexsort((matched, -counts[matched]))][:k]
+        if len(ranked) < k:
+            filler = np.flatnonzero(mask & self.has_skills & (counts == 0))[:k - len(ranked)]
+            ranked = np.concatenate([ranked, filler])
+        return self.vacancy_ids[ranked].tolist()
+
+
+class RecommendationEngine:
+    """Maintains the skill index and writes per-user feeds to Redis."""
+
+    def __init__(self, top_k: int = 20, feed_ttl_seconds: int = 2 * 24 * 3600):
+        self._top_k = top_k
+        self._feed_ttl_seconds = feed_ttl_seconds
+        self._index: Optional[SkillIndex] = None
+        self._index_lock: Optional[asyncio.Lock] = None
+        self._rebuild_task: Optional[asyncio.Task] = None
+        self._rebuild_pending = False
+        self._tasks: Set[asyncio.Task] = set()
+        # Per-user refreshes: in flight, asked again while in flight, and
+        # held back until the running full rebuild has finished.
+        self._refreshing: Set[int] = set()
+        self._refresh_pending: Set[int] = set()
+        self._refresh_after_rebuild: Set[int] = set()
+        # Feed read script, registered once per Redis client (EVALSHA).
+        self._read_feed_client = None
+        self._read_feed_script = None
+
+    def _lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        lock_loop = getattr(self._index_lock, "_loop", None) if self._index_lock else None
+        if self._index_lock is None or (lock_loop is not None and lock_loop is not loop):
+            self._index_lock = asyncio.Lock()
+        return self._index_lock
+
+    async def _load_index(self, db, generation: int) -> SkillIndex:
+        result = await db.execute(
+            select(Vacancy.id, Vacancy.skill_ids, Vacancy.grade)
+            .filter(Vacancy.is_active == True)
+            .order_by(Vacancy.published_at.desc().nullslast(), Vacancy.id.desc())
+        )
+        started = time.perf_counter()
+        index = SkillIndex.build(result.all(), generation)
+        logger.info(
+            "recommendation_index_built generation=%s vacancies=%d skills=%d duration_ms=%d",
+            generation,
+            len(index.vacancy_ids),
+            len(index.postings),
+            int((time.perf_counter() - started) * 1000),
+        )
+        return index
+
+    async def get_index(self, db, generation: int) -> SkillIndex:
+        """Current index, rebuilt when the dataset generation moved on."""
+        index = self._index
+        if index is not None and index.generation == generation:
+            return index
+        async with self._lock():
+            index = self._index
+            if index is None or index.generation != generation:
+                index = await self._load_index(db, generation)
+                self._index = index
+        return index
+
+    async def read_feed(self, user_id: int) -> Optional[bytes]:
+        """Return the user's precomputed JSON feed, or None on a miss."""
+        redis = get_redis()
+        if redis is None:
+            return None
+        if redis is not self._read_feed_client:
+            self._read_feed_script = redis.register_script(_READ_FEED_SCRIPT)
+            self._read_feed_client = redis
+        try:
+            result = await self._read_feed_script(keys=[DATASET_GENERATION_KEY], args=[_KEY_PREFIX, str(user_id)])
+        except Exception as exc:
+            logger.warning("recommendation_feed_error operation=read user_id=%s error=%s", user_id, exc)
+            return None
+        if not result or len(result) == 1:
+            return None
+        rows = result[1:-1]
+        return ("[" + ",".join(rows) + "]").encode("utf-8")
+
+    async def invalidate_user(self, user_id: int) -> None:
+        redis = get_redis()
+        if redis is None:
+            return
+        try:
+            await redis.delete(_feed_key(await get_dataset_generation(), user_id))
+        except Exception as exc:
+            logger.warning("recommendation_feed_error operation=invalidate user_id=%s error=%s", user_id, exc)
+
+    async def _write_payloads(self, redis, db, generation: int, vacancy_ids: Set[int]) -> None:
+        ids = sorted(vacancy_ids)
+        key = _payloads_key(generation)
+        for start in range(0, len(ids), _PAYLOAD_BATCH_SIZE):
+            chunk = ids[start:start + _PAYLOAD_BATCH_SIZE]
+            result = await db.execute(select(*VACANCY_LIST_COLUMNS).filter(Vacancy.id.in_(chunk)))
+            mapping = {
+                str(vacancy.id): VacancyListItem.model_validate(vacancy).model_dump_json()
+                for vacancy in result.all()
+            }
+            if mapping:
+                await redis.hset(key, mapping=mapping)
+        await redis.expire(key, self._feed_ttl_seconds)
+
+    async def _write_feeds(self, redis, generation: int, feeds: Dict[int, List[int]]) -> None:
+        async with redis.pipeline(transaction=False) as pipe:
+            for user_id, vacancy_ids in feeds.items():
+                pipe.set(
+                    _feed_key(generation, user_id),
+                    ",".join(str(vacancy_id) for vacancy_id in vacancy_ids),
+                    ex=self._feed_ttl_seconds,
+                )
+            await pipe.execute()
+
+    async def refresh_user(self, user_id: int) -> None:
+        """Recompute one user's feed from the current index."""
+        redis = get_redis()
+        if redis is None:
+            return
+        generation = await get_dataset_generation()
+        async with AsyncSessionLocal() as db:
+            user = await db.get(User, user_id)
+            if user is None or not user.is_active:
+                return
+            index = await self.get_index(db, generation)
+            vacancy_ids = index.top_k(
+                SKILL_REGISTRY.ids(user.skills), user.grade, self._top_k, has_skills=bool(user.skills)
+            )
+            await self._write_payloads(redis, db, generation, set(vacancy_ids))
+        await self._write_feeds(redis, generation, {user_id: vacancy_ids})
+
+    async def rebuild_all(self) -> int:
+        """Rebuild the index and every active user's feed; returns the number of feeds written."""
+        redis = get_redis()
+        if redis is None:
+            return 0
+        started = time.perf_counter()
+        generation = await get_dataset_generation()
+        written = 0
+        async with AsyncSessionLocal() as db:
+            index = await self.get_index(db, generation)
+            last_id = 0
+            while True:
+                result = await db.execute(
+                    select(User.id, User.skills, User.grade)
+                    .filter(User.is_active == True, User.id > last_id)
+                    .order_by(User.id)
+                    .limit(_USER_BATCH_SIZE)
+                )
+                users = result.all()
+                if not users:
+                    break
+                last_id = users[-1].id
+                feeds = {
+                    user.id: index.top_k(
+                        SKILL_REGISTRY.ids(user.skills), user.grade, self._top_k, has_skills=bool(user.skills)
+                    )
+                    for user in users
+                }
+                await self._write_payloads(
+                    redis, db, generation, {vacancy_id for ids in feeds.values() for vacancy_id in ids}
+                )
+                await self._write_feeds(redis, generation, feeds)
+                written += len(feeds)
+        logger.info(
+            "recommendation_feeds_rebuilt generation=%s users=%d duration_ms=%d",
+            generation,
+            written,
+            int((time.perf_counter() - started) * 1000),
+        )
+        return written
+
+    def _track(self, task: asyncio.Task) -> asyncio.Task:
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def _rebuild_running(self) -> bool:
+        return self._rebuild_task is not None and not self._rebuild_task.done()
+
+    def schedule_user_refresh(self, user_id: int) -> None:
+        """
+        Refresh one user's feed in the background.
+
+        At most one refresh per user runs at a time; requests made meanwhile
+        coalesce into one rerun. While a full rebuild runs the refresh is
+        held back and only rerun afterwards, in case the rebuild had already
+        passed this user.
+        """
+        if self._rebuild_running():
+            self._refresh_after_rebuild.add(user_id)
+            return
+        if user_id in self._refreshing:
+            self._refresh_pending.add(user_id)
+            return
+        self._refreshing.add(user_id)
+
+        async def _run():
+            try:
+                while True:
+                    self._refresh_pending.discard(user_id)
+                    try:
+                        await self.refresh_user(user_id)
+                    except Exception:
+                        logger.warning("Recommendation feed refresh failed user_id=%s", user_id, exc_info=True)
+                    if user_id not in self._refresh_pending:
+                        return
+            finally:
+                self._refreshing.discard(user_id)
+
+        self._track(asyncio.get_running_loop().create_task(_run()))
+
+    def schedule_rebuild(self) -> None:
+        """Rebuild all feeds in the background; requests during a rebuild coalesce into one rerun."""
+        if self._rebuild_running():
+            self._rebuild_pending = True
+            return
+
+        async def _run():
+            while True:
+                self._rebuild_pending = False
+                try:
+                    await self.rebuild_all()
+                except Exception:
+                    logger.exception("Recommendation feed rebuild failed")
+                if not self._rebuild_pending:
+                    break
+            self._rebuild_task = None
+            deferred, self._refresh_after_rebuild = self._refresh_after_rebuild, set()
+            for user_id in deferred:
+                self.schedule_user_refresh(user_id)
+
+        self._rebuild_task = self._track(asyncio.get_running_loop().create_task(_run()))
+
+    async def shutdown(self) -> None:
+        """Cancel background jobs; feeds already written stay valid until their TTL."""
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+        self._rebuild_task = None
+        self._refreshing.clear()
+        self._refresh_pending.clear()
+        self._refresh_after_rebuild.clear()
+
+
+_engine: Optional[RecommendationEngine] = None
+
+
+def get_recommendation_engine() -> RecommendationEngine:
+    """Get or create the recommendation engine singleton."""
+    global _engine
+    if _engine is None:
+        _engine = RecommendationEngine(
+            top_k=settings.RECOMMENDATIONS_TOP_K,
+            feed_ttl_seconds=settings.RECOMMENDATIONS_FEED_TTL_SECONDS,
+        )
+    return _engine
+
+
+async def shutdown_recommendation_engine() -> None:
+    if _engine is not None:
+        await _engine.shutdown()
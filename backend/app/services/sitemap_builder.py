@@ -0,0 +1,279 @@
+"""
+Pre-generated, sharded sitemap.
+
+The sitemap is a sitemap index (/sitemap.xml) pointing at /sitemaps/pages.xml
+(static pages) and /sitemaps/vacancies-{n}.xml shards of at most
+SITEMAP_SHARD_SIZE URLs (50k is the protocol limit). A build streams active
+vacancy ids over a server-side cursor and gzips each shard as it is written,
+so neither the rows nor the XML are ever held in full.
+
+Each worker keeps the last build in memory, tagged with the dataset
+generation (app.infra.cache). A rebuild is scheduled when the pipeline
+reports completion (/api/internal/clear-cache); a worker that notices a newer
+generation, or a build older than SITEMAP_MAX_AGE_SECONDS, keeps serving
+what it has and rebuilds in the background. Only a worker with no sitemap at
+all builds inline, once.
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+import zlib
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import AsyncIterator, Dict, List, Optional, Set, Tuple
+from xml.sax.saxutils import escape
+
+from sqlalchemy import select
+
+from app.config import settings
+from app.database import AsyncSessionLocal
+from app.infra.cache import get_dataset_generation
+from app.models import Vacancy
+
+logger = logging.getLogger(__name__)
+
+INDEX_NAME = "sitemap.xml"
+PAGES_NAME = "pages.xml"
+
+STATIC_PAGES = [
+    {"loc": "/", "changefreq": "daily", "priority": "1.0"},
+    {"loc": "/jobs", "changefreq": "hourly", "priority": "0.9"},
+    {"loc": "/companies", "changefreq": "daily", "priority": "0.8"},
+    {"loc": "/guide", "changefreq": "weekly", "priority": "0.7"},
+    {"loc": "/career", "changefreq": "weekly", "priority": "0.7"},
+    {"loc": "/start", "changefreq": "weekly", "priority": "0.6"},
+]
+
+_URLSET_OPEN = b'<?xml version="1.0" encoding="UTF-8"?>\n<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+_URLSET_CLOSE = b"</urlset>"
+_INDEX_OPEN = b'<?xml version="1.0" encoding="UTF-8"?>\n<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+_INDEX_CLOSE = b"</sitemapindex>"
+_STREAM_BATCH_SIZE = 5000
+
+
+def vacancy_shard_name(number: int) -> str:
+    return f"vacancies-{number}.xml"
+
+
+@dataclass(frozen=True)
+class SitemapFile:
+    """One generated sitemap document, stored gzip-compressed."""
+    gzip_body: bytes
+    etag: str
+    last_modified: datetime
+
+
+@dataclass(frozen=True)
+class Sitemap:
+    generation: int
+    generated_at: datetime
+    built_at: float  # time.monotonic() of the build
+    files: Dict[str, SitemapFile]
+
+
+class _GzipWriter:
+    """Incrementally gzips a document and hashes its uncompressed bytes (for the ETag)."""
+
+    def __init__(self, header: bytes):
+        self._compressor = zlib.compressobj(6, zlib.DEFLATED, 31)
+        self._chunks: List[bytes] = []
+        self._digest = hashlib.sha256()
+        self.urls = 0
+        self.last_modified: Optional[datetime] = None
+        self.write(header)
+
+    def write(self, data: bytes) -> None:
+        self._digest.update(data)
+        chunk = self._compressor.compress(data)
+        if chunk:
+            self._chunks.append(chunk)
+
+    def close(self, footer: bytes, last_modified: datetime) -> SitemapFile:
+        self.write(footer)
+        self._chunks.append(self._compressor.flush())
+        return SitemapFile(
+            gzip_body=b"".join(self._chunks),
+            etag=f'"{self._digest.hexdigest()[:32]}"',
+            last_modified=self.last_modified or last_modified,
+        )
+
+
+def _url_entry(loc: str, lastmod: str, changefreq: str, priority: str) -> bytes:
+    return (
+        f"  <url>\n"
+        f"    <loc>{loc}</loc>\n"
+        f"    <lastmod>{lastmod}</lastmod>\n"
+        f"    <changefreq>{changefreq}</changefreq>\n"
+        f"    <priority>{priority}</priority>\n"
+        f"  </url>\n"
+    ).encode("utf-8")
+
+
+async def build_sitemap(
+    rows: AsyncIterator[Tuple[int, Optional[datetime]]],
+    base_url: str,
+    generation: int = 0,
+    shard_size: int = 50000,
+    now: Optional[datetime] = None,
+) -> Sitemap:
+    """Build the index, the static page sitemap and vacancy shards from (id, updated_at) rows in id order."""
+    now = now or datetime.now(timezone.utc)
+    base_url = escape(base_url.rstrip("/"))
+    today = now.strftime("%Y-%m-%d")
+    shard_size = max(1, min(shard_size, 50000))
+    files: Dict[str, SitemapFile] = {}
+
+    pages = _GzipWriter(_URLSET_OPEN)
+    for page in STATIC_PAGES:
+        pages.write(_url_entry(f"{base_url}{page['loc']}", today, page["changefreq"], page["priority"]))
+    files[PAGES_NAME] = pages.close(_URLSET_CLOSE, now)
+
+    shard: Optional[_GzipWriter] = None
+    shards = 0
+    async for vacancy_id, updated_at in rows:
+        if shard is None:
+            shard = _GzipWriter(_URLSET_OPEN)
+        lastmod = updated_at.strftime("%Y-%m-%d") if updated_at else today
+        shard.write(_url_entry(f"{base_url}/jobs/{vacancy_id}", lastmod, "weekly", "0.8"))
+        shard.urls += 1
+        if updated_at and (shard.last_modified is None or updated_at > shard.last_modified):
+            shard.last_modified = updated_at
+        if shard.urls >= shard_size:
+            shards += 1
+            files[vacancy_shard_name(shards)] = shard.close(_URLSET_CLOSE, now)
+            shard = None
+    if shard is not None:
+        shards += 1
+        files[vacancy_shard_name(shards)] = shard.close(_URLSET_CLOSE, now)
+
+    index = _GzipWriter(_INDEX_OPEN)
+    for name, sitemap_file in files.items():
+        index.write((
+            f"  <sitemap>\n"
+            f"    <loc>{base_url}/sitemaps/{name}</loc>\n"
+            f"    <lastmod>{sitemap_file.last_modified.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%S+00:00')}</lastmod>\n"
+            f"  </sitemap>\n"
+        ).encode("utf-8"))
+    files[INDEX_NAME] = index.close(_INDEX_CLOSE, now)
+
+    return Sitemap(generation=generation, generated_at=now, built_at=time.monotonic(), files=files)
+
+
+async def _active_vacancy_rows(db) -> AsyncIterator[Tuple[int, Optional[datetime]]]:
+    result = await db.stream(
+        select(Vacancy.id, Vacancy.updated_at)
+        .where(Vacancy.is_active == True)
+        .order_by(Vacancy.id)
+        .execution_options(yield_per=_STREAM_BATCH_SIZE)
+    )
+    async for vacancy_id, updated_at in result:
+        yield vacancy_id, updated_at
+
+
+class SitemapStore:
+    """Holds this worker's latest sitemap build and rebuilds it off the request path."""
+
+    def __init__(self, shard_size: int = 50000, max_age_seconds: int = 3600):
+        self._shard_size = shard_size
+        self._max_age_seconds = max_age_seconds
+        self._sitemap: Optional[Sitemap] = None
+        self._build_lock: Optional[asyncio.Lock] = None
+        self._rebuild_task: Optional[asyncio.Task] = None
+        self._rebuild_pending = False
+        self._tasks: Set[asyncio.Task] = set()
+
+    def _lock(self) -> asyncio.Lock:
+        loop = asyncio.get_running_loop()
+        lock_loop = getattr(self._build_lock, "_loop", None) if self._build_lock else None
+        if self._build_lock is None or (lock_loop is not None and lock_loop is not loop):
+            self._build_lock = asyncio.Lock()
+        return self._build_lock
+
+    async def _build(self) -> Sitemap:
+        started = time.perf_counter()
+        generation = await get_dataset_generation()
+        async with AsyncSessionLocal() as db:
+            sitemap = await build_sitemap(
+                _active_vacancy_rows(db),
+                settings.FRONTEND_URL,
+                generation=generation,
+                shard_size=self._shard_size,
+            )
+        self._sitemap = sitemap
+        logger.info(
+            "sitemap_built generation=%s files=%d duration_ms=%d",
+            generation,
+            len(sitemap.files),
+            int((time.perf_counter() - started) * 1000),
+        )
+        return sitemap
+
+    async def rebuild(self) -> Sitemap:
+        """Build the sitemap for the current dataset generation and make it current."""
+        async with self._lock():
+            return await self._build()
+
+    async def get(self, name: str) -> Optional[SitemapFile]:
+        """A sitemap document by name; stale builds are served while a rebuild runs."""
+        sitemap = self._sitemap
+        if sitemap is None:
+            async with self._lock():
+                sitemap = self._sitemap or await self._build()
+        elif (
+            sitemap.generation != await get_dataset_generation()
+            or time.monotonic() - sitemap.built_at > self._max_age_seconds
+        ):
+            self.schedule_rebuild()
+        return sitemap.files.get(name)
+
+    def _track(self, task: asyncio.Task) -> asyncio.Task:
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    def schedule_rebuild(self) -> None:
+        """Rebuild in the background; requests during a rebuild coalesce into one rerun."""
+        if self._rebuild_task is not None and not self._rebuild_task.done():
+            self._rebuild_pending = True
+            return
+
+        async def _run():
+            while True:
+                self._rebuild_pending = False
+                try:
+                    await self.rebuild()
+                except Exception:
+                    logger.exception("Sitemap rebuild failed")
+                if not self._rebuild_pending:
+                    return
+
+        self._rebuild_task = self._track(asyncio.get_running_loop().create_task(_run()))
+
+    async def shutdown(self) -> None:
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks.clear()
+        self._rebuild_task = None
+
+
+_store: Optional[SitemapStore] = None
+
+
+def get_sitemap_store() -> SitemapStore:
+    """Get or create the sitemap store singleton."""
+    global _store
+    if _store is None:
+        _store = SitemapStore(
+            shard_size=settings.SITEMAP_SHARD_SIZE,
+            max_age_seconds=settings.SITEMAP_MAX_AGE_SECONDS,
+        )
+    return _store
+
+
+async def shutdown_sitemap_store() -> None:
+    if _store is not None:
+        await _store.shutdown()
@@ -1,11 +1,13 @@
 from typing import List, Optional, Tuple, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import desc, func, or_, select, asc, String, text, bindparam
+from sqlalchemy import Row, desc, func, or_, select, asc, String, Integer, text, bindparam
+from sqlalchemy.dialects.postgresql import ARRAY
 from fastapi import HTTPException, status
 
-from app.models import Vacancy
+from app.models import Vacancy, VacancyRaw
 from app.core.enums import GradeEnum
-from app.schemas import SortEnum
+from app.core.skills import SKILL_REGISTRY
+from app.schemas import SortEnum, VacancyListItem, VacancyResponse
 
 # Role to vacancy search terms mapping
 ROLE_SEARCH_MAPPING = {
@@ -59,11 +61,38 @@ ROLE_SEARCH_MAPPING = {
     ],
 }
 
+# Columns behind VacancyListItem. Listings select only these, so description
+# and search_vector (and vacancy_raw) are read for the detail endpoint alone.
+VACANCY_LIST_COLUMNS = tuple(getattr(Vacancy, name) for name in VacancyListItem.model_fields)
+
+
 def _escape_ilike_value(raw_value: str) -> str:
     """Escape wildcard symbols used by SQL ILIKE."""
     return raw_value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
 
 
+def _top_skill_ids_query(*filters, limit: int):
+    """Most frequent canonical skill ids among vacancies matching filters."""
+    skill_id = func.unnest(Vacancy.skill_ids).label("skill_id")
+    return (
+        select(skill_id, func.count().label("cnt"))
+        .filter(Vacancy.skill_ids.isnot(None), *filters)
+        .group_by(skill_id)
+        .order_by(desc("cnt"), skill_id)
+        .limit(limit)
+    )
+
+
+def _skill_names(rows) -> List[str]:
+    """Map (skill_id, cnt) rows to lowercased canonical names (the facet values used by ?stack=)."""
+    names = []
+    for row in rows:
+        skill = SKILL_REGISTRY.get(row.skill_id)
+        if skill is not None:
+            names.append(skill.name.lower())
+    return names
+
+
 class VacancyService:
     @staticmethod
     async def get_filters(db: AsyncSession):
@@ -88,21 +117,9 @@ class VacancyService:
         grades_query = result.all()
         grades = sorted([g[0] for g in grades_query if g[0]])
 
-        # Dynamic popular techs from key_skills
-        tech = func.lower(func.trim(func.jsonb_array_elements_text(Vacancy.key_skills))).label("tech")
-        result = await db.execute(
-            select(tech, func.count().label("cnt"))
-            .filter(
-                Vacancy.is_active == True,
-                Vacancy.key_skills.isnot(None),
-                func.jsonb_array_length(Vacancy.key_skills) > 0
-            )
-            .group_by(tech)
-            .order_by(desc("cnt"))
-            .limit(30)
-        )
-        tech_rows = result.all()
-        technologies = [row.tech for row in tech_rows if row.tech]
+        # Dynamic popular techs from canonical skill ids
+        result = await db.execute(_top_skill_ids_query(Vacancy.is_active == True, limit=30))
+        technologies = _skill_names(result.all())
 
         return {
             "locations": locations,
@@ -122,14 +139,15 @@ class VacancyService:
         min_salary: Optional[int] = None,
         company: Optional[str] = None,
         sort: SortEnum = SortEnum.newest
-    ) -> Tuple[List[Vacancy], int]:
+    ) -> Tuple[List[Row], int]:
         """
         Get paginated vacancies with filters and sorting.
+        Rows carry VACANCY_LIST_COLUMNS only (see VacancyListItem).
         """
         skip = (page - 1) * per_page
         
         # Base query: only active vacancies
-        query = select(Vacancy).filter(Vacancy.is_active == True)
+        query = select(*VACANCY_LIST_COLUMNS).filter(Vacancy.is_active == True)
 
         if search:
             # Full Text Search via Postgres
@@ -170,7 +188,16 @@ class VacancyService:
             stacks = [s.strip() for s in stack.split(',') if s.strip()]
             if stacks:
                 stack_conditions = []
-                for i, s in enumerate(stacks):
+                # Registered skills (and their synonyms) match by id via the GIN index
+                skill_ids = SKILL_REGISTRY.ids(stacks)
+                if skill_ids:
+                    stack_conditions.append(
+                        Vacancy.skill_ids.overlap(
+                            bindparam("stack_skill_ids", skill_ids, type_=ARRAY(Integer))
+                        )
+                    )
+                unknown = [s for s in stacks if SKILL_REGISTRY.lookup(s) is None]
+                for i, s in enumerate(unknown):
                     param_name = f"tech_{i}"
                     stack_conditions.append(
                         text(
@@ -201,22 +228,28 @@ class VacancyService:
 
         # Pagination
         result = await db.execute(query.offset(skip).limit(per_page))
-        vacancies = result.scalars().all()
+        vacancies = result.all()
         
         return vacancies, total
 
     @staticmethod
-    async def get_vacancy_by_id(db: AsyncSession, vacancy_id: int) -> Optional[Vacancy]:
+    async def get_vacancy_by_id(db: AsyncSession, vacancy_id: int) -> Optional[VacancyResponse]:
         """
-        Get single vacancy by ID.
+        Get single vacancy by ID, with its source payload from vacancy_raw.
         """
         result = await db.execute(
-            select(Vacancy).filter(
+            select(Vacancy, VacancyRaw.raw_data)
+            .outerjoin(VacancyRaw, VacancyRaw.vacancy_id == Vacancy.id)
+            .filter(
                 Vacancy.id == vacancy_id,
                 Vacancy.is_active == True
             )
         )
-        return result.scalar_one_or_none()
+        row = result.first()
+        if row is None:
+            return None
+        vacancy, raw_data = row
+        return VacancyResponse.model_validate(vacancy).model_copy(update={"raw_data": raw_data})
 
     @staticmethod
     async def get_role_market_stats(
@@ -328,22 +361,11 @@ class VacancyService:
             else 0.0
         )
 
-        # Top 10 skills from key_skills
-        tech = func.lower(func.trim(func.jsonb_array_elements_text(Vacancy.key_skills))).label("tech")
+        # Top 10 skills from canonical skill ids
         tech_result = await db.execute(
-            select(tech, func.count().label("cnt"))
-            .filter(
-                Vacancy.is_active == True,
-                base_filter,
-                Vacancy.key_skills.isnot(None),
-                func.jsonb_array_length(Vacancy.key_skills) > 0
-            )
-            .group_by(tech)
-            .order_by(desc("cnt"))
-            .limit(10)
+            _top_skill_ids_query(Vacancy.is_active == True, base_filter, limit=10)
         )
-        tech_rows = tech_result.all()
-        top_skills = [row.tech for row in tech_rows if row.tech]
+        top_skills = _skill_names(tech_result.all())
 
         return {
             "vacancy_count": vacancy_count,
@@ -1,13 +1,192 @@
 """
 Account security utilities for rate limiting and lockout.
+
+Lockout state lives in Redis: one sorted set of failure timestamps per
+(user id or email) + IP scope, trimmed to the lockout window. A single Lua
+script trims the window, optionally records a failure and returns
+(locked, failed_count, remaining_seconds), so a login needs one round trip
+instead of COUNT / ORDER BY queries over login_attempts.
+
+LoginAttempt rows are still written for auditing, in the background when
+Redis is available. Without Redis (or on Redis errors) the Postgres queries
+below are the source of truth, and rows are written inline so they count.
 """
+import asyncio
+import hashlib
+import logging
+import time
+import uuid
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from typing import Optional, Set
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func
 
+from app.database import AsyncSessionLocal
+from app.infra.redis_client import get_redis
 from app.models import LoginAttempt
 
+logger = logging.getLogger(__name__)
+
+_LOCKOUT_KEY_PREFIX = "lockout:v1:"
+
+# KEYS[1] = sorted set of failure timestamps (ms)
+# ARGV = now_ms, window_ms, threshold, member-to-record ('' = check only)
+# Returns {locked, failed_count, remaining_seconds}
+_LOCKOUT_SCRIPT = """
+local now = tonumber(ARGV[1])
+local window = tonumber(ARGV[2])
+local threshold = tonumber(ARGV[3])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window)
+if ARGV[4] ~= '' then
+    redis.call('ZADD', KEYS[1], now, ARGV[4])
+    redis.call('PEXPIRE', KEYS[1], window)
+end
+local count = redis.call('ZCARD', KEYS[1])
+if count < threshold then
+    return {0, count, 0}
+end
+local oldest = redis.call('ZRANGE', KEYS[1], 0, 0, 'WITHSCORES')
+local remaining = math.floor((tonumber(oldest[2]) + window - now) / 1000)
+if remaining < 0 then
+    remaining = 0
+end
+return {1, count, remaining}
+"""
+
+
+@dataclass(frozen=True)
+class LockoutStatus:
+    locked: bool
+    failed_count: int
+    remaining_seconds: int
+
+
+def _lockout_key(user_id: Optional[int], email: Optional[str], ip: Optional[str]) -> str:
+    """Same scoping as the Postgres queries: user id (else email), narrowed by IP."""
+    subject = f"u:{user_id}" if user_id is not None else f"e:{email}"
+    scope = f"{subject}|ip:{ip or ''}"
+    return _LOCKOUT_KEY_PREFIX + hashlib.sha256(scope.encode("utf-8")).hexdigest()[:32]
+
+
+async def _run_lockout_script(
+    user_id: Optional[int],
+    email: Optional[str],
+    ip: Optional[str],
+    lockout_threshold: int,
+    lockout_window_minutes: int,
+    record_failure: bool,
+) -> Optional[LockoutStatus]:
+    """Run the sliding-window script; None when Redis is unavailable."""
+    redis = get_redis()
+    if redis is None:
+        return None
+    member = f"{time.time_ns()}:{uuid.uuid4().hex[:8]}" if record_failure else ""
+    try:
+        locked, count, remaining = await redis.eval(
+            _LOCKOUT_SCRIPT,
+            1,
+            _lockout_key(user_id, email, ip),
+            int(time.time() * 1000),
+            lockout_window_minutes * 60 * 1000,
+            lockout_threshold,
+            member,
+        )
+    except Exception as exc:
+        logger.warning("login_lockout_error operation=%s error=%s", "record" if record_failure else "check", exc)
+        return None
+    return LockoutStatus(locked=bool(int(locked)), failed_count=int(count), remaining_seconds=int(remaining))
+
+
+async def get_lockout_status(
+    db: AsyncSession,
+    user_id: Optional[int] = None,
+    email: Optional[str] = None,
+    ip: Optional[str] = None,
+    lockout_threshold: int = 5,
+    lockout_window_minutes: int = 15
+) -> LockoutStatus:
+    """
+    Lockout state and remaining time in one call: one Redis script,
+    or the Postgres queries below when Redis is unavailable.
+    """
+    if user_id is None and not email:
+        return LockoutStatus(False, 0, 0)
+
+    status = await _run_lockout_script(
+        user_id, email, ip, lockout_threshold, lockout_window_minutes, record_failure=False
+    )
+    if status is not None:
+        return status
+
+    is_locked, failed_count = await check_account_lockout(
+        db, user_id, email, ip, lockout_threshold, lockout_window_minutes
+    )
+    remaining = 0
+    if is_locked:
+        remaining = await get_lockout_remaining_time(db, user_id, email, ip, lockout_window_minutes)
+    return LockoutStatus(is_locked, failed_count, remaining)
+
+
+_audit_tasks: Set[asyncio.Task] = set()
+
+
+async def _write_login_attempt(values: dict) -> None:
+    try:
+        async with AsyncSessionLocal() as session:
+            session.add(LoginAttempt(**values))
+            await session.commit()
+    except Exception:
+        logger.warning("Failed to write login attempt audit row email=%s", values.get("email"), exc_info=True)
+
+
+async def record_login_attempt(
+    db: AsyncSession,
+    email: str,
+    ip_address: str,
+    user_agent: Optional[str],
+    success: bool,
+    failure_reason: Optional[str] = None,
+    user_id: Optional[int] = None,
+    lockout_ip: Optional[str] = None,
+    lockout_threshold: int = 5,
+    lockout_window_minutes: int = 15,
+) -> None:
+    """
+    Record a login attempt: failures go into the Redis lockout window, and the
+    LoginAttempt audit row is written in the background. Without Redis the row
+    is added to `db` instead (the caller commits), since Postgres then decides
+    lockouts.
+    """
+    values = dict(
+        user_id=user_id,
+        email=email,
+        ip_address=ip_address,
+        user_agent=user_agent,
+        success=success,
+        failure_reason=failure_reason,
+    )
+    recorded = get_redis() is not None
+    if not success:
+        status = await _run_lockout_script(
+            user_id, email, lockout_ip, lockout_threshold, lockout_window_minutes, record_failure=True
+        )
+        recorded = status is not None
+
+    if not recorded:
+        db.add(LoginAttempt(**values))
+        return
+
+    task = asyncio.get_running_loop().create_task(_write_login_attempt(values))
+    _audit_tasks.add(task)
+    task.add_done_callback(_audit_tasks.discard)
+
+
+async def flush_login_audit() -> None:
+    """Wait for pending audit writes (called on shutdown)."""
+    if _audit_tasks:
+        await asyncio.gather(*list(_audit_tasks), return_exceptions=True)
+
 
 async def check_account_lockout(
     db: AsyncSession,
@@ -19,6 +198,7 @@ async def check_account_lockout(
 ) -> tuple[bool, int]:
     """
     Check if account should be locked out due to too many failed login attempts.
+    Postgres implementation; get_lockout_status() prefers the Redis window.
     
     Args:
         db: Database session
@@ -67,6 +247,7 @@ async def get_lockout_remaining_time(
 ) -> int:
     """
     Get remaining lockout time in seconds.
+    Postgres implementation; get_lockout_status() prefers the Redis window.
     
     Args:
         db: Database session
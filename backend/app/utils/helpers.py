@@ -1,5 +1,12 @@
+import html
+import re
 from typing import Optional
 
+SNIPPET_LENGTH = 200
+
+_TAG_RE = re.compile(r"<[^>]+>")
+_SPACE_RE = re.compile(r"\s+")
+
 
 def determine_grade(title_raw: str, experience_id: str) -> Optional[str]:
     """
@@ -83,3 +90,24 @@ def determine_grade(title_raw: str, experience_id: str) -> Optional[str]:
         grade = "Junior"
 
     return grade
+
+
+def make_snippet(description: Optional[str], hh_snippet: Optional[dict] = None, limit: int = SNIPPET_LENGTH) -> Optional[str]:
+    """
+    Plain-text teaser for vacancy cards, cut at a word boundary.
+
+    Built from the HTML description, or from HH's search snippet
+    (responsibility, requirement) when there is no description.
+    """
+    text = description or ""
+    if not text.strip() and hh_snippet:
+        text = " ".join(filter(None, (hh_snippet.get("responsibility"), hh_snippet.get("requirement"))))
+    text = _SPACE_RE.sub(" ", html.unescape(_TAG_RE.sub(" ", text))).strip()
+    if not text:
+        return None
+    if len(text) <= limit:
+        return text
+    cut = text[:limit]
+    if text[limit] != " " and " " in cut:
+        cut = cut.rsplit(" ", 1)[0]
+    return cut.rstrip(" ,.;:-") + "…"
@@ -0,0 +1,59 @@
+"""
+Minimal HyperLogLog sketch for approximate distinct counts.
+
+Used by the analytics daily rollups: each day stores one sketch of its
+session ids, and sketches of several days merge into the distinct-session
+estimate for the whole period (~2% standard error at the default
+precision; 2 KiB per sketch).
+"""
+import hashlib
+import math
+from typing import Iterable, Optional
+
+DEFAULT_PRECISION = 11
+
+
+class HyperLogLog:
+    """Mergeable distinct-count sketch with one byte per register."""
+
+    def __init__(self, precision: int = DEFAULT_PRECISION, registers: Optional[bytes] = None):
+        if not 4 <= precision <= 16:
+            raise ValueError("precision must be between 4 and 16")
+        self.precision = precision
+        self._m = 1 << precision
+        if registers is not None and len(registers) != self._m:
+            raise ValueError("register count does not match precision")
+        self._registers = bytearray(registers or bytes(self._m))
+
+    def add(self, value: str) -> None:
+        h = int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
+        bits = 64 - self.precision
+        index = h >> bits
+        rank = bits - (h & ((1 << bits) - 1)).bit_length() + 1
+        if rank > self._registers[index]:
+            self._registers[index] = rank
+
+    def update(self, values: Iterable[str]) -> None:
+        for value in values:
+            self.add(value)
+
+    def merge(self, other: "HyperLogLog") -> None:
+        if other.precision != self.precision:
+            raise ValueError("cannot merge sketches of different precision")
+        self._registers = bytearray(max(a, b) for a, b in zip(self._registers, other._registers))
+
+    def count(self) -> int:
+        m = self._m
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0 ** -r for r in self._registers)
+        zeros = self._registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            estimate = m * math.log(m / zeros)  # linear counting for small cardinalities
+        return int(round(estimate))
+
+    def to_bytes(self) -> bytes:
+        return bytes(self._registers)
+
+    @classmethod
+    def from_bytes(cls, registers: bytes) -> "HyperLogLog":
+        return cls(precision=int(math.log2(len(registers))), registers=registers)
@@ -0,0 +1,156 @@
+"""
+Per-page benchmark of the vacancy list projection against full rows.
+
+Compares, for listing pages (newest first):
+
+- full: select(Vacancy) hydrated into ORM objects and encoded as VacancyResponse
+  (description, raw_data and search_vector included)
+- list: select(*VACANCY_LIST_COLUMNS) rows encoded as VacancyListItem
+
+and reports mean/p95 latency per page (query + hydration + encoding), the
+encoded payload size and, against a database, the average size of the
+selected row (pg_column_size of the whole row, TOASTed values included).
+
+Without a reachable database, --synthetic builds rows of typical HH size
+(an 8k-character HTML description, repeated inside raw_data) and measures hydration and
+encoding only.
+
+Usage:
+    python scripts/benchmark_list_projection.py --pages 20
+    python scripts/benchmark_list_projection.py --synthetic --per-page 100 --json
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from sqlalchemy import desc, func, select
+
+from app.infra.cache import encode_json
+from app.schemas import VacancyListItem, VacancyResponse
+
+
+def _stats(samples):
+    samples = sorted(samples)
+    return {
+        "mean_ms": round(sum(samples) / len(samples) * 1e3, 3),
+        "p95_ms": round(samples[max(0, int(len(samples) * 0.95) - 1)] * 1e3, 3),
+    }
+
+
+def _encode(schema, rows):
+    return encode_json([schema.model_validate(row).model_dump(mode="json") for row in rows])
+
+
+def _synthetic_rows(count):
+    description = "<p>" + "Разработка и поддержка сервисов на Python, ревью кода, менторство. " * 120 + "</p>"
+    raw_data = {
+        "description": description,
+        "branded_description": description,
+        "snippet": {"requirement": "Опыт коммерческой разработки от 3 лет", "responsibility": "Разработка сервисов"},
+        "professional_roles": [{"id": "96", "name": "Программист, разработчик"}],
+        "key_skills": [{"name": f"skill-{index}"} for index in range(15)],
+        "employer": {"id": "9", "name": "Kaspi.kz", "logo_urls": {"90": "https://img.hhcdn.ru/90.png"}},
+        "address": {"city": "Алматы", "street": "Наурызбай батыра", "metro_stations": []},
+    }
+    return [
+        SimpleNamespace(
+            id=vacancy_id, title=f"Python developer {vacancy_id}", company_id=vacancy_id % 50,
+            company_name="Kaspi.kz", company_logo="https://img.hhcdn.ru/240.png",
+            salary_from=500000, salary_to=900000, salary_in_kzt=500000, currency="KZT",
+            location="Алматы", grade="Middle", published_at=datetime(2026, 10, 1, tzinfo=timezone.utc),
+            description=description, key_skills=["Python", "PostgreSQL", "Docker"],
+            url=f"https://hh.kz/vacancy/{vacancy_id}", raw_data=raw_data,
+            snippet="Разработка и поддержка сервисов на Python, ревью кода, менторство…",
+        )
+        for vacancy_id in range(1, count + 1)
+    ]
+
+
+def _run_synthetic(pages, per_page):
+    rows = _synthetic_rows(per_page)
+    report = {}
+    for name, schema in (("full", VacancyResponse), ("list", VacancyListItem)):
+        timings, size = [], 0
+        for _ in range(pages):
+            started = time.perf_counter()
+            size = len(_encode(schema, rows))
+            timings.append(time.perf_counter() - started)
+        report[name] = {**_stats(timings), "payload_bytes": size}
+    return report
+
+
+async def _run_database(pages, per_page):
+    from app.database import AsyncSessionLocal
+    from app.models import Vacancy
+    from app.services.vacancy_service import VACANCY_LIST_COLUMNS
+
+    def page_query(stmt, page):
+        return (
+            stmt.filter(Vacancy.is_active == True)
+            .order_by(desc(Vacancy.published_at), desc(Vacancy.salary_in_kzt))
+            .offset(page * per_page)
+            .limit(per_page)
+        )
+
+    cases = (
+        ("full", select(Vacancy), lambda result: result.scalars().all(), VacancyResponse),
+        ("list", select(*VACANCY_LIST_COLUMNS), lambda result: result.all(), VacancyListItem),
+    )
+    report = {}
+    async with AsyncSessionLocal() as db:
+        for name, stmt, fetch, schema in cases:
+            timings, sizes = [], []
+            for page in range(pages):
+                started = time.perf_counter()
+                rows = fetch(await db.execute(page_query(stmt, page)))
+                sizes.append(len(_encode(schema, rows)))
+                timings.append(time.perf_counter() - started)
+                db.expunge_all()
+            sample = page_query(stmt, 0).subquery()
+            row_bytes = await db.scalar(select(func.avg(func.pg_column_size(sample.table_valued()))))
+            report[name] = {
+                **_stats(timings),
+                "payload_bytes": round(sum(sizes) / len(sizes)),
+                "row_bytes": round(float(row_bytes or 0)),
+            }
+    return report
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Vacancy list projection benchmark")
+    parser.add_argument("--pages", type=int, default=20, help="Pages to fetch per case (default: 20)")
+    parser.add_argument("--per-page", type=int, default=20, help="Vacancies per page (default: 20)")
+    parser.add_argument("--synthetic", action="store_true", help="Use in-memory rows instead of the database")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    if args.synthetic:
+        report = _run_synthetic(args.pages, args.per_page)
+    else:
+        report = asyncio.run(_run_database(args.pages, args.per_page))
+    report = {"pages": args.pages, "per_page": args.per_page, "synthetic": args.synthetic, **report}
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    source = "synthetic rows" if args.synthetic else "database"
+    print(f"{args.pages} pages x {args.per_page} vacancies ({source}):")
+    for name in ("full", "list"):
+        stats = report[name]
+        row_bytes = f"  row {stats['row_bytes']:>8,} B" if "row_bytes" in stats else ""
+        print(
+            f"  {name:<5} mean {stats['mean_ms']:>8} ms  p95 {stats['p95_ms']:>8} ms"
+            f"  payload {stats['payload_bytes']:>10,} B{row_bytes}"
+        )
+
+
+if __name__ == "__main__":
+    main()
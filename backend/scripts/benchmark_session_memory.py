@@ -0,0 +1,149 @@
+"""
+Memory benchmark for interview session storage.
+
+Fills the session cap with fully answered sessions and compares the legacy
+representation (SessionModel with resolved weights per response, stored in
+Redis as model_dump_json) against the compact one (answer index bytes plus
+metadata):
+
+- Redis payload: bytes per session for the JSON dump vs the compact hash.
+- Process memory: tracemalloc of legacy SessionModels vs UserResponseStore.
+
+Usage:
+    python scripts/benchmark_session_memory.py
+    python scripts/benchmark_session_memory.py --sessions 2000 --json
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tracemalloc
+from datetime import datetime, timedelta
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.interview.models.user_response import SessionModel, UserResponse
+from app.interview.storage.question_bank_manager import QuestionBankManager
+from app.interview.storage.session_codec import SessionCodec
+from app.interview.storage.user_response_store import UserResponseStore
+
+
+def _random_answers(questions, rng):
+    order = list(questions)
+    rng.shuffle(order)
+    return [(q.id, rng.choice(q.answer_options).id) for q in order]
+
+
+def _legacy_session(session_id, answers, question_bank, version):
+    now = datetime.now()
+    responses = []
+    for question_id, option_id in answers:
+        option = next(
+            o for o in question_bank.get_question(question_id).answer_options if o.id == option_id
+        )
+        responses.append(UserResponse(
+            session_id=session_id,
+            question_id=question_id,
+            answer_option_id=option_id,
+            resolved_signals=option.signal_associations.copy(),
+            resolved_weights=option.role_weights.copy(),
+            resolved_stage_weights=option.stage_weights.copy(),
+            timestamp=now,
+        ))
+    return SessionModel(
+        session_id=session_id,
+        responses=responses,
+        locked_question_bank_version=version,
+        created_at=now,
+        expires_at=now + timedelta(minutes=30),
+    )
+
+
+def _compact_hash_bytes(codec, answers, version):
+    now = datetime.now()
+    fields = {
+        "_status": "in_progress",
+        "_version": version,
+        "_created_at": now.isoformat(),
+        "_expires_at": (now + timedelta(minutes=30)).isoformat(),
+        "_answers": codec.encode(answers).decode("ascii"),
+    }
+    return sum(len(name) + len(value.encode("utf-8")) for name, value in fields.items())
+
+
+def _measure(build):
+    tracemalloc.start()
+    baseline = tracemalloc.take_snapshot()
+    keep = build()
+    total = sum(stat.size_diff for stat in tracemalloc.take_snapshot().compare_to(baseline, "filename"))
+    tracemalloc.stop()
+    return keep, total
+
+
+async def _fill_store(store, sessions_answers):
+    for answers in sessions_answers:
+        session_id = (await store.create_session()).session_id
+        for question_id, option_id in answers:
+            await store.store_response(session_id, question_id, option_id)
+    return store
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Interview session memory benchmark")
+    parser.add_argument("--sessions", type=int, default=2000, help="Sessions to hold (default: the 2,000 cap)")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    question_bank = QuestionBankManager()
+    version = question_bank.get_version()
+    codec = SessionCodec(question_bank)
+    rng = random.Random(args.seed)
+    questions = question_bank.get_all_questions()
+    sessions_answers = [_random_answers(questions, rng) for _ in range(args.sessions)]
+
+    legacy, legacy_heap = _measure(lambda: [
+        _legacy_session(f"session_{idx}", answers, question_bank, version)
+        for idx, answers in enumerate(sessions_answers)
+    ])
+    legacy_redis = sum(len(session.model_dump_json()) for session in legacy)
+    compact_redis = sum(_compact_hash_bytes(codec, answers, version) for answers in sessions_answers)
+    del legacy
+
+    store = UserResponseStore(question_bank, max_active_sessions=args.sessions)
+    _, compact_heap = _measure(lambda: asyncio.run(_fill_store(store, sessions_answers)))
+
+    report = {
+        "sessions": args.sessions,
+        "questions": len(questions),
+        "redis_bytes": {
+            "legacy_json": legacy_redis,
+            "compact_hash": compact_redis,
+            "per_session_legacy": legacy_redis // max(1, args.sessions),
+            "per_session_compact": compact_redis // max(1, args.sessions),
+        },
+        "process_bytes": {
+            "legacy_models": legacy_heap,
+            "compact_store": compact_heap,
+            "per_session_legacy": legacy_heap // max(1, args.sessions),
+            "per_session_compact": compact_heap // max(1, args.sessions),
+        },
+    }
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"{args.sessions:,} fully answered sessions, {len(questions)} questions each")
+    for label, section in (("Redis payload", report["redis_bytes"]), ("Process memory", report["process_bytes"])):
+        legacy_total, compact_total = list(section.values())[:2]
+        print(f"{label}:")
+        print(f"  legacy   {legacy_total / 1024:10.1f} KiB  ({section['per_session_legacy']:,} B/session)")
+        print(f"  compact  {compact_total / 1024:10.1f} KiB  ({section['per_session_compact']:,} B/session)")
+        print(f"  ratio    {legacy_total / max(1, compact_total):10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
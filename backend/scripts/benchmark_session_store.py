@@ -0,0 +1,89 @@
+"""
+Throughput benchmark for the in-memory interview session store.
+
+Opens N concurrent sessions, answers every question round-robin across all
+of them (so every write happens with N live sessions) and completes them,
+reporting per-operation latency. Admission and expiry bookkeeping should
+stay flat as N grows.
+
+Usage:
+    python scripts/benchmark_session_store.py
+    python scripts/benchmark_session_store.py --sessions 10000 --json
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.interview.storage.question_bank_manager import QuestionBankManager
+from app.interview.storage.user_response_store import UserResponseStore
+
+
+def _stats(samples):
+    samples = sorted(samples)
+    if not samples:
+        return {"ops": 0, "mean_us": 0.0, "p99_us": 0.0}
+    return {
+        "ops": len(samples),
+        "mean_us": round(sum(samples) / len(samples) * 1e6, 2),
+        "p99_us": round(samples[int(len(samples) * 0.99) - 1] * 1e6, 2),
+    }
+
+
+async def _run(store, questions, sessions, rng):
+    timings = {"create": [], "answer": [], "complete": []}
+    clock = time.perf_counter
+
+    session_ids = []
+    for _ in range(sessions):
+        started = clock()
+        session_ids.append((await store.create_session()).session_id)
+        timings["create"].append(clock() - started)
+
+    for question in questions:
+        for session_id in session_ids:
+            option_id = rng.choice(question.answer_options).id
+            started = clock()
+            await store.store_response(session_id, question.id, option_id)
+            timings["answer"].append(clock() - started)
+
+    for session_id in session_ids:
+        started = clock()
+        await store.complete_session(session_id)
+        timings["complete"].append(clock() - started)
+
+    return {name: _stats(samples) for name, samples in timings.items()}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="In-memory session store benchmark")
+    parser.add_argument("--sessions", type=int, default=10000, help="Concurrent sessions (default: 10k)")
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    question_bank = QuestionBankManager()
+    store = UserResponseStore(question_bank, max_active_sessions=args.sessions)
+    questions = question_bank.get_all_questions()
+
+    started = time.perf_counter()
+    report = asyncio.run(_run(store, questions, args.sessions, random.Random(args.seed)))
+    report = {"sessions": args.sessions, "elapsed_s": round(time.perf_counter() - started, 2), **report}
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+        return
+
+    print(f"{args.sessions:,} concurrent sessions, {len(questions)} questions, {report['elapsed_s']} s total")
+    for name in ("create", "answer", "complete"):
+        stats = report[name]
+        print(f"  {name:<9} {stats['ops']:>9,} ops  mean {stats['mean_us']:>8} us  p99 {stats['p99_us']:>8} us")
+
+
+if __name__ == "__main__":
+    main()
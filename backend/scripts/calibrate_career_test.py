@@ -0,0 +1,114 @@
+"""
+Monte-Carlo calibration harness for the career test.
+
+Scores large synthetic (random and persona-based) or recorded answer
+populations with the vectorized batch scorer and reports role-win and
+stage distributions, ties and close calls. Use it before and after
+editing weights in questions_data.json.
+
+Usage:
+    python scripts/calibrate_career_test.py --sessions 200000
+    python scripts/calibrate_career_test.py --population persona --fidelity 0.6
+    python scripts/calibrate_career_test.py --recorded answers.jsonl --json
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+import numpy as np
+
+from app.interview.aggregation.batch_scoring import BatchScorer, BatchScoreResult
+
+CLOSE_THRESHOLD = 0.1  # LLMInterpreter score_threshold: top roles reported as alternatives
+
+
+def _summarize(label: str, result: BatchScoreResult, elapsed: float, target_role: str = None) -> dict:
+    summary = {
+        "population": label,
+        "sessions": result.size,
+        "sessions_per_second": int(result.size / elapsed) if elapsed > 0 else None,
+        "role_wins": result.role_distribution(),
+        "stage_wins": result.stage_distribution(),
+        "tie_rate": float(result.tied.mean()) if result.size else 0.0,
+        "close_call_rate": float((result.top_gap < CLOSE_THRESHOLD).mean()) if result.size else 0.0,
+    }
+    if target_role is not None:
+        summary["target_role"] = target_role
+        summary["target_recall"] = summary["role_wins"].get(target_role, 0.0)
+    return summary
+
+
+def _print_summary(summary: dict) -> None:
+    print(f"\n=== {summary['population']} ({summary['sessions']:,} sessions, "
+          f"{summary['sessions_per_second'] or 0:,} sessions/s) ===")
+    if "target_role" in summary:
+        print(f"Target role recall: {summary['target_recall']:.1%}")
+    print("Role wins:")
+    for role_id, share in sorted(summary["role_wins"].items(), key=lambda x: -x[1]):
+        print(f"  {role_id:<22} {share:7.2%}")
+    print("Stage wins:")
+    for stage_id, share in sorted(summary["stage_wins"].items(), key=lambda x: -x[1]):
+        print(f"  {stage_id:<22} {share:7.2%}")
+    print(f"Exact ties (top-2): {summary['tie_rate']:.2%}")
+    print(f"Close calls (gap < {CLOSE_THRESHOLD}): {summary['close_call_rate']:.2%}")
+
+
+def _load_recorded(scorer: BatchScorer, path: str) -> np.ndarray:
+    with open(path, "r", encoding="utf-8") as f:
+        answer_maps = [json.loads(line) for line in f if line.strip()]
+    return scorer.rows_from_answer_maps(answer_maps)
+
+
+def _timed(scorer: BatchScorer, rows: np.ndarray):
+    started = time.perf_counter()
+    result = scorer.score_rows(rows)
+    return result, time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Career test weight calibration")
+    parser.add_argument("--sessions", type=int, default=100_000, help="Sessions per synthetic population")
+    parser.add_argument("--population", choices=["random", "persona", "all"], default="all")
+    parser.add_argument("--fidelity", type=float, default=0.7, help="Persona probability of picking its best option")
+    parser.add_argument("--recorded", help="JSONL file with one {question_id: option_id} object per session")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    scorer = BatchScorer()
+    rng = np.random.default_rng(args.seed)
+    summaries = []
+
+    if args.recorded:
+        result, elapsed = _timed(scorer, _load_recorded(scorer, args.recorded))
+        summaries.append(_summarize(f"recorded:{os.path.basename(args.recorded)}", result, elapsed))
+    else:
+        if args.population in ("random", "all"):
+            rows = scorer.model.local_to_rows(scorer.random_answers(args.sessions, rng))
+            result, elapsed = _timed(scorer, rows)
+            summaries.append(_summarize("random", result, elapsed))
+
+        if args.population in ("persona", "all"):
+            for role_id in scorer.model.role_ids:
+                answers = scorer.persona_answers(role_id, args.sessions, rng, fidelity=args.fidelity)
+                result, elapsed = _timed(scorer, scorer.model.local_to_rows(answers))
+                summaries.append(
+                    _summarize(f"persona:{role_id}", result, elapsed, target_role=role_id)
+                )
+
+    if args.json:
+        print(json.dumps({"question_bank_version": scorer.model.version, "populations": summaries},
+                         ensure_ascii=False, indent=2))
+        return
+
+    print(f"Question bank version: {scorer.model.version}")
+    for summary in summaries:
+        _print_summary(summary)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+import logging
+import os
+import sys
+from datetime import datetime, timezone
+
+sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from app.config import settings
+from app.database import SessionLocal
+from app.services.analytics_rollups import drop_expired_partitions, ensure_partitions, refresh_rollups
+
+logger = logging.getLogger("AnalyticsMaintenance")
+
+
+def maintain_analytics(retention_months: int = 6, months_ahead: int = 2) -> dict:
+    """Create upcoming analytics partitions, drop expired ones and refresh the daily rollups."""
+    today = datetime.now(timezone.utc).date()
+
+    db = SessionLocal()
+    try:
+        ensure_partitions(db, today, months_ahead=months_ahead)
+        dropped = drop_expired_partitions(db, today, retention_months)
+        rolled_days = refresh_rollups(db, today)
+
+        db.commit()
+        logger.info(
+            "Analytics maintenance complete: partitions_dropped=%s days_rolled_up=%s retention_months=%s",
+            dropped,
+            len(rolled_days),
+            retention_months,
+        )
+        return {
+            "partitions_dropped": dropped,
+            "days_rolled_up": len(rolled_days),
+            "retention_months": retention_months,
+        }
+    except Exception:
+        db.rollback()
+        logger.exception("Analytics maintenance failed")
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    maintain_analytics(retention_months=settings.ANALYTICS_RETENTION_MONTHS)
@@ -11,8 +11,10 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from apscheduler.schedulers.blocking import BlockingScheduler
 from apscheduler.triggers.interval import IntervalTrigger
 from apscheduler.triggers.cron import CronTrigger
+from app.config import settings
 from scripts.run_pipeline import execute_full_cycle
 from scripts.cleanup_auth_artifacts import cleanup_auth_artifacts
+from scripts.maintain_analytics import maintain_analytics
 import httpx
 
 # Ensure logs directory exists
@@ -94,6 +96,19 @@ def job_cleanup_auth_artifacts():
     except Exception as e:
         logger.error(f"[ERROR] AUTH ARTIFACT CLEANUP FAILED: {e}", exc_info=True)
 
+def job_maintain_analytics():
+    """Analytics partitions (create ahead / drop expired) and daily rollups."""
+    logger.info(">>> STARTING ANALYTICS MAINTENANCE <<<")
+    try:
+        result = maintain_analytics(retention_months=settings.ANALYTICS_RETENTION_MONTHS)
+        logger.info(
+            "[SUCCESS] ANALYTICS MAINTENANCE FINISHED: partitions_dropped=%s days_rolled_up=%s",
+            result["partitions_dropped"],
+            result["days_rolled_up"],
+        )
+    except Exception as e:
+        logger.error(f"[ERROR] ANALYTICS MAINTENANCE FAILED: {e}", exc_info=True)
+
 def heartbeat():
     """Logs 'Alive' status."""
     next_run = datetime.now() + timedelta(minutes=15)
@@ -113,6 +128,8 @@ if __name__ == "__main__":
     scheduler.add_job(job_daily_deep, CronTrigger(hour=3, minute=0, jitter=300))
     # 4. Daily auth artifact cleanup at 04:00 AM
     scheduler.add_job(job_cleanup_auth_artifacts, CronTrigger(hour=4, minute=0, jitter=180))
+    # 5. Hourly analytics rollups and partition maintenance
+    scheduler.add_job(job_maintain_analytics, IntervalTrigger(hours=1, jitter=60))
 
     logger.info("Scheduler initialized. Jobs configured.")
     
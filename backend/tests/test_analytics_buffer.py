@@ -0,0 +1,69 @@
+import asyncio
+
+from app.infra.analytics_buffer import AnalyticsBuffer
+
+
+def _rows(n):
+    return [{"event_name": f"e{i}"} for i in range(n)]
+
+
+def test_flushes_in_batches_when_batch_size_is_reached():
+    batches = []
+
+    async def writer(rows):
+        batches.append(len(rows))
+
+    async def run():
+        buffer = AnalyticsBuffer(max_events=100, batch_size=3, flush_interval_ms=60000, writer=writer)
+        assert buffer.submit(_rows(7)) == 7
+        await asyncio.sleep(0.01)
+        assert batches == [3, 3, 1]
+        await buffer.shutdown()
+        return buffer.get_stats()
+
+    stats = asyncio.run(run())
+    assert stats["written"] == 7
+    assert stats["buffered"] == 0
+
+
+def test_drops_events_beyond_capacity_and_flushes_on_shutdown():
+    written = []
+
+    async def writer(rows):
+        written.extend(rows)
+
+    async def run():
+        buffer = AnalyticsBuffer(max_events=5, batch_size=100, flush_interval_ms=60000, writer=writer)
+        assert buffer.submit(_rows(4)) == 4
+        assert buffer.submit(_rows(4)) == 1
+        assert written == []  # neither batch size nor interval reached yet
+        await buffer.shutdown()
+        return buffer.get_stats()
+
+    stats = asyncio.run(run())
+    assert len(written) == 5
+    assert stats["dropped"] == 3
+    assert stats["accepted"] == 5
+
+
+def test_failed_batches_are_counted_and_flusher_keeps_running():
+    calls = []
+
+    async def writer(rows):
+        calls.append(len(rows))
+        if len(calls) == 1:
+            raise RuntimeError("db down")
+
+    async def run():
+        buffer = AnalyticsBuffer(max_events=100, batch_size=100, flush_interval_ms=10, writer=writer)
+        buffer.submit(_rows(2))
+        await asyncio.sleep(0.05)
+        buffer.submit(_rows(3))
+        await asyncio.sleep(0.05)
+        await buffer.shutdown()
+        return buffer.get_stats()
+
+    stats = asyncio.run(run())
+    assert calls == [2, 3]
+    assert stats["failed"] == 2
+    assert stats["written"] == 3
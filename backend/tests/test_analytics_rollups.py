@@ -0,0 +1,40 @@
+from datetime import date
+
+from app.services.analytics_rollups import (
+    create_partition_sql,
+    expired_partitions,
+    month_range,
+    partition_month,
+    partition_name,
+)
+from app.utils.hyperloglog import HyperLogLog
+
+
+def test_month_range_crosses_year_boundary():
+    months = list(month_range(date(2026, 11, 17), date(2027, 1, 1)))
+    assert months == [date(2026, 11, 1), date(2026, 12, 1), date(2027, 1, 1)]
+    assert [partition_name(m) for m in months][-1] == "analytics_events_p202701"
+
+
+def test_partition_bounds_are_utc_months():
+    sql = create_partition_sql(date(2026, 12, 1))
+    assert "analytics_events_p202612 PARTITION OF analytics_events" in sql
+    assert "FROM ('2026-12-01 00:00:00+00') TO ('2027-01-01 00:00:00+00')" in sql
+
+
+def test_expired_partitions_keep_retention_window_and_ignore_other_tables():
+    names = ["analytics_events_p202603", "analytics_events_p202604", "analytics_events_p202610", "analytics_events_old"]
+    # Oct 2026 with 6 months retention keeps April onwards.
+    assert expired_partitions(names, date(2026, 10, 19), 6) == ["analytics_events_p202603"]
+    assert partition_month("analytics_events_old") is None
+
+
+def test_hyperloglog_estimates_and_merges_daily_sketches():
+    monday, tuesday = HyperLogLog(), HyperLogLog()
+    monday.update(f"session-{i}" for i in range(0, 6000))
+    tuesday.update(f"session-{i}" for i in range(3000, 9000))  # half overlap with Monday
+
+    merged = HyperLogLog.from_bytes(monday.to_bytes())
+    merged.merge(tuesday)
+    assert abs(merged.count() - 9000) / 9000 < 0.05
+    assert HyperLogLog().count() == 0
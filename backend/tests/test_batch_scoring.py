@@ -0,0 +1,51 @@
+import asyncio
+
+import numpy as np
+
+from app.interview.aggregation.aggregation_engine import AggregationEngine
+from app.interview.aggregation.batch_scoring import BatchScorer
+from app.interview.aggregation.stage_aggregation_engine import StageAggregationEngine
+from app.interview.storage.question_bank_manager import QuestionBankManager
+from app.interview.storage.role_catalog_manager import RoleCatalogManager
+from app.interview.storage.stage_manager import StageManager
+from app.interview.storage.user_response_store import UserResponseStore
+
+
+def test_batch_winners_match_single_session_engine():
+    question_bank = QuestionBankManager()
+    role_catalog = RoleCatalogManager()
+    scorer = BatchScorer(question_bank, role_catalog, chunk_size=64)
+    store = UserResponseStore(question_bank, max_active_sessions=1000)
+    engine = AggregationEngine(store)
+    stage_engine = StageAggregationEngine(StageManager(), role_catalog)
+
+    rng = np.random.default_rng(7)
+    answers = np.concatenate([
+        scorer.random_answers(200, rng),
+        scorer.persona_answers("backend_developer", 50, rng, fidelity=0.5),
+    ])
+    batch = scorer.score_answers(answers)
+    questions = question_bank.get_all_questions()
+
+    async def _score_single(row):
+        session_id = (await store.create_session()).session_id
+        for question, option_idx in zip(questions, row):
+            await store.store_response(session_id, question.id, question.answer_options[option_idx].id)
+        return await engine.compute_scores(session_id)
+
+    for idx, row in enumerate(answers):
+        single = asyncio.run(_score_single(row))
+        stage = stage_engine.compute_stage_scores(single.ranked_roles, single.stage_affinity)
+
+        assert batch.role_ids[batch.winning_role[idx]] == single.ranked_roles[0][0]
+        assert batch.stage_ids[batch.winning_stage[idx]] == stage.recommendation.primary_stage_id
+        expected = dict(single.ranked_roles)
+        assert batch.normalized[idx].tolist() == [expected[r] for r in batch.role_ids]
+
+
+def test_distributions_sum_to_one():
+    scorer = BatchScorer()
+    result = scorer.score_answers(scorer.random_answers(1000, np.random.default_rng(0)))
+
+    assert abs(sum(result.role_distribution().values()) - 1.0) < 1e-9
+    assert abs(sum(result.stage_distribution().values()) - 1.0) < 1e-9
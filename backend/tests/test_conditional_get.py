@@ -0,0 +1,59 @@
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+from fastapi_cache import FastAPICache
+from fastapi_cache.backends.inmemory import InMemoryBackend
+from fastapi_cache.decorator import cache
+
+from app.infra import http_cache
+from app.infra.http_cache import dataset_validated
+
+
+def _app(monkeypatch, generation):
+    calls = []
+
+    async def read_generation():
+        return generation["value"]
+
+    monkeypatch.setattr(http_cache, "read_dataset_generation", read_generation)
+    FastAPICache.init(InMemoryBackend(), prefix="test-conditional")
+    app = FastAPI()
+
+    @app.get("/api/filters")
+    @dataset_validated
+    @cache(expire=60)
+    async def filters(request: Request, page: int = 1):
+        calls.append(page)
+        return {"page": page}
+
+    return TestClient(app), calls
+
+
+def test_matching_etag_short_circuits_before_cache_and_handler(monkeypatch):
+    generation = {"value": 3}
+    client, calls = _app(monkeypatch, generation)
+
+    first = client.get("/api/filters?page=2")
+    etag = first.headers["etag"]
+    assert first.status_code == 200
+    assert etag.startswith('W/"g3-')
+    assert first.headers["cache-control"].startswith("public, max-age=")
+
+    repeat = client.get("/api/filters?page=2", headers={"If-None-Match": etag})
+    assert repeat.status_code == 304
+    assert repeat.headers["etag"] == etag
+    assert calls == [2]
+
+    # Another query, or a new dataset generation, gets a different validator.
+    assert client.get("/api/filters?page=3", headers={"If-None-Match": etag}).status_code == 200
+    generation["value"] = 4
+    refreshed = client.get("/api/filters?page=2", headers={"If-None-Match": etag})
+    assert refreshed.status_code == 200
+    assert refreshed.headers["etag"] != etag
+
+
+def test_no_validators_without_redis(monkeypatch):
+    client, _ = _app(monkeypatch, {"value": None})
+
+    response = client.get("/api/filters", headers={"If-None-Match": "*"})
+    assert response.status_code == 200
+    assert not response.headers.get("etag", "").startswith('W/"g')
@@ -0,0 +1,108 @@
+import json
+import os
+
+from app.config import settings
+from app.interview import catalog as catalog_module
+from app.interview.catalog import get_interview_catalog, reload_interview_catalog
+from app.interview.interpretation.interpretation_cache import (
+    InterpretationCache,
+    build_profile_fingerprint,
+)
+from app.interview.interpretation.llm_interpreter import InterpretationResult
+from app.interview.orchestrator import ITCareerTestOrchestrator
+
+
+def _result(**overrides):
+    payload = dict(
+        primary_recommendation="backend_developer",
+        explanation="Почему тебе подходит роль: ...",
+        signal_analysis="",
+        alternative_roles=[],
+        differentiation_criteria="",
+        why_this_role_reasons=["a", "b", "c"],
+    )
+    payload.update(overrides)
+    return InterpretationResult(**payload)
+
+
+def test_fingerprint_quantizes_scores_and_ignores_signal_order():
+    roles_a = [("backend_developer", 0.812), ("devops_engineer", 0.601)]
+    roles_b = [("backend_developer", 0.809), ("devops_engineer", 0.598)]
+    signals_a = {"analytical_thinking": 4, "systematic_approach": 2}
+    signals_b = {"systematic_approach": 2, "analytical_thinking": 4}
+
+    fp_a = build_profile_fingerprint(roles_a, signals_a, score_step=0.05, close_threshold=0.1)
+    fp_b = build_profile_fingerprint(roles_b, signals_b, score_step=0.05, close_threshold=0.1)
+    assert fp_a == fp_b
+
+    roles_c = [("devops_engineer", 0.812), ("backend_developer", 0.601)]
+    fp_c = build_profile_fingerprint(roles_c, signals_a, score_step=0.05, close_threshold=0.1)
+    assert fp_c != fp_a
+
+
+def test_cache_hit_counts_and_skips_fallback_results():
+    cache = InterpretationCache(version="test:v1", redis_url=None, local_max_entries=2)
+    key = cache.build_key([("backend_developer", 0.8)], {"analytical_thinking": 3}, "c1")
+
+    assert cache.get(key) is None
+    cache.set(key, _result())
+    assert cache.get(key) == _result()
+
+    other_key = cache.build_key([("qa_engineer", 0.7)], {"detail_orientation": 3}, "c1")
+    cache.set(other_key, _result(is_fallback=True))
+    assert cache.get(other_key) is None
+
+    stats = cache.get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 2
+    assert stats["stores"] == 1
+    assert stats["hit_ratio"] == round(1 / 3, 4)
+
+
+def test_local_lru_evicts_oldest_entry():
+    cache = InterpretationCache(version="test:v1", redis_url=None, local_max_entries=1)
+    first = cache.build_key([("backend_developer", 0.8)], {}, "c1")
+    second = cache.build_key([("qa_engineer", 0.8)], {}, "c1")
+
+    cache.set(first, _result())
+    cache.set(second, _result(primary_recommendation="qa_engineer"))
+
+    assert cache.get(first) is None
+    assert cache.get(second).primary_recommendation == "qa_engineer"
+
+
+def test_catalog_reload_misses_the_interpretation_cache(monkeypatch, tmp_path):
+    questions_file = tmp_path / "questions.json"
+    source = os.path.join(os.path.dirname(catalog_module.__file__), "storage", "questions_data.json")
+    questions_file.write_bytes(open(source, "rb").read())
+    original_compile = catalog_module.compile_catalog
+    monkeypatch.setattr(catalog_module, "compile_catalog", lambda: original_compile(str(questions_file)))
+    monkeypatch.setattr(catalog_module, "_catalog", None)
+    monkeypatch.setattr(settings, "INTERVIEW_LLM_CACHE_ENABLED", True)
+    monkeypatch.setattr(settings, "REDIS_URL", None)
+
+    first = get_interview_catalog()
+    orchestrator = ITCareerTestOrchestrator(openai_api_key="test", session_backend="memory")
+    calls = []
+
+    def interpret_results(ranked_roles, signal_profile, role_profiles, signals):
+        calls.append(role_profiles)
+        return _result()
+
+    monkeypatch.setattr(orchestrator.llm_interpreter, "interpret_results", interpret_results)
+    profile = ([("backend_developer", 0.8)], {"analytical_thinking": 3})
+
+    orchestrator.interpret_scores(*profile)
+    orchestrator.interpret_scores(*profile)
+    assert len(calls) == 1
+
+    # Same question bank version, new catalog content: the prompt may differ.
+    data = json.loads(open(source, encoding="utf-8-sig").read())
+    data["generated_at"] = "reloaded"
+    questions_file.write_text(json.dumps(data), encoding="utf-8")
+    assert reload_interview_catalog() is True
+    assert get_interview_catalog().question_bank.get_version() == first.question_bank.get_version()
+
+    assert orchestrator.get_cached_interpretation(*profile) is None
+    orchestrator.interpret_scores(*profile)
+    assert len(calls) == 2
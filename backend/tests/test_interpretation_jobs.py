@@ -0,0 +1,130 @@
+import asyncio
+import subprocess
+import threading
+import time
+
+import pytest
+
+from app.interview.interpretation import interpretation_jobs as jobs_module
+from app.interview.interpretation.interpretation_jobs import (
+    InterpretationJobQueue,
+    InterpretationQueueFullError,
+)
+from app.interview.interpretation import llm_interpreter as llm_module
+from app.interview.interpretation.llm_interpreter import (
+    InterpretationResult,
+    LLMAPIError,
+    LLMInterpreter,
+    RetryConfig,
+)
+
+
+def _interpretation():
+    return InterpretationResult(
+        primary_recommendation="backend_developer",
+        explanation="text",
+        signal_analysis="",
+        alternative_roles=[],
+        differentiation_criteria="",
+        why_this_role_reasons=[],
+    )
+
+
+async def _wait_for_status(queue, job_id, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = await queue.get(job_id)
+        if job["status"] != "pending":
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError("job did not finish")
+
+
+def test_job_becomes_ready_without_redis(monkeypatch):
+    monkeypatch.setattr(jobs_module, "get_redis", lambda: None)
+
+    async def scenario():
+        queue = InterpretationJobQueue(max_workers=1, max_queue_size=4)
+        job_id = await queue.submit("session_1", _interpretation)
+        assert (await queue.get(job_id))["status"] in {"pending", "ready"}
+        job = await _wait_for_status(queue, job_id)
+        await queue.shutdown()
+        return job
+
+    job = asyncio.run(scenario())
+    assert job["status"] == "ready"
+    assert job["interpretation"]["primary_recommendation"] == "backend_developer"
+
+
+def test_failed_job_reports_llm_unavailable(monkeypatch):
+    monkeypatch.setattr(jobs_module, "get_redis", lambda: None)
+
+    def failing():
+        raise RuntimeError("llm down")
+
+    async def scenario():
+        queue = InterpretationJobQueue(max_workers=1, max_queue_size=4)
+        job_id = await queue.submit("session_1", failing)
+        job = await _wait_for_status(queue, job_id)
+        await queue.shutdown()
+        return job
+
+    job = asyncio.run(scenario())
+    assert job["status"] == "failed"
+    assert job["warnings"] == ["llm_unavailable"]
+
+
+def test_submit_rejects_when_queue_is_full(monkeypatch):
+    monkeypatch.setattr(jobs_module, "get_redis", lambda: None)
+
+    async def scenario():
+        queue = InterpretationJobQueue(max_workers=1, max_queue_size=1)
+        await queue.submit("session_1", _interpretation)
+        with pytest.raises(InterpretationQueueFullError):
+            await queue.submit("session_2", _interpretation)
+        await queue.shutdown()
+
+    asyncio.run(scenario())
+
+
+def test_jobs_run_on_the_queue_thread_pool(monkeypatch):
+    monkeypatch.setattr(jobs_module, "get_redis", lambda: None)
+    threads = []
+
+    def interpret():
+        threads.append(threading.current_thread().name)
+        return _interpretation()
+
+    async def scenario():
+        queue = InterpretationJobQueue(max_workers=2, max_queue_size=4)
+        job_id = await queue.submit("session_1", interpret)
+        job = await _wait_for_status(queue, job_id)
+        await queue.shutdown()
+        return job
+
+    assert asyncio.run(scenario())["status"] == "ready"
+    assert threads[0].startswith("interpretation")
+
+
+def test_llm_call_stops_retrying_at_request_timeout(monkeypatch):
+    calls = []
+
+    def fake_run(args, **kwargs):
+        calls.append((float(args[args.index("--max-time") + 1]), kwargs["timeout"]))
+        return subprocess.CompletedProcess(args, 28, stdout="", stderr="timeout")
+
+    monkeypatch.setattr(llm_module.subprocess, "run", fake_run)
+    monkeypatch.setattr(llm_module.time, "sleep", lambda seconds: None)
+    interpreter = LLMInterpreter(
+        api_key="test",
+        retry_config=RetryConfig(max_retries=5, base_delay=4.0, jitter=False),
+        request_timeout_seconds=3,
+    )
+
+    with pytest.raises(LLMAPIError):
+        interpreter._call_with_retry("prompt")
+
+    # The 4 s backoff after the first failure would overrun the 3 s budget.
+    assert len(calls) == 1
+    max_time, process_timeout = calls[0]
+    assert max_time <= 3 and process_timeout <= 4
@@ -0,0 +1,57 @@
+import json
+import os
+
+from app.interview import catalog as catalog_module
+from app.interview.catalog import compile_catalog, get_interview_catalog, reload_interview_catalog
+from app.interview.orchestrator import ITCareerTestOrchestrator
+
+
+def test_catalog_snapshot_precomputes_lookups_and_payloads():
+    catalog = compile_catalog()
+    questions = catalog.question_bank.get_all_questions()
+
+    assert list(catalog.question_index) == [q.id for q in questions]
+    assert set(catalog.llm_role_profiles) == {r.id for r in catalog.role_profiles.get_all_roles()}
+    assert [item["id"] for item in json.loads(catalog.questions_payload.body)] == [q.id for q in questions]
+    assert set(catalog.stage_payloads) == set(catalog.stage_index)
+    assert catalog.career_pipeline.get_next_roles("frontend_developer")
+
+    # Same sources, same content hash.
+    assert compile_catalog().version == catalog.version
+
+
+def test_reload_swaps_snapshot_only_when_sources_change(monkeypatch, tmp_path):
+    questions_file = tmp_path / "questions.json"
+    source = os.path.join(os.path.dirname(catalog_module.__file__), "storage", "questions_data.json")
+    questions_file.write_bytes(open(source, "rb").read())
+
+    original_compile = catalog_module.compile_catalog
+    monkeypatch.setattr(catalog_module, "compile_catalog", lambda: original_compile(str(questions_file)))
+    monkeypatch.setattr(catalog_module, "_catalog", None)
+
+    first = get_interview_catalog()
+    orchestrator = ITCareerTestOrchestrator(enable_llm=False, session_backend="memory")
+    assert reload_interview_catalog() is False
+    assert get_interview_catalog() is first
+
+    # Touching without changing content keeps the snapshot.
+    os.utime(questions_file, ns=(1, 1))
+    assert reload_interview_catalog() is False
+    assert get_interview_catalog().version == first.version
+
+    # Broken data keeps the previous snapshot.
+    questions_file.write_text("{", encoding="utf-8")
+    assert reload_interview_catalog() is False
+    assert get_interview_catalog().version == first.version
+
+    data = json.loads(open(source, encoding="utf-8-sig").read())
+    data["version"] = "reloaded"
+    questions_file.write_text(json.dumps(data), encoding="utf-8")
+    assert reload_interview_catalog() is True
+    current = get_interview_catalog()
+    assert current.version != first.version
+    assert current.question_bank.get_version() == "reloaded"
+
+    # Running orchestrators keep the question bank their sessions use.
+    assert orchestrator.question_manager is first.question_bank
+    assert orchestrator.stage_engine is current.stage_engine
@@ -0,0 +1,36 @@
+import asyncio
+import json
+
+from starlette.requests import Request
+
+from app.interview.catalog import get_interview_catalog
+from app.routers import interview as interview_router
+
+
+def _request(path, if_none_match=None):
+    headers = []
+    if if_none_match is not None:
+        headers.append((b"if-none-match", if_none_match.encode("latin-1")))
+    return Request({"type": "http", "method": "GET", "path": path, "headers": headers})
+
+
+def test_stage_endpoints_serve_encoded_payloads_with_etags():
+    catalog = get_interview_catalog()
+    stage_id = next(iter(catalog.stage_index))
+
+    response = asyncio.run(interview_router.get_stage_details(_request(f"/api/interview/stages/{stage_id}"), stage_id))
+    assert response.status_code == 200
+    assert json.loads(response.body)["stage"]["id"] == stage_id
+    etag = response.headers["etag"]
+    assert response.headers["cache-control"].startswith("public, max-age=")
+
+    revalidated = asyncio.run(interview_router.get_stage_details(
+        _request(f"/api/interview/stages/{stage_id}", f'"stale", W/{etag}'), stage_id
+    ))
+    assert revalidated.status_code == 304
+    assert revalidated.body == b""
+    assert revalidated.headers["etag"] == etag
+
+    listing = asyncio.run(interview_router.get_all_stages(_request("/api/interview/stages", '"stale"')))
+    assert listing.status_code == 200
+    assert [stage["id"] for stage in json.loads(listing.body)] == list(catalog.stage_index)
@@ -13,7 +13,7 @@ def _unwrap(function):
 
 
 class _DummyOrchestrator:
-    def complete_test(self, session_id: str, skip_llm: bool):
+    async def complete_test(self, session_id: str, skip_llm: bool):
         return SimpleNamespace(
             session_id=session_id,
             ranked_roles=[("backend_developer", 0.91)],
@@ -0,0 +1,65 @@
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from app.infra import cache
+from app.schemas import PaginatedVacancies
+
+
+class _FakeRedis:
+    """decode_responses=True client: values come back as str."""
+
+    def __init__(self):
+        self.values = {}
+
+    async def get(self, key):
+        value = self.values.get(key)
+        return value.decode("utf-8") if isinstance(value, bytes) else value
+
+    async def setex(self, key, ttl, value):
+        self.values[key] = value
+
+
+def _page():
+    vacancy = SimpleNamespace(
+        id=1, title="Python developer", company_id=None, company_name="Kaspi.kz", company_logo=None,
+        salary_from=500000, salary_to=None, salary_in_kzt=500000, currency="KZT", location="Алматы",
+        grade="Middle", published_at=datetime(2026, 10, 1, 9, 30, tzinfo=timezone.utc),
+        description=None, key_skills=["Python"], url="https://hh.kz/vacancy/1",
+        raw_data={"area": {"id": "160"}},
+    )
+    return PaginatedVacancies.model_validate(
+        {"items": [vacancy], "total": 1, "page": 1, "per_page": 20}, from_attributes=True
+    )
+
+
+def test_encode_json_matches_pydantic_output():
+    page = _page()
+
+    assert cache.encode_json(page.model_dump(mode="json")) == page.model_dump_json().encode("utf-8")
+
+
+def test_cached_body_round_trips_unchanged(monkeypatch):
+    redis = _FakeRedis()
+    monkeypatch.setattr(cache, "get_redis", lambda: redis)
+    monkeypatch.setattr(cache.settings, "CACHE_ENABLED", True)
+    body = cache.encode_json(_page().model_dump(mode="json"))
+
+    async def scenario():
+        assert await cache.get_cached_body("k") is None
+        assert await cache.set_cached_body("k", body, ttl_seconds=60)
+        assert await cache.get_cached_body("k") == body
+        assert await cache.set_cached_response("d", {"a": [1, "Алматы"]}, ttl_seconds=60)
+        assert await cache.get_cached_response("d") == {"a": [1, "Алматы"]}
+
+    asyncio.run(scenario())
+
+
+def test_cache_fails_open_without_redis(monkeypatch):
+    monkeypatch.setattr(cache, "get_redis", lambda: None)
+
+    async def scenario():
+        assert await cache.get_cached_body("k") is None
+        assert await cache.set_cached_response("k", {"a": 1}) is False
+
+    asyncio.run(scenario())
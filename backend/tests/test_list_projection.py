@@ -0,0 +1,63 @@
+import asyncio
+
+from sqlalchemy.dialects import postgresql
+
+from app.routers import recommendations
+from app.services.vacancy_service import VacancyService
+from app.utils.helpers import make_snippet
+
+HEAVY_COLUMNS = ("vacancies.description", "vacancies.search_vector", "vacancy_raw")
+
+
+def _select_list(query):
+    sql = str(query.compile(dialect=postgresql.dialect()))
+    return sql.split("FROM", 1)[0]
+
+
+class _CapturingSession:
+    def __init__(self):
+        self.statements = []
+
+    async def execute(self, statement):
+        self.statements.append(statement)
+        return _Result()
+
+
+class _Result:
+    def scalar(self):
+        return 0
+
+    def all(self):
+        return []
+
+
+def test_listing_selects_only_list_columns():
+    db = _CapturingSession()
+    asyncio.run(VacancyService.get_vacancies(db, page=1, per_page=20, search="python"))
+
+    page_query = db.statements[-1]
+    select_list = _select_list(page_query)
+    assert "vacancies.snippet" in select_list and "vacancies.title" in select_list
+    assert not any(column in select_list for column in HEAVY_COLUMNS)
+    # Full-text search still filters on the tsvector without returning it.
+    assert "vacancies.search_vector @@" in str(page_query.compile(dialect=postgresql.dialect()))
+
+
+def test_recommendation_queries_select_only_list_columns():
+    for query in (
+        recommendations.build_matched_query([1, 5], "Middle", 20),
+        recommendations.build_fallback_query([1, 5], None, 5),
+    ):
+        select_list = _select_list(query)
+        assert "vacancies.snippet" in select_list
+        assert not any(column in select_list for column in HEAVY_COLUMNS)
+
+
+def test_make_snippet_strips_html_and_cuts_at_word_boundary():
+    assert make_snippet("<p>Ищем&nbsp;<b>Python</b>\n разработчика</p>") == "Ищем Python разработчика"
+    assert make_snippet("", {"requirement": "Опыт <highlighttext>Go</highlighttext>", "responsibility": None}) == "Опыт Go"
+    assert make_snippet(None) is None
+
+    text = "<p>" + "слово " * 50 + "</p>"
+    assert make_snippet(text, limit=29) == "слово слово слово слово слово…"
+    assert make_snippet(text, limit=32) == "слово слово слово слово слово…"
@@ -0,0 +1,80 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+from app.utils import account_security
+from app.utils.account_security import LockoutStatus, get_lockout_status, record_login_attempt
+
+
+class _FakeRedis:
+    def __init__(self, result):
+        self.result = result
+        self.calls = []
+
+    async def eval(self, script, numkeys, *args):
+        self.calls.append(args)
+        return self.result
+
+
+class _FakeDB:
+    def __init__(self, results=()):
+        self.results = list(results)
+        self.added = []
+
+    async def execute(self, query):
+        value = self.results.pop(0)
+        return SimpleNamespace(scalar=lambda: value, scalar_one_or_none=lambda: value)
+
+    def add(self, row):
+        self.added.append(row)
+
+
+def test_lockout_status_comes_from_one_redis_script(monkeypatch):
+    redis = _FakeRedis([1, 5, 420])
+    monkeypatch.setattr(account_security, "get_redis", lambda: redis)
+
+    status = asyncio.run(get_lockout_status(_FakeDB(), user_id=3, email="a@b.c", ip="10.0.0.1"))
+    assert status == LockoutStatus(locked=True, failed_count=5, remaining_seconds=420)
+    key, now_ms, window_ms, threshold, member = redis.calls[0]
+    assert key == account_security._lockout_key(3, "a@b.c", "10.0.0.1")
+    assert window_ms == 15 * 60 * 1000 and threshold == 5 and member == ""
+    # Scoped like the SQL filters: user id wins over email, IP narrows.
+    assert key == account_security._lockout_key(3, "other@b.c", "10.0.0.1")
+    assert key != account_security._lockout_key(3, "a@b.c", "10.0.0.2")
+
+
+def test_lockout_falls_back_to_postgres_without_redis(monkeypatch):
+    monkeypatch.setattr(account_security, "get_redis", lambda: None)
+    oldest = datetime.now(timezone.utc) - timedelta(minutes=5)
+    db = _FakeDB([6, oldest])
+
+    status = asyncio.run(get_lockout_status(db, email="a@b.c", ip="10.0.0.1"))
+    assert status.locked and status.failed_count == 6
+    assert 590 <= status.remaining_seconds <= 600
+
+
+def test_failed_attempt_is_recorded_in_redis_and_audited_in_background(monkeypatch):
+    redis = _FakeRedis([0, 1, 0])
+    written = []
+
+    async def _write(values):
+        written.append(values)
+
+    monkeypatch.setattr(account_security, "get_redis", lambda: redis)
+    monkeypatch.setattr(account_security, "_write_login_attempt", _write)
+    db = _FakeDB()
+
+    async def scenario():
+        await record_login_attempt(
+            db, email="a@b.c", ip_address="10.0.0.1", user_agent="ua",
+            success=False, failure_reason="invalid_password", user_id=3, lockout_ip="10.0.0.1",
+        )
+        await account_security.flush_login_audit()
+
+    asyncio.run(scenario())
+    assert redis.calls[0][4] != ""  # a failure member was added to the window
+    assert db.added == [] and written[0]["failure_reason"] == "invalid_password"
+
+    monkeypatch.setattr(account_security, "get_redis", lambda: None)
+    asyncio.run(record_login_attempt(db, email="a@b.c", ip_address="10.0.0.1", user_agent="ua", success=True))
+    assert len(db.added) == 1 and db.added[0].success is True
@@ -1,29 +1,21 @@
+from types import SimpleNamespace
+
 import pytest
 
 from app.interview import orchestrator as orchestrator_module
 from app.interview.storage.session_store import SessionBackendUnavailableError
 
 
-class _DummyManager:
-    def __init__(self, *args, **kwargs):
-        pass
-
-
 class _DummyQuestionBankManager:
     def __init__(self, *args, **kwargs):
         pass
 
 
 class _DummyAggregationEngine:
-    def __init__(self, response_store):
+    def __init__(self, response_store, scoring_model=None):
         self.response_store = response_store
 
 
-class _DummyStageEngine:
-    def __init__(self, *args, **kwargs):
-        pass
-
-
 class _FailingRedisSessionStore:
     def __init__(self, *args, **kwargs):
         raise SessionBackendUnavailableError("redis unavailable")
@@ -35,13 +27,13 @@ class _MemorySessionStore:
 
 
 def _patch_orchestrator_dependencies(monkeypatch):
-    monkeypatch.setattr(orchestrator_module, "RoleProfileManager", _DummyManager)
-    monkeypatch.setattr(orchestrator_module, "SignalDictionaryManager", _DummyManager)
-    monkeypatch.setattr(orchestrator_module, "QuestionBankManager", _DummyQuestionBankManager)
+    catalog = SimpleNamespace(
+        question_bank=_DummyQuestionBankManager(),
+        session_codec=None,
+        scoring_model=None,
+    )
+    monkeypatch.setattr(orchestrator_module, "get_interview_catalog", lambda: catalog)
     monkeypatch.setattr(orchestrator_module, "AggregationEngine", _DummyAggregationEngine)
-    monkeypatch.setattr(orchestrator_module, "RoleCatalogManager", _DummyManager)
-    monkeypatch.setattr(orchestrator_module, "StageManager", _DummyManager)
-    monkeypatch.setattr(orchestrator_module, "StageAggregationEngine", _DummyStageEngine)
     monkeypatch.setattr(orchestrator_module.settings, "INTERVIEW_SESSION_MAX_ACTIVE", 2000, raising=False)
     monkeypatch.setattr(orchestrator_module.settings, "REDIS_URL", "redis://127.0.0.1:6399/0", raising=False)
 
@@ -0,0 +1,58 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from fastapi import HTTPException
+
+from app import auth
+from app.infra import password_hasher
+from app.infra.password_hasher import PasswordHasher, PasswordHasherBusy
+
+
+def _thread_pool(workers):
+    return ThreadPoolExecutor(max_workers=workers)
+
+
+def test_verify_upgrades_low_cost_hashes():
+    hasher = PasswordHasher(rounds=5, workers=1, executor_factory=_thread_pool)
+    legacy = password_hasher.build_crypt_context(4).hash("s3cret")
+
+    async def scenario():
+        valid, upgraded = await hasher.verify_and_update("s3cret", legacy)
+        assert valid and upgraded.startswith("$2b$05$")
+        assert await hasher.verify_and_update("s3cret", upgraded) == (True, None)
+        assert (await hasher.verify_and_update("wrong", upgraded))[0] is False
+        assert (await hasher.hash("other")).startswith("$2b$05$")
+
+    asyncio.run(scenario())
+    stats = hasher.get_stats()
+    assert stats["verifications"] == 3 and stats["rehashes"] == 1 and stats["hashes"] == 1
+    hasher.shutdown()
+
+
+def test_saturated_pool_rejects_with_503(monkeypatch):
+    release = threading.Event()
+
+    def _slow_hash(password, rounds):
+        release.wait(5)
+        return "hashed"
+
+    monkeypatch.setattr(password_hasher, "_hash", _slow_hash)
+    hasher = PasswordHasher(rounds=4, workers=1, max_pending=1, executor_factory=_thread_pool)
+    monkeypatch.setattr(auth, "get_password_hasher", lambda: hasher)
+
+    async def scenario():
+        first = asyncio.create_task(hasher.hash("a"))
+        await asyncio.sleep(0)
+        with pytest.raises(PasswordHasherBusy):
+            await hasher.hash("b")
+        with pytest.raises(HTTPException) as exc:
+            await auth.hash_password_async("c")
+        assert exc.value.status_code == 503
+        release.set()
+        assert await first == "hashed"
+
+    asyncio.run(scenario())
+    assert hasher.get_stats()["rejected"] == 2
+    hasher.shutdown()
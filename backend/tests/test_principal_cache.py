@@ -0,0 +1,82 @@
+import asyncio
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from app import auth
+from app.infra import principal_cache
+from app.infra.principal_cache import Principal, PrincipalCache
+from app.schemas import UserProfileOut
+
+
+def _user(**overrides):
+    fields = dict(
+        id=7,
+        email="dev@example.com",
+        username="dev",
+        role="user",
+        is_active=True,
+        token_version=2,
+        email_verified=True,
+        email_verified_at=datetime(2026, 1, 2, tzinfo=timezone.utc),
+        full_name="Dev",
+        location="Almaty",
+        grade="Middle",
+        skills=["python", "go"],
+        bio=None,
+    )
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+class _DB:
+    def __init__(self, user):
+        self.user = user
+        self.queries = 0
+
+    async def execute(self, query):
+        self.queries += 1
+        return SimpleNamespace(scalar_one_or_none=lambda: self.user)
+
+
+def _token(user, version=None):
+    claims = auth.access_token_claims(user)
+    if version is not None:
+        claims["ver"] = version
+    return auth.create_access_token(claims)
+
+
+@pytest.fixture(autouse=True)
+def _local_only_cache(monkeypatch):
+    monkeypatch.setattr(principal_cache, "get_redis", lambda: None)
+    monkeypatch.setattr(principal_cache, "_principal_cache", PrincipalCache(local_ttl_seconds=60))
+
+
+def test_principal_is_cached_per_token_version():
+    user = _user()
+    db = _DB(user)
+
+    first = asyncio.run(auth.get_current_principal(_token(user), db))
+    second = asyncio.run(auth.get_current_principal(_token(user), db))
+    assert first == second and first.skills == ("python", "go")
+    assert db.queries == 1
+
+    # A token from before logout-all (older version) is not served from cache and is rejected.
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(auth.get_current_principal(_token(user, version=1), db))
+    assert exc.value.status_code == 401
+    assert db.queries == 2
+
+    asyncio.run(principal_cache.invalidate_principal(user.id))
+    asyncio.run(auth.get_current_principal(_token(user), db))
+    assert db.queries == 3
+
+
+def test_principal_round_trips_and_serializes_as_profile():
+    principal = Principal.from_user(_user())
+    assert Principal.from_json(principal.to_json()) == principal
+
+    profile = UserProfileOut.model_validate(principal)
+    assert profile.skills == ["python", "go"] and profile.email_verified_at == principal.email_verified_at
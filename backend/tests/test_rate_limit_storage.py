@@ -0,0 +1,120 @@
+from limits import parse
+from limits.strategies import FixedWindowRateLimiter
+from redis.exceptions import ConnectionError as RedisConnectionError
+from slowapi import Limiter
+from starlette.requests import Request
+
+from app.core.limiter import get_client_ip
+from app.infra import rate_limit_storage
+from app.infra.rate_limit_storage import PrefetchRedisStorage, RateLimitStats
+
+
+class _FakeRedis:
+    """Evaluates the sliding-window script in Python."""
+
+    def __init__(self, fail=False):
+        self.counters = {}
+        self.calls = 0
+        self.fail = fail
+
+    def register_script(self, script):
+        def _run(keys, args):
+            self.calls += 1
+            if self.fail:
+                raise RedisConnectionError("down")
+            amount, window, elapsed = (int(a) for a in args)
+            self.counters[keys[0]] = self.counters.get(keys[0], 0) + amount
+            previous = self.counters.get(keys[1], 0)
+            return previous * (window - elapsed) // window + self.counters[keys[0]]
+        return _run
+
+
+def _limiter(client, monkeypatch):
+    monkeypatch.setattr(rate_limit_storage, "rate_limit_stats", RateLimitStats())
+    storage = PrefetchRedisStorage("prefetch+redis://localhost:6379", client=client, prefetch_max=10)
+    return FixedWindowRateLimiter(storage)
+
+
+def test_generous_limits_prefetch_and_strict_limits_do_not(monkeypatch):
+    client = _FakeRedis()
+    limiter = _limiter(client, monkeypatch)
+
+    generous = parse("100/minute")
+    assert all(limiter.hit(generous, "1.2.3.4", "/api/vacancies") for _ in range(6))
+    # The first hit goes alone; back-to-back hits then reserve 5 per round trip.
+    assert client.calls == 2
+    assert sum(client.counters.values()) == 6
+
+    strict = parse("2/minute")
+    assert limiter.hit(strict, "1.2.3.4", "/api/auth/token")
+    assert limiter.hit(strict, "1.2.3.4", "/api/auth/token")
+    assert not limiter.hit(strict, "1.2.3.4", "/api/auth/token")
+    assert client.calls == 5
+
+    routes = rate_limit_storage.rate_limit_stats.to_dict()["routes"]
+    assert routes["/api/vacancies"]["local_hits"] == 4
+    assert routes["/api/auth/token"]["rejected"] == 1
+
+
+class _Clock:
+    def __init__(self, now=1_000_000.0):
+        self.now = now
+
+    def time(self):
+        return self.now
+
+    monotonic = perf_counter = time
+
+
+def test_sparse_traffic_is_counted_exactly(monkeypatch):
+    clock = _Clock()
+    monkeypatch.setattr(rate_limit_storage, "time", clock)
+    client = _FakeRedis()
+    limiter = _limiter(client, monkeypatch)
+    generous = parse("100/minute")
+
+    # 40 requests/minute, each after the previous reservation expired.
+    for _ in range(120):
+        assert limiter.hit(generous, "1.2.3.4", "/api/vacancies")
+        clock.now += 1.5
+    assert client.calls == 120
+    assert rate_limit_storage.rate_limit_stats.to_dict()["routes"]["/api/vacancies"]["rejected"] == 0
+
+    # A burst still prefetches, and is rejected once it goes over the limit.
+    results = [limiter.hit(generous, "5.6.7.8", "/api/vacancies") for _ in range(101)]
+    assert all(results[:100]) and not results[100]
+    assert client.calls < 120 + 25
+
+
+def test_redis_errors_fail_open_to_local_counters(monkeypatch):
+    client = _FakeRedis(fail=True)
+    limiter = _limiter(client, monkeypatch)
+
+    strict = parse("2/minute")
+    assert limiter.hit(strict, "1.2.3.4", "/api/auth/token")
+    assert limiter.hit(strict, "1.2.3.4", "/api/auth/token")
+    assert not limiter.hit(strict, "1.2.3.4", "/api/auth/token")
+    assert client.calls == 1  # back-off after the first error
+    assert rate_limit_stats_value("redis_errors") == 1
+
+
+def rate_limit_stats_value(name):
+    return rate_limit_storage.rate_limit_stats.to_dict()[name]
+
+
+def _request(peer, forwarded=None):
+    headers = [(b"x-forwarded-for", forwarded.encode())] if forwarded else []
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": headers, "client": (peer, 1234)})
+
+
+def test_client_ip_trusts_forwarded_for_only_from_proxies():
+    assert get_client_ip(_request("172.18.0.5", "203.0.113.7")) == "203.0.113.7"
+    # Spoofed left-most entries are ignored; nginx appended the real peer.
+    assert get_client_ip(_request("172.18.0.5", "1.1.1.1, 203.0.113.7")) == "203.0.113.7"
+    # Direct clients cannot spoof.
+    assert get_client_ip(_request("198.51.100.2", "1.1.1.1")) == "198.51.100.2"
+
+
+def test_limiter_resolves_prefetch_scheme():
+    limiter = Limiter(key_func=get_client_ip, storage_uri="prefetch+redis://localhost:6379", strategy="fixed-window")
+    assert isinstance(limiter._storage, PrefetchRedisStorage)
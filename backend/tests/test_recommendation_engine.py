@@ -0,0 +1,100 @@
+import asyncio
+
+from app.core.skills import SKILL_REGISTRY
+from app.services import recommendation_engine as engine_module
+from app.services.recommendation_engine import RecommendationEngine, SkillIndex
+
+
+def _ids(*names):
+    return SKILL_REGISTRY.ids(names)
+
+
+def _index():
+    # Rows are in recency order: position 0 is the newest vacancy.
+    rows = [
+        (10, _ids("Python"), "Senior"),
+        (11, _ids("Go", "Python"), "Middle"),
+        (12, _ids("PostgreSQL"), "Junior"),
+        (13, [], "Middle"),
+        (14, _ids("Docker", "Go", "Python"), "Lead"),
+        (15, _ids("Java"), None),
+    ]
+    return SkillIndex.build(rows, generation=3)
+
+
+def test_top_k_ranks_by_overlap_then_recency_within_grade():
+    index = _index()
+
+    # Middle sees Junior/Middle/Senior; 14 is Lead and excluded.
+    assert index.top_k(_ids("golang", "python"), "Middle", 3) == [11, 10, 12]
+    # No grade: overlap 2 ties broken by recency, then the non-matching filler (only vacancies with skills).
+    assert index.top_k(_ids("go", "python"), None, 10) == [11, 14, 10, 12, 15]
+    # Unregistered skills fall back to the latest vacancies with skills.
+    assert index.top_k(_ids("cobol"), "Junior", 2, has_skills=True) == [11, 12]
+    # No skills: latest vacancies for the grade window, with or without skills.
+    assert index.top_k([], "Junior", 5) == [11, 12, 13]
+
+
+def test_read_feed_joins_cached_payloads(monkeypatch):
+    class _FakeRedis:
+        def __init__(self, result):
+            self.result = result
+
+        def register_script(self, script):
+            async def _run(keys, args):
+                return self.result
+            return _run
+
+    engine = RecommendationEngine()
+
+    monkeypatch.setattr(engine_module, "get_redis", lambda: _FakeRedis(["3", '{"id":11}', '{"id":10}', ""]))
+    assert asyncio.run(engine.read_feed(1)) == b'[{"id":11},{"id":10}]'
+
+    monkeypatch.setattr(engine_module, "get_redis", lambda: _FakeRedis(["3", ""]))
+    assert asyncio.run(engine.read_feed(1)) == b"[]"
+
+    monkeypatch.setattr(engine_module, "get_redis", lambda: _FakeRedis(["3"]))
+    assert asyncio.run(engine.read_feed(1)) is None
+
+
+def test_user_refreshes_dedupe_and_wait_for_a_running_rebuild(monkeypatch):
+    engine = RecommendationEngine()
+    refreshed = []
+    rebuilds = []
+
+    async def refresh_user(user_id):
+        refreshed.append(user_id)
+        await asyncio.sleep(0)
+
+    async def rebuild_all():
+        rebuilds.append(list(refreshed))
+        await asyncio.sleep(0)
+        return 0
+
+    monkeypatch.setattr(engine, "refresh_user", refresh_user)
+    monkeypatch.setattr(engine, "rebuild_all", rebuild_all)
+
+    async def scenario():
+        for _ in range(3):
+            engine.schedule_user_refresh(1)
+        engine.schedule_user_refresh(2)
+        assert len(engine._tasks) == 2
+        await asyncio.sleep(0)
+        # Repeats once the refresh has started coalesce into a single rerun.
+        engine.schedule_user_refresh(1)
+        engine.schedule_user_refresh(1)
+        await asyncio.gather(*engine._tasks)
+        assert sorted(refreshed) == [1, 1, 2]
+
+        refreshed.clear()
+        engine.schedule_rebuild()
+        engine.schedule_user_refresh(1)
+        engine.schedule_user_refresh(1)
+        assert refreshed == []
+        while engine._tasks:
+            await asyncio.gather(*list(engine._tasks))
+        # Held back during the rebuild, then refreshed once.
+        assert rebuilds == [[]] and refreshed == [1]
+        assert not engine._refreshing and not engine._refresh_after_rebuild
+
+    asyncio.run(scenario())
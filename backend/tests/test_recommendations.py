@@ -0,0 +1,69 @@
+import asyncio
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import postgresql
+from starlette.requests import Request
+
+from app.core.skills import SKILL_REGISTRY
+from app.routers import recommendations
+
+
+def _sql(query):
+    return str(query.compile(dialect=postgresql.dialect()))
+
+
+def test_matched_query_ranks_by_overlap_in_postgres():
+    skill_ids = SKILL_REGISTRY.ids([" Python", "python", "Golang", "", None])
+    assert skill_ids == [1, 5]
+
+    sql = _sql(recommendations.build_matched_query(skill_ids, "Middle", 20))
+    assert "vacancies.skill_ids && %(user_skill_ids)s::INTEGER[]" in sql
+    assert "ORDER BY skill_id_overlap(vacancies.skill_ids, %(user_skill_ids)s::INTEGER[]) DESC" in sql
+    assert "vacancies.grade IN" in sql
+    assert "LIMIT" in sql
+
+    fallback = _sql(recommendations.build_fallback_query(skill_ids, None, 5))
+    assert "NOT (vacancies.skill_ids && %(user_skill_ids)s::INTEGER[])" in fallback
+    assert "cardinality(vacancies.skill_ids) > %(cardinality_1)s" in fallback
+    assert "key_skills" not in fallback.split("WHERE", 1)[1]
+    assert "vacancies.grade IN" not in fallback
+
+    no_skills = _sql(recommendations.build_fallback_query([], None, 5, has_skills=False))
+    where = no_skills.split("WHERE", 1)[1]
+    assert "key_skills" not in where and "skill_ids" not in where
+
+
+def test_cache_hit_skips_database(monkeypatch):
+    cached = [{"id": 1, "title": "Backend", "url": "https://example.com/1"}]
+    seen_keys = []
+
+    async def _generation():
+        return 7
+
+    async def _get_cached(cache_key, request_id=None):
+        seen_keys.append(cache_key)
+        return cached
+
+    class _NoFeedEngine:
+        refreshed = []
+
+        async def read_feed(self, user_id):
+            return None
+
+        def schedule_user_refresh(self, user_id):
+            self.refreshed.append(user_id)
+
+    engine = _NoFeedEngine()
+    monkeypatch.setattr(recommendations, "get_recommendation_engine", lambda: engine)
+    monkeypatch.setattr(recommendations, "get_dataset_generation", _generation)
+    monkeypatch.setattr(recommendations, "get_cached_response", _get_cached)
+
+    request = Request({"type": "http", "method": "GET", "path": "/api/recommendations", "headers": []})
+    user = SimpleNamespace(id=5, skills=["python", "golang"], grade="Middle")
+    result = asyncio.run(recommendations.get_recommendations(request, current_user=user, db=None))
+
+    assert result == cached
+    assert engine.refreshed == [5]
+    assert "gen=7" in seen_keys[0] and "grade=Middle" in seen_keys[0]
+    same_skills = recommendations._recommendations_cache_key([1, 5], True, "Middle", 7)
+    assert seen_keys[0] == same_skills
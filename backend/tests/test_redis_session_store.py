@@ -0,0 +1,212 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.interview.aggregation.aggregation_engine import AggregationEngine
+from app.interview.models.user_response import SessionModel, SessionStatus, UserResponse
+from app.interview.storage.question_bank_manager import QuestionBankManager
+from app.interview.storage import redis_session_store as store_module
+from app.interview.storage.redis_session_store import RedisSessionStore
+from app.interview.storage.session_codec import SessionCodec
+from app.interview.storage.session_store import SessionBackendUnavailableError, SessionLimitExceededError
+from app.interview.storage.user_response_store import SessionCompleteError, UnansweredQuestionsError
+
+
+class _FakeRedis:
+    def __init__(self, strings=None, hashes=None):
+        self.strings = strings or {}
+        self.hashes = hashes or {}
+
+    async def get(self, key):
+        return self.strings.get(key)
+
+    async def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+
+def _store_without_connection(question_bank, redis=None):
+    store = RedisSessionStore.__new__(RedisSessionStore)
+    store._question_bank_manager = question_bank
+    store._codec = SessionCodec(question_bank)
+    store._redis = redis
+    return store
+
+
+def _scripted_store(question_bank, max_active_sessions=10):
+    """Store on fakeredis with the real Lua scripts registered (needs lupa)."""
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    redis = fakeredis.FakeAsyncRedis(decode_responses=True)
+    store = _store_without_connection(question_bank, redis)
+    store._max_active_sessions = max_active_sessions
+    store._ttl_seconds = 1800
+    store._create_session_script = redis.register_script(store_module._CREATE_SESSION_SCRIPT)
+    store._store_response_script = redis.register_script(store_module._STORE_RESPONSE_SCRIPT)
+    store._complete_session_script = redis.register_script(store_module._COMPLETE_SESSION_SCRIPT)
+    return store
+
+
+def test_compact_snapshot_keeps_answer_order_and_scores():
+    question_bank = QuestionBankManager()
+    store = _store_without_connection(question_bank)
+    questions = question_bank.get_all_questions()
+    answers = [
+        (question.id, question.answer_options[idx % len(question.answer_options)].id)
+        for idx, question in enumerate(reversed(questions))
+    ]
+
+    fields = {
+        "_status": "completed",
+        "_version": question_bank.get_version(),
+        "_created_at": "2026-01-01T00:00:00+00:00",
+        "_expires_at": "2026-01-01T01:00:00+00:00",
+        "_answers": store._codec.encode(answers).decode("ascii"),
+    }
+    session = store._build_session("session_1", fields)
+
+    assert session.status == SessionStatus.COMPLETED
+    assert [(r.question_id, r.answer_option_id) for r in session.responses] == answers
+    assert len(fields["_answers"]) == 2 * len(questions)
+
+    engine = AggregationEngine(store)
+    assert engine.score_session(session) == engine._score_resolved_responses(session.responses)
+
+
+def test_legacy_layouts_are_read_into_compact_answers():
+    question_bank = QuestionBankManager()
+    questions = question_bank.get_all_questions()[:3]
+    answers = [(q.id, q.answer_options[1].id) for q in reversed(questions)]
+    created_at = datetime(2026, 1, 1, 12, 0)
+
+    legacy_json = SessionModel(
+        session_id="session_json",
+        responses=[
+            UserResponse(session_id="session_json", question_id=qid, answer_option_id=oid)
+            for qid, oid in answers
+        ],
+        locked_question_bank_version=question_bank.get_version(),
+        created_at=created_at,
+        expires_at=created_at + timedelta(minutes=30),
+    ).model_dump_json()
+    legacy_hash = {
+        "_status": "in_progress",
+        "_version": question_bank.get_version(),
+        "_created_at": created_at.isoformat(),
+        "_seq": "3",
+        **{qid: f"{seq}:{oid}" for seq, (qid, oid) in enumerate(answers, start=1)},
+    }
+    redis = _FakeRedis(strings={"json": legacy_json}, hashes={"hash": legacy_hash})
+    store = _store_without_connection(question_bank, redis)
+    expected = store._codec.encode(answers).decode("ascii")
+
+    for key, key_type in (("json", "string"), ("hash", "hash")):
+        mapping, status = asyncio.run(store._read_legacy_session(key, key_type))
+        assert status == "in_progress"
+        assert mapping["_answers"] == expected
+        assert mapping["_created_at"] == created_at.isoformat()
+
+
+def test_create_script_admits_up_to_the_active_limit():
+    store = _scripted_store(QuestionBankManager(), max_active_sessions=2)
+    redis = store._redis
+
+    async def scenario():
+        first = await store.create_session()
+        second = await store.create_session()
+        with pytest.raises(SessionLimitExceededError):
+            await store.create_session()
+
+        fields = await redis.hgetall(store._session_key(first.session_id))
+        assert fields["_status"] == "in_progress" and fields["_answers"] == ""
+        assert 0 < await redis.ttl(store._session_key(first.session_id)) <= 1800
+
+        # An index entry whose expiry has passed is evicted by the next create.
+        await redis.zadd(store._ACTIVE_SESSIONS_KEY, {second.session_id: 1})
+        await store.create_session()
+        assert await redis.zscore(store._ACTIVE_SESSIONS_KEY, second.session_id) is None
+        assert await redis.zcard(store._ACTIVE_SESSIONS_KEY) == 2
+
+    asyncio.run(scenario())
+
+
+def test_store_and_complete_scripts_check_answers_atomically():
+    question_bank = QuestionBankManager()
+    store = _scripted_store(question_bank)
+    questions = question_bank.get_all_questions()
+
+    async def scenario():
+        session_id = (await store.create_session()).session_id
+        for question in questions[:-1]:
+            await store.store_response(session_id, question.id, question.answer_options[0].id)
+        # Re-answering keeps the question's original position.
+        await store.store_response(session_id, questions[0].id, questions[0].answer_options[1].id)
+
+        with pytest.raises(UnansweredQuestionsError):
+            await store.complete_session(session_id, require_all_answered=True)
+        assert (await store.get_session(session_id)).status == SessionStatus.IN_PROGRESS
+
+        last = questions[-1]
+        await store.store_response(session_id, last.id, last.answer_options[0].id)
+        session = await store.complete_session(session_id, require_all_answered=True)
+
+        assert session.status == SessionStatus.COMPLETED
+        assert [r.question_id for r in session.responses] == [q.id for q in questions]
+        assert session.responses[0].answer_option_id == questions[0].answer_options[1].id
+        assert await store._redis.zscore(store._ACTIVE_SESSIONS_KEY, session_id) is None
+        with pytest.raises(SessionCompleteError):
+            await store.complete_session(session_id)
+        with pytest.raises(SessionCompleteError):
+            await store.store_response(session_id, last.id, last.answer_options[0].id)
+
+    asyncio.run(scenario())
+
+
+def test_migrated_in_progress_session_rejoins_the_active_index():
+    question_bank = QuestionBankManager()
+    store = _scripted_store(question_bank)
+    question = question_bank.get_all_questions()[0]
+    created_at = datetime(2026, 1, 1, 12, 0)
+    legacy_json = SessionModel(
+        session_id="session_old",
+        locked_question_bank_version=question_bank.get_version(),
+        created_at=created_at,
+        expires_at=created_at + timedelta(minutes=30),
+    ).model_dump_json()
+
+    async def scenario():
+        # The creation-time index entry was already evicted by the create script.
+        await store._redis.set(store._session_key("session_old"), legacy_json, ex=600)
+        await store.store_response("session_old", question.id, question.answer_options[0].id)
+
+        assert await store._redis.type(store._session_key("session_old")) == "hash"
+        assert await store._redis.zscore(store._ACTIVE_SESSIONS_KEY, "session_old") is not None
+        assert len((await store.get_session("session_old")).responses) == 1
+
+    asyncio.run(scenario())
+
+
+def test_scripts_fail_cleanly_when_migration_leaves_a_legacy_layout(monkeypatch):
+    question_bank = QuestionBankManager()
+    store = _scripted_store(question_bank)
+    question = question_bank.get_all_questions()[0]
+
+    async def _no_migration(session_id):
+        return None
+
+    # Stands in for a concurrent writer restoring the old layout after migration.
+    monkeypatch.setattr(store, "_migrate_legacy_session", _no_migration)
+
+    async def scenario():
+        await store._redis.hset(
+            store._session_key("session_hash"),
+            mapping={"_status": "in_progress", "_version": question_bank.get_version(), "_seq": "0"},
+        )
+        await store._redis.set(store._session_key("session_json"), "{}")
+        for session_id in ("session_hash", "session_json"):
+            with pytest.raises(SessionBackendUnavailableError):
+                await store.store_response(session_id, question.id, question.answer_options[0].id)
+            with pytest.raises(SessionBackendUnavailableError):
+                await store.complete_session(session_id)
+
+    asyncio.run(scenario())
@@ -0,0 +1,72 @@
+import asyncio
+import random
+
+from app.interview.aggregation import aggregation_engine as aggregation_module
+from app.interview.aggregation.aggregation_engine import AggregationEngine
+from app.interview.storage.question_bank_manager import QuestionBankManager
+from app.interview.storage.user_response_store import UserResponseStore
+
+
+async def _answer_randomly(store, questions, rng):
+    session_id = (await store.create_session()).session_id
+    order = list(questions)
+    rng.shuffle(order)
+    for question in order:
+        option = rng.choice(question.answer_options)
+        await store.store_response(session_id, question.id, option.id)
+    return session_id
+
+
+def test_compiled_model_matches_dict_scoring_exactly():
+    question_bank = QuestionBankManager()
+    store = UserResponseStore(question_bank, max_active_sessions=1000)
+    engine = AggregationEngine(store)
+    questions = question_bank.get_all_questions()
+    rng = random.Random(2026)
+
+    for _ in range(300):
+        session_id = asyncio.run(_answer_randomly(store, questions, rng))
+        responses = asyncio.run(store.get_session_responses(session_id))
+
+        compiled = asyncio.run(engine.compute_scores(session_id))
+        reference = engine._score_resolved_responses(responses)
+
+        assert compiled == reference
+        # Insertion order feeds tie-breaking and the LLM prompt, so it must match too.
+        assert list(compiled.raw_scores) == list(reference.raw_scores)
+        assert list(compiled.signal_profile.items()) == list(reference.signal_profile.items())
+        assert list(compiled.stage_affinity.items()) == list(reference.stage_affinity.items())
+        assert asyncio.run(engine.validate_determinism(session_id))
+
+
+def test_unknown_option_falls_back_to_resolved_weights():
+    question_bank = QuestionBankManager()
+    store = UserResponseStore(question_bank, max_active_sessions=10)
+    engine = AggregationEngine(store)
+    session_id = asyncio.run(_answer_randomly(store, question_bank.get_all_questions(), random.Random(1)))
+
+    responses = asyncio.run(store.get_session_responses(session_id))
+    expected = engine._score_resolved_responses(responses)
+    responses[0] = responses[0].model_copy(update={"answer_option_id": "legacy_option"})
+
+    assert engine.score_responses(responses) == expected
+
+
+def test_failed_compile_is_logged_once_per_version(monkeypatch):
+    question_bank = QuestionBankManager()
+    store = UserResponseStore(question_bank, max_active_sessions=10)
+    engine = AggregationEngine(store)
+    compiles, logged = [], []
+
+    def failing_compile(manager):
+        compiles.append(manager.get_version())
+        raise ValueError("bad weights")
+
+    monkeypatch.setattr(aggregation_module.CompiledScoringModel, "compile", staticmethod(failing_compile))
+    monkeypatch.setattr(aggregation_module.logger, "exception", lambda message, *args: logged.append(message % args))
+
+    assert engine.get_scoring_model() is None
+    assert engine.get_scoring_model() is None
+
+    assert len(compiles) == 1
+    assert len(logged) == 1 and "Scoring model compile failed" in logged[0]
@@ -0,0 +1,64 @@
+import asyncio
+
+import pytest
+
+from app.interview.storage import session_token as token_module
+from app.interview.storage.question_bank_manager import QuestionBankManager
+from app.interview.storage.session_codec import SessionCodec
+from app.interview.storage.session_token import (
+    SessionNonceRegistry,
+    SessionTokenError,
+    SessionTokenSigner,
+)
+from app.interview.storage.user_response_store import SessionCompleteError
+
+
+def _signer(secret="secret", ttl_seconds=600):
+    return SessionTokenSigner(SessionCodec(QuestionBankManager()), secret=secret, ttl_seconds=ttl_seconds)
+
+
+def test_token_round_trip_keeps_answers_in_order():
+    signer = _signer()
+    questions = QuestionBankManager().get_all_questions()
+    state = signer.issue()
+    token = signer.encode(state)
+
+    for question in reversed(questions):
+        state = signer.with_answer(signer.decode(token, state.session_id), question.id, question.answer_options[0].id)
+        token = signer.encode(state)
+    # Changing an earlier answer keeps its position.
+    last = questions[-1]
+    state = signer.with_answer(signer.decode(token), last.id, last.answer_options[1].id)
+
+    session = signer.to_session(signer.decode(signer.encode(state)))
+    assert [r.question_id for r in session.responses] == [q.id for q in reversed(questions)]
+    assert session.responses[0].answer_option_id == last.answer_options[1].id
+    # 21-byte header + 2 bytes per answer + 16-byte signature, base64url.
+    assert len(signer.encode(state)) == 130
+
+
+def test_tampered_foreign_and_expired_tokens_are_rejected():
+    signer = _signer()
+    state = signer.issue()
+    token = signer.encode(state)
+
+    tampered = token[:-2] + ("A" if token[-2] != "A" else "B") + token[-1]
+    with pytest.raises(SessionTokenError):
+        signer.decode(tampered)
+    with pytest.raises(SessionTokenError):
+        _signer(secret="other").decode(token)
+    with pytest.raises(SessionTokenError):
+        signer.decode(token, session_id="tok_other")
+    expired = _signer(ttl_seconds=-1)
+    with pytest.raises(SessionTokenError):
+        expired.decode(expired.encode(expired.issue()))
+
+
+def test_nonce_registry_allows_single_completion(monkeypatch):
+    monkeypatch.setattr(token_module, "get_redis", lambda: None)
+    registry = SessionNonceRegistry()
+    state = _signer().issue()
+
+    asyncio.run(registry.claim(state))
+    with pytest.raises(SessionCompleteError):
+        asyncio.run(registry.claim(state))
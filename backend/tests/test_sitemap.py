@@ -0,0 +1,81 @@
+import asyncio
+import gzip
+from datetime import datetime, timezone
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.routers import sitemap as sitemap_router
+from app.services import sitemap_builder
+from app.services.sitemap_builder import INDEX_NAME, PAGES_NAME, SitemapStore, build_sitemap
+
+NOW = datetime(2026, 10, 19, 12, 0, tzinfo=timezone.utc)
+
+
+async def _rows(count):
+    for vacancy_id in range(1, count + 1):
+        yield vacancy_id, datetime(2026, 10, vacancy_id % 28 + 1, tzinfo=timezone.utc)
+
+
+def _build(count, shard_size):
+    return asyncio.run(build_sitemap(_rows(count), "https://devjobs.kz/", shard_size=shard_size, now=NOW))
+
+
+def test_vacancies_are_split_into_shards_listed_by_the_index():
+    sitemap = _build(5, shard_size=2)
+
+    assert sorted(sitemap.files) == sorted(
+        [INDEX_NAME, PAGES_NAME, "vacancies-1.xml", "vacancies-2.xml", "vacancies-3.xml"]
+    )
+    index = gzip.decompress(sitemap.files[INDEX_NAME].gzip_body).decode()
+    assert "<loc>https://devjobs.kz/sitemaps/vacancies-3.xml</loc>" in index
+    assert index.count("<sitemap>") == 4
+
+    last_shard = gzip.decompress(sitemap.files["vacancies-3.xml"].gzip_body).decode()
+    assert last_shard.count("<url>") == 1
+    assert "<loc>https://devjobs.kz/jobs/5</loc>" in last_shard
+    assert last_shard.endswith("</urlset>")
+
+
+def test_etag_changes_only_with_content():
+    assert _build(3, 2).files["vacancies-1.xml"].etag == _build(3, 2).files["vacancies-1.xml"].etag
+    assert _build(3, 2).files[INDEX_NAME].etag != _build(5, 2).files[INDEX_NAME].etag
+
+
+def _client(monkeypatch, sitemap):
+    store = SitemapStore()
+    store._sitemap = sitemap
+
+    async def generation():
+        return sitemap.generation
+
+    monkeypatch.setattr(sitemap_builder, "get_dataset_generation", generation)
+    monkeypatch.setattr(sitemap_router, "get_sitemap_store", lambda: store)
+    app = FastAPI()
+    app.include_router(sitemap_router.router)
+    return TestClient(app)
+
+
+def test_served_from_memory_with_gzip_and_conditional_requests(monkeypatch):
+    sitemap = _build(3, 2)
+    client = _client(monkeypatch, sitemap)
+
+    response = client.get("/sitemaps/vacancies-1.xml", headers={"Accept-Encoding": "gzip"})
+    assert response.status_code == 200
+    assert response.headers["content-encoding"] == "gzip"
+    assert "<loc>https://devjobs.kz/jobs/1</loc>" in response.text  # decoded by the client
+    etag = response.headers["etag"]
+
+    assert client.get(
+        "/sitemaps/vacancies-1.xml", headers={"Accept-Encoding": "gzip", "If-None-Match": etag}
+    ).status_code == 304
+
+    plain = client.get("/sitemap.xml", headers={"Accept-Encoding": "identity"})
+    assert "content-encoding" not in plain.headers
+    assert plain.text.startswith('<?xml version="1.0"')
+    assert client.get(
+        "/sitemap.xml", headers={"If-Modified-Since": plain.headers["last-modified"]}
+    ).status_code == 304
+
+    assert client.get("/sitemaps/vacancies-9.xml").status_code == 404
+    assert client.get("/sitemaps/other.xml").status_code == 404
@@ -0,0 +1,59 @@
+import asyncio
+from types import SimpleNamespace
+
+from sqlalchemy.dialects import postgresql
+
+from app.core.skills import SKILL_REGISTRY, SKILLS
+from app.models import Vacancy
+from app.schemas import UserProfileUpdate
+from app.services import vacancy_service
+from app.services.vacancy_service import VacancyService
+from app.utils.tech_extractor import extract_tech_stack
+
+
+def _sql(query):
+    return str(query.compile(dialect=postgresql.dialect()))
+
+
+def test_registry_ids_are_unique_and_synonyms_resolve():
+    assert len({skill.id for skill in SKILLS}) == len(SKILLS)
+    assert SKILL_REGISTRY.lookup(" golang ").name == "Go"
+    assert SKILL_REGISTRY.ids(["Postgres", "PostgreSQL", "k8s", "cobol"]) == [56, 71]
+    assert SKILL_REGISTRY.canonical_names(["ReactJS", "React", "COBOL"]) == ["React"]
+
+
+def test_extractor_and_profiles_emit_canonical_names():
+    assert extract_tech_stack("Golang, Postgres and K8s; also Go") == ["Kubernetes", "PostgreSQL", "Go"]
+
+    profile = UserProfileUpdate(skills=["Golang", " go", "Postgres", "Cobol", " "])
+    assert profile.skills == ["go", "postgresql", "cobol"]
+
+
+def test_stack_filter_and_facets_use_skill_ids():
+    executed = []
+
+    class _Result:
+        def scalar(self):
+            return 0
+
+        def scalars(self):
+            return SimpleNamespace(all=lambda: [])
+
+        def all(self):
+            return []
+
+    class _DB:
+        async def execute(self, query):
+            executed.append(_sql(query))
+            return _Result()
+
+    asyncio.run(VacancyService.get_vacancies(_DB(), page=1, per_page=20, stack="golang, Postgres, cobol"))
+    sql = executed[-1]
+    assert "vacancies.skill_ids && %(stack_skill_ids)s::INTEGER[]" in sql
+    # Unregistered names keep the JSONB scan.
+    assert sql.count("jsonb_array_elements_text(key_skills)") == 1
+
+    facets = _sql(vacancy_service._top_skill_ids_query(Vacancy.is_active == True, limit=5))
+    assert "unnest(vacancies.skill_ids)" in facets
+    rows = [SimpleNamespace(skill_id=5, cnt=3), SimpleNamespace(skill_id=9999, cnt=1)]
+    assert vacancy_service._skill_names(rows) == ["go"]
@@ -0,0 +1,50 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from app.interview.storage import user_response_store as store_module
+from app.interview.storage.question_bank_manager import QuestionBankManager
+from app.interview.storage.session_store import SessionLimitExceededError
+from app.interview.storage.user_response_store import SessionNotFoundError, UserResponseStore
+
+
+class _Clock:
+    now = datetime(2026, 1, 1, 12, 0)
+
+
+class _FrozenDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return _Clock.now
+
+
+def test_expired_sessions_are_evicted_and_free_active_slots(monkeypatch):
+    monkeypatch.setattr(store_module, "datetime", _FrozenDatetime)
+    monkeypatch.setattr(store_module.settings, "CAREER_SESSION_TTL_MINUTES", 30)
+    question_bank = QuestionBankManager()
+    store = UserResponseStore(question_bank, max_active_sessions=2)
+
+    async def scenario():
+        first = (await store.create_session()).session_id
+        _Clock.now += timedelta(minutes=10)
+        second = (await store.create_session()).session_id
+        with pytest.raises(SessionLimitExceededError):
+            await store.create_session()
+
+        await store.complete_session(second)
+        third = (await store.create_session()).session_id
+        assert store._active_count == 2
+
+        # Only the first session has expired; it no longer counts as active.
+        _Clock.now += timedelta(minutes=25)
+        with pytest.raises(SessionNotFoundError):
+            await store.get_session(first)
+        assert store._active_count == 1
+        await store.get_session(third)
+        await store.create_session()
+
+        await store.delete_session(third)
+        assert store._active_count == 1
+
+    asyncio.run(scenario())
@@ -0,0 +1,50 @@
+import asyncio
+import inspect
+from datetime import datetime, timezone
+
+from sqlalchemy.dialects import postgresql
+
+from app.models import Vacancy
+from app.scrapers.hh_scraper import HHScraper
+from app.services.vacancy_service import VacancyService
+
+
+def test_vacancies_heap_has_no_raw_payload():
+    columns = Vacancy.__table__.columns
+    assert "raw_data" not in columns
+    assert "professional_role_ids" in columns
+    assert any(index.name == "ix_vacancies_professional_role_ids" for index in Vacancy.__table__.indexes)
+
+
+def test_professional_role_ids_are_extracted_for_cleanup():
+    scraper = HHScraper()
+    item = {"professional_roles": [{"id": "96"}, {"id": "160"}, {"id": "96"}, {"id": "x"}, {}]}
+    assert scraper._extract_professional_role_ids(item) == [96, 160]
+    assert scraper._extract_professional_role_ids({"professional_roles": None}) == []
+
+    source = inspect.getsource(HHScraper.save_to_db)
+    assert "Vacancy.professional_role_ids.contains(" in source
+    assert "insert(VacancyRaw)" in source
+
+
+def test_detail_lookup_joins_raw_payload():
+    vacancy = Vacancy(
+        id=7, title="Go developer", url="https://hh.kz/vacancy/7", currency="KZT",
+        published_at=datetime(2026, 10, 1, tzinfo=timezone.utc), description="<p>Go</p>",
+    )
+    executed = []
+
+    class _Result:
+        def first(self):
+            return (vacancy, {"experience": {"name": "1–3 года"}})
+
+    class _DB:
+        async def execute(self, query):
+            executed.append(str(query.compile(dialect=postgresql.dialect())))
+            return _Result()
+
+    detail = asyncio.run(VacancyService.get_vacancy_by_id(_DB(), 7))
+
+    assert "LEFT OUTER JOIN vacancy_raw ON vacancy_raw.vacancy_id = vacancies.id" in executed[0]
+    assert detail.description == "<p>Go</p>"
+    assert detail.raw_data == {"experience": {"name": "1–3 года"}}
@@ -5,14 +5,22 @@ export const interviewApi = {
 
     startTest: () => axiosClient.post('/interview/start'),
 
-    submitAnswer: (sessionId, questionId, answerOptionId) =>
+    // sessionToken is only set when the backend runs stateless token sessions.
+    submitAnswer: (sessionId, questionId, answerOptionId, sessionToken = null) =>
         axiosClient.post(`/interview/answer/${sessionId}`, {
             question_id: questionId,
-            answer_option_id: answerOptionId
+            answer_option_id: answerOptionId,
+            ...(sessionToken ? { session_token: sessionToken } : {})
         }),
 
-    completeTest: (sessionId) =>
-        axiosClient.post(`/interview/complete/${sessionId}`, {}, { timeout: 0 }),
+    completeTest: (sessionId, sessionToken = null) =>
+        axiosClient.post(
+            `/interview/complete/${sessionId}`,
+            sessionToken ? { session_token: sessionToken } : {},
+            { timeout: 0 }
+        ),
+
+    getInterpretation: (jobId) => axiosClient.get(`/interview/interpretation/${jobId}`),
 
     // Career Pipeline Endpoints
     getRoleDetails: (roleId) => axiosClient.get(`/interview/roles/${roleId}`),
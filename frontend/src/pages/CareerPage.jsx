@@ -1,4 +1,4 @@
-import React, { useState, useCallback, useEffect } from 'react';
+import React, { useState, useCallback, useEffect, useRef } from 'react';
 import { motion } from 'framer-motion';
 import { interviewApi } from '../api/interviewApi';
 import WelcomeScreen from '../components/career/WelcomeScreen';
@@ -12,6 +12,8 @@ import { ANALYTICS_EVENTS } from '../constants/analyticsEvents';
 const CareerPage = () => {
     const [screen, setScreen] = useState('welcome'); // 'welcome' | 'test' | 'analyzing' | 'results'
     const [sessionId, setSessionId] = useState(null);
+    // Signed session state, returned by the API only in stateless token mode.
+    const sessionTokenRef = useRef(null);
     const [questions, setQuestions] = useState([]);
     const [currentIndex, setCurrentIndex] = useState(0);
     const [answers, setAnswers] = useState({}); // Record<questionId, answerOptionId>
@@ -21,7 +23,7 @@ const CareerPage = () => {
     const [errorState, setErrorState] = useState(null);
 
     const completeTestRequest = useCallback(async () => {
-        const completeRes = await interviewApi.completeTest(sessionId);
+        const completeRes = await interviewApi.completeTest(sessionId, sessionTokenRef.current);
         const resultData = completeRes.data;
 
         trackEvent(ANALYTICS_EVENTS.CAREER_TEST_COMPLETE, {
@@ -36,6 +38,50 @@ const CareerPage = () => {
         setScreen('results');
     }, [sessionId]);
 
+    // LLM interpretation runs as a background job: poll until it is ready or failed.
+    const interpretationJobId = results?.interpretation_status === 'pending'
+        ? results.interpretation_job_id
+        : null;
+
+    useEffect(() => {
+        if (!interpretationJobId) return undefined;
+
+        let cancelled = false;
+        let attempts = 0;
+        let timerId = null;
+
+        const poll = async () => {
+            attempts += 1;
+            try {
+                const { data } = await interviewApi.getInterpretation(interpretationJobId);
+                if (cancelled) return;
+                if (data.status !== 'pending') {
+                    setResults(prev => ({
+                        ...prev,
+                        interpretation: data.interpretation || null,
+                        interpretation_status: data.status,
+                        warnings: [...(prev?.warnings || []), ...(data.warnings || [])],
+                    }));
+                    return;
+                }
+            } catch (err) {
+                console.error('Interpretation poll error:', err);
+            }
+            if (cancelled) return;
+            if (attempts >= 45) {
+                setResults(prev => ({ ...prev, interpretation_status: 'failed' }));
+                return;
+            }
+            timerId = setTimeout(poll, 2000);
+        };
+
+        timerId = setTimeout(poll, 1500);
+        return () => {
+            cancelled = true;
+            clearTimeout(timerId);
+        };
+    }, [interpretationJobId]);
+
     const handleStart = useCallback(async () => {
         setIsLoading(true);
         setErrorState(null);
@@ -53,6 +99,7 @@ const CareerPage = () => {
 
             setQuestions(questionsRes.data);
             setSessionId(sessionRes.data.session_id);
+            sessionTokenRef.current = sessionRes.data.session_token || null;
             setScreen('test');
         } catch (err) {
             setErrorState({
@@ -88,6 +135,18 @@ const CareerPage = () => {
         }
     }, [currentIndex, errorState]);
 
+    const submitAnswer = useCallback(async (questionId, answerOptionId) => {
+        const { data } = await interviewApi.submitAnswer(
+            sessionId,
+            questionId,
+            answerOptionId,
+            sessionTokenRef.current
+        );
+        if (data?.session_token) {
+            sessionTokenRef.current = data.session_token;
+        }
+    }, [sessionId]);
+
     const handleNext = useCallback(async () => {
         const currentQuestion = questions[currentIndex];
         if (!currentQuestion) {
@@ -107,7 +166,7 @@ const CareerPage = () => {
         setIsSubmitting(true);
         if (currentIndex < questions.length - 1) {
             try {
-                await interviewApi.submitAnswer(sessionId, currentQuestion.id, selectedAnswerId);
+                await submitAnswer(currentQuestion.id, selectedAnswerId);
                 setCurrentIndex(prev => prev + 1);
             } catch (err) {
                 setErrorState({
@@ -123,7 +182,7 @@ const CareerPage = () => {
         }
 
         try {
-            await interviewApi.submitAnswer(sessionId, currentQuestion.id, selectedAnswerId);
+            await submitAnswer(currentQuestion.id, selectedAnswerId);
         } catch (err) {
             setErrorState({
                 title: 'Не удалось отправить финальный ответ',
@@ -148,7 +207,7 @@ const CareerPage = () => {
             });
             console.error('Complete test error:', err);
         }
-    }, [answers, completeTestRequest, currentIndex, questions, sessionId]);
+    }, [answers, completeTestRequest, currentIndex, questions, submitAnswer]);
 
     const handleRetryError = useCallback(async () => {
         if (!errorState?.retryAction) return;
@@ -184,6 +243,7 @@ const CareerPage = () => {
         if (errorState.retryAction === 'restart') {
             setScreen('welcome');
             setSessionId(null);
+            sessionTokenRef.current = null;
             setQuestions([]);
             setCurrentIndex(0);
             setAnswers({});
@@ -195,6 +255,7 @@ const CareerPage = () => {
     const handleRestart = useCallback(() => {
         setScreen('welcome');
         setSessionId(null);
+        sessionTokenRef.current = null;
         setQuestions([]);
         setCurrentIndex(0);
         setAnswers({});